@@ -0,0 +1,140 @@
+"""
+This module holds the auto combat mode, in which the character's turns are taken by a policy picked by the player
+rather than by typing a command for every one of them. The messages of the fight's turns are muted
+(see information_printer.combat_log) and a short summary of it is printed once it is over.
+    auto                    - auto attacks only
+    auto sor                - keeps Seal of Righteousness up
+    auto heal [X]           - casts Flash of Light whenever the health is below X% (50 by default)
+    auto sor heal [X]       - both of the above
+"""
+import logging
+from collections import Counter
+
+from classes import Paladin
+from information_printer import combat_log
+
+AUTO_COMBAT_DEFAULT_HEAL_PERCENTAGE = 50
+# Key: a command, Value: how it is shown in the summary
+AUTO_COMBAT_COMMAND_NAMES = {'attack': 'auto attacks', 'sor': Paladin.KEY_SEAL_OF_RIGHTEOUSNESS,
+                             'fol': Paladin.KEY_FLASH_OF_LIGHT, 'ms': Paladin.KEY_MELTING_STRIKE}
+
+
+class AutoCombatPolicy:
+    """ Picks the command of the character's turn, the spells are those of a paladin """
+    def __init__(self, keep_seal_of_righteousness: bool=False, heal_below_percentage: float=None):
+        """
+        :param keep_seal_of_righteousness: cast Seal of Righteousness whenever it is not active
+        :param heal_below_percentage: cast Flash of Light whenever the health is below this percentage of the maximum
+        """
+        self.keep_seal_of_righteousness = keep_seal_of_righteousness
+        self.heal_below_percentage = heal_below_percentage
+
+    def __eq__(self, other):
+        return (isinstance(other, AutoCombatPolicy)
+                and self.keep_seal_of_righteousness == other.keep_seal_of_righteousness
+                and self.heal_below_percentage == other.heal_below_percentage)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(keep_seal_of_righteousness={self.keep_seal_of_righteousness}, ' \
+               f'heal_below_percentage={self.heal_below_percentage})'
+
+    def choose_command(self, character: Paladin) -> str:
+        """ Returns the command for the character's turn, a spell is picked only if it can be cast """
+        if (self.heal_below_percentage is not None
+                and character.health < character.max_health * self.heal_below_percentage / 100
+                and self._can_cast(character, Paladin.KEY_FLASH_OF_LIGHT)):
+            return 'fol'
+        if (self.keep_seal_of_righteousness and not character.SOR_ACTIVE
+                and self._can_cast(character, Paladin.KEY_SEAL_OF_RIGHTEOUSNESS)):
+            return 'sor'
+
+        return 'attack'
+
+    def __call__(self, encounter: 'Encounter', character: Paladin):
+        """ Take the character's turn in an Encounter (see encounter.py) """
+        command = self.choose_command(character)
+        target = encounter.get_target(character)
+        if command == 'attack':
+            character.attack(target)
+        else:
+            character.spell_handler(command, target)
+
+    @staticmethod
+    def _can_cast(character: Paladin, spell_name: str) -> bool:
+        spell = character.learned_spells.get(spell_name)
+        return (spell is not None and character.has_enough_mana(spell.mana_cost)
+                and character.spell_cooldowns.is_ready(spell_name))
+
+
+def parse_auto_combat_policy(command: str) -> AutoCombatPolicy or None:
+    """
+    Parse an auto combat command, like 'auto sor heal 40'
+    :return: the policy, None if the command is not a valid auto combat command
+    """
+    words = command.split()
+    if not words or words[0] != 'auto':
+        return None
+
+    keep_seal_of_righteousness, heal_below_percentage = False, None
+    words = iter(words[1:])
+    for word in words:
+        if word == 'sor' and not keep_seal_of_righteousness:
+            keep_seal_of_righteousness = True
+        elif word == 'heal' and heal_below_percentage is None:
+            heal_below_percentage = AUTO_COMBAT_DEFAULT_HEAL_PERCENTAGE
+            percentage = next(words, None)
+            if percentage is not None:
+                if not percentage.isdigit() or not 0 < int(percentage) <= 100:
+                    return None
+                heal_below_percentage = int(percentage)
+        else:
+            return None
+
+    return AutoCombatPolicy(keep_seal_of_righteousness, heal_below_percentage)
+
+
+class AutoCombat:
+    """
+    Runs the character's side of a fight through a policy, with the messages of the fight's turns
+    being muted from start() until finish() is called
+    """
+    def __init__(self, policy: AutoCombatPolicy, character: Paladin, monsters: ['Monster']):
+        """
+        :param monsters: the monsters the character fights, named in the summary
+        """
+        self.policy = policy
+        self.character = character
+        self.monsters = monsters
+        self.commands = Counter()  # Key: a command, Value: the count of turns it was used on
+        self._start_health, self._start_mana = character.health, character.mana
+        self._combat_log_level = None  # the level of the combat log before it was muted
+        self.is_finished = False
+
+    def start(self):
+        """ Start muting the messages of the fight's turns """
+        self._combat_log_level = combat_log.level
+        combat_log.setLevel(logging.WARNING)
+
+    def next_command(self) -> str:
+        command = self.policy.choose_command(self.character)
+        self.commands[command] += 1
+        return command
+
+    def finish(self):
+        """ Stop muting the fight's messages and print its summary, does nothing if already finished """
+        if self.is_finished:
+            return
+        self.is_finished = True
+        if self._combat_log_level is not None:
+            combat_log.setLevel(self._combat_log_level)
+        print(self.get_summary())
+
+    def get_summary(self) -> str:
+        """ Ex: Auto combat against Wolf - 6 turns: 4 auto attacks, 2 Seal of Righteousness | Health 42 -> 30/60 ... """
+        character = self.character
+        monster_names = ', '.join(monster.name for monster in self.monsters)
+        used_commands = ', '.join(f'{count} {AUTO_COMBAT_COMMAND_NAMES.get(command, command)}'
+                                  for command, count in self.commands.most_common())
+        return (f'Auto combat against {monster_names} - {sum(self.commands.values())} turns: {used_commands} '
+                f'| Health {self._start_health:.0f} -> {character.health:.0f}/{character.max_health} '
+                f'| Mana {self._start_mana:.0f} -> {character.mana:.0f}/{character.max_mana}')
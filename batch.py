@@ -0,0 +1,177 @@
+"""
+This module holds the batch mode of the game, in which the player's commands are read from a script rather than
+typed into the console - every command the game asks for, be it in the start prompt, out of combat, in combat,
+in a vendor's dialogue or in a loot window, is the next line of the script.
+Empty lines and lines starting with # are skipped, the game ends once the script runs out of commands.
+
+While a script runs, the prompts of the game are not printed (every command is echoed after a > instead) and
+its pauses (i.e. the ones for a monster's gossip) are skipped, so that it runs as fast as the game can go.
+Once it is over, the wall time of the run and the latency of the commands - the time from one command being read
+to the next one being asked for - are reported on stderr, away from the game's own output.
+
+A script runs against a scratch copy of the database, which is thrown away afterwards, and the character is not
+saved when it ends, so that every run of a script starts off from the same saved characters.
+
+    python main.py --script commands.txt --seed 42
+    python main.py --script - < commands.txt
+"""
+import builtins
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import sqlalchemy
+
+
+class CommandScript:
+    """ Replaces the built-in input, returning the next command of the script and timing each of them """
+    def __init__(self, lines, clock=time.perf_counter):
+        """
+        :param lines: the lines of the script, i.e. an open file
+        :param clock: a function which returns the current time in seconds
+        """
+        self.commands: [str] = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+        self._clock = clock
+        self._next_command_idx = 0
+        self.latencies: [(str, float)] = []  # a tuple of (command, seconds until the next one was asked for)
+        self._read_at: float = None  # when the last command was read
+        self.start_time: float = None
+        self.end_time: float = None
+
+    def __call__(self, prompt: str='') -> str:
+        now = self._clock()
+        if self.start_time is None:
+            self.start_time = now
+        self._record_latency(now)
+
+        if self._next_command_idx >= len(self.commands):
+            self.end_time = now
+            raise EOFError('The script has run out of commands')
+        command = self.commands[self._next_command_idx]
+        self._next_command_idx += 1
+        print(f'>{command}')
+
+        self._read_at = self._clock()
+        return command
+
+    def finish(self):
+        """ Stop the timing, the last command's latency lasts until now if the game ended before asking for more """
+        if self.end_time is None:
+            self.end_time = self._clock()
+            self._record_latency(self.end_time)
+        if self.start_time is None:
+            self.start_time = self.end_time
+
+    def get_report(self) -> str:
+        """
+        Ex:
+            Ran 120/120 commands in 0.412s
+            Latency - mean: 3.41ms, median: 0.52ms, 95th percentile: 12.09ms, max: 61.30ms
+            By command:       count      mean       max
+                engage             12   21.66ms   61.30ms
+        """
+        lines = [f'Ran {self._next_command_idx}/{len(self.commands)} commands '
+                 f'in {self.end_time - self.start_time:.3f}s']
+        if not self.latencies:
+            return '\n'.join(lines)
+
+        latencies = sorted(latency for _, latency in self.latencies)
+        lines.append(f'Latency - mean: {sum(latencies) / len(latencies) * 1000:.2f}ms, '
+                     f'median: {get_percentile(latencies, 50) * 1000:.2f}ms, '
+                     f'95th percentile: {get_percentile(latencies, 95) * 1000:.2f}ms, '
+                     f'max: {latencies[-1] * 1000:.2f}ms')
+
+        # Key: the first word of the command, Value: the latencies of the commands starting with it
+        latencies_by_command = defaultdict(list)
+        for command, latency in self.latencies:
+            latencies_by_command[command.split()[0]].append(latency)
+        lines.append(f'{"By command:":<16}{"count":>7}{"mean":>10}{"max":>10}')
+        for command, command_latencies in sorted(latencies_by_command.items(), key=lambda item: -sum(item[1])):
+            lines.append(f'    {command:<12}{len(command_latencies):>7}'
+                         f'{sum(command_latencies) / len(command_latencies) * 1000:>8.2f}ms'
+                         f'{max(command_latencies) * 1000:>8.2f}ms')
+
+        return '\n'.join(lines)
+
+    def _record_latency(self, now: float):
+        if self._read_at is not None:
+            self.latencies.append((self.commands[self._next_command_idx - 1], now - self._read_at))
+            self._read_at = None
+
+
+def get_percentile(sorted_values: list, percentile: float):
+    """ Returns the value below which the given percentage of the sorted values fall (the nearest rank) """
+    rank = max(round(percentile / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@contextmanager
+def skipped_sleeps():
+    """
+    Have time.sleep return at once, both for the modules which call time.sleep
+    and for the ones which have already imported it through from time import sleep
+    """
+    original_sleep = time.sleep
+
+    def skip_sleep(seconds: float):
+        pass
+
+    patched_modules = [module for module in list(sys.modules.values())
+                       if getattr(module, 'sleep', None) is original_sleep and module is not time]
+    time.sleep = skip_sleep
+    for module in patched_modules:
+        module.sleep = skip_sleep
+    try:
+        yield
+    finally:
+        time.sleep = original_sleep
+        for module in patched_modules:
+            module.sleep = original_sleep
+
+
+@contextmanager
+def scratch_database(session, db_path: str):
+    """
+    Point the session at a copy of the database for the duration of the context, so that nothing that is saved
+    in the meantime reaches the database itself
+    :param session: the session every query of the game goes through (database.main.session)
+    :param db_path: the path of the database the session is bound to
+    """
+    scratch_file, scratch_path = tempfile.mkstemp(suffix='.db')
+    os.close(scratch_file)
+    shutil.copyfile(db_path, scratch_path)
+    scratch_engine = sqlalchemy.create_engine(f'sqlite:///{scratch_path}')
+
+    original_bind = session.bind
+    session.close()
+    session.bind = scratch_engine
+    try:
+        yield
+    finally:
+        session.close()
+        session.bind = original_bind
+        scratch_engine.dispose()
+        os.remove(scratch_path)
+
+
+def run_script(script: CommandScript, run_game):
+    """
+    Run the game with its commands read from the script, until the script runs out of commands or the game quits,
+    and report the timing of the run on stderr
+    :param run_game: a function which starts the game
+    """
+    original_input = builtins.input
+    builtins.input = script
+    try:
+        with skipped_sleeps():
+            run_game()
+    except EOFError:
+        pass  # the script has run out of commands
+    finally:
+        builtins.input = original_input
+        script.finish()
+        print(script.get_report(), file=sys.stderr)
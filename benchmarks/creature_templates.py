@@ -0,0 +1,65 @@
+"""
+A memory benchmark of a subzone holding many spawns of a handful of creature entries.
+It compares monsters that share their CreatureTemplate (as they are loaded from the DB, see
+CreatureTemplateSchema.convert_to_creature_template) against monsters which each hold their own copy of it.
+
+Run it from the root folder of the project:
+    python -m benchmarks.creature_templates [spawn count]
+"""
+import sys
+import tracemalloc
+
+from entities import CreatureTemplate, Monster
+
+SPAWN_COUNT = 100000
+TEMPLATES = [CreatureTemplate(entry=entry, name=name, health=health, mana=0, level=level, min_damage=level,
+                              max_damage=level * 2, quest_relation_id=0, xp_to_give=level * 25,
+                              gold_to_give_range=(level, level * 3), loot_table=None, armor=level * 25,
+                              gossip='', respawnable=True)
+             for entry, (name, health, level) in enumerate([('Young Wolf', 10, 1), ('Wolf', 15, 2),
+                                                             ('Kobold Worker', 15, 2), ('Kobold Vermin', 12, 1),
+                                                             ('Defias Thug', 20, 3)], start=1)]
+
+
+def build_shared_subzone(spawn_count: int) -> {int: Monster}:
+    """ Every spawn references the template of its entry """
+    return {guid: Monster.from_template(TEMPLATES[guid % len(TEMPLATES)]) for guid in range(spawn_count)}
+
+
+def build_copied_subzone(spawn_count: int) -> {int: Monster}:
+    """ Every spawn gets its own copy of the values in the template of its entry """
+    subzone = {}
+    for guid in range(spawn_count):
+        template = TEMPLATES[guid % len(TEMPLATES)]
+        subzone[guid] = Monster(monster_id=template.entry, name=''.join(template.name),
+                                health=template.health, mana=template.mana, level=template.level,
+                                min_damage=template.min_damage, max_damage=template.max_damage,
+                                quest_relation_id=template.quest_relation_id, xp_to_give=template.xp_to_give,
+                                gold_to_give_range=tuple(template.gold_to_give_range),
+                                loot_table=template.loot_table, armor=template.armor,
+                                gossip=''.join(template.gossip), respawnable=template.respawnable)
+    return subzone
+
+
+def measure(build_function, spawn_count: int) -> int:
+    """ Returns the bytes that the subzone built by the function takes up """
+    tracemalloc.start()
+    subzone = build_function(spawn_count)
+    used_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del subzone
+
+    return used_memory
+
+
+def main():
+    spawn_count = int(sys.argv[1]) if len(sys.argv) > 1 else SPAWN_COUNT
+    print(f'{spawn_count} spawns of {len(TEMPLATES)} creature templates')
+    for description, build_function in [('Shared templates', build_shared_subzone),
+                                        ('Copied templates', build_copied_subzone)]:
+        used_memory = measure(build_function, spawn_count)
+        print(f'{description}: {used_memory / 1024 / 1024:.2f} MB, {used_memory // spawn_count} bytes per spawn')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+A benchmark of the turn engine in encounter.py - a party of paladins against a pack of monsters, every one of them
+controlled by the auto attacking AI, headless, with the printing sent to os.devnull.
+It runs encounters of growing sizes, to show that the cost of a turn stays about the same as the count of
+participants grows, on:
+    turns per second
+    the rounds it took the party to win
+
+Run it from the root folder of the project:
+    python -m benchmarks.encounter [largest count of monsters]
+"""
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+from models import main as _  # load all the DB models
+from classes import Paladin
+from encounter import Encounter, attack_target_controller
+from entities import Monster
+
+LARGEST_MONSTER_COUNT = 1000
+MONSTERS_PER_PALADIN = 5
+
+
+def build_encounter(monster_count: int, seed: int=0) -> Encounter:
+    encounter = Encounter(rng=random.Random(seed))
+    for idx in range(max(monster_count // MONSTERS_PER_PALADIN, 1)):
+        paladin = Paladin(name=f'Paladin {idx}', level=3, health=200)
+        encounter.add_participant(paladin, 'party', attack_target_controller)
+    for idx in range(monster_count):
+        wolf = Monster(monster_id=1, name=f'Wolf {idx}', health=8, level=2, min_damage=1, max_damage=2)
+        encounter.add_participant(wolf, 'monsters', attack_target_controller)
+
+    return encounter
+
+
+def measure(monster_count: int) -> (float, int):
+    """ Returns a tuple of (turns per second, the count of rounds) """
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        random.seed(0)  # the damage rolls
+        encounter = build_encounter(monster_count)
+        turns = 0
+        start = time.perf_counter()
+        while not encounter.is_over():
+            turns += sum(participant.living_thing.is_alive() for participant in encounter.participants)
+            encounter.run_round()
+        elapsed = time.perf_counter() - start
+
+    return turns / elapsed, encounter.round
+
+
+def main():
+    largest_monster_count = int(sys.argv[1]) if len(sys.argv) > 1 else LARGEST_MONSTER_COUNT
+
+    monster_count = 10
+    while monster_count <= largest_monster_count:
+        turns_per_second, rounds = measure(monster_count)
+        paladin_count = max(monster_count // MONSTERS_PER_PALADIN, 1)
+        print(f'{paladin_count} paladins against {monster_count} monsters: '
+              f'{turns_per_second:,.0f} turns per second, won in {rounds} rounds')
+        monster_count *= 10
+
+
+if __name__ == '__main__':
+    main()
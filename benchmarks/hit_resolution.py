@@ -0,0 +1,55 @@
+"""
+A throughput benchmark of the auto attacks in a headless combat - a Paladin and a Monster hitting each other,
+with the printing sent to os.devnull.
+Both of them have armor and the Paladin's target has an absorption shield, so that every step of resolving a hit
+is taken.
+
+Run it from the root folder of the project:
+    python -m benchmarks.hit_resolution [hit count]
+"""
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from models import main as _  # load all the DB models
+from classes import Paladin
+from constants import KEY_ARMOR_ATTRIBUTE, KEY_STAT_LAYER_BASE
+from entities import Monster
+
+HIT_COUNT = 200000
+
+
+def measure_hits_per_second(hit_count: int) -> (float, float):
+    """ Returns the hits per second of the Paladin's and the Monster's auto attacks """
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        character = Paladin(name='Benchmark', level=3)
+        character._modify_stat_layer(KEY_STAT_LAYER_BASE, {KEY_ARMOR_ATTRIBUTE: 50})
+        monster = Monster(monster_id=1, name='Wolf', health=10 ** 9, mana=0, level=3, min_damage=1, max_damage=4,
+                          armor=50)
+        character.health = character.max_health = 10 ** 9
+        character.SOR_ACTIVE = True  # adds magic damage to the Paladin's attacks
+
+        start = time.perf_counter()
+        for _ in range(hit_count):
+            monster.absorption_shield = 1
+            character.attack(monster)
+        paladin_hits_per_second = hit_count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(hit_count):
+            monster.attack(character)
+        monster_hits_per_second = hit_count / (time.perf_counter() - start)
+
+    return paladin_hits_per_second, monster_hits_per_second
+
+
+def main():
+    hit_count = int(sys.argv[1]) if len(sys.argv) > 1 else HIT_COUNT
+    paladin_hits_per_second, monster_hits_per_second = measure_hits_per_second(hit_count)
+    print(f'Paladin auto attacks: {paladin_hits_per_second:,.0f} hits per second')
+    print(f'Monster auto attacks: {monster_hits_per_second:,.0f} hits per second')
+
+
+if __name__ == '__main__':
+    main()
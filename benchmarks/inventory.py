@@ -0,0 +1,104 @@
+"""
+A throughput benchmark of a large character inventory.
+It compares the Inventory class against the dictionary of Key: item name, Value: tuple(Item, count) with a 'gold' key
+that the character used to hold, on:
+    adding and removing single items (looting, equipping, selling)
+    iterating through the items for printing
+    serializing them into (item ID, item count) tuples for saving
+
+Run it from the root folder of the project:
+    python -m benchmarks.inventory [item count] [operation count]
+"""
+import sys
+import time
+
+from inventory import Inventory
+from items import Item
+
+ITEM_COUNT = 10000
+OPERATION_COUNT = 200000
+
+
+def add_to_dict(inventory: dict, item: Item, item_count: int=1):
+    count = item_count
+    if item.name in inventory:
+        count += inventory[item.name][1]
+    inventory[item.name] = (item, count)
+
+
+def remove_from_dict(inventory: dict, item_name: str, item_count: int=1):
+    item, count_in_inventory = inventory[item_name]
+    resulting_count = count_in_inventory - item_count
+    if resulting_count <= 0:
+        del inventory[item_name]
+    else:
+        inventory[item_name] = item, resulting_count
+
+
+def print_dict(inventory: dict) -> int:
+    """ Returns the count of the printed lines, instead of printing them """
+    lines = [f"\t{inventory['gold']} gold"]
+    for key, item_tuple in [(k, v) for k, v in inventory.items() if k != 'gold']:
+        item, item_count = item_tuple
+        lines.append(f'\t{item_count} {item.name}')
+    return len(lines)
+
+
+def serialize_dict(inventory: dict) -> [(int, int)]:
+    return [(inventory[item_name][0].id, inventory[item_name][1]) for item_name in inventory.keys() if item_name != 'gold']
+
+
+def print_inventory(inventory: Inventory) -> int:
+    """ Returns the count of the printed lines, instead of printing them """
+    lines = [f"\t{inventory.gold} gold"]
+    for stack in inventory.stacks():
+        lines.append(f'\t{stack.count} {stack.item.name}')
+    return len(lines)
+
+
+def measure(description: str, function, repeat_count: int, operations_per_call: int=1):
+    """ Prints the operations per second of calling the function repeat_count times """
+    start = time.perf_counter()
+    for _ in range(repeat_count):
+        function()
+    elapsed = time.perf_counter() - start
+    print(f'\t{description}: {repeat_count * operations_per_call / elapsed:,.0f} per second')
+
+
+def main():
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else ITEM_COUNT
+    operation_count = int(sys.argv[2]) if len(sys.argv) > 2 else OPERATION_COUNT
+    items = [Item(name=f'Item {item_id}', item_id=item_id, buy_price=1, sell_price=1)
+             for item_id in range(1, item_count + 1)]
+
+    dict_inventory = {'gold': 0}
+    inventory = Inventory()
+    for item in items:
+        add_to_dict(dict_inventory, item, 2)
+        inventory.add_item(item, 2)
+
+    def dict_add_remove():
+        for idx in range(operation_count):
+            item = items[idx % item_count]
+            add_to_dict(dict_inventory, item)
+            remove_from_dict(dict_inventory, item.name)
+
+    def inventory_add_remove():
+        for idx in range(operation_count):
+            item = items[idx % item_count]
+            inventory.add_item(item)
+            inventory.remove_item(item.name)
+
+    print(f'An inventory of {item_count} item stacks')
+    print('Dictionary of tuples:')
+    measure('add and remove an item', dict_add_remove, 1, operation_count)
+    measure('print', lambda: print_dict(dict_inventory), 20)
+    measure('serialize', lambda: serialize_dict(dict_inventory), 20)
+    print('Inventory:')
+    measure('add and remove an item', inventory_add_remove, 1, operation_count)
+    measure('print', lambda: print_inventory(inventory), 20)
+    measure('serialize', inventory.serialize, 20)
+
+
+if __name__ == '__main__':
+    main()
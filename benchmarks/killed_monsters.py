@@ -0,0 +1,108 @@
+"""
+A benchmark of saving and loading a character who has killed a great many monsters.
+It compares holding every killed GUID in its own row and loading them into a Python set (as the
+saved_character_killed_monsters table used to) against a single packed column (see utils/guid_set.py) loaded
+into a GuidSet, on:
+    the time it takes to save and to load the killed monsters
+    the size of the saved killed monsters and the memory they take up once loaded
+    membership tests per second, which are done for every monster when a subzone is loaded
+
+The tables are created in an in-memory SQLite database, so that the game's database is not touched.
+
+Run it from the root folder of the project:
+    python -m benchmarks.killed_monsters [kill count]
+"""
+import random
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+from utils.guid_set import GuidSet, pack_guids
+
+KILL_COUNT = 100000
+GUID_RANGE = 1000000
+CHARACTER_ENTRY = 1
+
+
+def save_rows(connection: sqlite3.Connection, guids: set):
+    connection.execute('DELETE FROM killed_monsters WHERE saved_character_id = ?', (CHARACTER_ENTRY,))
+    connection.executemany('INSERT INTO killed_monsters (saved_character_id, guid) VALUES (?, ?)',
+                           ((CHARACTER_ENTRY, guid) for guid in guids))
+    connection.commit()
+
+
+def load_rows(connection: sqlite3.Connection) -> set:
+    return {guid for guid, in connection.execute('SELECT guid FROM killed_monsters WHERE saved_character_id = ?',
+                                                 (CHARACTER_ENTRY,))}
+
+
+def save_packed(connection: sqlite3.Connection, guids: GuidSet):
+    connection.execute('UPDATE saved_character SET packed_killed_monsters = ? WHERE entry = ?',
+                       (pack_guids(guids), CHARACTER_ENTRY))
+    connection.commit()
+
+
+def load_packed(connection: sqlite3.Connection) -> GuidSet:
+    packed_guids, = connection.execute('SELECT packed_killed_monsters FROM saved_character WHERE entry = ?',
+                                       (CHARACTER_ENTRY,)).fetchone()
+    return GuidSet.from_packed(packed_guids)
+
+
+def measure_time(function, *args):
+    """ Returns a tuple of (the function's result, the seconds it took) """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def measure_memory(function, *args) -> int:
+    """ Returns the bytes that the function's result takes up """
+    tracemalloc.start()
+    result = function(*args)
+    used_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return used_memory
+
+
+def measure_lookups(killed_monsters, lookup_guids: list) -> float:
+    """ Returns the membership tests per second """
+    start = time.perf_counter()
+    for guid in lookup_guids:
+        guid in killed_monsters
+    return len(lookup_guids) / (time.perf_counter() - start)
+
+
+def main():
+    kill_count = int(sys.argv[1]) if len(sys.argv) > 1 else KILL_COUNT
+    generator = random.Random(0)
+    guids: [int] = generator.sample(range(1, GUID_RANGE + 1), kill_count)
+    lookup_guids: [int] = [generator.randint(1, GUID_RANGE) for _ in range(kill_count)]
+
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE killed_monsters (id INTEGER PRIMARY KEY, saved_character_id INTEGER, '
+                       'guid INTEGER)')
+    connection.execute('CREATE TABLE saved_character (entry INTEGER PRIMARY KEY, packed_killed_monsters BLOB)')
+    connection.execute('INSERT INTO saved_character (entry) VALUES (?)', (CHARACTER_ENTRY,))
+
+    print(f'A character with {kill_count} killed monsters, out of {GUID_RANGE} GUIDs')
+    print('A row per GUID, loaded into a set:')
+    _, save_time = measure_time(save_rows, connection, set(guids))
+    loaded_guids, load_time = measure_time(load_rows, connection)
+    print(f'\tsave: {save_time * 1000:.1f} ms, load: {load_time * 1000:.1f} ms')
+    print(f'\tsaved: {kill_count} rows, loaded: {measure_memory(load_rows, connection) / 1024:,.0f} KB')
+    print(f'\tlookups: {measure_lookups(loaded_guids, lookup_guids):,.0f} per second')
+
+    print('A packed column, loaded into a GuidSet:')
+    _, save_time = measure_time(save_packed, connection, GuidSet(guids))
+    loaded_guids, load_time = measure_time(load_packed, connection)
+    print(f'\tsave: {save_time * 1000:.1f} ms, load: {load_time * 1000:.1f} ms')
+    print(f'\tsaved: {len(pack_guids(guids)) / 1024:,.0f} KB, '
+          f'loaded: {measure_memory(load_packed, connection) / 1024:,.0f} KB')
+    print(f'\tlookups: {measure_lookups(loaded_guids, lookup_guids):,.0f} per second')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+An allocation benchmark of a grind spot - the same creature being killed and looted over and over, headless,
+with the printing sent to os.devnull.
+It compares building a new Monster for every kill against reusing the Monster objects (and their loot containers)
+through a MonsterPool, on:
+    kills per second
+    the count of memory blocks that are allocated for every kill (building the monster, dying and dropping its loot)
+
+Run it from the root folder of the project:
+    python -m benchmarks.monster_pool [kill count]
+"""
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from models import main as _  # load all the DB models
+from models.items.loot_table import loot_tables
+from entities import CreatureTemplate, Monster, MonsterPool
+
+KILL_COUNT = 100000
+
+
+def kill_new_monsters(template: CreatureTemplate, kill_count: int) -> int:
+    """ Returns the count of memory blocks that were allocated for the kills """
+    allocated_blocks = 0
+    for _ in range(kill_count):
+        blocks_before = sys.getallocatedblocks()
+        monster = Monster.from_template(template)
+        monster._die()
+        allocated_blocks += sys.getallocatedblocks() - blocks_before
+        del monster  # free it outside of the measured blocks
+    return allocated_blocks
+
+
+def kill_pooled_monsters(template: CreatureTemplate, kill_count: int) -> int:
+    """ Returns the count of memory blocks that were allocated for the kills """
+    pool = MonsterPool()
+    allocated_blocks = 0
+    for _ in range(kill_count):
+        blocks_before = sys.getallocatedblocks()
+        monster = pool.acquire(template)
+        monster._die()
+        allocated_blocks += sys.getallocatedblocks() - blocks_before
+        pool.release(monster)
+    return allocated_blocks
+
+
+def measure(kill_function, template: CreatureTemplate, kill_count: int) -> (float, float):
+    """ Returns a tuple of (kills per second, memory blocks allocated per kill) """
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        start = time.perf_counter()
+        allocated_blocks = kill_function(template, kill_count)
+        elapsed = time.perf_counter() - start
+
+    return kill_count / elapsed, allocated_blocks / kill_count
+
+
+def main():
+    kill_count = int(sys.argv[1]) if len(sys.argv) > 1 else KILL_COUNT
+    template = CreatureTemplate(entry=1, name='Kobold Worker', health=15, mana=0, level=2, min_damage=2, max_damage=4,
+                                quest_relation_id=0, xp_to_give=50, gold_to_give_range=(1, 5),
+                                loot_table=loot_tables[0], armor=50, gossip='', respawnable=False)
+
+    print(f'{kill_count} kills of a monster with a loot table')
+    for description, kill_function in [('New monsters', kill_new_monsters),
+                                       ('Pooled monsters', kill_pooled_monsters)]:
+        kills_per_second, blocks_per_kill = measure(kill_function, template, kill_count)
+        print(f'{description}: {kills_per_second:,.0f} kills per second, {blocks_per_kill:.1f} memory blocks allocated per kill')
+
+
+if __name__ == '__main__':
+    main()
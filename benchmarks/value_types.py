@@ -0,0 +1,129 @@
+"""
+A memory benchmark of the small value types that are created all the time during the game
+(Damage, Heal, Item, StatusEffect, Spell, Quest and their subclasses).
+It reports the bytes and memory blocks every object takes up and the memory that a headless combat turn
+between a Paladin and a Monster allocates.
+
+Run it from the root folder of the project:
+    python -m benchmarks.value_types [object count] [turn count]
+"""
+import os
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+
+from models import main as _  # load all the DB models
+from buffs import BeneficialBuff, DoT
+from classes import Paladin
+from constants import KEY_ARMOR_ATTRIBUTE
+from damage import Damage
+from entities import Monster
+from heal import Heal, HolyHeal, ProtectiveHeal
+from items import Item, Weapon, Equipment, Potion
+from quest import KillQuest, FetchQuest
+from spells import PaladinSpell
+
+OBJECT_COUNT = 100000
+TURN_COUNT = 1000
+OBJECT_FACTORIES = [
+    ('Damage', lambda: Damage(phys_dmg=5, magic_dmg=2)),
+    ('Heal', lambda: Heal(heal_amount=5)),
+    ('HolyHeal', lambda: HolyHeal(heal_amount=5)),
+    ('ProtectiveHeal', lambda: ProtectiveHeal(heal_amount=5, target=None)),
+    ('Item', lambda: Item(name='Linen Cloth', item_id=1, buy_price=1, sell_price=1)),
+    ('Weapon', lambda: Weapon(name='Worn Sword', item_id=2, min_damage=1, max_damage=3)),
+    ('Equipment', lambda: Equipment(name='Worn Belt', item_id=3, slot='belt')),
+    ('Potion', lambda: Potion(name='Potion', item_id=4, buy_price=1, sell_price=1,
+                              buff=BeneficialBuff(name='Armor', buff_stats_and_amounts=[(KEY_ARMOR_ATTRIBUTE, 5)],
+                                                  duration=5))),
+    ('BeneficialBuff', lambda: BeneficialBuff(name='Armor', buff_stats_and_amounts=[(KEY_ARMOR_ATTRIBUTE, 5)],
+                                              duration=5)),
+    ('DoT', lambda: DoT(name='Melting', damage_tick=Damage(magic_dmg=2), duration=2, caster_lvl=3)),
+    ('PaladinSpell', lambda: PaladinSpell(name='Melting Strike', rank=1, damage1=3, mana_cost=6, cooldown=3)),
+    ('KillQuest', lambda: KillQuest(quest_name='Wolves', quest_id=1, required_monster='Wolf', xp_reward=100,
+                                    item_reward_dict={}, reward_choice_enabled=False, level_required=1,
+                                    required_kills=5)),
+    ('FetchQuest', lambda: FetchQuest(quest_name='Cloth', quest_id=2, required_item='Linen Cloth', xp_reward=100,
+                                      item_reward_dict={}, reward_choice_enabled=False, level_required=1,
+                                      required_item_count=5)),
+]
+# the commands the paladin cycles through in combat
+COMBAT_ROTATION = ['sor', 'attack', 'ms', 'attack', 'fol', 'attack']
+
+
+def measure_object(factory, object_count: int) -> (int, int):
+    """ Returns the bytes and the memory blocks that a single object of the factory takes up """
+    objects = [None] * object_count  # allocate the list before tracing, so that it is not measured
+    tracemalloc.start()
+    for idx in range(object_count):
+        objects[idx] = factory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    statistics = snapshot.statistics('filename')
+    del objects
+
+    used_memory = sum(stat.size for stat in statistics)
+    used_blocks = sum(stat.count for stat in statistics)
+    return used_memory // object_count, used_blocks // object_count
+
+
+def combat_turn(character: Paladin, monster: Monster, command: str):
+    """ A single turn of combat.engage_combat with the command given in place of the player's input """
+    monster.start_turn_update()
+    character.start_turn_update()
+    monster.attack(character)
+
+    if command == 'attack':
+        character.attack(monster)
+    else:
+        character.spell_handler(command, monster)
+
+    monster.end_turn_update()
+    character.end_turn_update()
+    # keep both of them alive for the next turn
+    character.health, character.mana = character.max_health, character.max_mana
+    monster.health = monster.max_health
+
+
+def measure_combat(turn_count: int) -> (int, int):
+    """
+    Returns the average peak of memory allocated in a combat turn and the memory blocks that are left allocated
+    after all the turns
+    """
+    total_peak = 0
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        character = Paladin(name='Benchmark', level=3)
+        monster = Monster(monster_id=1, name='Wolf', health=1000, mana=0, level=3, min_damage=1, max_damage=2)
+        character.enter_combat()
+        monster.enter_combat()
+
+        tracemalloc.start()
+        start_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        for turn in range(turn_count):
+            turn_start_memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            combat_turn(character, monster, COMBAT_ROTATION[turn % len(COMBAT_ROTATION)])
+            _, turn_peak = tracemalloc.get_traced_memory()
+            total_peak += turn_peak - turn_start_memory
+        end_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        tracemalloc.stop()
+
+    return total_peak // turn_count, end_blocks - start_blocks
+
+
+def main():
+    object_count = int(sys.argv[1]) if len(sys.argv) > 1 else OBJECT_COUNT
+    turn_count = int(sys.argv[2]) if len(sys.argv) > 2 else TURN_COUNT
+
+    print(f'Memory per object, averaged over {object_count} objects')
+    for name, factory in OBJECT_FACTORIES:
+        used_memory, used_blocks = measure_object(factory, object_count)
+        print(f'{name:>15}: {used_memory:>4} bytes, {used_blocks} blocks')
+
+    peak_memory, retained_blocks = measure_combat(turn_count)
+    print(f'Combat turn, averaged over {turn_count} turns: {peak_memory} bytes peak allocation, '
+          f'{retained_blocks} blocks retained after all turns')
+
+
+if __name__ == '__main__':
+    main()
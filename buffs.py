@@ -5,12 +5,17 @@ This module holds information about all kinds of buffs that are applied to an en
 - DoTs
 etc
 """
+import heapq
+from collections.abc import MutableMapping
+
 from damage import Damage
 from constants import KEY_ARMOR_ATTRIBUTE, KEY_STRENGTH_ATTRIBUTE, KEY_HEALTH_ATTRIBUTE, KEY_MANA_ATTRIBUTE
 from exceptions import InvalidBuffError
 
 # the base class for all buffs/dots/debuffs
 class StatusEffect:
+    __slots__ = ('name', 'duration')
+
     def __init__(self, name: str, duration: int):
         self.name = name
         self.duration = duration  # measured in turns
@@ -21,6 +26,8 @@ class StatusEffect:
 
 # Standard Buff that increases X stat for Y minutes (in our case: turns)
 class BeneficialBuff(StatusEffect):
+    __slots__ = ('buff_amounts',)
+
     def __init__(self, name: str, buff_stats_and_amounts: [(str, int)], duration: int):
         """
         Buff(10, [(armor, 3), (None, None), (None, None)) will increase your armor by 10 for 3 turns
@@ -84,6 +91,8 @@ class DoT(StatusEffect):
     # IMPORTANT: Due to the way of how loading spells work and the DoT requiring a level to be initialized
     # Every time a character casts a spell which uses a DoT, he should update the level on the DoT
     # This can be changed by changing the Character take_dot_proc function
+    __slots__ = ('damage', 'level')
+
     def __init__(self, name: str, damage_tick: Damage, duration: int, caster_lvl: int):
         """
         Dots(Fireball, 5, 2) will damage you for 5 at the start of each turn for 2 turns.
@@ -107,3 +116,115 @@ class DoT(StatusEffect):
 
     def update_caster_level(self, level: int):
         self.level = level
+
+
+class StatusEffectScheduler(MutableMapping):
+    """
+    Holds the status effects (buffs and DoTs) of an entity as a dictionary of Key: StatusEffect, Value: turns left.
+
+    The DoTs and the buffs are kept separately, as DoTs tick at the start of a turn and buffs at the end of it.
+    Each of them has its own turn counter and holds the turn each effect expires on, instead of its turns left,
+    in a min-heap. This way a tick does not touch every effect, but only the ones which expire on it.
+    """
+    def __init__(self, effects: dict=None):
+        self._dots = _EffectTimeline()
+        self._buffs = _EffectTimeline()
+        for effect, turns_left in (effects or {}).items():
+            self[effect] = turns_left
+
+    def _get_timeline(self, effect: StatusEffect) -> '_EffectTimeline':
+        return self._dots if isinstance(effect, DoT) else self._buffs
+
+    def __getitem__(self, effect: StatusEffect) -> int:
+        return self._get_timeline(effect).get_turns_left(effect)
+
+    def __setitem__(self, effect: StatusEffect, turns_left: int):
+        self._get_timeline(effect).schedule(effect, turns_left)
+
+    def __delitem__(self, effect: StatusEffect):
+        self._get_timeline(effect).remove(effect)
+
+    def __contains__(self, effect):
+        return effect in self._get_timeline(effect).expiry_turns
+
+    def __iter__(self):
+        yield from self._dots.expiry_turns
+        yield from self._buffs.expiry_turns
+
+    def __len__(self):
+        return len(self._dots.expiry_turns) + len(self._buffs.expiry_turns)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self.items())})'
+
+    def clear(self):
+        """ Removes every effect, reusing the timelines """
+        self._dots.clear()
+        self._buffs.clear()
+
+    def active_dots(self) -> [DoT]:
+        """ Returns a list of the DoTs which are active """
+        return list(self._dots.expiry_turns)
+
+    def tick_dots(self) -> [DoT]:
+        """ Pass a turn for the DoTs, returning the ones which have expired. They are not removed """
+        return self._dots.tick()
+
+    def tick_buffs(self) -> [StatusEffect]:
+        """ Pass a turn for the buffs, returning the ones which have expired. They are not removed """
+        return self._buffs.tick()
+
+
+class _EffectTimeline:
+    """ Holds effects by the turn they expire on """
+    def __init__(self):
+        self.turn = 0  # the count of turns that have passed
+        self.expiry_turns: {StatusEffect: int} = {}  # Key: StatusEffect, Value: the turn it expires on
+        # holds tuples of (expiry turn, insertion count, effect), where the insertion count keeps equal turns in order
+        # entries of effects which were removed or rescheduled are left in and skipped whenever they are popped
+        self._expiry_heap = []
+        self._insertion_count = 0
+        # Key: StatusEffect, Value: the insertion count of its current heap entry, as an effect which is rescheduled
+        # on the same turn it expires on has two entries of the same expiry turn
+        self._scheduled_entries: {StatusEffect: int} = {}
+
+    def clear(self):
+        self.turn = 0
+        self.expiry_turns.clear()
+        self._expiry_heap.clear()
+        self._insertion_count = 0
+        self._scheduled_entries.clear()
+
+    def get_turns_left(self, effect: StatusEffect) -> int:
+        return self.expiry_turns[effect] - self.turn
+
+    def schedule(self, effect: StatusEffect, turns_left: int):
+        expiry_turn = self.turn + turns_left
+        self.expiry_turns[effect] = expiry_turn
+        self._insertion_count += 1
+        self._scheduled_entries[effect] = self._insertion_count
+        heapq.heappush(self._expiry_heap, (expiry_turn, self._insertion_count, effect))
+
+        if len(self._expiry_heap) > 2 * len(self.expiry_turns) + 16:  # too many skipped entries, rebuild the heap
+            self._expiry_heap = [entry for entry in self._expiry_heap if self._is_valid(entry)]
+            heapq.heapify(self._expiry_heap)
+
+    def remove(self, effect: StatusEffect):
+        del self.expiry_turns[effect]
+        del self._scheduled_entries[effect]
+
+    def tick(self) -> [StatusEffect]:
+        self.turn += 1
+        expired_effects = []
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= self.turn:
+            entry = heapq.heappop(self._expiry_heap)
+            if self._is_valid(entry):
+                expired_effects.append(entry[2])
+
+        return expired_effects
+
+    def _is_valid(self, heap_entry: tuple) -> bool:
+        """ Check if the heap entry is still the one that the effect is scheduled by """
+        _, insertion_count, effect = heap_entry
+        return self._scheduled_entries.get(effect) == insertion_count
@@ -1,11 +1,12 @@
 import random
+from copy import copy
 
-from damage import Damage
+from damage import Damage, HitResult
 from decorators import cast_spell
-from entities import Character, Monster, CHARACTER_DEFAULT_EQUIPMENT
+from entities import Character, Monster
 from heal import HolyHeal
-from models.spells.loader import load_paladin_spells_for_level
-from spells import PaladinSpell
+from information_printer import combat_log
+from spells import PaladinSpell, Spellbook
 
 
 class Paladin(Character):
@@ -15,31 +16,35 @@ class Paladin(Character):
             Seal of Righteousness
                 Deals X damage on each attack, needs to be activated first
     """
-    # TODO: Storing the spells here will be a problem if we ever want to have 2 simultaneous players or
-    #       the ability to load another character without exiting the game.
-    learned_spells: {str: PaladinSpell} = {}
-    SOR_ACTIVE = False  # Seal of Righteousness trigger
-    SOR_TURNS = 0  # Holds the remaining turns for SOR
     KEY_FLASH_OF_LIGHT = "Flash of Light"
     KEY_SEAL_OF_RIGHTEOUSNESS = "Seal of Righteousness"
     KEY_MELTING_STRIKE = "Melting Strike"
 
     def __init__(self, name: str, level: int = 1, health: int = 12, mana: int = 15, strength: int = 4,
-                 loaded_scripts: set=set(), killed_monsters: set=set(), completed_quests: set=(),
-                 saved_inventory: dict={"gold": 0}, saved_equipment: dict=CHARACTER_DEFAULT_EQUIPMENT):
+                 loaded_scripts: set=None, killed_monsters: set=None, completed_quests: set=None,
+                 saved_inventory: dict=None, saved_equipment: dict=None):
+        # the spells have to be set before the Character's init, because leveling up there learns spells
+        self.learned_spells: {str: PaladinSpell} = {}
+        self.spell_commands: frozenset = frozenset()  # the commands of the spells available for the level
+        self.SOR_ACTIVE = False  # Seal of Righteousness trigger
+        self.SOR_TURNS = 0  # Holds the remaining turns for SOR
         super().__init__(name=name, level=level, health=health, mana=mana, strength=strength, loaded_scripts=loaded_scripts,
                          killed_monsters=killed_monsters, completed_quests=completed_quests,
                          saved_inventory=saved_inventory, saved_equipment=saved_equipment)
         # TODO: Equip items AFTER level up
         self.min_damage = 1
         self.max_damage = 3
-        self._lookup_and_handle_new_spells()
+
+    @property
+    def spellbook(self) -> Spellbook:
+        """ The spellbook shared by every paladin """
+        return Spellbook.get_spellbook(self.get_class())
 
     def end_turn_update(self):
         super().end_turn_update()
         if self.SOR_TURNS == 0:  # fade spell
             self.SOR_ACTIVE = False
-            print(f'{self.KEY_SEAL_OF_RIGHTEOUSNESS} has faded from {self.name}')
+            combat_log.info(f'{self.KEY_SEAL_OF_RIGHTEOUSNESS} has faded from {self.name}')
 
     def leave_combat(self):
         super().leave_combat()
@@ -51,26 +56,27 @@ class Paladin(Character):
         Resets the cooldown of every spell
         Typically called when we leave combat
         """
-        for spell in self.learned_spells.values():
-            spell.reset_cd()
+        self.spell_cooldowns.reset()
 
     def _level_up(self, to_level: int=0, to_print: bool=True):
         """
         This method levels the character up, if we're given a to_level we need to level up until we get to that level
+        and learns the spells of every level he has gained
         """
-        if to_level:
-            super()._level_up(to_level=to_level, to_print=to_print)
-        else:
-            super()._level_up(to_print=to_print)
-            self._lookup_and_handle_new_spells()
+        from_level = self.level
+        super()._level_up(to_level=to_level, to_print=to_print)
+        self._lookup_and_handle_new_spells(from_level=from_level + 1)
+        self.spell_commands = self.spellbook.get_available_commands(self.level)
 
-    def _lookup_and_handle_new_spells(self):
+    def _lookup_and_handle_new_spells(self, from_level: int=0):
         """
         This method looks up all the new available spells to learn or update their ranks and does so
         accordingly
+        :param from_level: look up the spells of every level from this one up to the character's level,
+                           only the character's level by default
         """
         for available_spell in self._lookup_available_spells_to_learn(
-                self.level):  # generator that returns dictionaries holding spell attributes
+                from_level or self.level, self.level):  # generator that returns PaladinSpell objects
 
             # update spell rank
             if available_spell.name in self.learned_spells:
@@ -84,11 +90,12 @@ class Paladin(Character):
 
         self.learned_spells[spell.name] = spell
 
-    def _lookup_available_spells_to_learn(self, level: int) -> [PaladinSpell]:
+    def _lookup_available_spells_to_learn(self, level: int, to_level: int=0) -> [PaladinSpell]:
         """
         Generator function yielding from a list of PaladinSpells that the character can learn
+        :param to_level: if given, yield the spells of every level from level to to_level
         """
-        yield from load_paladin_spells_for_level(level)
+        yield from self.spellbook.get_spells_for_level_range(level, to_level or level)
 
     def update_spell(self, spell: PaladinSpell):
         spell_name = spell.name
@@ -96,10 +103,11 @@ class Paladin(Character):
         print(f'Spell {spell.name} has been updated to rank {spell.rank}!')
         print("*" * 20)
 
-    def spell_handler(self, command: str, target: Monster) -> bool:
+    def spell_handler(self, command: str, target: Monster, splash_targets: [Monster]=()) -> bool:
         """
         :param target: The target the spell is cast on
         :param command: Command telling you which spell to use
+        :param splash_targets: The other monsters the character is fighting, which his damaging spells hit as well
         :return: Returns a boolean indicating if the cast was successful or not
         """
         if command == 'sor':
@@ -107,7 +115,8 @@ class Paladin(Character):
         elif command == 'fol':
             return self.spell_flash_of_light(self.learned_spells[self.KEY_FLASH_OF_LIGHT])
         elif command == 'ms':
-            return self.spell_melting_strike(spell=self.learned_spells[self.KEY_MELTING_STRIKE], target=target)
+            return self.spell_melting_strike(spell=self.learned_spells[self.KEY_MELTING_STRIKE], target=target,
+                                             splash_targets=splash_targets)
 
         print("Unsuccessful cast")
         return False  # if we do not go into any spell
@@ -124,7 +133,7 @@ class Paladin(Character):
 
         self.SOR_ACTIVE = True
         self.SOR_TURNS = 3
-        print(f'{self.name} activates {self.KEY_SEAL_OF_RIGHTEOUSNESS}!')
+        combat_log.info(f'{self.name} activates {self.KEY_SEAL_OF_RIGHTEOUSNESS}!')
         return True
 
     def _spell_seal_of_righteousness_attack(self):
@@ -145,32 +154,35 @@ class Paladin(Character):
 
         if self.health > self.max_health:  # check for overheal
             overheal = self._handle_overheal()
-            print(f'{spell.name} healed {self.name} for {heal-overheal:.2f} ({overheal:.2f} Overheal).')
+            combat_log.info(f'{spell.name} healed {self.name} for {heal-overheal:.2f} ({overheal:.2f} Overheal).')
         else:
-            print(f'{spell.name} healed {self.name} for {heal}.')
+            combat_log.info(f'{spell.name} healed {self.name} for {heal}.')
 
         return True
 
     @cast_spell
-    def spell_melting_strike(self, spell: PaladinSpell, target: Monster):
+    def spell_melting_strike(self, spell: PaladinSpell, target: Monster, splash_targets: [Monster]=()):
         """ Damages the enemy for DAMAGE_1 damage and puts a DoT effect, the index of which is EFFECT
+        When fighting a group of monsters, every one of them (splash_targets) is hit the same way
         :return successful cast or not"""
         mana_cost: int = spell.mana_cost
         damage: Damage = Damage(phys_dmg=spell.damage1)
-        dot: 'DoT' = spell.harmful_effect
+        dot: 'DoT' = copy(spell.harmful_effect)  # the spell's DoT is shared between every paladin
         dot.update_caster_level(self.level)
 
         self.mana -= mana_cost
-        # damage the target and add the DoT
-        print(f'{spell.name} damages {target.name} for {damage}!')
-        target.take_attack(damage, self.level)
-        target.add_buff(dot)
+        # damage the targets and add the DoT
+        for monster in (target, *splash_targets):
+            combat_log.info(f'{spell.name} damages {monster.name} for {damage}!')
+            monster.take_attack(damage, self.level)
+            monster.add_buff(dot)
 
         return True
 
     # SPELLS
 
-    def get_auto_attack_damage(self, target_level: int) -> (Damage, int):
+    def _roll_auto_attack_damage(self, target_level: int) -> (float, float):
+        """ Returns the physical damage of an auto attack and the magical damage of Seal of Righteousness """
         level_difference = self.level - target_level
         percentage_mod = (abs(level_difference) * 0.1)  # calculates by how many % we're going to increase/decrease dmg
 
@@ -188,22 +200,20 @@ class Paladin(Character):
             damage_to_deal += damage_to_deal * percentage_mod  # +X%
             sor_damage += sor_damage * percentage_mod
 
-        return Damage(phys_dmg=damage_to_deal, magic_dmg=sor_damage), sor_damage
+        return damage_to_deal, sor_damage
 
     def attack(self, victim: Monster):
-        attacker_swing: (Damage, int) = self.get_auto_attack_damage(victim.level)
-
-        auto_attack: Damage = attacker_swing[0]  # type: Damage
         # the sor_damage below is used just to check for printing
-        sor_damage: int = attacker_swing[1]  # if the seal isn't active the damage will be 0
+        damage_to_deal, sor_damage = self._roll_auto_attack_damage(victim.level)  # sor_damage is 0 if it isn't active
+        # resolve the hit once, both for printing and dealing it
+        hit: HitResult = victim.resolve_hit(damage_to_deal, sor_damage, self.level)
 
-        auto_attack_print = victim.get_take_attack_damage_repr(auto_attack, self.level)
         if sor_damage:
-            print(f'{self.name} attacks {victim.name} for {auto_attack_print} from {self.KEY_SEAL_OF_RIGHTEOUSNESS}!')
+            combat_log.info(f'{self.name} attacks {victim.name} for {hit} from {self.KEY_SEAL_OF_RIGHTEOUSNESS}!')
         else:
-            print(f'{self.name} attacks {victim.name} for {auto_attack_print}!')
+            combat_log.info(f'{self.name} attacks {victim.name} for {hit}!')
 
-        victim.take_attack(auto_attack, self.level)
+        victim.apply_hit(hit)
 
     def get_class(self):
         """
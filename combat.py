@@ -1,23 +1,75 @@
 from time import sleep
 
-from command_router import route_in_combat_non_ending_turn_commands
+from auto_combat import AutoCombat, parse_auto_combat_policy
 from commands import pac_looting, get_available_paladin_abilities
 from command_handler import prompt_revive
+from encounter import Encounter, CommandController, attack_target_controller
 from entities import Character, Monster
 from information_printer import print_loot_table
 
 
+CHARACTER_TEAM = 'character'
+MONSTERS_TEAM = 'monsters'
+
+
+class PlayerController(CommandController):
+    """
+    Controls the player's character in a fight through the commands he types, until he types an auto command
+    (see auto_combat.py), after which the rest of his turns are taken by its policy rather than read
+    """
+    def __init__(self):
+        super().__init__()
+        self.auto_combat: AutoCombat = None
+
+    def __call__(self, encounter: Encounter, character: Character):
+        if self.auto_combat is not None:
+            self.take_command(encounter, character, self.auto_combat.next_command())
+        else:
+            super().__call__(encounter, character)
+
+    def take_command(self, encounter: Encounter, character: Character, command: str) -> bool:
+        auto_combat_policy = parse_auto_combat_policy(command)
+        if auto_combat_policy is not None and self.auto_combat is None:
+            self.auto_combat = AutoCombat(auto_combat_policy, character, encounter.get_enemies(character))
+            self.auto_combat.start()
+            command = self.auto_combat.next_command()
+
+        return super().take_command(encounter, character, command)
+
+    def finish(self):
+        """ Print the summary of the auto combat, if the player has started one """
+        if self.auto_combat is not None:
+            self.auto_combat.finish()
+
+
+def run_player_encounter(character: Character, monsters: [Monster]):
+    """
+    Run the fight of the player's character against the monsters through an Encounter (see encounter.py),
+    the character's turns are taken by the player's commands and the monsters auto attack him.
+    Every participant takes his turns in the order of his initiative.
+    """
+    encounter = Encounter()
+    controller = PlayerController()
+    encounter.add_participant(character, CHARACTER_TEAM, controller)
+    for monster in monsters:
+        encounter.add_participant(monster, MONSTERS_TEAM, attack_target_controller)
+
+    try:
+        encounter.run()
+    finally:
+        controller.finish()
+
+
 def engage_combat(character: Character, monster: Monster, alive_monsters: dict, guid_name_set: set, monster_GUID: int):
     """
-    This is where we handle the turn based combat of the game
-    available_spells - set of string commands that enable our character to use the spells he has available.
-
-    First we get both parties to enter combat. We start the loop and have the monster attack and
-    immediately check if the character is not dead from the blow.
-    If not, we take his command and if said command is one that does not end the turn (ie. wants to print some
-    information about the fight) we enter an inner loop handling such commands and
-    which continues to take commands until it gets one that does end the turn.
-    We handle the command (which is most likely a spell or auto attack) and check if the monster is dead.
+    This is where we handle the turn based combat of the game, against a single monster.
+
+    Both parties take their turns in the order of their initiative (see run_player_encounter) until one of them dies.
+    On his turn, the character takes a command and if said command is one that does not end the turn
+    (ie. wants to print some information about the fight), it is handled and another command is taken until one
+    that does end the turn comes (which is most likely a spell or auto attack).
+    Once the player types an auto command (see auto_combat.py), the rest of the character's commands are picked by
+    its policy rather than read, with the messages of the fight's turns muted until a summary of it is printed at its end.
     :param character: the player
     :param monster: the monster that the player has attacked
     Parameters below are used solely to delete the monster from the dict & set once he's dead
@@ -25,58 +77,17 @@ def engage_combat(character: Character, monster: Monster, alive_monsters: dict,
     :param guid_name_set: Set which holds the name of each monster_GUID
     :param monster_GUID: The monster GUID
     """
-    # Load all of the currently available spells for our character
-    available_spells: set() = get_available_spells(character)
-    will_end_turn = True  # Dictates if we are going to count the iteration of the loop as a turn
-
-    character.enter_combat()
-    monster.enter_combat()
     if monster.gossip:  # if the monster has gossip
         monster.say_gossip()
         sleep(2)
 
-    while character.is_in_combat():
-        # We start off the combat with the monster dealing the first blow
-        if not will_end_turn:  # skip attack if the turn has not ended
-            # skip turn based things
-            will_end_turn = True
-        else:
-            monster.start_turn_update()
-            character.start_turn_update()
-
-            if monster.is_alive():
-                monster.attack(character)
-            else:  # monster has died, most probably from a DoT
-                handle_monster_death(character, monster, alive_monsters, guid_name_set, monster_GUID)
-                break
+    run_player_encounter(character, [monster])
 
-        if not character.is_alive():
-            monster.leave_combat()
-            print(f'{monster.name} has slain character {character.name}')
-
-            prompt_revive(character)
-            break
-
-        command = input()
-        # check if the command does not end the turn, if it doesn't the same command gets returned
-        command = route_in_combat_non_ending_turn_commands(command, character, monster)
-
-        if command == 'attack':
-            character.attack(monster)
-        elif command in available_spells:
-            # try to execute the spell and return if it managed to or not
-            successful_cast = character.spell_handler(command, monster)
-            if not successful_cast:
-                # skip the next attack, don't count this iteration as a turn and load a command again
-                will_end_turn = False
-
-        if will_end_turn:
-            monster.end_turn_update()
-            character.end_turn_update()
-
-        if not monster.is_alive():
-            handle_monster_death(character, monster, alive_monsters, guid_name_set, monster_GUID)
-            break
+    if not monster.is_alive():  # most probably by the character, though a DoT might have killed it
+        handle_monster_death(character, monster, alive_monsters, guid_name_set, monster_GUID)
+    if not character.is_alive():
+        print(f'{monster.name} has slain character {character.name}')
+        prompt_revive(character)
 
 
 def handle_monster_death(character: Character, monster: Monster, alive_monsters: dict, guid_name_set: set, monster_GUID: int):
@@ -91,15 +102,94 @@ def handle_monster_death(character: Character, monster: Monster, alive_monsters:
     print(f'{character.name} has slain {monster.name}!')
 
     character.award_monster_kill(monster=monster, monster_guid=monster_GUID)
-    character.leave_combat()  # will exit the combat loop on next iter
 
     del alive_monsters[monster_GUID]  # removes the monster from the dictionary
     guid_name_set.remove((monster_GUID, monster.name))  # remove it from the set used for looking up
 
-    handle_loot(character, monster)
+    if character.is_alive():
+        handle_loot(character, monster)
 
 
-def handle_loot(character: Character, monster: Monster):
+def engage_group_combat(character: Character, monsters: {int: Monster}, alive_monsters: dict, guid_name_set: set):
+    """
+    This is where we handle the turn based combat against a group of monsters.
+    It goes like engage_combat, with every monster taking his own turn in the order of the initiatives.
+    The character's auto attacks hit his target - the first engaged monster that is still alive, while his damaging
+    spells hit every engaged monster. An auto command works as it does in engage_combat.
+    The monsters which have died are handled together once the fight is over (see handle_monster_deaths)
+    and their loot is pooled into a single loot window.
+    :param character: the player
+    :param monsters: Dictionary with the monsters that the player has engaged - Key: GUID, Value: Monster
+    Parameters below are used solely to delete the monsters from the dict & set once they're dead
+    :param alive_monsters: Dictionary with the alive monsters in the subzone the player is in
+    :param guid_name_set: Set which holds the name of each monster_GUID
+    """
+    for monster in monsters.values():
+        monster.say_gossip()
+
+    run_player_encounter(character, list(monsters.values()))
+
+    slain_monsters = {guid: monster for guid, monster in monsters.items() if not monster.is_alive()}
+    if slain_monsters:
+        handle_monster_deaths(character, slain_monsters, alive_monsters, guid_name_set)
+    if not character.is_alive():
+        monster_names = ', '.join(monster.name for monster in monsters.values() if monster.is_alive())
+        print(f'{monster_names} have slain character {character.name}')
+        prompt_revive(character)
+    elif slain_monsters:
+        handle_loot(character, LootPool(monsters.values()))
+
+
+def handle_monster_deaths(character: Character, slain_monsters: {int: Monster}, alive_monsters: dict,
+                          guid_name_set: set):
+    """
+    This function is called when a group of monsters has died in a fight, their kills are awarded together
+    :param slain_monsters: the monsters that have died - Key: GUID, Value: Monster
+    """
+    for monster_guid, monster in slain_monsters.items():
+        print(f'{character.name} has slain {monster.name}!')
+        del alive_monsters[monster_guid]
+        guid_name_set.remove((monster_guid, monster.name))
+
+    character.award_monster_kills(list(slain_monsters.items()))
+
+
+class LootPool:
+    """
+    The loot of a group of monsters, looted through a single loot window as if it had dropped from one monster.
+    Its gold is the sum of the monsters' gold and taking an item takes it from the first monster that has dropped it
+    """
+    def __init__(self, monsters: [Monster]):
+        self.monsters: [Monster] = list(monsters)
+
+    @property
+    def loot(self) -> dict:
+        pooled_loot = {}
+        gold = sum(monster.loot.get('gold', 0) for monster in self.monsters)
+        if gold:
+            pooled_loot['gold'] = gold
+        for monster in self.monsters:
+            for item_name, item in monster.loot.items():
+                if item_name != 'gold':
+                    pooled_loot.setdefault(item_name, item)
+
+        return pooled_loot
+
+    def give_loot(self, item_name: str):
+        """ Returns the looted item (or the summed gold) and removes it from the monsters' loot """
+        if item_name == 'gold':
+            gold = sum(monster.loot.pop('gold', 0) for monster in self.monsters)
+            return gold or False
+
+        for monster in self.monsters:
+            if item_name in monster.loot:
+                return monster.give_loot(item_name)
+
+        print(f'The monsters did not drop {item_name}.')
+        return False
+
+
+def handle_loot(character: Character, monster: Monster or LootPool):
     """ Display the loot dropped from the monster and listen for input if the player wants to take any"""
     print_loot_table(monster.loot)
     while True:
@@ -113,14 +203,15 @@ def handle_loot(character: Character, monster: Monster):
                 character.award_gold(gold)
                 print(f'{character.name} has looted {gold} gold.')
 
-            monster_loot = list(monster.loot.keys())  # list of strings, the item's names
-            for item_name in monster_loot:
-                # loop through them and get every one
-                item: 'Item' = monster.give_loot(item_name=item_name)
+            while monster.loot:  # a loot pool shows a single one of the items which have the same name
+                monster_loot = list(monster.loot.keys())  # list of strings, the item's names
+                for item_name in monster_loot:
+                    # loop through them and get every one
+                    item: 'Item' = monster.give_loot(item_name=item_name)
 
-                if item:  # if the loot is successful
-                    character.award_item(item=item)
-                    print(f'{character.name} has looted {item_name}.')
+                    if item:  # if the loot is successful
+                        character.award_item(item=item)
+                        print(f'{character.name} has looted {item_name}.')
 
         elif "take" in command:
             item_name = command[5:]
@@ -7,8 +7,9 @@ from commands import pac_main_ooc, pac_map_directions, pac_in_combat, pac_vendor
 from information_printer import (print_live_npcs, print_live_monsters, print_quest_item_choices,
                                  print_available_quests, print_in_combat_stats, print_character_xp_bar,
                                  print_character_equipment, print_inventory)
-from constants import ZONE_MOVE_BLOCK_SPECIAL_KEY
+from constants import ZONE_MOVE_BLOCK_SPECIAL_KEY, ENCOUNTER_MAX_MONSTERS
 from utils.helper import get_guid_by_name
+from entities import monster_pool
 from information_printer import print_quest_log, print_vendor_products_for_sale
 # handlers here!
 
@@ -51,10 +52,44 @@ def handle_engage_command(command: str, character, zone_object: Zone):
     if target_guid in alive_monsters.keys():
         target = alive_monsters[target_guid]  # convert the string to a Monster object
         engage_combat(character, target, alive_monsters, guid_name_set, target_guid)
+        handle_dead_monster(target_guid, target, zone_object)
     else:
         print(f'Could not find creature {target}.')
 
 
+def handle_engage_all_command(command: str, character, zone_object: Zone):
+    """
+    This checks if there are hostile monsters with the name provided in the command.
+    If there are, we engage in combat with all of them (up to ENCOUNTER_MAX_MONSTERS) by going into the
+    engage_group_combat function in the combat.py module.
+    :param command: the player's command, like 'engage all Kobold Worker'
+    :param character: The player's character, a Character object
+    :param zone_object: a Zone object from which we will get the monsters
+    """
+    from combat import engage_group_combat
+
+    alive_monsters, guid_name_set = zone_object.get_cs_monsters()
+    target = command[11:]  # name of the monsters to engage
+
+    target_guids = sorted(guid for guid, name in guid_name_set if name == target)[:ENCOUNTER_MAX_MONSTERS]
+    if target_guids:
+        targets = {guid: alive_monsters[guid] for guid in target_guids}
+        engage_group_combat(character, targets, alive_monsters, guid_name_set)
+        for target_guid, target in targets.items():
+            handle_dead_monster(target_guid, target, zone_object)
+    else:
+        print(f'Could not find creature {target}.')
+
+
+def handle_dead_monster(monster_guid: int, monster, zone_object: Zone):
+    """ Once a fight is over, have the monster respawn if it is dead and respawnable or give it back to the pool """
+    if not monster.is_alive():
+        if monster.respawnable:
+            zone_object.schedule_respawn(monster_guid, monster)
+        else:
+            monster_pool.release(monster)
+
+
 def handle_accept_quest_command(command: str, character, available_quests: dict):
     quest_to_accept = command[7:]  # name of quest to accept
 
@@ -149,7 +184,7 @@ def handle_open_inventory_command(character):
 
             # failsafe check if the item is in the inventory of the player. if it's not it will return a None object,
             # which will not pass the if checks in the equip_item method
-            item, _ = character.inventory.get(item_name, (None, None))
+            item = character.inventory.get_item(item_name)
 
             character.equip_item(item)
         elif "use" in command:
@@ -158,7 +193,7 @@ def handle_open_inventory_command(character):
 
             # failsafe check if the item is in the inventory of the player. if it's not it will return a None object,
             # which will not pass the if checks in the consume_item method
-            item, _ = character.inventory.get(item_name, (None, None))
+            item = character.inventory.get_item(item_name)
 
             character.consume_item(item)
 
@@ -260,7 +295,7 @@ def handle_paq_command(zone_object, main_character):
 def handle_pql_command(main_character):
     """ this function handles the 'print quest log' or 'pql' command, showing the player all the quests he is
     currently on """
-    print_quest_log(main_character.quest_log)
+    print_quest_log(main_character)
 
 
 def handle_print_inventory_command(main_character):
@@ -12,7 +12,19 @@ def route_main_commands(main_character, zone_object):
     :param zone_object: A class object of Zone
     """
     command = input()
-    if command is '?':
+    route_main_command(command, main_character, zone_object)
+
+
+def route_main_command(command: str, main_character, zone_object):
+    """
+    Run the given command if it's a valid command.
+    This is separated from route_main_commands so that commands which do not come from the console
+    (i.e. ones forwarded to a zone shard) can be ran as well.
+    :param command: the player's command
+    :param main_character: A Character class object. This is basically the player
+    :param zone_object: A class object of Zone
+    """
+    if command == '?':
         ch.handle_help_command()
     elif command == 'save':
         ch.handle_save_character_command(main_character)
@@ -32,6 +44,8 @@ def route_main_commands(main_character, zone_object):
         ch.handle_talk_to_command(command, main_character, zone_object)
     elif 'buy from' in command:
         ch.handle_buy_from_command(command, main_character, zone_object)
+    elif command.startswith('engage all '):
+        ch.handle_engage_all_command(command, main_character, zone_object)
     elif 'engage' in command:
         ch.handle_engage_command(command, main_character, zone_object)
     elif 'accept' in command:  # accept the quest
@@ -50,7 +64,7 @@ def route_main_commands(main_character, zone_object):
 
 # IN COMBAT COMMANDS
 # COMMANDS THAT DO NOT END THE TURN
-def route_in_combat_non_ending_turn_commands(command: str, character, monster) -> str:
+def route_in_combat_non_ending_turn_commands(command: str, character, monster, read_command=None) -> str:
     """
     This function is called whenever the player sends a command while in combat.
     We go through this while loop to check if the command is any of the ones supported below.
@@ -60,6 +74,7 @@ def route_in_combat_non_ending_turn_commands(command: str, character, monster) -
     :param command: player's command
     :param character: Character object
     :param monster: Monster object
+    :param read_command: a function which returns the next command, input() by default
     :return:
     """
     while True:  # for commands that do not end the turn, like printing the stats or the possible commands
@@ -72,4 +87,4 @@ def route_in_combat_non_ending_turn_commands(command: str, character, monster) -
         else:
             return command
 
-        command = input()
+        command = read_command() if read_command is not None else input()
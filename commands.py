@@ -15,6 +15,8 @@ def pac_main_ooc():
     print("Available commands:")
     print("\tengage [Monster Name]")
     print("\t\tEngages in combat with the monster whose name you've entered.\n")
+    print("\tengage all [Monster Name]")
+    print("\t\tEngages in combat with every monster by that name around you (up to 5) at once.\n")
     print("\ttalk to [NPC Name]")
     print("\t\tTalks to the NPC.\n")
     print("\tbuy from [NPC Name]")
@@ -69,6 +71,9 @@ def pac_in_combat(character):
     print("Available commands that end the turn:")
     print("\tattack")
     print("\t\tAttacks the monster you are in combat with a meele swing.\n")
+    print("\tauto [sor] [heal [X]]")
+    print("\t\tFights the rest of the combat on its own and prints a summary of it - auto attacks only,")
+    print("\t\tkeeps Seal of Righteousness up (sor) and casts Flash of Light when below X% health (heal, 50 by default).\n")
     print_class_abilities_in_combat(character)
 
 
@@ -157,14 +162,5 @@ def get_available_paladin_abilities(character: Paladin):
     :param character:
     :return:
     """
-    available_spells = set()
-    available_spells.add('sor')
-
-    if "Flash of Light" in character.learned_spells.keys():
-        available_spells.add('fol')
-
-    if "Melting Strike" in character.learned_spells.keys():
-        available_spells.add('ms')
-
-    return available_spells
+    return character.spell_commands  # looked up from the paladin's spellbook whenever he levels up
 #  ------------------------------PALADIN------------------------------
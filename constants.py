@@ -1,6 +1,7 @@
 """ This file holds constant variables """
 from models.creatures.creature_defaults.loader import load_creature_defaults
 from models.misc.loader import load_character_level_stats, load_character_xp_requirements
+from utils.helper import build_cumulative_level_stats, build_cumulative_xp_requirements
 
 
 ZONE_MOVE_BLOCK_SPECIAL_KEY = '$'
@@ -19,16 +20,33 @@ KEY_BONUS_MANA_ATTRIBUTE = 'bonus_mana'
 KEY_LEVEL_STATS_HEALTH = 'health'
 KEY_LEVEL_STATS_MANA = 'mana'
 
+# Key: the name of a paladin spell, Value: the command which casts it in combat
+PALADIN_SPELL_COMMANDS = {"Seal of Righteousness": 'sor', "Flash of Light": 'fol', "Melting Strike": 'ms'}
+
+MONSTER_RESPAWN_TURNS = 30  # the count of world turns after which a respawnable monster comes back to life
+ENCOUNTER_MAX_MONSTERS = 5  # the maximum count of monsters that can be engaged at once with 'engage all'
 MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD = 5  # a monster that is 5 levels lower than the character yields no XP
+# the bounds of the cache of recently loaded characters (see models/characters/loader.py)
+SAVED_CHARACTER_CACHE_MAX_COUNT, SAVED_CHARACTER_CACHE_MAX_BYTES = 256, 4 * 1024 * 1024
+SAVED_CHARACTER_ROSTER_PAGE_SIZE = 10  # the count of saved characters that are listed at a time when loading one
 
 CHAR_STARTER_ZONE, CHAR_STARTER_SUBZONE = "Northshire Abbey", "Northshire Valley"
 CHAR_ATTRIBUTES_TEMPLATE = {KEY_STRENGTH_ATTRIBUTE: 0, KEY_ARMOR_ATTRIBUTE: 0,
                             KEY_AGILITY_ATTRIBUTE: 0, KEY_BONUS_HEALTH_ATTRIBUTE: 0,
                             KEY_BONUS_MANA_ATTRIBUTE: 0}
+# the layers of modifiers that make up a character's attributes (see Character.stat_layers)
+KEY_STAT_LAYER_BASE = 'base'  # the stats the character starts off with, before any level
+KEY_STAT_LAYER_LEVEL = 'level'  # the stats gained from leveling up
+KEY_STAT_LAYER_GEAR = 'gear'  # the attributes of the equipped weapon and equipment
+KEY_STAT_LAYER_BUFFS = 'buffs'  # the attributes of the active beneficial buffs
 # these functions run only once due to a decorator
 CREATURE_DEFAULT_VALUES = load_creature_defaults()
 CHARACTER_LEVELUP_BONUS_STATS = load_character_level_stats()
 CHARACTER_LEVEL_XP_REQUIREMENTS = load_character_xp_requirements()
+# prefix sums of the two tables above, used to level a character up through multiple levels at once
+CHARACTER_CUMULATIVE_LEVELUP_STATS = build_cumulative_level_stats(CHARACTER_LEVELUP_BONUS_STATS)
+CHARACTER_CUMULATIVE_XP_REQUIREMENTS = build_cumulative_xp_requirements(CHARACTER_LEVEL_XP_REQUIREMENTS)
+CHARACTER_MAXIMUM_LEVEL = max(CHARACTER_LEVELUP_BONUS_STATS)
 
 CHARACTER_EQUIPMENT_HEADPIECE_KEY = 'headpiece'
 CHARACTER_EQUIPMENT_SHOULDERPAD_KEY = 'shoulderpad'
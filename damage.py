@@ -1,10 +1,13 @@
 """
 This module will hold the damage class in the game.
 """
+from collections import namedtuple
 
 
 class Damage:
     """ This class holds the damage of every character/monster in the game"""
+    __slots__ = ('phys_dmg', 'magic_dmg', 'phys_absorbed', 'magic_absorbed')
+
     def __init__(self, phys_dmg: float=0, magic_dmg: float=0):
         self.phys_dmg = round(phys_dmg, 1)
         self.magic_dmg = round(magic_dmg, 1)
@@ -15,33 +18,7 @@ class Damage:
                 and self.phys_absorbed == other.phys_absorbed and self.magic_absorbed == other.magic_absorbed
 
     def __str__(self):
-        """
-        Have two separate strings for physical damage and magical damage.
-        Fill them if we have such damages and modify them if there is absorption
-        Then, return what's appropriate
-        """
-        phys_dmg_print = ""
-        if self.phys_dmg:
-            phys_dmg_print = f'{self.phys_dmg:.2f} physical damage'
-
-        if self.phys_absorbed:
-            phys_dmg_print = f'{self.phys_dmg:.2f} physical damage ({self.phys_absorbed:.2f} absorbed)'
-
-        magic_dmg_print = ""
-        if self.magic_dmg:
-            magic_dmg_print = f'{self.magic_dmg:.2f} magical damage'
-
-        if self.magic_absorbed:
-            magic_dmg_print = f'{self.magic_dmg:.2f} magical damage ({self.magic_absorbed:.2f} absorbed)'
-
-        if phys_dmg_print and magic_dmg_print:
-            return f'{phys_dmg_print} and {magic_dmg_print}'
-        elif phys_dmg_print:
-            return phys_dmg_print
-        elif magic_dmg_print:
-            return magic_dmg_print
-        else:
-            return "0 damage"
+        return format_damage(self.phys_dmg, self.magic_dmg, self.phys_absorbed, self.magic_absorbed)
 
     def __sub__(self, other):
         return (self.phys_dmg + self.magic_dmg) - other
@@ -108,3 +85,86 @@ class Damage:
             absorption_shield = 0
 
         return absorption_shield
+
+
+class HitResult(namedtuple('HitResult', ['phys_dmg', 'magic_dmg', 'phys_absorbed', 'magic_absorbed',
+                                         'absorption_shield'])):
+    """
+    The outcome of a single hit on a target, as computed by resolve_hit.
+    absorption_shield is what is left of the target's shield after the hit.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return format_damage(self.phys_dmg, self.magic_dmg, self.phys_absorbed, self.magic_absorbed)
+
+    @property
+    def total(self) -> float:
+        """ The damage that the target's health takes """
+        return self.phys_dmg + self.magic_dmg
+
+    def to_damage(self) -> Damage:
+        """ Materialize the hit as a Damage object """
+        damage = Damage()
+        damage.phys_dmg, damage.magic_dmg = self.phys_dmg, self.magic_dmg
+        damage.phys_absorbed, damage.magic_absorbed = self.phys_absorbed, self.magic_absorbed
+        return damage
+
+
+def resolve_hit(phys_dmg: float, magic_dmg: float, armor: int, attacker_level: int,
+                absorption_shield: float) -> HitResult:
+    """
+    Resolve a hit on a target in a single pass, without creating intermediate Damage objects.
+    Gives the same result as reducing the physical damage of Damage(phys_dmg, magic_dmg) by the armor
+    and then going through Damage.handle_absorption.
+    :param armor: the target's armor, the physical damage is reduced by Armor / (Armor + 400 + 85 * Attacker_Level)
+    :param absorption_shield: the target's absorption shield, the magical damage always gets absorbed first
+    """
+    phys_dmg, magic_dmg = round(phys_dmg, 1), round(magic_dmg, 1)
+    if phys_dmg:
+        phys_dmg = round(phys_dmg - phys_dmg * (armor / (armor + 400 + 85 * attacker_level)), 1)
+
+    phys_absorbed, magic_absorbed = 0, 0
+    if absorption_shield:
+        if absorption_shield >= magic_dmg:
+            absorption_shield -= magic_dmg
+            magic_absorbed, magic_dmg = magic_dmg, 0
+
+            phys_absorbed = min(phys_dmg, absorption_shield)
+            absorption_shield = max(absorption_shield - phys_dmg, 0)
+            phys_dmg = max(phys_dmg - phys_absorbed, 0)
+        else:
+            magic_dmg -= absorption_shield
+            magic_absorbed, absorption_shield = absorption_shield, 0
+
+    return HitResult(phys_dmg, magic_dmg, phys_absorbed, magic_absorbed, absorption_shield)
+
+
+def format_damage(phys_dmg: float, magic_dmg: float, phys_absorbed: float=0, magic_absorbed: float=0) -> str:
+    """
+    Have two separate strings for physical damage and magical damage.
+    Fill them if we have such damages and modify them if there is absorption
+    Then, return what's appropriate
+    """
+    phys_dmg_print = ""
+    if phys_dmg:
+        phys_dmg_print = f'{phys_dmg:.2f} physical damage'
+
+    if phys_absorbed:
+        phys_dmg_print = f'{phys_dmg:.2f} physical damage ({phys_absorbed:.2f} absorbed)'
+
+    magic_dmg_print = ""
+    if magic_dmg:
+        magic_dmg_print = f'{magic_dmg:.2f} magical damage'
+
+    if magic_absorbed:
+        magic_dmg_print = f'{magic_dmg:.2f} magical damage ({magic_absorbed:.2f} absorbed)'
+
+    if phys_dmg_print and magic_dmg_print:
+        return f'{phys_dmg_print} and {magic_dmg_print}'
+    elif phys_dmg_print:
+        return phys_dmg_print
+    elif magic_dmg_print:
+        return magic_dmg_print
+    else:
+        return "0 damage"
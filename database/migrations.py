@@ -0,0 +1,73 @@
+"""
+This module upgrades a database created by an older version of the game to the current schema.
+Every upgrade checks whether it is needed by itself, so that upgrade_database can be ran on any database,
+any number of times. It is ran on startup (see main.py) and can also be ran on its own:
+    python -m database.migrations [path to the database]
+
+The upgrades, in the order they are applied:
+    packed character progress - the killed monsters and loaded scripts of a saved character used to be held
+        in a row per GUID/script in the saved_character_killed_monsters and saved_character_loaded_scripts tables.
+        They are packed into the packed_killed_monsters and packed_loaded_scripts columns of saved_character
+        (see models/characters/saved_character.py) and the old tables are dropped.
+        Rows of characters that do not exist are dropped along with them.
+"""
+import sqlite3
+import sys
+
+from database.database_info import DB_PATH
+from utils.guid_set import GuidSet
+
+OLD_KILLED_MONSTERS_TABLE_NAME = 'saved_character_killed_monsters'
+OLD_LOADED_SCRIPTS_TABLE_NAME = 'saved_character_loaded_scripts'
+
+
+def upgrade_database(db_path: str=DB_PATH):
+    connection = sqlite3.connect(db_path)
+    try:
+        with connection:  # a single transaction, rolled back if any upgrade fails
+            upgrade_packed_character_progress(connection)
+    finally:
+        connection.close()
+
+
+def upgrade_packed_character_progress(connection: sqlite3.Connection):
+    columns = {row[1] for row in connection.execute('PRAGMA table_info(saved_character)')}
+    if not columns:
+        return  # the saved_character table itself is not there, there is nothing to upgrade
+    if 'packed_killed_monsters' not in columns:
+        connection.execute('ALTER TABLE saved_character ADD COLUMN packed_killed_monsters BLOB')
+    if 'packed_loaded_scripts' not in columns:
+        connection.execute('ALTER TABLE saved_character ADD COLUMN packed_loaded_scripts TEXT')
+
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    characters = {entry: (packed_killed_monsters, packed_loaded_scripts)
+                  for entry, packed_killed_monsters, packed_loaded_scripts
+                  in connection.execute('SELECT entry, packed_killed_monsters, packed_loaded_scripts '
+                                        'FROM saved_character')}
+
+    if OLD_KILLED_MONSTERS_TABLE_NAME in tables:
+        # Key: the character's entry, Value: his killed monsters, starting off with the ones already packed
+        killed_monsters = {entry: GuidSet.from_packed(packed_killed_monsters)
+                           for entry, (packed_killed_monsters, _) in characters.items()}
+        for entry, guid in connection.execute(f'SELECT saved_character_id, GUID '
+                                              f'FROM {OLD_KILLED_MONSTERS_TABLE_NAME}'):
+            if entry in killed_monsters and guid is not None:
+                killed_monsters[entry].add(guid)
+        connection.executemany('UPDATE saved_character SET packed_killed_monsters = ? WHERE entry = ?',
+                               ((guids.pack(), entry) for entry, guids in killed_monsters.items()))
+        connection.execute(f'DROP TABLE {OLD_KILLED_MONSTERS_TABLE_NAME}')
+
+    if OLD_LOADED_SCRIPTS_TABLE_NAME in tables:
+        loaded_scripts = {entry: set(packed_loaded_scripts.split('\n')) if packed_loaded_scripts else set()
+                          for entry, (_, packed_loaded_scripts) in characters.items()}
+        for entry, script_name in connection.execute(f'SELECT saved_character_id, script_name '
+                                                     f'FROM {OLD_LOADED_SCRIPTS_TABLE_NAME}'):
+            if entry in loaded_scripts and script_name:
+                loaded_scripts[entry].add(script_name)
+        connection.executemany('UPDATE saved_character SET packed_loaded_scripts = ? WHERE entry = ?',
+                               (('\n'.join(sorted(scripts)), entry) for entry, scripts in loaded_scripts.items()))
+        connection.execute(f'DROP TABLE {OLD_LOADED_SCRIPTS_TABLE_NAME}')
+
+
+if __name__ == '__main__':
+    upgrade_database(sys.argv[1] if len(sys.argv) > 1 else DB_PATH)
@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+
+
 def cast_spell(func):
     """
     Wraps a function that is tied to a spell cast.
@@ -19,11 +22,11 @@ def cast_spell(func):
             print(f'Not enough mana! {spell.name} requires {mana_cost} but you have {self.mana}!')
             return False
 
-        # proceed with casting the spell and start its cooldown timer
-        is_ready = spell.cast()
-        if not is_ready:
+        if not self.spell_cooldowns.is_ready(spell.name):
             print(f'{spell.name} is still on cooldown!')
             return False
+        # proceed with casting the spell and start its cooldown timer
+        self.spell_cooldowns.start_cooldown(spell)
 
         return func(*args, **kwargs)
     return decorator
@@ -47,7 +50,7 @@ def has_item_in_stock(func):
     has the item in his self.inventory dictionary
     """
     def decorate(self, item_name: str, *args, **kwargs):
-        if (not hasattr(self, 'name') or not hasattr(self, 'inventory') or not isinstance(self.inventory, dict)
+        if (not hasattr(self, 'name') or not hasattr(self, 'inventory') or not isinstance(self.inventory, Mapping)
            or not hasattr(self, 'has_item') or not callable(self.has_item)):
             raise Exception('The has_item_in_stock decorator expects the self parameter to be an instance of VendorNPC!')
         if not self.has_item(item_name):
@@ -0,0 +1,209 @@
+"""
+This module holds the Encounter - a turn engine for a fight between any number of participants split into teams,
+like a party of characters against a group of monsters.
+Every participant takes his turns in the order of his initiative and what he does on his turn is decided
+by his controller - a human typing commands, a script of commands or an AI policy.
+"""
+import heapq
+import random
+from collections import deque
+from itertools import count
+
+from command_router import route_in_combat_non_ending_turn_commands
+from constants import KEY_AGILITY_ATTRIBUTE
+from entities import LivingThing
+
+
+class Participant:
+    """ A living thing taking part in an encounter """
+    def __init__(self, living_thing: LivingThing, team: str, controller, initiative: int):
+        """
+        :param controller: a function which receives the encounter and the living thing and acts on his turn
+        :param initiative: the higher it is, the earlier in the round he takes his turn
+        """
+        self.living_thing = living_thing
+        self.team = team
+        self.controller = controller
+        self.initiative = initiative
+        self.is_slain = False  # whether his death has been recorded in Encounter.slain
+
+
+class Encounter:
+    """
+    The turns are held in a priority queue, ordered by the round they are due on and then by the initiative of the
+    participant, so that a round goes through the participants from the highest initiative to the lowest one.
+    Once a participant has taken his turn, his next one is queued for the next round, while a participant who has died
+    is dropped out of the queue when his turn comes up.
+    A participant who joins in the middle of a round (i.e. a monster called for help) takes his first turn
+    on the next one.
+
+    Every turn of the fights in combat.py (engage_combat, engage_group_combat) goes through it:
+        the participant's start of the turn updates (DoT ticks, spell cooldowns)
+        his action, taken by his controller, if he is still alive and has someone to fight
+        the participant's end of the turn updates (buff durations)
+    """
+    def __init__(self, rng: random.Random=None):
+        """
+        :param rng: the random generator for the initiative rolls, given to have an encounter play out the same.
+            The shared one of the random module by default, so that seeding it (i.e. main.py --seed) covers them
+        """
+        self.rng = rng if rng is not None else random
+        self.round = 0
+        self.participants: [Participant] = []
+        self._participants_by_thing: {int: Participant} = {}  # Key: the id() of the living thing
+        # Key: the team's name, Value: its participants in the order they have joined, the ones at the front are
+        # dropped once they are dead, so that the first living one is found without going through the dead ones
+        self._teams: {str: deque} = {}
+        self.slain: [LivingThing] = []  # the participants that have died, in the order of the rounds they died on
+        self._turn_queue: [(int, int, int, Participant)] = []  # a heap of (round, -initiative, queue order, participant)
+        self._queue_order = count()  # breaks the ties between equal initiatives
+
+    def add_participant(self, living_thing: LivingThing, team: str, controller, initiative: int=None) -> Participant:
+        """
+        :param team: the name of the participant's team, every participant from another team is his enemy
+        :param initiative: rolled through roll_initiative if it is not given
+        """
+        if initiative is None:
+            initiative = self.roll_initiative(living_thing)
+        participant = Participant(living_thing, team, controller, initiative)
+        self.participants.append(participant)
+        self._participants_by_thing[id(living_thing)] = participant
+        self._teams.setdefault(team, deque()).append(participant)
+        self._queue_turn(participant, self.round + 1)
+        if self.round:
+            living_thing.enter_combat()
+
+        return participant
+
+    def roll_initiative(self, living_thing: LivingThing) -> int:
+        """ A d20 roll plus the level and agility of the living thing """
+        return self.rng.randint(1, 20) + living_thing.level + living_thing.attributes.get(KEY_AGILITY_ATTRIBUTE, 0)
+
+    def get_enemies(self, living_thing: LivingThing) -> [LivingThing]:
+        """ Returns the living participants of every other team """
+        team = self._get_team(living_thing)
+        return [participant.living_thing for participant in self.participants
+                if participant.team != team and participant.living_thing.is_alive()]
+
+    def get_target(self, living_thing: LivingThing) -> LivingThing or None:
+        """ Returns the first enemy who is still alive, None if there is no such one """
+        team = self._get_team(living_thing)
+        for other_team, members in self._teams.items():
+            if other_team == team:
+                continue
+            while members and not members[0].living_thing.is_alive():
+                members.popleft()
+            if members:
+                return members[0].living_thing
+
+        return None
+
+    def get_living_teams(self) -> {str}:
+        return {participant.team for participant in self.participants if participant.living_thing.is_alive()}
+
+    def is_over(self) -> bool:
+        """ The encounter is over once a single team (or none) has anyone alive """
+        return len(self.get_living_teams()) <= 1
+
+    def run(self, max_rounds: int=None) -> str or None:
+        """
+        Run rounds until the encounter is over
+        :param max_rounds: stop after this many rounds even if the encounter is not over
+        :return: the name of the winning team, None if nobody has won
+        """
+        for participant in self.participants:
+            participant.living_thing.enter_combat()
+
+        while not self.is_over() and (max_rounds is None or self.round < max_rounds):
+            self.run_round()
+
+        for participant in self.participants:
+            if participant.living_thing.is_alive():
+                participant.living_thing.leave_combat()
+
+        living_teams = self.get_living_teams()
+        return living_teams.pop() if len(living_teams) == 1 else None
+
+    def run_round(self):
+        """ Have every participant whose turn is due on the next round take it """
+        self.round += 1
+        turn_queue = self._turn_queue
+        while turn_queue and turn_queue[0][0] == self.round:
+            participant = heapq.heappop(turn_queue)[-1]
+            if not participant.living_thing.is_alive():
+                continue  # dropped out of the queue
+
+            self.take_turn(participant)
+            self._queue_turn(participant, self.round + 1)
+
+        self._record_slain()
+
+    def take_turn(self, participant: Participant):
+        living_thing = participant.living_thing
+        living_thing.start_turn_update()
+        if living_thing.is_alive() and self.get_target(living_thing) is not None:
+            participant.controller(self, living_thing)
+        if living_thing.is_alive():
+            living_thing.end_turn_update()
+
+    def _get_team(self, living_thing: LivingThing) -> str:
+        participant = self._participants_by_thing.get(id(living_thing))
+        if participant is None:
+            raise ValueError(f'{living_thing.name} is not taking part in the encounter!')
+
+        return participant.team
+
+    def _queue_turn(self, participant: Participant, due_round: int):
+        heapq.heappush(self._turn_queue, (due_round, -participant.initiative, next(self._queue_order), participant))
+
+    def _record_slain(self):
+        for participant in self.participants:
+            if not participant.is_slain and not participant.living_thing.is_alive():
+                participant.is_slain = True
+                self.slain.append(participant.living_thing)
+
+
+def attack_target_controller(encounter: Encounter, living_thing: LivingThing):
+    """ The AI of a monster - auto attack the first enemy that is alive """
+    living_thing.attack(encounter.get_target(living_thing))
+
+
+class CommandController:
+    """
+    Controls a character through the combat commands of a human, read from the console,
+    or of a script, read from a list of commands.
+    Commands that do not end the turn (like 'print stats') and spells that could not be cast are followed by
+    reading another command.
+    Auto attacks hit the character's target - the first enemy that is still alive, while his damaging spells
+    hit every enemy
+    """
+    def __init__(self, commands: [str]=None):
+        """ :param commands: the script of commands, the console is read if there is none """
+        self._commands = iter(commands) if commands is not None else None
+
+    def read_command(self) -> str:
+        return next(self._commands) if self._commands is not None else input()
+
+    def __call__(self, encounter: Encounter, character: 'Character'):
+        while True:
+            target = encounter.get_target(character)
+            # check if the command does not end the turn, if it doesn't the same command gets returned
+            command = route_in_combat_non_ending_turn_commands(self.read_command(), character, target,
+                                                               read_command=self.read_command)
+            if self.take_command(encounter, character, command):
+                return
+
+    def take_command(self, encounter: Encounter, character: 'Character', command: str) -> bool:
+        """
+        Act on a command which ends the turn, any command that is not an attack or a spell passes the turn
+        :return: a boolean indicating if the turn has ended, it does not if the spell could not be cast
+        """
+        from combat import get_available_spells
+        target = encounter.get_target(character)
+        if command == 'attack':
+            character.attack(target)
+        elif command in get_available_spells(character):
+            splash_targets = [enemy for enemy in encounter.get_enemies(character) if enemy is not target]
+            return character.spell_handler(command, target, splash_targets)
+
+        return True
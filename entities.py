@@ -2,19 +2,28 @@
 This holds the classes for every entity in the game: Monsters and Characters currently
 """
 import random
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager
 from termcolor import colored
 from constants import (CHARACTER_DEFAULT_EQUIPMENT, CHARACTER_LEVELUP_BONUS_STATS, CHARACTER_LEVEL_XP_REQUIREMENTS,
                        KEY_ARMOR_ATTRIBUTE, KEY_STRENGTH_ATTRIBUTE, KEY_AGILITY_ATTRIBUTE, KEY_BONUS_HEALTH_ATTRIBUTE,
                        KEY_BONUS_MANA_ATTRIBUTE, KEY_LEVEL_STATS_HEALTH, KEY_LEVEL_STATS_MANA, CHAR_STARTER_ZONE,
-                       CHAR_STARTER_SUBZONE, CHAR_ATTRIBUTES_TEMPLATE, MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD)
-from information_printer import print_level_up_event, print_vendor_products_for_sale
+                       CHAR_STARTER_SUBZONE, CHAR_ATTRIBUTES_TEMPLATE, MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD,
+                       KEY_STAT_LAYER_BASE, KEY_STAT_LAYER_LEVEL, KEY_STAT_LAYER_GEAR, KEY_STAT_LAYER_BUFFS,
+                       CHARACTER_CUMULATIVE_LEVELUP_STATS, CHARACTER_CUMULATIVE_XP_REQUIREMENTS,
+                       CHARACTER_MAXIMUM_LEVEL)
+from information_printer import combat_log, print_level_up_event, print_vendor_products_for_sale
 from exceptions import ItemNotInInventoryError, NonExistantBuffError
 from utils.helper import create_character_attributes_template
+from utils.guid_set import GuidSet
 from items import Item, Weapon, Potion, Equipment
-from quest import Quest, FetchQuest
+from inventory import Inventory
+from quest import Quest, FetchQuest, QuestLog
 from decorators import has_item_in_stock
-from damage import Damage
-from buffs import BeneficialBuff, DoT
+from damage import Damage, HitResult, resolve_hit
+from buffs import BeneficialBuff, DoT, StatusEffectScheduler
+from spells import CooldownTracker
 
 
 class LivingThing:
@@ -33,7 +42,17 @@ class LivingThing:
         self.attributes = {KEY_ARMOR_ATTRIBUTE: 0}
         self._alive = True
         self._in_combat = False
-        self.buffs: {BeneficialBuff or DoT: int} = {}
+        self._buffs: StatusEffectScheduler = None  # created on the first buff/DoT, see the buffs property
+
+    @property
+    def buffs(self) -> StatusEffectScheduler:
+        """
+        Key: BeneficialBuff or DoT, Value: the turns it has left
+        Most monsters never get a status effect, so the scheduler is only created when it is first needed.
+        """
+        if self._buffs is None:
+            self._buffs = StatusEffectScheduler()
+        return self._buffs
 
     def is_alive(self):
         return self._alive
@@ -70,49 +89,25 @@ class LivingThing:
 
     def _update_dots(self):
         """
-        This method goes through all the DoT effects on the entity, activates their tick, reduces their duration
-        and, if the are expired, adds them to a list which holds DoTs that should be removed(expired) from the character
-        After iterating through all of the active DoTs, we remove every DoT that is in the list.
+        This method activates the tick of every DoT effect on the entity and reduces their duration.
+        The DoTs which have expired are removed afterwards.
         """
-        dots_to_remove = []  # type: list of DoTs
-
-        # filter the DoTs from the character's buffs, iterate through active DoTs and reduce duration
-        for dot in list(filter(lambda buff: isinstance(buff, DoT), self.buffs.keys())):
-            # activate DoT effect
+        if self._buffs is None:
+            return
+        for dot in self.buffs.active_dots():
             self.take_dot_proc(dot)
-            # reduce duration by 1 turn
-            turns_left = self.buffs[dot]
-            turns_left -= 1
-            self.buffs[dot] = turns_left
 
-            if not turns_left:  # if it is expired
-                dots_to_remove.append(dot)
-
-        # remove the buffs
-        for dot in dots_to_remove:
+        for dot in self.buffs.tick_dots():
             self.remove_buff(dot)
 
     def _update_buffs(self):
         """
-        This method goes through all the Buffs on the netity, reduces their duration
-        and, if they are expired (0 duration) adds them to a list which holds Buffs that should be removed (are expired)
-        from the character.
-        After iterating through all of the active Buffs, we remove every Buff that is in the list
+        This method reduces the duration of every Buff on the entity and removes the ones which have expired.
+        The durations are held by the buffs scheduler, therefore only the expired buffs are touched.
         """
-        buffs_to_remove: [BeneficialBuff] = []  # type: list of Buffs
-
-        # iterate through active buffs and reduce duration
-        for buff in filter(lambda bf: isinstance(bf, BeneficialBuff), self.buffs.keys()):
-            # reduce duration by 1 turn
-            turns_left = self.buffs[buff]
-            turns_left -= 1
-            self.buffs[buff] = turns_left
-
-            if not turns_left:  # if it is expired
-                buffs_to_remove.append(buff)
-
-        # remove the buffs
-        for buff in buffs_to_remove:
+        if self._buffs is None:
+            return
+        for buff in self.buffs.tick_buffs():
             self.remove_buff(buff)
 
     def remove_buff(self, buff: BeneficialBuff or DoT):
@@ -122,18 +117,18 @@ class LivingThing:
                                        buff.name)
         if isinstance(buff, BeneficialBuff):
             self._deapply_buff(buff)
-            print(f"Buff {buff.name} has expired from {self.name}.")
+            combat_log.info(f"Buff {buff.name} has expired from {self.name}.")
         elif isinstance(buff, DoT):
-            print(f"DoT {buff.name} has expired from {self.name}.")
+            combat_log.info(f"DoT {buff.name} has expired from {self.name}.")
         del self.buffs[buff]
 
     def add_buff(self, buff: BeneficialBuff or DoT):
         """ Method that handles when a buff is added to the player
         also adds DoTs to the list"""
-        if buff in self.buffs:
-            self._deapply_buff(buff)
+        # a buff that is already active only has its duration refreshed, its stats are already applied
+        is_active = buff in self.buffs
         self.buffs[buff] = buff.duration
-        if isinstance(buff, BeneficialBuff):
+        if isinstance(buff, BeneficialBuff) and not is_active:
             self._apply_buff(buff)
 
     def _apply_buff(self, buff: BeneficialBuff):
@@ -168,21 +163,6 @@ class LivingThing:
                 if self.mana > self.max_mana:
                     self.mana = self.max_mana
 
-    def _apply_armor_reduction(self, damage: Damage, attacker_level: int) -> Damage:
-        """
-        This method applies the armor reduction to a blow, the formula is as follows:
-        Percentage to Reduce = Armor / (Armor + 400 + 85 * Attacker_Level)
-        :param damage: the raw damage
-        :return: the damage with the applied reduction
-        """
-        armor = self.attributes[KEY_ARMOR_ATTRIBUTE]
-
-        reduction_percentage = armor / (armor + 400 + 85 * attacker_level)
-        damage_to_deduct = damage.phys_dmg * reduction_percentage
-        reduced_damage = damage.phys_dmg - damage_to_deduct
-
-        return Damage(phys_dmg=reduced_damage, magic_dmg=damage.magic_dmg)
-
     def _regenerate(self):
         self.health = self.max_health
         self.mana = self.max_mana
@@ -218,14 +198,24 @@ class LivingThing:
         dot_proc_damage = self._calculate_level_difference_damage(damage_to_deal=dot_proc_damage,
                                                                   target_level=dot.level,
                                                                   inverse=True)
-        if dot_proc_damage.phys_dmg:  # if there is physical damage in the DoT, apply armor reduction
-            dot_proc_damage = self._apply_armor_reduction(damage=dot_proc_damage,
-                                                          attacker_level=self.level)
-        if self.absorption_shield:  # if we have a shield
-            dot_proc_damage = self._apply_damage_absorption(dot_proc_damage)
+        # apply armor reduction to the physical damage in the DoT and absorption
+        hit = self.resolve_hit(dot_proc_damage.phys_dmg, dot_proc_damage.magic_dmg, attacker_level=self.level)
 
-        print(f'{self.name} suffers {dot_proc_damage} from {dot.name}!')
-        self._subtract_health(dot_proc_damage)
+        combat_log.info(f'{self.name} suffers {hit} from {dot.name}!')
+        self.apply_hit(hit)
+
+    def resolve_hit(self, phys_dmg: float, magic_dmg: float, attacker_level: int) -> HitResult:
+        """
+        Apply the armor reduction and damage absorption to a hit in a single pass, without modifying anything.
+        The result is used both to print the hit and to deal it through apply_hit
+        """
+        return resolve_hit(phys_dmg, magic_dmg, armor=self.attributes[KEY_ARMOR_ATTRIBUTE],
+                           attacker_level=attacker_level, absorption_shield=self.absorption_shield)
+
+    def apply_hit(self, hit: HitResult):
+        """ Deal a hit returned by resolve_hit, taking what it absorbed off the absorption shield """
+        self.absorption_shield = hit.absorption_shield
+        self._subtract_health(hit.total)
 
     def _calculate_level_difference_damage(self, damage_to_deal: int, target_level: int, inverse: bool=False) -> int:
         """
@@ -261,23 +251,6 @@ class LivingThing:
 
         return damage_to_deal
 
-    def _apply_damage_absorption(self, damage: Damage, to_print=False) -> Damage:
-        """
-        This method subtracts the absorption (if any) from the damage
-        :param to_print: A boolean indicating if we want to actually subtract the damage from the shield. If it's true,
-        we're getting the damage for the sole reason to print it only, therefore we should not modify anything
-        :return Damage
-        """
-
-        if self.absorption_shield:  # if there is anything to absorb
-            # lowers the damage and returns our shield
-            if not to_print:  # we want to modify the shield
-                self.absorption_shield = damage.handle_absorption(self.absorption_shield)
-            else:
-                damage.handle_absorption(self.absorption_shield) # only modify the specific damage in order to print it
-
-        return damage
-
     def _die(self):
         self._alive = False
 
@@ -301,7 +274,12 @@ class FriendlyNPC(LivingThing):
         self.colored_name = colored(self.name, color='green')
 
     def __str__(self):
-        return f'{self.colored_name}'
+        return self.describe(self.name)
+
+    @staticmethod
+    def describe(name: str) -> str:
+        """ Returns how a friendly NPC of the given name is printed """
+        return colored(name, color='green')
 
     def talk(self, player_name: str):
         print(f'{self.colored_name} says: {self.gossip.replace("$N", player_name)}')
@@ -317,10 +295,16 @@ class VendorNPC(FriendlyNPC):
                  loot_table: 'LootTable'=None, gossip: str='Hello'):
         super().__init__(name, health, mana, level, min_damage, max_damage, quest_relation_id, loot_table, gossip)
         self.entry = entry
+        # Key: item name, Value: tuple(Item, count), usually a view over the product list shared with other vendors
         self.inventory = inventory
 
     def __str__(self):
-        return f'{self.colored_name} <Vendor>'
+        return self.describe(self.name)
+
+    @staticmethod
+    def describe(name: str) -> str:
+        """ Returns how a vendor of the given name is printed """
+        return f'{FriendlyNPC.describe(name)} <Vendor>'
 
     def has_item(self, item_name: str) -> bool:
         """
@@ -358,53 +342,104 @@ class VendorNPC(FriendlyNPC):
         return item, item_count, item_price
 
 
+# The information shared by every monster of the same creature entry, see Monster
+CreatureTemplate = namedtuple('CreatureTemplate', ['entry', 'name', 'health', 'mana', 'level', 'min_damage',
+                                                   'max_damage', 'quest_relation_id', 'xp_to_give',
+                                                   'gold_to_give_range', 'loot_table', 'armor', 'gossip',
+                                                   'respawnable'])
+
+
+class _CreatureTemplateField:
+    """
+    A Monster attribute which is read from the monster's CreatureTemplate.
+    Setting it replaces the monster's template with a modified copy, as the template is shared with other monsters
+    """
+    def __init__(self, template_field: str):
+        self.template_field = template_field
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return getattr(instance.template, self.template_field)
+
+    def __set__(self, instance, value):
+        if getattr(instance.template, self.template_field) != value:
+            instance.template = instance.template._replace(**{self.template_field: value})
+
+
 class Monster(LivingThing):
+    """
+    The information every monster of a creature entry has in common is held in a CreatureTemplate,
+    which is shared by all of them. The monster itself holds only what changes per monster - health, mana, buffs,
+    its alive state and its rolled gold and loot.
+    """
+    monster_id = _CreatureTemplateField('entry')
+    name = _CreatureTemplateField('name')
+    level = _CreatureTemplateField('level')
+    min_damage = _CreatureTemplateField('min_damage')
+    max_damage = _CreatureTemplateField('max_damage')
+    quest_relation_id = _CreatureTemplateField('quest_relation_id')
+    xp_to_give = _CreatureTemplateField('xp_to_give')
+    loot_table = _CreatureTemplateField('loot_table')
+    gossip = _CreatureTemplateField('gossip')
+    respawnable = _CreatureTemplateField('respawnable')  # says if the creature can ever respawn, once killed of course
+
     def __init__(self, monster_id: int, name: str, health: int = 1, mana: int = 1, level: int = 1, min_damage: int = 0,
                  max_damage: int = 1, quest_relation_id=0, xp_to_give: int=0,
                  gold_to_give_range: (int, int)=(0, 0), loot_table: 'LootTable'=None, armor: int=0, gossip: str='',
                  respawnable: bool=False):
-        super().__init__(name, health, mana, level)
-        self.monster_id = monster_id
-        self.level = level
-        self.min_damage = min_damage
-        self.max_damage = max_damage
-        self.xp_to_give = xp_to_give
-        self.attributes[KEY_ARMOR_ATTRIBUTE] = armor
-        self.gossip = gossip
-        self.respawnable = respawnable  # says if the creature can ever respawn, once killed of course
-        self._gold_to_give = self._calculate_gold_reward(gold_to_give_range)
-        self.quest_relation_id = quest_relation_id
-        self.loot_table = loot_table
+        self.template = CreatureTemplate(entry=monster_id, name=name, health=health, mana=mana, level=level,
+                                         min_damage=min_damage, max_damage=max_damage,
+                                         quest_relation_id=quest_relation_id, xp_to_give=xp_to_give,
+                                         gold_to_give_range=gold_to_give_range, loot_table=loot_table, armor=armor,
+                                         gossip=gossip, respawnable=respawnable)
+        self._init_from_template()
+
+    @classmethod
+    def from_template(cls, template: CreatureTemplate) -> 'Monster':
+        """ Create a monster which shares the given template """
+        monster = cls.__new__(cls)
+        monster.template = template
+        monster._init_from_template()
+        return monster
+
+    def _init_from_template(self):
+        template = self.template
+        super().__init__(template.name, template.health, template.mana, template.level)
+        self.attributes[KEY_ARMOR_ATTRIBUTE] = template.armor
+        self._gold_to_give = self._calculate_gold_reward(template.gold_to_give_range)
         self.loot = {"gold": self._gold_to_give}  # dict Key: str, Value: Item class object
 
     def __str__(self):
-        colored_name = colored(self.name, color="red")
-        return f'Creature Level {self.level} {colored_name} - {self.health}/{self.max_health} HP ' \
-               f'| {self.mana}/{self.max_mana} Mana | {self.min_damage}-{self.max_damage} Damage'
+        return self.describe(self.template, self.health, self.max_health, self.mana, self.max_mana)
 
-    def get_auto_attack_damage(self, target_level: int):
+    @staticmethod
+    def describe(template: CreatureTemplate, health: int, max_health: int, mana: int, max_mana: int) -> str:
+        """ Returns how a monster of the given template is printed, with the given health and mana """
+        colored_name = colored(template.name, color="red")
+        return f'Creature Level {template.level} {colored_name} - {health}/{max_health} HP ' \
+               f'| {mana}/{max_mana} Mana | {template.min_damage}-{template.max_damage} Damage'
+
+    def _roll_auto_attack_damage(self, target_level: int) -> float:
         # get the base auto attack damage
         damage_to_deal = random.randint(self.min_damage, self.max_damage)
         # factor in the level difference
-        damage_to_deal = self._calculate_level_difference_damage(damage_to_deal, target_level)
-
-        return Damage(phys_dmg=damage_to_deal)
+        return self._calculate_level_difference_damage(damage_to_deal, target_level)
 
     def attack(self, victim: 'Character'):
-        monster_swing: Damage = self.get_auto_attack_damage(victim.level)
+        hit: HitResult = victim.resolve_hit(self._roll_auto_attack_damage(victim.level), 0, self.level)
 
-        victim.take_attack(self.name, monster_swing, self.level)
+        combat_log.info(f'{self.name} attacks {victim.name} for {hit}!')
+        victim.apply_hit(hit)
 
     def take_attack(self, damage: Damage, attacker_level: int):
-        damage = self._apply_armor_reduction(damage, attacker_level)
-        damage = self._apply_damage_absorption(damage)
-        self._subtract_health(damage)
+        self.apply_hit(self.resolve_hit(damage.phys_dmg, damage.magic_dmg, attacker_level))
 
     def get_take_attack_damage_repr(self, damage: Damage, attacker_level: int) -> Damage:
         """ this method returns the damage that the monster will suffer after taking into account
         armor and absorption. This is used for printing the result
         Currently: Only armor reduction and damage absorption is applied."""
-        return self._apply_damage_absorption(self._apply_armor_reduction(damage, attacker_level), to_print=True)
+        return self.resolve_hit(damage.phys_dmg, damage.magic_dmg, attacker_level).to_damage()
 
     def _drop_loot(self):
         """
@@ -430,7 +465,26 @@ class Monster(LivingThing):
     def _die(self):
         super()._die()
         self._drop_loot()
-        print(f'Creature {self.name} has died!')
+        combat_log.info(f'Creature {self.name} has died!')
+
+    def respawn(self):
+        """
+        Bring the monster back to how it was spawned - full health and mana, no buffs and freshly rolled gold.
+        Everything is reset in place, reusing the monster's attributes, buffs and loot containers
+        """
+        template = self.template
+        self.health = self.max_health = template.health
+        self.mana = self.max_mana = template.mana
+        self.absorption_shield = 0
+        self.attributes.clear()
+        self.attributes[KEY_ARMOR_ATTRIBUTE] = template.armor
+        self._alive = True
+        self._in_combat = False
+        if self._buffs is not None:
+            self._buffs.clear()
+        self._gold_to_give = self._calculate_gold_reward(template.gold_to_give_range)
+        self.loot.clear()
+        self.loot['gold'] = self._gold_to_give
 
     def _calculate_gold_reward(self, min_max_gold: tuple) -> int:
         """ Calculate the gold this monster is going to award the player
@@ -452,10 +506,49 @@ class Monster(LivingThing):
             print(f'{self.name} {verb}: {self.gossip}')
 
 
+class MonsterPool:
+    """
+    Holds the Monster objects which are no longer in the world (i.e killed, non-respawnable monsters),
+    so that the next monster of the same creature entry reuses one of them instead of being built from scratch.
+    A reused monster is respawned, which resets it and its loot container in place.
+    """
+    def __init__(self, max_free_per_entry: int=32):
+        self.max_free_per_entry = max_free_per_entry
+        # Key: the creature entry, Value: a list of the free Monster objects of that entry
+        self._free_monsters: {int: [Monster]} = {}
+
+    def __len__(self):
+        return sum(len(monsters) for monsters in self._free_monsters.values())
+
+    def acquire(self, template: CreatureTemplate) -> Monster:
+        """ Returns a monster of the template, reusing a free one if there is any """
+        free_monsters = self._free_monsters.get(template.entry)
+        if not free_monsters:
+            return Monster.from_template(template)
+
+        monster = free_monsters.pop()
+        monster.template = template
+        monster.respawn()
+        return monster
+
+    def release(self, monster: Monster):
+        """ Gives the monster back to the pool. It must not be used by anything after this """
+        free_monsters = self._free_monsters.setdefault(monster.monster_id, [])
+        if len(free_monsters) < self.max_free_per_entry:
+            free_monsters.append(monster)
+
+    def clear(self):
+        self._free_monsters.clear()
+
+
+# the pool that every monster loaded from the DB is taken from
+monster_pool = MonsterPool()
+
+
 class Character(LivingThing):
     def __init__(self, name: str, level: int=1, health: int = 1, mana: int = 1, strength: int = 1, agility: int = 1,
-                 loaded_scripts: set=set(), killed_monsters: set=set(), completed_quests: set=set(),
-                 saved_inventory: dict={'gold': 0}, saved_equipment: dict=CHARACTER_DEFAULT_EQUIPMENT):
+                 loaded_scripts: set=None, killed_monsters: set=None, completed_quests: set=None,
+                 saved_inventory: Inventory=None, saved_equipment: dict=None):
         super().__init__(name, health, mana, level=0)
         self.min_damage = 0
         self.max_damage = 1
@@ -466,21 +559,34 @@ class Character(LivingThing):
         self._bonus_mana = 0
         self._bonus_strength = 0
         self._bonus_armor = 0
+        # the modifiers that make up the attributes below, every layer holds what it adds to each attribute
+        self.stat_layers: {str: {str: int}} = {layer: create_character_attributes_template()
+                                               for layer in (KEY_STAT_LAYER_BASE, KEY_STAT_LAYER_LEVEL,
+                                                             KEY_STAT_LAYER_GEAR, KEY_STAT_LAYER_BUFFS)}
+        # the sum of the stat layers plus the bonus strength/armor from agility, calculated from them
+        # in _calculate_stats_formulas. Change the layers through _modify_stat_layer rather than writing to it
         self.attributes: {str: int} = create_character_attributes_template()
+        self._stat_batch_depth = 0  # how many stat_batch() blocks we are in
+        self._stats_changed = False  # whether the attributes changed during the current stat_batch()
+        self.spell_cooldowns = CooldownTracker()  # holds the spells which are on cooldown
         self._level_up(to_print=False)  # level up to 1
         if level > 1:
             self._level_up(to_level=level, to_print=False)
 
         self.current_zone = CHAR_STARTER_ZONE
         self.current_subzone = CHAR_STARTER_SUBZONE
+        # NOTE: Every default below is created anew, otherwise separate characters would share the same set/dict
         # holds the scripts that the character has seen (which should load only once)
-        self.loaded_scripts: set() = loaded_scripts
+        self.loaded_scripts: set() = loaded_scripts if loaded_scripts is not None else set()
         # holds the GUIDs of the creatures that the character has killed (and that should not be killable a second time)
-        self.killed_monsters: set() = killed_monsters
-        self.completed_quests: set() = completed_quests  # ids of the quests that the character has completed
-        self.quest_log = {}
-        self.inventory = saved_inventory # dict Key: str, Value: tuple(Item class instance, Item Count)
-        self.equipment = saved_equipment # dict Key: Equipment slot, Value: object of class Equipment
+        self.killed_monsters: GuidSet = (killed_monsters if isinstance(killed_monsters, GuidSet)
+                                         else GuidSet(killed_monsters if killed_monsters is not None else ()))
+        # ids of the quests that the character has completed
+        self.completed_quests: set() = completed_quests if completed_quests is not None else set()
+        self.quest_log = QuestLog()
+        self.inventory: Inventory = saved_inventory if saved_inventory is not None else Inventory()
+        # dict Key: Equipment slot, Value: object of class Equipment
+        self.equipment = saved_equipment if saved_equipment is not None else dict(CHARACTER_DEFAULT_EQUIPMENT)
 
         self._handle_load_saved_equipment()  # add up the attributes for our saved_equipment
 
@@ -489,11 +595,7 @@ class Character(LivingThing):
         self.update_spell_cooldowns()
 
     def add_item_to_inventory(self, item: Item, item_count=1):
-        count = item_count
-        if item.name in self.inventory:
-            count += self.inventory[item.name][1]
-
-        self.inventory[item.name] = (item, count)
+        self.inventory.add_item(item, item_count)
 
     def equip_item(self, item: Item):
         """
@@ -502,42 +604,31 @@ class Character(LivingThing):
         :param item:
         :return:
         """
-        if isinstance(item, Weapon):
-            item_in_inventory, count = self.inventory[item.name]
-
-            # remove the item we're equipping from the inventory
-            if count == 1:  # remove from the inventory
-                del self.inventory[item.name]
-            else:  # reduce it's count
-                self.inventory[item.name] = item_in_inventory, count-1
-
-            # transfer the equipped weapon to the inventory
-            eq_weapon = self.equipped_weapon
+        with self.stat_batch():  # recalculate the formulas once, after the item is equipped
+            if isinstance(item, Weapon):
+                # remove the item we're equipping from the inventory
+                self.inventory.remove_item(item.name)
 
-            self.add_item_to_inventory(eq_weapon)
+                # transfer the equipped weapon to the inventory
+                eq_weapon = self.equipped_weapon
 
-            self._subtract_attributes(eq_weapon.attributes)  # remove the attributes it has given us
-            self._equip_weapon(item)
-        elif isinstance(item, Equipment):
-            item_in_inventory, count = self.inventory[item.name]
+                self.add_item_to_inventory(eq_weapon)
 
-            # remove the item we're equipping from the inventory
-            if count == 1:  # remove from the inventory
-                del self.inventory[item.name]
-            else:  # reduce it's count
-                self.inventory[item.name] = item_in_inventory, count - 1
+                self._subtract_attributes(eq_weapon.attributes)  # remove the attributes it has given us
+                self._equip_weapon(item)
+            elif isinstance(item, Equipment):
+                # remove the item we're equipping from the inventory
+                self.inventory.remove_item(item.name)
 
-            # transfer the equipped item back to the inventory
-            # TODO: Handle custom error if there isn't such a slot in the equipment
-            equipped_item: Equipment = self.equipment[item.slot]
+                # transfer the equipped item back to the inventory
+                # TODO: Handle custom error if there isn't such a slot in the equipment
+                equipped_item: Equipment = self.equipment[item.slot]
 
-            if equipped_item:
-                self.add_item_to_inventory(equipped_item)
-                self._subtract_attributes(equipped_item.attributes)
+                if equipped_item:
+                    self.add_item_to_inventory(equipped_item)
+                    self._subtract_attributes(equipped_item.attributes)
 
-            self._equip_gear(item)
-
-        self._calculate_stats_formulas()  # always recalculate formulas when adding an item
+                self._equip_gear(item)
 
     def consume_item(self, item: Item):
         """
@@ -546,13 +637,8 @@ class Character(LivingThing):
         """
         if isinstance(item, Potion):
             potion: Potion = item
-            potion_in_inventory, count = self.inventory[potion.name]
-
             # remove the potion we're consuming from the inventory
-            if count == 1:  # remove from the inventory
-                del self.inventory[potion.name]
-            else:  # reduce it's count
-                self.inventory[potion.name] = potion_in_inventory, count - 1
+            self.inventory.remove_item(potion.name)
 
             print(f'{self.name} drinks {potion.name} and is afflicted by {potion.get_buff_name()}')
             # call the potion's consume method
@@ -572,31 +658,67 @@ class Character(LivingThing):
     def _add_attributes(self, attributes: dict):
         """ this function goes through a dictionary that holds character attributes and adds them
         with the character's. Called whenever we equip an item
-        We directly apply it to the character's attributes dictionary because we trust that the
+        We directly apply it to the character's gear stat layer because we trust that the
         argument has gone through helper.py's create_attributes function
         and has valid attribute names"""
-        for attribute_name, attribute_value in attributes.items():
-            self.attributes[attribute_name] += attribute_value
-        self._calculate_stats_formulas()
+        self._modify_stat_layer(KEY_STAT_LAYER_GEAR, attributes)
 
     def _subtract_attributes(self, attributes: dict):
         """ this function goes through a dictionary that holds character attributes and adds them
             with the character's. Called whenever we dequip an item
-            We directly apply it to the character's attributes dictionary because we trust that the
+            We directly apply it to the character's gear stat layer because we trust that the
             argument has gone through helper.py's create_attributes function
             and has valid attribute names"""
+        # we also trust that the values cannot be negative after the subtraction, because the same amount has
+        # been added beforehand and we currently do not support any features that lower a character's
+        # attributes outside of combat, where he will not be able to dequip an item
+        self._modify_stat_layer(KEY_STAT_LAYER_GEAR, attributes, remove=True)
+
+    def _modify_stat_layer(self, layer: str, attributes: dict, remove: bool=False):
+        """
+        Add (or remove) the attributes to one of the character's stat layers,
+        recalculating his attributes and the formulas that depend on them
+        :param layer: the key of the layer in self.stat_layers, i.e KEY_STAT_LAYER_GEAR
+        """
+        layer_attributes = self.stat_layers[layer]
         for attribute_name, attribute_value in attributes.items():
-            # we also trust that the values cannot be negative after the subtraction, because the same amount has
-            # been added beforehand and we currently do not support any features that lower a character's
-            # attributes outside of combat, where he will not be able to dequip an item
-            self.attributes[attribute_name] -= attribute_value
-        self._calculate_stats_formulas()
+            layer_attributes[attribute_name] += -attribute_value if remove else attribute_value
+        self._recalculate_stats()
+
+    @contextmanager
+    def stat_batch(self):
+        """
+        Groups changes to the character's stat layers, so that his attributes and the formulas which depend on them
+        (max health/mana, the bonus strength/armor from agility, damage) are recalculated only once,
+        when the outermost batch ends.
+            with character.stat_batch():
+                character.equip_item(helmet)
+                character.equip_item(sword)
+        """
+        self._stat_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._stat_batch_depth -= 1
+            if not self._stat_batch_depth and self._stats_changed:
+                self._calculate_stats_formulas()
+
+    def _recalculate_stats(self):
+        """ Recalculate the formulas now, or at the end of the stat_batch() we are in """
+        if self._stat_batch_depth:
+            self._stats_changed = True
+        else:
+            self._calculate_stats_formulas()
 
     def _calculate_stats_formulas(self):
         """
         Whenever we level up or equip an item, our stats are changed.
-        According to that change, we need to recalculate the formulas in which those stats are used in.
+        According to that change, we need to sum up the stat layers into our attributes again
+        and recalculate the formulas in which those stats are used in.
         """
+        self._stats_changed = False
+        for attribute_name in self.attributes:
+            self.attributes[attribute_name] = sum(layer[attribute_name] for layer in self.stat_layers.values())
 
         # update health according to bonus health
         orig_max_h = self.max_health
@@ -613,14 +735,8 @@ class Character(LivingThing):
 
         # formula for agility is: for each point of agility, add 2.5 armor and 0.5 strength
         agility = self.attributes[KEY_AGILITY_ATTRIBUTE]
-
-        # remove the old bonus strength/armor
-        self.attributes[KEY_STRENGTH_ATTRIBUTE] -= self._bonus_strength
-        self.attributes[KEY_ARMOR_ATTRIBUTE] -= self._bonus_armor
-        # recalculate them
         self._bonus_strength = agility * 0.5
         self._bonus_armor = agility * 2.5
-        # add them back again
         self.attributes[KEY_STRENGTH_ATTRIBUTE] += self._bonus_strength
         self.attributes[KEY_ARMOR_ATTRIBUTE] += self._bonus_armor
 
@@ -678,71 +794,50 @@ class Character(LivingThing):
         """
         pass
 
-    def get_auto_attack_damage(self, target_level: int) -> Damage:
-        # get the base auto attack damage
-        damage_to_deal = random.randint(int(self.min_damage), int(self.max_damage))
-        # factor in the level difference
-        damage_to_deal = self._calculate_level_difference_damage(damage_to_deal, target_level)
-
-        return Damage(phys_dmg=damage_to_deal)
-
     def attack(self, victim: Monster):
         pass
 
     def take_attack(self, monster_name: str, damage: Damage, attacker_level: int):
-        damage = self._apply_armor_reduction(damage, attacker_level)
-        damage = self._apply_damage_absorption(damage)
+        hit: HitResult = self.resolve_hit(damage.phys_dmg, damage.magic_dmg, attacker_level)
 
-        print(f'{monster_name} attacks {self.name} for {damage}!')
-        self._subtract_health(damage)
+        combat_log.info(f'{monster_name} attacks {self.name} for {hit}!')
+        self.apply_hit(hit)
 
     def _apply_buff(self, buff: BeneficialBuff):
         """ Add the buffed attributes to the character's stats"""
-        buff_attributes: {str: int} = buff.get_buffed_attributes()
-
-        # iterate through the buffed attributes and apply them to the character
-        for buff_type, buff_amount in buff_attributes.items():
-            if buff_type == "health":
-                self.attributes[KEY_BONUS_HEALTH_ATTRIBUTE] += buff_amount
-            elif buff_type == "mana":
-                self.attributes[KEY_BONUS_MANA_ATTRIBUTE] += buff_amount
-            else:
-                self.attributes[buff_type] += buff_amount
-
-            self._calculate_stats_formulas()  # always recalculate the formulas when stats are changed
+        self._modify_stat_layer(KEY_STAT_LAYER_BUFFS, self._get_buff_attributes(buff))
 
     def _deapply_buff(self, buff: BeneficialBuff):
         """ Remove the buff from the character's stats"""
-        buff_attributes: {str: int} = buff.get_buffed_attributes()
+        self._modify_stat_layer(KEY_STAT_LAYER_BUFFS, self._get_buff_attributes(buff), remove=True)
 
-        # iterate through the buffed attributes and remove them from the character
-        for buff_type, buff_amount in buff_attributes.items():
+    @staticmethod
+    def _get_buff_attributes(buff: BeneficialBuff) -> {str: int}:
+        """ Convert the buffed attributes to the character's attributes, as a buff increases health/mana by bonus """
+        buff_attributes: {str: int} = {}
+        for buff_type, buff_amount in buff.get_buffed_attributes().items():
             if buff_type == "health":
-                self.attributes[KEY_BONUS_HEALTH_ATTRIBUTE] -= buff_amount
+                buff_attributes[KEY_BONUS_HEALTH_ATTRIBUTE] = buff_amount
             elif buff_type == "mana":
-                self.attributes[KEY_BONUS_MANA_ATTRIBUTE] -= buff_amount
+                buff_attributes[KEY_BONUS_MANA_ATTRIBUTE] = buff_amount
             else:
-                self.attributes[buff_type] -= buff_amount
+                buff_attributes[buff_type] = buff_amount
 
-            self._calculate_stats_formulas()  # always recalculate the formulas when stats are changed
+        return buff_attributes
 
     def _die(self):
         super()._die()
-        print(f'Character {self.name} has died!')
+        combat_log.info(f'Character {self.name} has died!')
 
     def has_enough_gold(self, gold: int) -> bool:
         """
         :return: a boolean indicating if we have that much gold
         """
-        return self.inventory['gold'] >= gold
+        return self.inventory.gold >= gold
 
     def has_item(self, item: str) -> bool:
         """ This method checks if the character has the item in his inventory"""
-        if item == 'gold':
-            # gold is a special keyword used to store the gold in the inventory
-            return False
-
-        return item in self.inventory.keys()
+        return item in self.inventory
 
     def buy_item(self, sale: (Item, int, int)):
         """
@@ -755,7 +850,7 @@ class Character(LivingThing):
         """
         item, item_count, item_price = sale
 
-        self.inventory['gold'] -= item_price
+        self.inventory.gold -= item_price
 
         self.award_item(item, item_count)
 
@@ -764,13 +859,9 @@ class Character(LivingThing):
         This method is used when the character sells an item to the vendor.
         We give **him** the item and he gives us gold for it
         """
-        item, item_count = self.inventory[item_name]
-
+        item = self.inventory.get_item(item_name)
         # remove the item from the inventory
-        if item_count == 1:
-            del self.inventory[item.name]
-        else:
-            self.inventory[item_name] = (item, item_count-1)
+        self.inventory.remove_item(item_name)
 
         gold_award = item.sell_price
         print(f'You have sold {item_name} for {gold_award} gold.')
@@ -827,21 +918,10 @@ class Character(LivingThing):
     def award_monster_kill(self, monster: Monster, monster_guid: int):
         """
         This method is called whenever a Monster is killed. It gives the monster's XP reward,
-                counts him for the appropriate quest (if there is one) and adds him to the killed_monsters
+                counts him for the appropriate quests (if there are any) and adds him to the killed_monsters
                 (if he's not respawnable)
         """
-        monster_level = monster.level
-        xp_reward = monster.xp_to_give
-        monster_quest_ID = monster.quest_relation_id
-
-        level_difference = self.level - monster_level
-        xp_bonus_reward = 0
-        if level_difference >= MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD:
-            xp_reward = 0
-        elif level_difference < 0:  # monster is higher level
-            # 10% increase of XP for every level the monster has over player
-            percentage_mod = abs(level_difference) * 0.1
-            xp_bonus_reward += int(xp_reward * percentage_mod)  # convert to int
+        xp_reward, xp_bonus_reward = self._calculate_monster_xp_reward(monster)
 
         if xp_bonus_reward:
             print(f'XP awarded: {xp_reward} + bonus {xp_bonus_reward} for the level difference!')
@@ -852,27 +932,58 @@ class Character(LivingThing):
             self.killed_monsters.add(monster_guid)
 
         self._award_experience(xp_reward + xp_bonus_reward)
+        self._count_quest_kill(monster)
+
+    def award_monster_kills(self, killed_monsters: [(int, Monster)]):
+        """
+        This method is called whenever a group of Monsters is killed on the same turn. It does what award_monster_kill
+        does for each of them, but the XP rewards are summed up and given at once, so that the character checks
+        for a level up a single time
+        :param killed_monsters: a list of tuples of (monster GUID, Monster)
+        """
+        total_xp_reward = 0
+        for monster_guid, monster in killed_monsters:
+            total_xp_reward += sum(self._calculate_monster_xp_reward(monster))
+            if not monster.respawnable:
+                self.killed_monsters.add(monster_guid)
+
+        print(f'XP awarded: {total_xp_reward} for {len(killed_monsters)} kills!')
+        self._award_experience(total_xp_reward)
 
-        # If this monster is for a quest and we have that quest
-        if monster_quest_ID and monster_quest_ID in self.quest_log:
-            quest = self.quest_log[monster_quest_ID]
+        for _, monster in killed_monsters:
+            self._count_quest_kill(monster)
+
+    def _calculate_monster_xp_reward(self, monster: Monster) -> (int, int):
+        """ Returns a tuple of (the monster's XP reward, the bonus XP for the monster being of a higher level) """
+        xp_reward = monster.xp_to_give
+        level_difference = self.level - monster.level
+        xp_bonus_reward = 0
+        if level_difference >= MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD:
+            xp_reward = 0
+        elif level_difference < 0:  # monster is higher level
+            # 10% increase of XP for every level the monster has over player
+            percentage_mod = abs(level_difference) * 0.1
+            xp_bonus_reward += int(xp_reward * percentage_mod)  # convert to int
+
+        return xp_reward, xp_bonus_reward
+
+    def _count_quest_kill(self, monster: Monster):
+        """ Count the kill for every quest that requires this monster """
+        for quest in self.quest_log.get_kill_quests(monster.name):
             quest.update_kills()
 
             self._check_if_quest_completed(quest)
 
     def award_gold(self, gold: int):
-        self.inventory['gold'] += gold
+        self.inventory.gold += gold
 
     def award_item(self, item: Item, item_count=1):
         """ Take an item and put it into the character's inventory,
         store it as a tuple holding (Item Object, Item Count) """
-        item_quest_id = item.quest_id
-
         self.add_item_to_inventory(item, item_count)
 
-        if item_quest_id and item_quest_id in self.quest_log:
-            # if the item is related to a quest, have the quest check if the player has enough items to complete it
-            quest = self.quest_log[item_quest_id]
+        # have every quest that requires the item check if the player has enough items to complete it
+        for quest in self.quest_log.get_fetch_quests(item.name):
             quest.check_if_complete(self)
 
             self._check_if_quest_completed(quest)
@@ -881,63 +992,67 @@ class Character(LivingThing):
         """ This method removes the specified item from the player's inventory
             :param item_count: the count we want to remove, ex: we may want to remove 2 Wolf Meats, as opposed to one
             :param remove_all: simply removes all the items, with this variable set to True, item_count is useless"""
-        if item_name not in self.inventory.keys():
+        if item_name not in self.inventory:
             raise ItemNotInInventoryError(f'{item_name} is not in {self.name}\'s inventory!',
                                           inventory=self.inventory, item_name=item_name)
 
         if remove_all:
-            del self.inventory[item_name]
+            self.inventory.remove_stack(item_name)
         else:
-            item, count_in_inventory = self.inventory[item_name]
-
-            # subtract the number of items we're removing from the number we have
-            resulting_count = count_in_inventory - item_count
-
-            if resulting_count <= 0:
-                # if it's 0 or less, remove the key/value pair
-                del self.inventory[item_name]
-            else:
-                # if we have items left, simply reduce their count
-                self.inventory[item_name] = item, resulting_count
+            # the stack is removed if there are none left
+            self.inventory.remove_item(item_name, item_count)
 
     def _handle_load_saved_equipment(self):
         """
         This function is used to add the attributes of all the character's equipment.
         NOTE: This is used only on the initial character load
         """
-        for item in (itm for itm in self.equipment.values() if itm is not None):
-            self._add_attributes(item.attributes)
+        with self.stat_batch():
+            for item in (itm for itm in self.equipment.values() if itm is not None):
+                self._add_attributes(item.attributes)
 
     def check_if_levelup(self):
-        if self.experience >= self.xp_req_to_level:
-            self._level_up()
-            self.experience = self.experience - self.xp_req_to_level
-            self.xp_req_to_level = self._lookup_next_xp_level_req()
+        """
+        Level the character up as many times as his experience allows.
+        The level he gets to is found by bisecting the cumulative XP table with his total experience
+        """
+        if self.experience < self.xp_req_to_level:
+            return
 
-    def _level_up(self, to_level: int=0, to_print=True):
-        if to_level:
-            # level up multiple times
-            for i in range(self.level, to_level-1):
-                self._level_up(to_print=to_print)
-            self.xp_req_to_level: int = self._lookup_next_xp_level_req()
-
-        self.level += 1
-
-        current_level_stats = CHARACTER_LEVELUP_BONUS_STATS[self.level]
-        # access the dictionary holding the appropriate value increases for each level
-        hp_increase_amount = current_level_stats[KEY_LEVEL_STATS_HEALTH]
-        mana_increase_amount = current_level_stats[KEY_LEVEL_STATS_MANA]
-        strength_increase_amount = current_level_stats[KEY_STRENGTH_ATTRIBUTE]
-        agility_increase_amount = current_level_stats[KEY_AGILITY_ATTRIBUTE]
-        armor_increase_amount = current_level_stats[KEY_ARMOR_ATTRIBUTE]
+        total_experience = CHARACTER_CUMULATIVE_XP_REQUIREMENTS[self.level - 1] + self.experience
+        new_level = min(bisect_right(CHARACTER_CUMULATIVE_XP_REQUIREMENTS, total_experience), CHARACTER_MAXIMUM_LEVEL)
+        if new_level <= self.level:  # the maximum level
+            return
 
+        self._level_up(to_level=new_level)
+        self.experience = total_experience - CHARACTER_CUMULATIVE_XP_REQUIREMENTS[new_level - 1]
+
+    def _level_up(self, to_level: int=0, to_print=True):
+        """
+        Level the character up once or, if we're given a to_level, straight to that level.
+        The stats gained are taken from the cumulative level stats table, so that the stats are added and the
+        formulas recalculated only once, regardless of how many levels are gained
+        """
+        from_level = self.level
+        to_level = max(to_level, from_level + 1)
+        from_level_stats = CHARACTER_CUMULATIVE_LEVELUP_STATS[from_level]
+        to_level_stats = CHARACTER_CUMULATIVE_LEVELUP_STATS[to_level]
+        # the stats the character gains on the way from his level to the new one
+        hp_increase_amount = to_level_stats[KEY_LEVEL_STATS_HEALTH] - from_level_stats[KEY_LEVEL_STATS_HEALTH]
+        mana_increase_amount = to_level_stats[KEY_LEVEL_STATS_MANA] - from_level_stats[KEY_LEVEL_STATS_MANA]
+        strength_increase_amount = to_level_stats[KEY_STRENGTH_ATTRIBUTE] - from_level_stats[KEY_STRENGTH_ATTRIBUTE]
+        agility_increase_amount = to_level_stats[KEY_AGILITY_ATTRIBUTE] - from_level_stats[KEY_AGILITY_ATTRIBUTE]
+        armor_increase_amount = to_level_stats[KEY_ARMOR_ATTRIBUTE] - from_level_stats[KEY_ARMOR_ATTRIBUTE]
+
+        self.level = to_level
         self.max_health += hp_increase_amount
         self.max_mana += mana_increase_amount
-        self.attributes[KEY_STRENGTH_ATTRIBUTE] += strength_increase_amount
-        self.attributes[KEY_ARMOR_ATTRIBUTE] += armor_increase_amount
-        self.attributes[KEY_AGILITY_ATTRIBUTE] += agility_increase_amount
-        self._calculate_stats_formulas()  # recalculate formulas with stats
+        # recalculates the formulas with the stats
+        self._modify_stat_layer(KEY_STAT_LAYER_LEVEL, {KEY_STRENGTH_ATTRIBUTE: strength_increase_amount,
+                                                       KEY_ARMOR_ATTRIBUTE: armor_increase_amount,
+                                                       KEY_AGILITY_ATTRIBUTE: agility_increase_amount})
         self._regenerate()  # regen to full hp/mana
+        self.xp_req_to_level: int = self._lookup_next_xp_level_req()
 
         if to_print:
             print_level_up_event(name=self.name, level=self.level, armor_inc=armor_increase_amount,
@@ -979,8 +1094,7 @@ class Character(LivingThing):
         This method is called at the start of every turn
         It reduces the active cooldowns of our spells by 1, because a turn has passed
         """
-        for spell in self.learned_spells.values():
-            spell.pass_turn()
+        self.spell_cooldowns.pass_turn()
 
     def get_class(self) -> str:
         """Returns the class of the character as a string"""
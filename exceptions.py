@@ -8,7 +8,7 @@ class Error(Exception):
 
 class ItemNotInInventoryError(Error):
     """ This exception is raised whenever the item we want to remove from our inventory is not there. """
-    def __init__(self, message, inventory: dict, item_name: str, *args):
+    def __init__(self, message, inventory: 'Inventory', item_name: str, *args):
         self.message = message
         self.inventory = inventory
         # value that caused the error
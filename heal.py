@@ -9,6 +9,8 @@ from constants import (HOLY_HEAL_DOUBLE_HEAL_CHANCE as DOUBLE_HEAL_CHANCE,
 
 
 class Heal:
+    __slots__ = ('heal_amount',)
+
     def __init__(self, heal_amount: float=0):
         self.heal_amount = heal_amount
 
@@ -44,6 +46,8 @@ class NatureHeal(Heal):
     The idea with nature heal is that every such heal leaves off a HoT (healing over time effect)
     for a % of the main heal
     """
+    __slots__ = ()
+
     def __init__(self):
         raise NotImplementedError()
 
@@ -52,6 +56,8 @@ class HolyHeal(Heal):
     """
     The idea with holy heal is that every such heal has a significant chance to heal for double it's original amount.
     """
+    __slots__ = ('will_double_heal',)
+
     def __init__(self, heal_amount: float=0):
         super().__init__(heal_amount)
         self.will_double_heal: bool = self.check_double_heal()
@@ -90,6 +96,8 @@ class ProtectiveHeal(Heal):
     The idea with protective heal is that every such heal leaves off a slight absorption shield on the target, absorbing
     a % of the original heal.
     """
+    __slots__ = ('target', 'added_shield', 'shield')
+
     def __init__(self, heal_amount: float, target):
         super().__init__(heal_amount)
         self.target = target
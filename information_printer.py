@@ -1,6 +1,8 @@
 """
 This module will hold functions that print all kinds of information to the player
 """
+import logging
+
 from termcolor import colored
 # from zones.zone import Zone
 from constants import (CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_BRACER_KEY,
@@ -10,16 +12,29 @@ from constants import (CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_BRACER
                        CHARACTER_EQUIPMENT_BELT_KEY)
 
 
+class _PrintHandler(logging.Handler):
+    """ Prints the messages, so that they go wherever sys.stdout currently points to """
+    def emit(self, record: logging.LogRecord):
+        print(self.format(record))
+
+
+# The messages of the turns taken in a fight - attacks, spells, status effects and deaths.
+# They are printed like everything else, but can be muted by raising the logger's level above INFO (see auto_combat.py)
+combat_log = logging.getLogger('python_wow.combat')
+combat_log.setLevel(logging.INFO)
+combat_log.propagate = False
+combat_log.addHandler(_PrintHandler())
+
+
 def print_inventory(character: 'Character'):
     inventory = character.inventory
     """ Prints the Character's inventory """
     print("Your inventory:")
 
     # print the gold separately so it always comes up on top
-    print(f"\t{inventory['gold']} gold")
-    for key, item_tuple in [(k, v) for k, v in inventory.items() if k != 'gold']:
-        item, item_count = item_tuple
-        print(f'\t{item_count} {item}')
+    print(f"\t{inventory.gold} gold")
+    for stack in inventory.stacks():
+        print(f'\t{stack.count} {stack.item}')
 
 
 def print_level_up_event(name, level, armor_inc, hp_inc, mana_inc, strength_inc, agi_inc):
@@ -36,16 +51,14 @@ def print_level_up_event(name, level, armor_inc, hp_inc, mana_inc, strength_inc,
     print('*' * 20)
 
 
-def print_quest_log(quest_log):
+def print_quest_log(character: 'Character'):
     """
-    Print out the character's quest log
-    :param quest_log: {str: 'Quest'} - the quest log of the character
+    Print out the character's quest log, with his progress on every quest
     """
     print("Your quest log:")
 
-    for quest in quest_log.values():
-        # TODO: validate quest types, maybe move to a str
-        print(f'\t{quest.name} - {quest.kills}/{quest.required_kills} {quest.required_monster} slain.')
+    for quest in character.quest_log.values():
+        print(f'\t{quest.get_progress_description(character)}')
 
     print()
 
@@ -239,15 +252,18 @@ def print_available_character_classes():
     print("| "*20)
 
 
-def print_available_characters_to_load(characters_list: list):
+def print_available_characters_to_load(characters_list: list, has_next_page: bool=False):
     """
-    This function prints all the saved characters in the database that the player can choose to load
+    This function prints the saved characters in the database that the player can choose to load
     :param characters_list: A list of dictionaries for each character, holding the keys 'name','class' and 'level'.
+    :param has_next_page: whether there are more characters to list after these ones
     """
     if characters_list:
         print("Available characters to load:")
         for character in characters_list:
             print(f"\t| {character['name']} - {character['level']} {character['class']}")
+        if has_next_page:
+            print(f"Type {colored('next', color='magenta')} to see more characters.")
     else:
         print("No available characters to laod from the DB, enter something to exit this prompt.")
 
@@ -0,0 +1,116 @@
+"""
+This module holds the inventory of a character
+"""
+from collections.abc import Mapping
+
+from items import Item
+
+
+class ItemStack:
+    """
+    A stack of the same item in an inventory.
+    It unpacks and compares like an (Item, count) tuple, i.e item, count = inventory['Wolf Meat']
+    """
+    __slots__ = ('item', 'count')
+
+    def __init__(self, item: Item, count: int):
+        self.item = item
+        self.count = count
+
+    def __iter__(self):
+        yield self.item
+        yield self.count
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    __hash__ = None  # the count is mutable
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.item!r}, {self.count})'
+
+
+class Inventory(Mapping):
+    """
+    The inventory of a character, a read-only dictionary of Key: item name, Value: ItemStack.
+    The gold is held separately, in the gold attribute.
+
+    The stacks are indexed both by the item's name and by its ID, so that adding or removing any count of an item
+    only touches its own stack. Items are added and removed through add_item and remove_item.
+    """
+    def __init__(self, stacks: {str: (Item, int)}=None, gold: int=0):
+        """
+        :param stacks: a dictionary of Key: item name, Value: tuple(Item class instance, Item Count)
+        """
+        self.gold = gold
+        self._stacks_by_name: {str: ItemStack} = {}
+        self._stacks_by_id: {int: ItemStack} = {}
+        for item, item_count in (stacks or {}).values():
+            self.add_item(item, item_count)
+
+    def __getitem__(self, item_name: str) -> ItemStack:
+        return self._stacks_by_name[item_name]
+
+    def __contains__(self, item_name):
+        return item_name in self._stacks_by_name
+
+    def __iter__(self):
+        return iter(self._stacks_by_name)
+
+    def __len__(self):
+        return len(self._stacks_by_name)
+
+    def __eq__(self, other):
+        if isinstance(other, Inventory) and self.gold != other.gold:
+            return False
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._stacks_by_name}, gold={self.gold})'
+
+    def add_item(self, item: Item, item_count: int=1):
+        stack = self._stacks_by_id.get(item.id)
+        if stack is None:
+            stack = ItemStack(item, 0)
+            self._stacks_by_id[item.id] = stack
+            self._stacks_by_name[item.name] = stack
+        stack.count += item_count
+
+    def remove_item(self, item_name: str, item_count: int=1) -> int:
+        """
+        Removes the count of the item, removing the whole stack if there are not any left
+        :return: the count of the item that is left
+        """
+        stack = self._stacks_by_name[item_name]
+        stack.count -= item_count
+        if stack.count <= 0:
+            self.remove_stack(item_name)
+            return 0
+
+        return stack.count
+
+    def remove_stack(self, item_name: str):
+        """ Removes every item by the name """
+        stack = self._stacks_by_name.pop(item_name)
+        del self._stacks_by_id[stack.item.id]
+
+    def get_item(self, item_name: str) -> Item:
+        """ Returns the item by the name or None if there is no such item """
+        stack = self._stacks_by_name.get(item_name)
+        return stack.item if stack is not None else None
+
+    def get_item_count(self, item_name: str) -> int:
+        stack = self._stacks_by_name.get(item_name)
+        return stack.count if stack is not None else 0
+
+    def get_stack_by_id(self, item_id: int) -> ItemStack:
+        """ Returns the stack of the item with the ID or None if there is no such item """
+        return self._stacks_by_id.get(item_id)
+
+    def stacks(self):
+        """ Returns a view of every ItemStack, without copying them """
+        return self._stacks_by_name.values()
+
+    def serialize(self) -> [(int, int)]:
+        """ Returns a list of tuples of (item ID, item count), as they are saved in the DB """
+        return [(item_id, stack.count) for item_id, stack in self._stacks_by_id.items()]
@@ -10,6 +10,8 @@ from utils.helper import display_attributes
 
 
 class Item:
+    __slots__ = ('name', 'id', 'buy_price', 'sell_price', 'quest_id')
+
     def __init__(self, name: str, item_id: int, buy_price: int, sell_price: int, quest_id: int=0):
         self.name = name
         self.id = item_id
@@ -25,6 +27,8 @@ class Item:
 
 
 class Weapon(Item):
+    __slots__ = ('min_damage', 'max_damage', 'attributes')
+
     def __init__(self, name: str, item_id: int, buy_price: int = 0, sell_price: int = 0, min_damage: int = 0,
                  max_damage: int = 1, attributes: dict=CHAR_ATTRIBUTES_TEMPLATE):
         super().__init__(name, item_id, buy_price, sell_price)
@@ -36,10 +40,17 @@ class Weapon(Item):
         return colored(f'{self.name}', color="green") + f'- Weapon ({self.min_damage}-{self.max_damage}) damage'
 
 
+def create_starter_weapon() -> Weapon:
+    """ Create the weapon every character starts the game with. It is not part of the item_template table """
+    return Weapon(name="Starter Weapon", item_id=0, min_damage=1, max_damage=3)
+
+
 class Equipment(Item):
     """ Any item that can be equipped in an equipment slot, as distinguished from items that can only be
     carried in the inventory.
     ex: Headpiece, Shoulderpad, Necklace, Chestguard, Bracer, Gloves, Belt, Leggings, Boots"""
+    __slots__ = ('slot', 'attributes')
+
     def __init__(self, name: str, item_id: int, slot: str, attributes: dict=CHAR_ATTRIBUTES_TEMPLATE, buy_price: int=0, sell_price: int=0):
         super().__init__(name, item_id, buy_price, sell_price)
         self.slot = slot
@@ -53,6 +64,8 @@ class Equipment(Item):
 
 class Potion(Item):
     """ Consumable item that gives a buff to the player"""
+    __slots__ = ('buff',)
+
     def __init__(self, name: str, item_id: int, buy_price: int, sell_price: int, buff: BeneficialBuff, quest_id: int=0):
         super().__init__(name, item_id, buy_price, sell_price, quest_id)
         self.buff = buff
@@ -1,27 +1,61 @@
+import argparse
 import atexit
+import random
+import sys
+
 import database.main
+from database.database_info import DB_PATH
+from database.migrations import upgrade_database
 from models import main as _  # load all the DB models
 from command_router import route_main_commands
 from information_printer import print_live_monsters, print_live_npcs, welcome_print
 from zones.zone import Zone
-from items import Weapon
+from items import create_starter_weapon
 from models.characters.saver import save_character
 from start_game_prompt import get_player_character
-from zones.northshire_abbey import NorthshireAbbey
+from world import World
+from batch import CommandScript, run_script, scratch_database
 GAME_VERSION = '0.1.0 ALPHA'
-ZONES = {"Northshire Abbey": None}
 
 
-def main():
+def main(arguments: [str]=None):
+    options = parse_arguments(arguments)
+    if options.seed is not None:
+        random.seed(options.seed)
+    upgrade_database(DB_PATH)  # bring a database saved by an older version of the game up to date
+
+    if options.script is None:
+        run_game()
+        return
+
+    if options.script == '-':
+        script = CommandScript(sys.stdin)
+    else:
+        with open(options.script) as script_file:
+            script = CommandScript(script_file)
+    with scratch_database(database.main.session, DB_PATH):
+        run_script(script, lambda: run_game(save_on_exit=False))
+
+
+def parse_arguments(arguments: [str]=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='A console turn-based RPG game inspired by the Warcraft universe')
+    parser.add_argument('--script', metavar='FILE',
+                        help='read the commands from a file (- for stdin) rather than the console, see batch.py')
+    parser.add_argument('--seed', type=int, help='seed the random generator, so that a script plays out the same')
+    return parser.parse_args(arguments)
+
+
+def run_game(save_on_exit: bool=True):
+    """ :param save_on_exit: save the character when the game is quit """
     welcome_print(GAME_VERSION)
     main_character = get_player_character()
-    atexit.register(on_exit_handler, main_character)
-    ZONES["Northshire Abbey"] = NorthshireAbbey(main_character)
-    starter_weapon = Weapon(name="Starter Weapon", item_id=0, min_damage=1, max_damage=3)
-    main_character._equip_weapon(starter_weapon)
+    if save_on_exit:
+        atexit.register(on_exit_handler, main_character)
+    world = World(main_character)
+    main_character._equip_weapon(create_starter_weapon())
     print(f'Character {main_character.name} created!')
 
-    zone_object = get_zone_object(main_character.current_zone)  # type: Zone
+    zone_object = world.get_zone(main_character.current_zone)  # type: Zone
 
     alive_npcs, _ = zone_object.get_cs_npcs()
     alive_monsters, _ = zone_object.get_cs_monsters()
@@ -32,14 +66,7 @@ def main():
     # main game loop
     while True:
         route_main_commands(main_character, zone_object)
-
-
-def get_zone_object(zone: str) -> Zone:
-    """
-    :param zone: The name of the zone
-    :return: Returns a class object from the ZONES dictionary
-    """
-    return ZONES[zone]
+        world.pass_turn()
 
 
 def on_exit_handler(character):
@@ -1,8 +1,61 @@
-from sqlalchemy.orm import load_only
+import sys
+
+from sqlalchemy.orm import joinedload, selectinload
 
 from exceptions import NoSuchCharacterError
-from models.characters.saved_character import SavedCharacterSchema
+from inventory import Inventory
+from models.characters.saved_character import SavedCharacterSchema, build_character
 from database.main import session
+from models.items.loader import load_item
+from models.quests.loader import load_quest
+from quest import KillQuest
+from utils.guid_set import GuidSet
+from utils.lru_cache import LRUCache
+from constants import (SAVED_CHARACTER_CACHE_MAX_COUNT, SAVED_CHARACTER_CACHE_MAX_BYTES,
+                       SAVED_CHARACTER_ROSTER_PAGE_SIZE,
+                       CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_LEGGINGS_KEY,
+                       CHARACTER_EQUIPMENT_BELT_KEY, CHARACTER_EQUIPMENT_GLOVES_KEY,
+                       CHARACTER_EQUIPMENT_BRACER_KEY,
+                       CHARACTER_EQUIPMENT_CHESTGUARD_KEY, CHARACTER_EQUIPMENT_HEADPIECE_KEY,
+                       CHARACTER_EQUIPMENT_NECKLACE_KEY,
+                       CHARACTER_EQUIPMENT_SHOULDERPAD_KEY)
+
+# Key: the equipment slot in Character.equipment, Value: the key of the item's ID in a serialized character
+EQUIPMENT_SLOT_ID_KEYS = {CHARACTER_EQUIPMENT_HEADPIECE_KEY: 'headpiece_id',
+                          CHARACTER_EQUIPMENT_SHOULDERPAD_KEY: 'shoulderpad_id',
+                          CHARACTER_EQUIPMENT_NECKLACE_KEY: 'necklace_id',
+                          CHARACTER_EQUIPMENT_CHESTGUARD_KEY: 'chestguard_id',
+                          CHARACTER_EQUIPMENT_BRACER_KEY: 'bracer_id',
+                          CHARACTER_EQUIPMENT_GLOVES_KEY: 'gloves_id',
+                          CHARACTER_EQUIPMENT_BELT_KEY: 'belt_id',
+                          CHARACTER_EQUIPMENT_LEGGINGS_KEY: 'leggings_id',
+                          CHARACTER_EQUIPMENT_BOOTS_KEY: 'boots_id'}
+# The options which load a saved character along with everything that is converted into the Character object -
+# his equipment is joined onto the character's row, while his completed quests and his inventory (with its items and
+# their buffs) are each loaded in a single query
+SAVED_CHARACTER_LOAD_OPTIONS = ([joinedload(id_key[:-len('_id')]) for id_key in EQUIPMENT_SLOT_ID_KEYS.values()]
+                                + [selectinload('completed_quests'),
+                                   selectinload('inventory').joinedload('item').joinedload('buff')])
+
+
+CHARACTER_RECORD_ENTRY_SIZE = 100  # the estimated bytes of an item, quest or script in a character record
+
+
+def estimate_character_record_size(character_record: dict) -> int:
+    """
+    A rough estimate of the memory the character record takes up, counted out of its packed kills and the count of
+    its other entries rather than by walking through everything it references (the shared Item objects included)
+    """
+    entry_count = (len(character_record['inventory']) + len(character_record['equipment'])
+                   + len(character_record['completed_quests']) + len(character_record['loaded_scripts']))
+    return (sys.getsizeof(character_record) + len(character_record['packed_killed_monsters'])
+            + entry_count * CHARACTER_RECORD_ENTRY_SIZE)
+
+
+# Key: the character's name, Value: the record of his saved row (see SavedCharacterSchema.convert_to_character_record)
+# Logging back in is then a lookup and a build of the Character out of it, the cache is invalidated by save_character
+loaded_characters = LRUCache(max_count=SAVED_CHARACTER_CACHE_MAX_COUNT, max_bytes=SAVED_CHARACTER_CACHE_MAX_BYTES,
+                             size_function=estimate_character_record_size)
 
 
 def load_saved_character(name: str):
@@ -17,20 +70,88 @@ Netherblood, Paladin,     10,                 1,                    1,
     For more information:
     https://github.com/Enether/python_wow/wiki/How-saving-a-Character-works-and-information-about-the-saved_character-database-table.
     """
-    from classes import Paladin
-    loaded_character: SavedCharacterSchema = session.query(SavedCharacterSchema).filter_by(name=name).one_or_none()
+    if name not in loaded_characters:
+        loaded_character: SavedCharacterSchema = (session.query(SavedCharacterSchema)
+                                                  .options(*SAVED_CHARACTER_LOAD_OPTIONS)
+                                                  .filter_by(name=name).one_or_none())
 
-    if loaded_character is None:
-        raise NoSuchCharacterError(f'There is no saved character by the name of {name}!')
+        if loaded_character is None:
+            raise NoSuchCharacterError(f'There is no saved character by the name of {name}!')
+        loaded_characters[name] = loaded_character.convert_to_character_record()
 
-    return loaded_character.convert_to_character_object()
+    # every load builds a new Character, as playing modifies him, while the record has to stay as it is saved
+    return build_character(loaded_characters[name])
 
 
-def load_all_saved_characters_general_info() -> [dict()]:
+def load_saved_characters_general_info_page(after_name: str=None, name_prefix: str='',
+                                            page_size: int=SAVED_CHARACTER_ROSTER_PAGE_SIZE) -> [dict]:
     """
-    This function loads general information about the saved characters in the DB and returns it as a list of
-    dictionaries to  be easily printable.
+    Load a page of the general information about the saved characters, ordered by their names.
+    The page is looked up by the name it starts after, rather than by an offset, so that it goes through the index on
+    saved_character.name and loading any page costs the same no matter how many characters are saved.
+    :param after_name: the name of the last character of the previous page, None for the first page
+    :param name_prefix: only load the characters whose names start with it (case sensitive)
+    :return: A list of up to page_size dictionaries of the characters' name, class and level, to be easily printable
     """
-    loaded_characters: [SavedCharacterSchema] = session.query(SavedCharacterSchema).options(load_only("name", "character_class", "level")).all()
+    query = session.query(SavedCharacterSchema.name, SavedCharacterSchema.character_class, SavedCharacterSchema.level)
+    if name_prefix:
+        # a range rather than a LIKE, as SQLite's LIKE is case insensitive and cannot use the index
+        # 'Net' -> 'Net' <= name < 'Neu'
+        name_upper_bound = name_prefix[:-1] + chr(ord(name_prefix[-1]) + 1)
+        query = query.filter(SavedCharacterSchema.name >= name_prefix, SavedCharacterSchema.name < name_upper_bound)
+    if after_name is not None:
+        query = query.filter(SavedCharacterSchema.name > after_name)
+
+    return [{'name': name, 'class': character_class, 'level': level}
+            for name, character_class, level in query.order_by(SavedCharacterSchema.name).limit(page_size)]
+
+
+def forget_saved_character(name: str):
+    """ Invalidate the cached character, as he has been saved anew """
+    loaded_characters.pop(name, None)
+
+
+def deserialize_character(serialized_character: dict):
+    """
+    Build a Character object from the dictionary created by models.characters.saver.serialize_character
+    This is used to receive a character that was handed off from another process (zone shard)
+    """
+    from classes import Paladin
+    from items import create_starter_weapon
+
+    loaded_scripts: {str} = set(serialized_character['loaded_scripts'])
+    killed_monsters: GuidSet = GuidSet(serialized_character['killed_monsters'])
+    completed_quests: {str} = set(serialized_character['completed_quests'])
+    inventory = Inventory(gold=serialized_character['gold'])
+    for item_id, item_count in serialized_character['inventory']:
+        inventory.add_item(load_item(item_id), item_count)
+    equipment = {slot: load_item(serialized_character[id_key]) if serialized_character[id_key] else None
+                 for slot, id_key in EQUIPMENT_SLOT_ID_KEYS.items()}
+
+    if serialized_character['character_class'] == 'paladin':
+        character = Paladin(name=serialized_character['name'],
+                            level=serialized_character['level'],
+                            loaded_scripts=loaded_scripts,
+                            killed_monsters=killed_monsters,
+                            completed_quests=completed_quests,
+                            saved_inventory=inventory,
+                            saved_equipment=equipment)
+    else:
+        raise Exception(f'Unsupported class - {serialized_character["character_class"]}')
+
+    # the starter weapon is not in the item_template table and has an ID of 0
+    weapon_id: int = serialized_character['weapon_id']
+    character._equip_weapon(load_item(weapon_id) if weapon_id else create_starter_weapon())
+    character.experience = serialized_character['experience']
+    character.health = serialized_character['health']
+    character.mana = serialized_character['mana']
+    for quest_id, kills, is_completed in serialized_character['quest_log']:
+        quest = load_quest(quest_id)
+        if isinstance(quest, KillQuest):
+            quest.kills = kills
+        quest.is_completed = is_completed
+        character.quest_log[quest_id] = quest
+    character.current_zone = serialized_character['current_zone']
+    character.current_subzone = serialized_character['current_subzone']
 
-    return [{'name': ch.name, 'class': ch.character_class, 'level': ch.level} for ch in loaded_characters]
+    return character
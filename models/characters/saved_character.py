@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, LargeBinary, ForeignKey
 from sqlalchemy.orm import relationship
 
 from models.items.item_template import ItemTemplateSchema
 from entities import Character
+from inventory import Inventory
 from constants import (CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_LEGGINGS_KEY,
                        CHARACTER_EQUIPMENT_BELT_KEY, CHARACTER_EQUIPMENT_GLOVES_KEY,
                        CHARACTER_EQUIPMENT_BRACER_KEY,
@@ -11,6 +12,7 @@ from constants import (CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_LEGGIN
                        CHARACTER_EQUIPMENT_SHOULDERPAD_KEY)
 from classes import Paladin
 from database.main import Base
+from utils.guid_set import GuidSet
 
 
 class SavedCharacterSchema(Base):
@@ -20,11 +22,16 @@ class SavedCharacterSchema(Base):
         character_class - the class of the character
         level - the level of the character
         gold - the amount of gold the character has
+        packed_killed_monsters - the GUIDs of the monsters that the character has killed, packed by
+            utils.guid_set.pack_guids. This works only for monsters that by design should not be killed twice
+            if the player restarts the game
+        packed_loaded_scripts - the names of the scripts the character has seen (and should not see again),
+            separated by a new line
     """
     __tablename__ = 'saved_character'
 
     entry = Column(Integer, primary_key=True)
-    name = Column(String(60))
+    name = Column(String(60), unique=True)  # the unique index is what the roster is paged through
     character_class = Column('class', String(60))
     level = Column(Integer)
     gold = Column(Integer)
@@ -38,6 +45,8 @@ class SavedCharacterSchema(Base):
     belt_id = Column(Integer, ForeignKey('item_template.entry'))
     leggings_id = Column(Integer, ForeignKey('item_template.entry'))
     boots_id = Column(Integer, ForeignKey('item_template.entry'))
+    packed_killed_monsters = Column(LargeBinary)
+    packed_loaded_scripts = Column(Text)
 
     headpiece: ItemTemplateSchema or None = relationship('ItemTemplateSchema', foreign_keys=[headpiece_id])
     shoulderpad: ItemTemplateSchema or None = relationship('ItemTemplateSchema', foreign_keys=[shoulderpad_id])
@@ -51,7 +60,8 @@ class SavedCharacterSchema(Base):
 
     def __init__(self, name: str, character_class: str, level: int, gold: int, headpiece_id: int,
                  shoulderpad_id: int, necklace_id: int, chestguard_id: int, bracer_id: int, gloves_id: int,
-                 belt_id: int, leggings_id: int, boots_id: int):
+                 belt_id: int, leggings_id: int, boots_id: int, packed_killed_monsters: bytes=b'',
+                 packed_loaded_scripts: str=''):
         # A init function for easily creating an object when wanting to insert a new row in the table
         super().__init__()
         self.name = name
@@ -67,6 +77,8 @@ class SavedCharacterSchema(Base):
         self.belt_id = belt_id
         self.leggings_id = leggings_id
         self.boots_id = boots_id
+        self.packed_killed_monsters = packed_killed_monsters
+        self.packed_loaded_scripts = packed_loaded_scripts
 
     def build_equipment(self) -> {str: 'Item' or None}:
         """
@@ -92,25 +104,47 @@ class SavedCharacterSchema(Base):
 
     def convert_to_character_object(self) -> Character:
         """ Convert the SavedCharacter object to a Character object to be used in the game"""
-        loaded_scripts: {str} = {script.script_name for script in self.loaded_scripts}
-        killed_monsters: {int} = {monster.guid for monster in self.killed_monsters}
-        completed_quests: {str} = {quest.quest_id for quest in self.completed_quests}
-        inventory: {str: tuple} = {i_schema.item.name: (i_schema.item.convert_to_item_object(), i_schema.item_count)
-                                   for i_schema in self.inventory}
-        inventory['gold'] = self.gold
-        equipment = self.build_equipment()
-        print(equipment)
-
-        if self.character_class == 'paladin':
-            return Paladin(name=self.name,
-                           level=self.level,
-                           loaded_scripts=loaded_scripts,
-                           killed_monsters=killed_monsters,
-                           completed_quests=completed_quests,
-                           saved_inventory=inventory,
-                           saved_equipment=equipment)
-        else:
-            raise Exception(f'Unsupported class - {self.character_class}')
+        return build_character(self.convert_to_character_record())
+
+    def convert_to_character_record(self) -> dict:
+        """
+        Convert the SavedCharacter object to the values a Character is built out of (see build_character),
+        which do not hold on to the DB row and out of which any number of Character objects can be built
+        :return: A dictionary like the following:
+            {'name': 'Netherblood', 'character_class': 'paladin', 'level': 3, 'gold': 61,
+             'loaded_scripts': frozenset({'HASKEL_PAXTON_CONVERSATION'}), 'packed_killed_monsters': b'\x0e\x01\x05',
+             'completed_quests': frozenset({1}), 'inventory': [(Item, 5)], 'equipment': {'headpiece': Item, ...}}
+        """
+        return {'name': self.name, 'character_class': self.character_class, 'level': self.level, 'gold': self.gold,
+                'loaded_scripts': (frozenset(self.packed_loaded_scripts.split('\n'))
+                                   if self.packed_loaded_scripts else frozenset()),
+                'packed_killed_monsters': self.packed_killed_monsters or b'',
+                'completed_quests': frozenset(quest.quest_id for quest in self.completed_quests),
+                'inventory': [(i_schema.item.convert_to_item_object(), i_schema.item_count)
+                              for i_schema in self.inventory],
+                'equipment': self.build_equipment()}
+
+
+def build_character(character_record: dict) -> Character:
+    """
+    Build a Character out of the values of SavedCharacterSchema.convert_to_character_record.
+    The character gets his own sets, inventory and equipment, while the Item objects in them are shared,
+    as every other loaded item is
+    """
+    inventory = Inventory(gold=character_record['gold'])
+    for item, item_count in character_record['inventory']:
+        inventory.add_item(item, item_count)
+
+    if character_record['character_class'] == 'paladin':
+        return Paladin(name=character_record['name'],
+                       level=character_record['level'],
+                       loaded_scripts=set(character_record['loaded_scripts']),
+                       killed_monsters=GuidSet.from_packed(character_record['packed_killed_monsters']),
+                       completed_quests=set(character_record['completed_quests']),
+                       saved_inventory=inventory,
+                       saved_equipment=dict(character_record['equipment']))
+    else:
+        raise Exception(f'Unsupported class - {character_record["character_class"]}')
 
 
 class CompletedQuestsSchema(Base):
@@ -159,46 +193,3 @@ class InventorySchema(Base):
 
     _ = relationship('SavedCharacterSchema', foreign_keys=[saved_character_id], backref='inventory')
     item = relationship('ItemTemplateSchema')
-
-
-class KilledMonstersSchema(Base):
-    """
-    This table holds information about all the monsters that the character has killed into the saved_character_killed_monsters DB table
-        saved_character_id - id of the character (NOT unique)
-        GUID - GUID of the monster in the creatures DB table
-    Table sample contents:
-         saved_character_id,    GUID(of monster)
-                          1,     14
-                          1,      7
-    IMPORTANT: This works only for monsters that by design should not be killed twice if the player restarts the game
-    """
-    # TODO: Hold more killed monsters per row to minimize queries
-    __tablename__ = 'saved_character_killed_monsters'
-
-    id = Column(Integer, primary_key=True)
-    saved_character_id = Column(Integer, ForeignKey('saved_character.entry'))
-    guid = Column(Integer, ForeignKey('creatures.guid'))
-
-    _ = relationship('SavedCharacterSchema', foreign_keys=[saved_character_id], backref='killed_monsters')
-    monster = relationship('CreaturesSchema')
-
-
-class LoadedScriptsSchema(Base):
-    """
-    This table holds the character's loaded scripts into the saved_character_loaded_scripts DB table
-        saved_character_id - id of the character (NOT unique)
-        script_name - the name of the script
-    Table sample contents:
-    saved_character_id,    script_name
-                     1,     HASKELL_PRAXTON_CONVERSATION
-                     1,     Something_Something_Something
-    Meaning the character whose loaded_scripts_id has seen both scripts and should not see them again in the game.
-    """
-    # TODO: Hold more scripts per row to minimize queries
-    __tablename__ = 'saved_character_loaded_scripts'
-
-    id = Column(Integer, primary_key=True)
-    saved_character_id = Column(Integer, ForeignKey('saved_character.entry'))
-
-    _ = relationship('SavedCharacterSchema', foreign_keys=[saved_character_id], backref='loaded_scripts')
-    script_name = Column(Text)
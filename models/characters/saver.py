@@ -4,21 +4,25 @@ This module takes care for saving a character to the database
 from sqlalchemy.sql.functions import coalesce, max as max_table_id
 
 from entities import Character
-from database.database_info import (DB_SC_COMPLETED_QUESTS_TABLE_NAME, DB_SC_INVENTORY_TABLE_NAME,
-                                    DB_SC_LOADED_SCRIPTS_TABLE_NAME, DB_SC_KILLED_MONSTERS_TABLE_NAME)
+from database.database_info import DB_SC_COMPLETED_QUESTS_TABLE_NAME, DB_SC_INVENTORY_TABLE_NAME
 from constants import (CHARACTER_EQUIPMENT_BELT_KEY, CHARACTER_EQUIPMENT_BOOTS_KEY,
                        CHARACTER_EQUIPMENT_CHESTGUARD_KEY, CHARACTER_EQUIPMENT_SHOULDERPAD_KEY,
                        CHARACTER_EQUIPMENT_HEADPIECE_KEY, CHARACTER_EQUIPMENT_NECKLACE_KEY,
                        CHARACTER_EQUIPMENT_BRACER_KEY, CHARACTER_EQUIPMENT_GLOVES_KEY, CHARACTER_EQUIPMENT_LEGGINGS_KEY)
+from inventory import Inventory
 from items import Item
+from quest import KillQuest
 from database.main import session
-from models.characters.saved_character import SavedCharacterSchema
-from models.characters.saved_character import CompletedQuestsSchema, SavedCharacterSchema, InventorySchema, LoadedScriptsSchema, KilledMonstersSchema
-
+from models.characters.saved_character import CompletedQuestsSchema, SavedCharacterSchema, InventorySchema
+from models.characters.loader import forget_saved_character
+from utils.guid_set import pack_guids
+
+# the keys from serialize_character's result which are columns in the saved_character table
+SAVED_CHARACTER_COLUMNS = ('name', 'character_class', 'level', 'gold', 'headpiece_id', 'shoulderpad_id',
+                           'necklace_id', 'chestguard_id', 'bracer_id', 'gloves_id', 'belt_id', 'leggings_id',
+                           'boots_id')
 ALLOWED_TABLES_TO_DELETE_FROM = {DB_SC_COMPLETED_QUESTS_TABLE_NAME: CompletedQuestsSchema,
-                                 DB_SC_INVENTORY_TABLE_NAME: InventorySchema,
-                                 DB_SC_KILLED_MONSTERS_TABLE_NAME: KilledMonstersSchema,
-                                 DB_SC_LOADED_SCRIPTS_TABLE_NAME: LoadedScriptsSchema}
+                                 DB_SC_INVENTORY_TABLE_NAME: InventorySchema}
 
 
 def save_character(character: Character):
@@ -26,26 +30,9 @@ def save_character(character: Character):
     Save the character into the database
     """
     character_info: SavedCharacterSchema = session.query(SavedCharacterSchema).filter_by(name=character.name).one_or_none()
-
-    character_level: int = character.level  # type: int
-    character_class: str = character.get_class()  # type: str
-    character_gold: int = character.inventory['gold']  # type: int
-    equipment: {str: int} = character.equipment
-    headpiece_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_HEADPIECE_KEY])
-    shoulderpad_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_SHOULDERPAD_KEY])
-    necklace_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_NECKLACE_KEY])
-    chestguard_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_CHESTGUARD_KEY])
-    bracer_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BRACER_KEY])
-    gloves_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_GLOVES_KEY])
-    belt_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BELT_KEY])
-    leggings_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_LEGGINGS_KEY])
-    boots_id: int = get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BOOTS_KEY])
-
-    character_values: {str: int or str} = {
-        'name': character.name, 'character_class': character_class, 'level': character_level, 'gold': character_gold,
-        'headpiece_id': headpiece_id, 'shoulderpad_id': shoulderpad_id, 'necklace_id': necklace_id,
-        'chestguard_id': chestguard_id, 'belt_id': belt_id, 'bracer_id': bracer_id, 'gloves_id': gloves_id,
-        'leggings_id': leggings_id, 'boots_id': boots_id}
+    serialized_character: dict = serialize_character(character)
+    character_values: {str: int or str} = {key: serialized_character[key] for key in SAVED_CHARACTER_COLUMNS}
+    character_values.update(pack_character_progress(character))
 
     # if the character exists, update the row, otherwise create a new one
     if character_info:
@@ -56,59 +43,67 @@ def save_character(character: Character):
 
     # save the sub-tables
     char_entry = session.query(SavedCharacterSchema).filter_by(name=character.name).first().entry
-    save_loaded_scripts(char_entry, character.loaded_scripts)
-    save_killed_monsters(char_entry, character.killed_monsters)
     save_completed_quests(char_entry, character.completed_quests)
     save_inventory(char_entry, character.inventory)
 
     session.commit()
+    forget_saved_character(character.name)
     print("-" * 40)
     print(f'Character {character.name} was saved successfully!')
     print("-" * 40)
 
 
-def save_loaded_scripts(char_id: int, loaded_scripts: set):
+def serialize_character(character: Character) -> dict:
     """
-    This function saves the character's loaded scripts into the saved_character_loaded_scripts DB table
-    Table sample contents:
-    id,    script_name
-      1,     HASKELL_PRAXTON_CONVERSATION
-
-    :param char_id: the ID of the character we have to save the loaded scripts to
-    :param loaded_scripts: a set containing all the names -> {HASKEL_PRAXTON_CONVERSATION} in this case
+    Convert the character into a dictionary of plain values, holding everything that is saved in the DB
+    (the saved_character columns and its sub-tables) along with the information about where the character is.
+    This is used to hand a character off between processes (zone shards)
+
+    :return: A dictionary like the following:
+        {'name': 'Netherblood', 'character_class': 'paladin', 'level': 3, 'gold': 61, 'headpiece_id': 11, ...
+         'loaded_scripts': ['HASKEL_PAXTON_CONVERSATION'], 'killed_monsters': [14], 'completed_quests': [1],
+         'inventory': [(1, 5)], 'weapon_id': 0, 'experience': 100, 'health': 41.5, 'mana': 30,
+         'quest_log': [(2, 3, False)], 'current_zone': 'Northshire Abbey', 'current_subzone': 'Northshire Valley'}
+        where inventory holds tuples of (item ID, item count)
+        and quest_log holds tuples of (quest ID, monsters killed for it, is it completed)
     """
-
-    delete_rows_from_table(table_name=DB_SC_LOADED_SCRIPTS_TABLE_NAME, char_id=char_id)  # delete the old values first
-
-    for loaded_script in loaded_scripts:
-        script_to_save = LoadedScriptsSchema()
-        script_to_save.saved_character_id = char_id
-        script_to_save.script_name = loaded_script
-
-        session.add(script_to_save)
-
-
-def save_killed_monsters(char_id: int, killed_monsters: set):
+    equipment: {str: Item} = character.equipment
+
+    return {
+        'name': character.name, 'character_class': character.get_class(), 'level': character.level,
+        'gold': character.inventory.gold,
+        'headpiece_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_HEADPIECE_KEY]),
+        'shoulderpad_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_SHOULDERPAD_KEY]),
+        'necklace_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_NECKLACE_KEY]),
+        'chestguard_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_CHESTGUARD_KEY]),
+        'bracer_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BRACER_KEY]),
+        'gloves_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_GLOVES_KEY]),
+        'belt_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BELT_KEY]),
+        'leggings_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_LEGGINGS_KEY]),
+        'boots_id': get_item_id_or_none(equipment[CHARACTER_EQUIPMENT_BOOTS_KEY]),
+        'loaded_scripts': sorted(character.loaded_scripts),
+        'killed_monsters': sorted(character.killed_monsters),
+        'completed_quests': sorted(character.completed_quests),
+        'inventory': character.inventory.serialize(),
+        'weapon_id': character.equipped_weapon.id,
+        'experience': character.experience,
+        'health': character.health,
+        'mana': character.mana,
+        'quest_log': [(quest_id, quest.kills if isinstance(quest, KillQuest) else 0, quest.is_completed)
+                      for quest_id, quest in character.quest_log.items()],
+        'current_zone': character.current_zone,
+        'current_subzone': character.current_subzone
+    }
+
+
+def pack_character_progress(character: Character) -> {str: bytes or str}:
     """
-    This function saves all the monsters that the character has killed into the saved_character_killed_monsters DB table
-    Table sample contents:
-    id,    GUID(of monster)
-          1,     14
-          1,      7
-    IMPORTANT: This works only for monsters that by design should not be killed twice if the player restarts the game
-
-    :param char_id:  the entry of the character we have to save the killed monsters to
-    :param killed_monsters: a set containing all the killed monster's GUIDs -> {14, 3, 2}
+    Pack the killed monsters and loaded scripts of the character into the values of their saved_character columns
+    :return: A dictionary like the following:
+        {'packed_killed_monsters': b'\x0e\x01\x05', 'packed_loaded_scripts': 'HASKEL_PAXTON_CONVERSATION'}
     """
-
-    delete_rows_from_table(table_name=DB_SC_KILLED_MONSTERS_TABLE_NAME, char_id=char_id)  # delete the old values first
-
-    for monster_guid in killed_monsters:
-        k_monster_to_save = KilledMonstersSchema()
-        k_monster_to_save.saved_character_id = char_id
-        k_monster_to_save.guid = monster_guid
-
-        session.add(k_monster_to_save)
+    return {'packed_killed_monsters': pack_guids(character.killed_monsters),
+            'packed_loaded_scripts': '\n'.join(sorted(character.loaded_scripts))}
 
 
 def save_completed_quests(char_id: int, completed_quests: set):
@@ -133,7 +128,7 @@ def save_completed_quests(char_id: int, completed_quests: set):
         session.add(c_quest_to_save)
 
 
-def save_inventory(char_id: int, inventory: dict):
+def save_inventory(char_id: int, inventory: Inventory):
     """
     This function saves the character's inventory into the saved_character_inventory DB table
     Table sample contents:
@@ -143,22 +138,14 @@ def save_inventory(char_id: int, inventory: dict):
      Meaning the character has 5 Wolf Meats in his inventory
 
     :param char_id: The id of the character this inventory is associated with
-    :param inventory: A dictionary, Key: item_name, Value: tuple(Item class instance, Item Count)
+    :param inventory: the Inventory of the character
     """
 
     delete_rows_from_table(table_name=DB_SC_INVENTORY_TABLE_NAME, char_id=char_id)  # delete the old values first
 
-    for item_name in inventory.keys():
-        if item_name != 'gold':
-            item_id = inventory[item_name][0].id  # get the instance of Item's ID
-            item_count = inventory[item_name][1]
-
-            inv_to_save = InventorySchema()
-            inv_to_save.saved_character_id = char_id
-            inv_to_save.item_id = item_id
-            inv_to_save.item_count = item_count
-
-            session.add(inv_to_save)
+    session.bulk_insert_mappings(InventorySchema, [{'saved_character_id': char_id, 'item_id': item_id,
+                                                    'item_count': item_count}
+                                                   for item_id, item_count in inventory.serialize()])
 
 
 def delete_rows_from_table(table_name: str, char_id: int):
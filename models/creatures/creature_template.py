@@ -1,7 +1,12 @@
 from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 
-from database.main import Base
+from database.main import Base, session
+from utils.copy_on_write import CopyOnWriteDict
+from utils.helper import parse_int
+
+# Key: the entry of a creature, Value: the CreatureTemplate object which every monster of that entry shares
+loaded_creature_templates: {int: 'CreatureTemplate'} = {}
 
 
 class CreatureTemplateSchema(Base):
@@ -49,27 +54,65 @@ class CreatureTemplateSchema(Base):
     quest_relation_id = Column(Integer, ForeignKey('quest_template.entry'))
     loot_table_id = Column(Integer, ForeignKey('loot_table.entry'))
     loot_table = relationship('LootTableSchema', foreign_keys=[loot_table_id])
-    vendor_inventory = relationship('NpcVendorSchema', uselist=True)
+    vendor = relationship('NpcVendorSchema', uselist=False)
     gossip = Column(Text)
     respawnable = Column(Boolean)
 
-    def build_vendor_inventory(self):
+    def convert_to_creature_template(self) -> 'CreatureTemplate':
+        """
+        Convert the monster's row to a CreatureTemplate, filling the rewards/armor from the creature_defaults table.
+        The template is converted once per entry, every later call returns the same object
+        """
+        if self.entry in loaded_creature_templates:
+            return loaded_creature_templates[self.entry]
+
+        from constants import CREATURE_DEFAULT_VALUES  # Hackish import to prevent an import loop
+        from entities import CreatureTemplate
+        level: int = parse_int(self.level)
+        armor: int = parse_int(self.armor)
+        level_defaults: dict = CREATURE_DEFAULT_VALUES[level]
+
+        creature_template = CreatureTemplate(entry=self.entry,
+                                             name=self.name,
+                                             health=parse_int(self.health),
+                                             mana=parse_int(self.mana),
+                                             level=level,
+                                             min_damage=parse_int(self.min_dmg),
+                                             max_damage=parse_int(self.max_dmg),
+                                             quest_relation_id=parse_int(self.quest_relation_id),
+                                             xp_to_give=level_defaults['xp_reward'],
+                                             gold_to_give_range=(level_defaults['min_gold_reward'],
+                                                                 level_defaults['max_gold_reward']),
+                                             loot_table=self.loot_table,
+                                             armor=armor if armor else level_defaults['armor'],
+                                             gossip=self.gossip,
+                                             respawnable=self.respawnable)
+        loaded_creature_templates[self.entry] = creature_template
+
+        return creature_template
+
+    def build_vendor_inventory(self) -> CopyOnWriteDict:
         """
         This function loads all the items that a certain vendor should sell.
-            We take them from the self.vendor_inventory list, which holds NpcVendor objects
+            We take them from the product list in the self.vendor NpcVendor object, which is shared by every vendor
+            that sells it. The vendor's own changes (the items he has sold) are held on the side.
 
-        :return: A dictionary of Key: "Item Name", Value: Tuple(1,2)
+        :return: A dictionary view of Key: "Item Name", Value: Tuple(1,2)
                                         1 - Item object of class Item from items.py
                                         2 - The count of the item
             """
-        vendor_inventory: {str: ('Item', int)} = {}
+        product_catalog: {str: ('Item', int)} = self.vendor.build_product_catalog() if self.vendor is not None else {}
+
+        return CopyOnWriteDict(product_catalog, copy_function=None)
+
 
-        for product in self.vendor_inventory:
-            item: 'Item' = product.item.convert_to_item_object()
-            item_count: int = product.item_count
+def get_creature_template(entry: int) -> 'CreatureTemplate':
+    """ Returns the CreatureTemplate of the given entry, converting it from the DB if it has not been loaded yet """
+    if entry in loaded_creature_templates:
+        return loaded_creature_templates[entry]
 
-            if product.price:  # check if there is anything set to price that'll make us override
-                item.buy_price = product.price
-            vendor_inventory[item.name] = (item, item_count)
+    creature_template: CreatureTemplateSchema = session.query(CreatureTemplateSchema).get(entry)
+    if creature_template is None:
+        raise Exception(f'There is no such creature template with an entry of {entry}!')
 
-        return vendor_inventory
+    return creature_template.convert_to_creature_template()
@@ -1,10 +1,12 @@
+from collections import namedtuple
+
 from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 
 from utils.helper import parse_int
-from entities import FriendlyNPC, VendorNPC, Monster
-from constants import CREATURE_DEFAULT_VALUES
-from database.main import Base
+from entities import FriendlyNPC, VendorNPC, Monster, CreatureTemplate, monster_pool
+from database.main import Base, session
+from models.creatures.creature_template import get_creature_template
 
 
 class CreaturesSchema(Base):
@@ -32,6 +34,11 @@ class CreaturesSchema(Base):
     zone = Column(String(60))
     sub_zone = Column(String(60))
 
+    def convert_to_spawn_record(self) -> 'SpawnRecord':
+        """ Converts the Creature to a SpawnRecord, which builds the living thing object only when it is needed """
+        return SpawnRecord(guid=self.guid, entry=self.creature_id, type=self.creature.type,
+                           level=parse_int(self.creature.level), name=self.creature.name)
+
     def convert_to_living_thing_object(self) -> VendorNPC or FriendlyNPC or Monster:
         """ Converts the Creature to whatever object he is according to his type column """
         # TODO: move to creature_template.py
@@ -69,23 +76,33 @@ class CreaturesSchema(Base):
                              inventory=vendor_inventory,
                              gossip=gossip)
         elif type_ == "monster":
-            gold_to_give_range = (CREATURE_DEFAULT_VALUES[level]['min_gold_reward'],
-                                  CREATURE_DEFAULT_VALUES[level]['max_gold_reward'])
-            xp_to_give = CREATURE_DEFAULT_VALUES[level]['xp_reward']
-            armor = armor if armor else CREATURE_DEFAULT_VALUES[level]['armor']
-            return Monster(monster_id=entry,
-                           name=name,
-                           health=health,
-                           mana=mana,
-                           armor=armor,
-                           level=level,
-                           min_damage=min_dmg,
-                           max_damage=max_dmg,
-                           quest_relation_id=quest_relation_id,
-                           loot_table=loot_table,
-                           xp_to_give=xp_to_give,
-                           gold_to_give_range=gold_to_give_range,
-                           gossip=gossip,
-                           respawnable=respawnable)
+            # every monster of the same entry shares its template, reusing a pooled Monster object if there is one
+            return monster_pool.acquire(self.creature.convert_to_creature_template())
         else:
             raise Exception(f'{type_} is not a valid creature type!')
+
+
+class SpawnRecord(namedtuple('SpawnRecord', ['guid', 'entry', 'type', 'level', 'name'])):
+    """
+    A compact record of a creature spawn, enough for listing, counting and looking up creatures by name.
+    The full Monster/NPC object (with its rolled gold, loot and buffs) is built from the DB only when the creature is
+    interacted with (engaged, talked to), by calling materialize()
+    """
+    __slots__ = ()
+
+    def materialize(self) -> VendorNPC or FriendlyNPC or Monster:
+        return session.query(CreaturesSchema).get(self.guid).convert_to_living_thing_object()
+
+    def copy_for_instance(self) -> VendorNPC or FriendlyNPC or Monster:
+        """ A player's own instance of a spawn is always a freshly built object """
+        return self.materialize()
+
+    def __str__(self):
+        """ Prints the spawn the same way its living thing object would be printed """
+        if self.type == 'monster':
+            template: CreatureTemplate = get_creature_template(self.entry)
+            return Monster.describe(template, template.health, template.health, template.mana, template.mana)
+        elif self.type == 'vendor':
+            return VendorNPC.describe(self.name)
+
+        return FriendlyNPC.describe(self.name)
@@ -3,29 +3,70 @@ from sqlalchemy.orm import relationship
 
 from database.main import Base
 
-# TODO: Rename
-""" TODO: Maybe split the table, it would be more efficient to hold a VendorProduct table, then 2 vendor can point to
-    1 document, rather than 2 """
+# Key: the entry of a vendor product list, Value: the products in it, shared by every vendor that sells that list
+loaded_vendor_product_lists: {int: {str: ('Item', int)}} = {}
 
 
 class NpcVendorSchema(Base):
     """
-    This table holds information regarding a single item a vendor sells
+    This table holds the product list that each vendor sells
 
     creature_entry - the entry of the vendor in creature_template
-    item_id - the ID of the item that he's supposed to sell
-    item_count - the count of items he sells at once
-    price - The price in gold. By default we use the Item's item.buy_price variable in it's class.
-        However, if this is set to something we override the price.
+    product_list_id - the entry of the products he sells in the vendor_product_list table
     Example:
-        creature_entry, item_id, item_count, price
-                13,       1,          5,    10
-    The NPC whose entry is 13, sells the item with ID 1, 5 at a time for 10 gold.
-    He sells the whole 5 items for 10 gold. He cannot sell 1,2,3 or 4 items, only 5 at once.
+        creature_entry, product_list_id
+                13,                1
+    The NPC whose entry is 13, sells the products in the list with entry 1.
+    Any number of vendors can sell the same product list.
     """
     __tablename__ = 'npc_vendor'
     creature_entry = Column(Integer, ForeignKey('creature_template.entry'), primary_key=True)
-    item_id = Column(Integer, ForeignKey('item_template.entry'))
+    product_list_id = Column(Integer)
+    products = relationship('VendorProductListSchema', uselist=True, viewonly=True,
+                            primaryjoin='NpcVendorSchema.product_list_id == foreign(VendorProductListSchema.entry)')
+
+    def build_product_catalog(self) -> {str: ('Item', int)}:
+        """
+        Build the products that the vendor sells. A product list is built once, every later call returns the same
+        dictionary, which must never be modified.
+
+        :return: A dictionary of Key: "Item Name", Value: Tuple(1,2)
+                                        1 - Item object of class Item from items.py
+                                        2 - The count of the item
+        """
+        if self.product_list_id in loaded_vendor_product_lists:
+            return loaded_vendor_product_lists[self.product_list_id]
+
+        catalog: {str: ('Item', int)} = {}
+        for product in self.products:
+            item: 'Item' = product.item.convert_to_item_object()
+
+            if product.price:  # check if there is anything set to price that'll make us override
+                item.buy_price = product.price
+            catalog[item.name] = (item, product.item_count)
+        loaded_vendor_product_lists[self.product_list_id] = catalog
+
+        return catalog
+
+
+class VendorProductListSchema(Base):
+    """
+    This table holds the products of every vendor product list, a row for each item in a list
+
+    entry - the entry of the product list
+    item_id - the ID of the item that is sold
+    item_count - the count of items that are sold at once
+    price - The price in gold. By default we use the Item's item.buy_price variable in it's class.
+        However, if this is set to something we override the price.
+    Example:
+        entry, item_id, item_count, price
+            1,       1,          5,    10
+    The product list with entry 1 sells the item with ID 1, 5 at a time for 10 gold.
+    It sells the whole 5 items for 10 gold. It cannot sell 1,2,3 or 4 items, only 5 at once.
+    """
+    __tablename__ = 'vendor_product_list'
+    entry = Column(Integer, primary_key=True)
+    item_id = Column(Integer, ForeignKey('item_template.entry'), primary_key=True)
     item = relationship('ItemTemplateSchema')
     item_count = Column(Integer)
     price = Column(Integer)
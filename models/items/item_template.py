@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy.orm import relationship
 
-from models.spells.loader import load_buff
+from models.spells.spell_buffs import BuffSchema
 from utils.helper import create_attributes_dict
 from items import Weapon, Equipment, Potion, Item
 from utils.helper import parse_int
@@ -55,6 +56,10 @@ class ItemTemplateSchema(Base):
     quest_id = Column(Integer, ForeignKey('quest_template.entry'), nullable=True, default=None)
     effect = Column(Integer)
 
+    # the buff a potion gives off, effect is not a foreign key as it only points to spell_buffs for potions
+    buff: BuffSchema or None = relationship('BuffSchema', viewonly=True,
+                                            primaryjoin='foreign(ItemTemplateSchema.effect) == BuffSchema.entry')
+
     def convert_to_item_object(self) -> Item:
         item_id: int = self.entry
         item_name: str = self.name
@@ -88,8 +93,9 @@ class ItemTemplateSchema(Base):
                 return Equipment(name=item_name, item_id=item_id, slot=item_slot, attributes=attributes,
                                  buy_price=item_buy_price, sell_price=item_sell_price)
         elif item_type == 'potion':
-            buff_id: int = self.effect
-            item_buff_effect: 'BeneficialBuff' = load_buff(buff_id)
+            if self.buff is None:
+                raise Exception(f'The potion {item_name} has no buff with an entry of {self.effect}!')
+            item_buff_effect: 'BeneficialBuff' = self.buff.convert_to_beneficial_buff_object()
 
             return Potion(name=item_name, item_id=item_id, buy_price=item_buy_price, sell_price=item_sell_price,
                           buff=item_buff_effect)
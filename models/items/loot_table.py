@@ -4,6 +4,9 @@ import random
 
 from database.main import Base, session
 
+# Key: the entry of an item template, Value: the Item object that every drop of it shares
+loaded_drop_items: {int: 'Item'} = {}
+
 
 class LootTableSchema(Base):
     """
@@ -100,6 +103,7 @@ class LootTableSchema(Base):
     item20_id = Column(Integer, ForeignKey('item_template.entry'))
     item20_chance = Column(Integer)
     item20 = relationship('ItemTemplateSchema', foreign_keys=[item20_id])
+    _valid_item_pairs = None  # the items that can drop, built on the first decide_drops call
 
     def decide_drops(self) -> ['Item']:
         """
@@ -107,17 +111,9 @@ class LootTableSchema(Base):
         to decide if it should drop or not
         :return: A list of the Item objects that have dropped
         """
-        item_pairs = [(self.item1, self.item1_chance), (self.item2, self.item2_chance), (self.item3, self.item3_chance), (self.item4, self.item4_chance),
-                      (self.item5, self.item5_chance), (self.item6, self.item6_chance), (self.item7, self.item7_chance), (self.item8, self.item8_chance),
-                      (self.item9, self.item9_chance), (self.item10, self.item10_chance), (self.item11, self.item11_chance), (self.item12, self.item12_chance),
-                      (self.item13, self.item13_chance), (self.item14, self.item14_chance), (self.item15, self.item15_chance),
-                      (self.item16, self.item16_chance),
-                      (self.item17, self.item17_chance), (self.item18, self.item18_chance), (self.item19, self.item19_chance),
-                      (self.item20, self.item20_chance)]
-        valid_item_pairs = [(item, chance) for item, chance in item_pairs if item is not None and chance != 0]
         dropped_items = []
 
-        for item, drop_chance in valid_item_pairs:
+        for item, drop_chance in self._get_valid_item_pairs():
             '''
             Generate a random float from 0.0 to ~0.9999 with random.random(), then multiply it by 100
             and compare it to the drop_chance. If the drop_chance is bigger, the item has dropped.
@@ -130,10 +126,35 @@ class LootTableSchema(Base):
             '''
             random_roll: float = random.random()
             if drop_chance >= (random_roll * 100):
-                dropped_items.append(item.convert_to_item_object())
+                dropped_items.append(get_drop_item(item))
 
         return dropped_items
 
+    def _get_valid_item_pairs(self) -> [('ItemTemplateSchema', int)]:
+        """ Returns a list of tuples of (item template, drop chance) of the items this table can drop """
+        if self._valid_item_pairs is None:
+            item_pairs = [(self.item1, self.item1_chance), (self.item2, self.item2_chance), (self.item3, self.item3_chance), (self.item4, self.item4_chance),
+                          (self.item5, self.item5_chance), (self.item6, self.item6_chance), (self.item7, self.item7_chance), (self.item8, self.item8_chance),
+                          (self.item9, self.item9_chance), (self.item10, self.item10_chance), (self.item11, self.item11_chance), (self.item12, self.item12_chance),
+                          (self.item13, self.item13_chance), (self.item14, self.item14_chance), (self.item15, self.item15_chance),
+                          (self.item16, self.item16_chance),
+                          (self.item17, self.item17_chance), (self.item18, self.item18_chance), (self.item19, self.item19_chance),
+                          (self.item20, self.item20_chance)]
+            self._valid_item_pairs = [(item, chance) for item, chance in item_pairs if item is not None and chance != 0]
+
+        return self._valid_item_pairs
+
+
+def get_drop_item(item_template: 'ItemTemplateSchema') -> 'Item':
+    """
+    Returns the Item object of the template, which is shared by every drop of it.
+    An inventory holds a single Item object per item ID, so a looted item does not need its own object
+    """
+    if item_template.entry not in loaded_drop_items:
+        loaded_drop_items[item_template.entry] = item_template.convert_to_item_object()
+
+    return loaded_drop_items[item_template.entry]
+
 
 # load all the loot tables in memory so that future SQLAlchemy queries do not access the DB
 # NOTE: Do not do this if the loot tables become more than 500 !
@@ -4,13 +4,13 @@ from quest import Quest, FetchQuest, KillQuest
 from database.main import session
 
 
-def load_quests(zone: str, subzone: str, character) -> {str: Quest}:
+def load_quests(zone: str, subzone: str, character=None) -> {str: Quest}:
     """
     Load all the quests in the zone/subzone that are available for the given character.
 
     :param zone: The zone that the query will use
     :param subzone: The subzone that the query will use
-    :param character: The Character object we're loading the quests for.
+    :param character: The Character object we're loading the quests for. If it's None, every quest is loaded
     :return: A Dctionary Key: Quest Name Value: Quest Object
     """
 
@@ -19,9 +19,21 @@ def load_quests(zone: str, subzone: str, character) -> {str: Quest}:
 
     print("Loading Quests...")
     for quest in quests:
-        if character.has_completed_quest(quest.entry):
+        if character is not None and character.has_completed_quest(quest.entry):
             continue  # do not load the quest into the game if the character has completed it
 
         loaded_quests[quest.name] = quest.convert_to_quest_object()
 
     return loaded_quests
+
+
+def load_quest(quest_id: int) -> Quest:
+    """
+    Load the quest with the given ID (its entry in the quest_template table)
+    :return: A KillQuest or FetchQuest object, without any progress on it
+    """
+    quest = session.query(QuestSchema).get(quest_id)
+    if quest is None:
+        raise Exception(f'There is no such quest with an ID of {quest_id}!')
+
+    return quest.convert_to_quest_object()
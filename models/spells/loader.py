@@ -1,28 +1,9 @@
 from database.main import session
-from models.spells.spell_buffs import BuffSchema
 from utils.helper import parse_int
 from models.spells.spell_dots import DotSchema
 from models.spells.paladin_spells_template import PaladinSpellsSchema
 
 
-def load_buff(buff_id: int) -> 'BeneficialBuff':
-    """
-    Loads a buff from the DB table spells_buffs, whose contents are the following:
-    entry,             name, duration,    stat,   amount,   stat2,   amount2,stat3,   amount3, comment
-        1,  Heart of a Lion,        5,strength,       10,                                      Increases strength by 10 for 5 turns
-        stat - the stat this buff increases
-        amount - the amount it increases the stat by
-        duration - the amount of turns this buff lasts for
-    This buff increases your strength by 10 for 5 turns.
-
-    Load the information about the buff, convert it to an class Buff object and return it
-    :param buff_id: the buff entry in spells_buffs
-    :return: A instance of class Buff
-    """
-    buff: BuffSchema = session.query(BuffSchema).get(buff_id)
-    return buff.convert_to_beneficial_buff_object()
-
-
 def load_dot(dot_id: int, caster_level: int) -> 'DoT':
     """
     Loads a DoT from the spell_dots table, whose contents are the following:
@@ -35,12 +16,25 @@ def load_dot(dot_id: int, caster_level: int) -> 'DoT':
     return dot_info.convert_to_dot_object(caster_level)
 
 
-def load_paladin_spells_for_level(level: int) -> ['PaladinSpell']:
+def load_spellbook(class_name: str) -> 'Spellbook':
     """
-    Load all the paladin spells that are available for the SPECIFIC level.
-    Get all the PaladinSpells schema objects and convert them to PaladinSpell objects.
-    Return said objects in a list
+    Load every rank of every spell of the class in one query and build its Spellbook.
+    :param class_name: the name of the class in lowercase, i.e paladin
     """
-    loaded_spells: [PaladinSpellsSchema] = session.query(PaladinSpellsSchema).filter_by(level_required=level).all()
+    if class_name == 'paladin':
+        return load_paladin_spellbook()
+
+    raise Exception(f'Unsupported class - {class_name}')
+
+
+def load_paladin_spellbook() -> 'Spellbook':
+    from spells import Spellbook
+    from constants import PALADIN_SPELL_COMMANDS
+    loaded_spells: [PaladinSpellsSchema] = (session.query(PaladinSpellsSchema)
+                                            .order_by(PaladinSpellsSchema.level_required, PaladinSpellsSchema.id)
+                                            .all())
+    spells_by_level: {int: ['PaladinSpell']} = {}
+    for spell in loaded_spells:
+        spells_by_level.setdefault(spell.level_required, []).append(spell.convert_to_paladin_spell_object())
 
-    return [spell.convert_to_paladin_spell_object() for spell in loaded_spells]
+    return Spellbook(spells_by_level, PALADIN_SPELL_COMMANDS)
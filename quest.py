@@ -1,4 +1,11 @@
+from collections.abc import MutableMapping
+from copy import copy
+
+
 class Quest:
+    __slots__ = ('name', 'ID', 'xp_reward', 'is_completed', 'required_level', 'item_rewards',
+                 'reward_choice_enabled')
+
     def __init__(self, quest_name: str, quest_id, xp_reward: int, item_reward_dict: dict, reward_choice_enabled: bool,
                  level_required: int, is_completed: bool = False):
         self.name = quest_name
@@ -12,10 +19,21 @@ class Quest:
     def __eq__(self, other):
         return self.ID == other.ID
 
+    def copy_for_instance(self):
+        """
+        Returns a copy of the quest for a single player, as its progress (kills, completion) is per player.
+        Used to get a player's own instance of a quest from a shared subzone template
+        """
+        return copy(self)
+
     def update_kills(self):
         """ This method updates the required kills if the quest is a KillQuest"""
         pass
 
+    def get_progress_description(self, character: 'Character') -> str:
+        """ Returns the progress of the character on the quest, as shown in his quest log """
+        return self.name
+
     def check_if_complete(self, character: 'Character'=None):
         """ This method checks if the quest is completed on each new addition and completes it if it is"""
         pass
@@ -43,6 +61,8 @@ class KillQuest(Quest):
     """
     Standard kill X of Y quest
     """
+    __slots__ = ('required_monster', 'required_kills', 'kills')
+
     def __init__(self, quest_name: str, quest_id, required_monster: str, xp_reward: int, item_reward_dict: dict,
                  reward_choice_enabled: bool, level_required: int, required_kills: int, is_completed: bool = False):
         super().__init__(quest_name, quest_id, xp_reward, item_reward_dict, reward_choice_enabled, level_required,
@@ -55,6 +75,9 @@ class KillQuest(Quest):
         return (f'{self.name} - Requires {self.required_kills} {self.required_monster} kills.'
                 f' Rewards {self.xp_reward} experience.')
 
+    def get_progress_description(self, character: 'Character') -> str:
+        return f'{self.name} - {self.kills}/{self.required_kills} {self.required_monster} slain.'
+
     def update_kills(self):
         self.kills += 1
         print(f'Quest {self.name}: {self.kills}/{self.required_kills} {self.required_monster} slain.')
@@ -69,6 +92,8 @@ class FetchQuest(Quest):
     """
     Standard obtain X of Y quest
     """
+    __slots__ = ('required_item', 'required_item_count')
+
     def __init__(self, quest_name: str, quest_id, required_item: str, xp_reward: int, item_reward_dict: dict,
                  reward_choice_enabled: bool, level_required: int, required_item_count: int, is_completed: bool = False):
         super().__init__(quest_name, quest_id, xp_reward, item_reward_dict, reward_choice_enabled,
@@ -80,14 +105,79 @@ class FetchQuest(Quest):
         return (f'{self.name} - Obtain {self.required_item_count} {self.required_item}. '
                 f'Rewards {self.xp_reward} experience.')
 
+    def get_progress_description(self, character: 'Character') -> str:
+        item_count = character.inventory.get_item_count(self.required_item)
+        return f'{self.name} - {item_count}/{self.required_item_count} {self.required_item} obtained.'
+
     def check_if_complete(self, character: 'Character'=None):
         """ Given the player's inventory, check if he has enough to complete the quest"""
         if character is None or not hasattr(character, 'inventory'):
             raise Exception('The FetchQuest check_if_complete method requires  that a character object is passed to it!')
-        _, item_count = character.inventory.get(self.required_item, (self.required_item, 0))
+        item_count = character.inventory.get_item_count(self.required_item)
 
         if item_count:
             print(f'Quest {self.name}: {item_count}/{self.required_item_count} {self.required_item} obtained.')
 
         if item_count >= self.required_item_count:
             self._quest_complete()
+
+
+class QuestLog(MutableMapping):
+    """
+    The quest log of a character, a dictionary of Key: quest ID, Value: Quest.
+
+    The quests are also indexed by the name of the monster or item they require, so that a kill or an obtained item
+    is routed straight to the quests which need it, without looking through the whole log.
+    Any number of quests can require the same monster or item.
+    """
+    def __init__(self, quests: dict=None):
+        self._quests: {int: Quest} = {}
+        # Key: the name of the required monster/item, Value: a dictionary of Key: quest ID, Value: KillQuest/FetchQuest
+        self._kill_quests: {str: {int: KillQuest}} = {}
+        self._fetch_quests: {str: {int: FetchQuest}} = {}
+        for quest_id, quest in (quests or {}).items():
+            self[quest_id] = quest
+
+    def _get_index(self, quest: Quest) -> (dict, str):
+        """ Returns the index the quest is kept in and its key there, or (None, None) if it is not indexed """
+        if isinstance(quest, KillQuest):
+            return self._kill_quests, quest.required_monster
+        elif isinstance(quest, FetchQuest):
+            return self._fetch_quests, quest.required_item
+        return None, None
+
+    def __getitem__(self, quest_id) -> Quest:
+        return self._quests[quest_id]
+
+    def __setitem__(self, quest_id, quest: Quest):
+        if quest_id in self._quests:
+            del self[quest_id]
+        self._quests[quest_id] = quest
+        index, key = self._get_index(quest)
+        if index is not None:
+            index.setdefault(key, {})[quest_id] = quest
+
+    def __delitem__(self, quest_id):
+        quest = self._quests.pop(quest_id)
+        index, key = self._get_index(quest)
+        if index is not None:
+            del index[key][quest_id]
+            if not index[key]:
+                del index[key]
+
+    def __iter__(self):
+        return iter(self._quests)
+
+    def __len__(self):
+        return len(self._quests)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self._quests})'
+
+    def get_kill_quests(self, monster_name: str) -> [KillQuest]:
+        """ Returns the quests which require the monster to be killed """
+        return list(self._kill_quests.get(monster_name, {}).values())
+
+    def get_fetch_quests(self, item_name: str) -> [FetchQuest]:
+        """ Returns the quests which require the item to be obtained """
+        return list(self._fetch_quests.get(item_name, {}).values())
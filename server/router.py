@@ -0,0 +1,109 @@
+"""
+This module holds the ShardRouter - the front end which starts a worker process (see server/shard.py)
+for every group of zones and forwards the players' commands to the shard their character is in.
+
+Whenever a character goes to a zone that is run by another shard, the router takes the serialized character
+out of the old shard and enters it into the new one.
+
+The router waits for the reply of every message it sends. A shard whose character's command is waiting for input
+only replies to that character's next command, so every other message for that shard is refused until then.
+"""
+import multiprocessing
+
+from models.characters.saver import serialize_character
+from server.shard import (run_shard, MSG_ENTER, MSG_COMMAND, MSG_LEAVE, MSG_STOP,
+                          REPLY_PROMPT, REPLY_HANDOFF, REPLY_ERROR)
+
+
+class ShardRouter:
+    def __init__(self, zone_groups: [[str]], zone_classes: dict=None):
+        """
+        :param zone_groups: A list of lists of zone names, every list is ran in a separate shard
+        :param zone_classes: optional override of World.zone_classes for the shards (must be importable by name)
+        """
+        context = multiprocessing.get_context('spawn')
+        self.shard_connections = []  # the router's ends of the pipes, one for every shard
+        self.shard_processes = []
+        self.zone_shards = {}  # Key: zone name, Value: the index of its shard
+        self.character_shards = {}  # Key: character name, Value: the index of the shard the character is in
+        self.waiting_for_input = set()  # the names of the characters whose last command is waiting for input
+
+        for shard_idx, zone_names in enumerate(zone_groups):
+            router_connection, shard_connection = context.Pipe()
+            process = context.Process(target=run_shard, args=(zone_names, shard_connection, zone_classes), daemon=True)
+            process.start()
+            self.shard_connections.append(router_connection)
+            self.shard_processes.append(process)
+            for zone_name in zone_names:
+                self.zone_shards[zone_name] = shard_idx
+
+    def connect(self, character) -> str:
+        """ Enter the character into the shard of his current zone, returning the output of the shard """
+        return self._enter(serialize_character(character))
+
+    def send_command(self, name: str, command: str) -> (str, bool):
+        """
+        Forward a command to the shard of the character
+        :return: A tuple of (the output of the command, a boolean indicating if the command is waiting for input)
+        """
+        reply_type, output = self._request(self.character_shards[name], MSG_COMMAND, name, command)
+        if reply_type == REPLY_PROMPT:
+            self.waiting_for_input.add(name)
+            return output, True
+        self.waiting_for_input.discard(name)
+
+        if reply_type == REPLY_HANDOFF:
+            output, destination = output
+            serialized_character = self._leave(name)
+            serialized_character['current_zone'] = destination
+            output += self._enter(serialized_character)
+
+        return output, False
+
+    def disconnect(self, name: str) -> dict:
+        """ Remove the character from his shard, returning him serialized """
+        return self._leave(name)
+
+    def close(self):
+        """ Stop every shard """
+        for connection, process in zip(self.shard_connections, self.shard_processes):
+            connection.send((MSG_STOP, None, None))
+            process.join()
+            connection.close()
+
+    def _enter(self, serialized_character: dict) -> str:
+        zone_name = serialized_character['current_zone']
+        if zone_name not in self.zone_shards:
+            raise Exception(f'There is no shard for the zone {zone_name}!')
+        shard_idx = self.zone_shards[zone_name]
+        _, output = self._request(shard_idx, MSG_ENTER, serialized_character['name'], serialized_character)
+        self.character_shards[serialized_character['name']] = shard_idx
+
+        return output
+
+    def _leave(self, name: str) -> dict:
+        _, serialized_character = self._request(self.character_shards[name], MSG_LEAVE, name, None)
+        del self.character_shards[name]
+        return serialized_character
+
+    def _request(self, shard_idx: int, message_type: str, name: str, payload) -> (str, object):
+        """
+        Send a message to a shard and wait for its reply
+        :raises Exception: if the shard is waiting for input from another character or for a command rather than
+            another kind of message, as it would not reply until it gets the input
+        """
+        prompting_name = self._get_prompting_character(shard_idx)
+        if prompting_name is not None and (message_type != MSG_COMMAND or name != prompting_name):
+            raise Exception(f'The shard is waiting for a command from {prompting_name}!')
+
+        connection = self.shard_connections[shard_idx]
+        connection.send((message_type, name, payload))
+        reply_type, _, reply_payload = connection.recv()
+        if reply_type == REPLY_ERROR:
+            raise Exception(reply_payload)
+
+        return reply_type, reply_payload
+
+    def _get_prompting_character(self, shard_idx: int) -> str or None:
+        """ Returns the name of the character whose command is waiting for input in the shard, if there is one """
+        return next((name for name in self.waiting_for_input if self.character_shards.get(name) == shard_idx), None)
@@ -0,0 +1,183 @@
+"""
+This module holds the zone shard - a worker process which runs a group of zones.
+
+Every shard owns a World per connected character, holding only the zones the shard is responsible for.
+The shard talks to the router (server/router.py) over a multiprocessing Connection (a local pipe) with tuples of
+    (message type, character name, payload)
+
+Messages the shard receives:
+    MSG_ENTER   - payload: a serialized character (see models.characters.saver.serialize_character), enters a zone
+    MSG_COMMAND - payload: the command string, ran just like a command from the console, after which a turn of
+                  the character's World passes (i.e. respawning monsters)
+    MSG_LEAVE   - payload: None, the character leaves the shard
+    MSG_STOP    - stops the shard
+
+Replies the shard sends:
+    REPLY_OUTPUT  - payload: everything that was printed while running the message
+    REPLY_PROMPT  - payload: everything printed so far, the command asked for further input (i.e. combat)
+                    and is waiting for a MSG_COMMAND holding it
+    REPLY_HANDOFF - payload: (printed output, destination zone name) - the character went to a zone
+                    that is not in this shard and should be left and entered in the destination's shard
+    REPLY_LEFT    - payload: the serialized character
+    REPLY_ERROR   - payload: the error message
+"""
+import builtins
+from collections import deque
+from contextlib import redirect_stdout
+from io import StringIO
+
+from models import main as _  # load all the DB models
+from world import World
+from command_router import route_main_command
+
+MSG_ENTER = 'enter'
+MSG_COMMAND = 'command'
+MSG_LEAVE = 'leave'
+MSG_STOP = 'stop'
+
+REPLY_OUTPUT = 'output'
+REPLY_PROMPT = 'prompt'
+REPLY_HANDOFF = 'handoff'
+REPLY_LEFT = 'left'
+REPLY_ERROR = 'error'
+
+
+def run_shard(zone_names: [str], connection, zone_classes: dict=None):
+    """
+    The entry point of a shard's worker process
+    :param zone_names: the names of the zones this shard runs
+    :param connection: the Connection through which the router sends messages
+    :param zone_classes: optional override of World.zone_classes (Key: zone name, Value: Zone class)
+    """
+    ZoneShard(zone_names, connection, zone_classes).serve()
+
+
+class ZoneShard:
+    def __init__(self, zone_names: [str], connection, zone_classes: dict=None):
+        self.zone_names = set(zone_names)
+        self.connection = connection
+        self.zone_classes = zone_classes
+        self.characters = {}  # Key: character name, Value: Character object
+        self.worlds = {}  # Key: character name, Value: the World of the character
+        # messages for other characters which were received while a character's command was waiting for input
+        self.pending_messages = deque()
+        self._output = StringIO()
+        self._active_character = None  # the name of the character whose message is being ran
+
+    def serve(self):
+        """ Handle messages until a MSG_STOP arrives """
+        while True:
+            message_type, name, payload = self._receive()
+            if message_type == MSG_STOP:
+                break
+
+            self._active_character = name
+            try:
+                with redirect_stdout(self._output):
+                    reply = self.handle_message(message_type, name, payload)
+            except Exception as e:
+                self._take_output()
+                reply = (REPLY_ERROR, name, str(e))
+            self.connection.send(reply)
+
+    def handle_message(self, message_type: str, name: str, payload) -> tuple:
+        if message_type == MSG_ENTER:
+            return self.enter(payload)
+        elif message_type == MSG_COMMAND:
+            return self.run_command(name, payload)
+        elif message_type == MSG_LEAVE:
+            return REPLY_LEFT, name, self.leave(name)
+        else:
+            raise Exception(f'Unsupported message type - {message_type}')
+
+    def enter(self, serialized_character: dict) -> tuple:
+        """ Load the serialized character into its current zone in this shard """
+        from models.characters.loader import deserialize_character
+        from information_printer import print_live_monsters, print_live_npcs
+        character = deserialize_character(serialized_character)
+        if character.current_zone not in self.zone_names:
+            raise Exception(f'Zone {character.current_zone} is not part of this shard!')
+        self._take_output()  # discard the equip/level up messages of the deserialization
+
+        world = World(character, zone_classes=self.zone_classes)
+        zone_object = world.get_zone(character.current_zone)
+        # the character goes back to the subzone he was in, a character coming from another zone starts off in
+        # the zone's starting subzone
+        if character.current_subzone in zone_object.loaded_zones:
+            zone_object.enter_subzone(character.current_subzone, character)
+        character.current_subzone = zone_object.curr_subzone
+        self.characters[character.name] = character
+        self.worlds[character.name] = world
+
+        print(f'{character.name} has entered {character.current_zone}')
+        print_live_npcs(zone_object, print_all=True)
+        print_live_monsters(zone_object)
+        return REPLY_OUTPUT, character.name, self._take_output()
+
+    def leave(self, name: str) -> dict:
+        """ Remove the character from the shard, returning him serialized """
+        from models.characters.saver import serialize_character
+        if name not in self.characters:
+            raise Exception(f'Character {name} is not in this shard!')
+        del self.worlds[name]
+
+        return serialize_character(self.characters.pop(name))
+
+    def run_command(self, name: str, command: str) -> tuple:
+        if name not in self.characters:
+            raise Exception(f'Character {name} is not in this shard!')
+        character = self.characters[name]
+        zone_object = self.worlds[name].get_zone(character.current_zone)
+
+        destination = self._get_zone_exit(command, character, zone_object)
+        if destination:
+            character.current_zone = destination
+            character.current_subzone = None  # he is yet to enter a subzone of the destination
+            print(f'{character.name} is leaving {zone_object.zone_name} for {destination}')
+            return REPLY_HANDOFF, name, (self._take_output(), destination)
+
+        original_input = builtins.input
+        builtins.input = self._input
+        try:
+            route_main_command(command, character, zone_object)
+        finally:
+            builtins.input = original_input
+        self.worlds[name].pass_turn()  # a command is a turn of the world, as in the main game loop
+
+        return REPLY_OUTPUT, name, self._take_output()
+
+    def _get_zone_exit(self, command: str, character, zone_object) -> str or None:
+        """ Returns the zone the command moves the character to, if it's a move to a zone outside of this shard """
+        if not command.startswith('go to '):
+            return None
+        destination = command[6:]
+        if (destination in zone_object.zone_exits.get(character.current_subzone, [])
+                and destination not in self.zone_names):
+            return destination
+
+        return None
+
+    def _input(self, prompt: str='') -> str:
+        """
+        Replaces the built-in input while a command is ran, sending what has been printed so far to the router
+        and waiting for the character's next command
+        """
+        print(prompt, end='')
+        name = self._active_character
+        self.connection.send((REPLY_PROMPT, name, self._take_output()))
+        while True:
+            message_type, message_name, payload = self.connection.recv()
+            if message_type == MSG_COMMAND and message_name == name:
+                return payload
+            self.pending_messages.append((message_type, message_name, payload))
+
+    def _receive(self) -> tuple:
+        if self.pending_messages:
+            return self.pending_messages.popleft()
+        return self.connection.recv()
+
+    def _take_output(self) -> str:
+        output = self._output.getvalue()
+        self._output.seek(0)
+        self._output.truncate()
+        return output
@@ -2,54 +2,30 @@
 
 # The base class for spells
 class Spell:
+    __slots__ = ('name', 'mana_cost', 'rank', 'cooldown', 'beneficial_effect', 'harmful_effect')
+
     def __init__(self, name: str, rank: int, mana_cost: int=0, cooldown: int=0, beneficial_effect: 'BeneficialBuff'=None,
                  harmful_effect: 'DoT'=None):
         self.name = name
         self.mana_cost = mana_cost
         self.rank = rank
-        self.cooldown = cooldown
-        self._cooldown_counter = 0
-        self.is_ready = True  # boolean indicating if the spell is ready to be cast
+        self.cooldown = cooldown  # the turns it takes for the spell to be ready again, tracked by a CooldownTracker
         self.beneficial_effect = beneficial_effect
         self.harmful_effect = harmful_effect
 
     def __repr__(self):
-        return f'Spell Object {self.name}: {self.mana_cost} Mana, {self._cooldown_counter}/{self.cooldown} CD.'
+        return f'Spell Object {self.name}: {self.mana_cost} Mana, {self.cooldown} CD.'
 
-    @property
-    def turns_on_cd(self):
-        """ Returns the turns this spell has left to cooldown """
-        return self._cooldown_counter
+    def __eq__(self, other):
+        return isinstance(other, Spell) and self.name == other.name and self.rank == other.rank
 
-    def reset_cd(self):
-        """
-        Resets the spell's cooldown
-        """
-        self._cooldown_counter = 0
-
-    def cast(self) -> int:
-        """
-        Cast the spell, starting the cooldown counter and returning its mana cost
-        """
-        if not self.is_ready:
-            return False
-        self._cooldown_counter = self.cooldown
-        self.is_ready = False
-
-        return True
-
-    def pass_turn(self):
-        """
-        Decrement the cooldown counter
-        :return:
-        """
-        if self._cooldown_counter != 0:
-            self._cooldown_counter -= 1
-        else:
-            self.is_ready = True
+    def __hash__(self):
+        return hash((self.name, self.rank))
 
 
 class PaladinSpell(Spell):
+    __slots__ = ('damage1', 'damage2', 'damage3', 'heal1', 'heal2', 'heal3')
+
     def __init__(self, name: str, rank: int, damage1: int=0, damage2: int=0, damage3: int=0, heal1: int=0, heal2: int=0,
                  heal3: int=0, mana_cost: int=0, cooldown: int=0, beneficial_effect: 'BeneficialBuff' = None,
                  harmful_effect: 'DoT' = None):
@@ -62,6 +38,105 @@ class PaladinSpell(Spell):
         self.heal3 = heal3
 
     def __repr__(self):
-        return (f'Paladin Spell Object {self.name}: {self.mana_cost} Mana, {self._cooldown_counter}/{self.cooldown} CD.'
+        return (f'Paladin Spell Object {self.name}: {self.mana_cost} Mana, {self.cooldown} CD.'
                 f'\nDamage values: {self.damage1} | {self.damage2} | {self.damage3} '
                 f'\nHeal values: {self.heal1} | {self.heal2} | {self.heal3}')
+
+
+class Spellbook:
+    """
+    Holds every rank of every spell of a class, indexed by the level they are learned at.
+    A spellbook is loaded once per class and is shared by every character of that class, it must never be modified.
+    The characters learn its spells as they are, the cooldowns are tracked by every character's CooldownTracker.
+    """
+    # Key: the class name (i.e paladin), Value: the Spellbook object
+    _loaded_spellbooks = {}
+
+    def __init__(self, spells_by_level: {int: [Spell]}, spell_commands: {str: str}):
+        """
+        :param spells_by_level: Key: level, Value: the spells (ranks) which are learned at that level
+        :param spell_commands: Key: the name of a spell, Value: the command that casts it in combat
+        """
+        self._spells_by_level = spells_by_level
+        self.max_level = max(spells_by_level, default=0)
+        # the combat commands of the spells that are available at each level
+        self._available_commands: [frozenset] = [frozenset()]
+        available_spell_names = set()
+        for level in range(1, self.max_level + 1):
+            available_spell_names.update(spell.name for spell in spells_by_level.get(level, []))
+            self._available_commands.append(frozenset(spell_commands[name] for name in available_spell_names
+                                                      if name in spell_commands))
+
+    @classmethod
+    def get_spellbook(cls, class_name: str) -> 'Spellbook':
+        """ Returns the spellbook of the class, loading it if it has not been loaded before """
+        if class_name not in cls._loaded_spellbooks:
+            from models.spells.loader import load_spellbook  # import here to prevent an import loop
+            cls._loaded_spellbooks[class_name] = load_spellbook(class_name)
+
+        return cls._loaded_spellbooks[class_name]
+
+    @classmethod
+    def clear_loaded_spellbooks(cls):
+        """ Forget every loaded spellbook, meaning they'll be loaded from the DB again """
+        cls._loaded_spellbooks.clear()
+
+    def get_spells_for_level_range(self, from_level: int, to_level: int) -> [Spell]:
+        """ Returns the spells which are learned at the levels from from_level to to_level (inclusive), by level """
+        return [spell for level in range(from_level, min(to_level, self.max_level) + 1)
+                for spell in self._spells_by_level.get(level, [])]
+
+    def get_available_commands(self, level: int) -> frozenset:
+        """ Returns the combat commands of the spells that are available at the level """
+        return self._available_commands[min(level, self.max_level)]
+
+
+class CooldownTracker:
+    """
+    Tracks the spells of a character which are on cooldown, by the turn they become ready again.
+    Only the spells which are cooling down are held, so that passing a turn or checking if a spell is ready does not
+    touch every learned spell.
+
+    A spell cast on turn X with a cooldown of N turns can be cast again on turn X + N + 1,
+    i.e a spell with a cooldown of 0 can be cast once per turn.
+    """
+    def __init__(self):
+        self.turn = 0  # the count of turns that have passed
+        self._ready_turns: {str: int} = {}  # Key: the name of a spell, Value: the turn it becomes ready on
+        self._spells_by_ready_turn: {int: [str]} = {}  # Key: a turn, Value: the spells which become ready on it
+
+    def __eq__(self, other):
+        return isinstance(other, CooldownTracker) and self.get_cooldowns() == other.get_cooldowns()
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.get_cooldowns()})'
+
+    def pass_turn(self):
+        """ Pass a turn, forgetting the spells which have become ready """
+        self.turn += 1
+        for spell_name in self._spells_by_ready_turn.pop(self.turn, []):
+            if self._ready_turns.get(spell_name) == self.turn:
+                del self._ready_turns[spell_name]
+
+    def start_cooldown(self, spell: Spell):
+        ready_turn = self.turn + spell.cooldown + 1
+        self._ready_turns[spell.name] = ready_turn
+        self._spells_by_ready_turn.setdefault(ready_turn, []).append(spell.name)
+
+    def is_ready(self, spell_name: str) -> bool:
+        return self._ready_turns.get(spell_name, 0) <= self.turn
+
+    def get_turns_on_cooldown(self, spell_name: str) -> int:
+        """ Returns the turns the spell has left to cooldown """
+        if spell_name not in self._ready_turns:
+            return 0
+        return self._ready_turns[spell_name] - self.turn - 1
+
+    def get_cooldowns(self) -> {str: int}:
+        """ Returns a dictionary of Key: the name of a spell on cooldown, Value: the turns it has left to cooldown """
+        return {spell_name: self.get_turns_on_cooldown(spell_name) for spell_name in self._ready_turns}
+
+    def reset(self):
+        """ Make every spell ready """
+        self._ready_turns = {}
+        self._spells_by_ready_turn = {}
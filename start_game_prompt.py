@@ -6,9 +6,10 @@ from termcolor import colored
 from entities import Character
 from classes import Paladin
 from information_printer import print_available_character_classes, print_available_characters_to_load
-from models.characters.loader import load_all_saved_characters_general_info
+from models.characters.loader import load_saved_characters_general_info_page
 from models.characters.loader import load_saved_character
 from exceptions import NoSuchCharacterError
+from constants import SAVED_CHARACTER_ROSTER_PAGE_SIZE
 AVAILABLE_CLASSES = ['paladin']
 
 
@@ -64,15 +65,47 @@ def handle_create_character() -> Character:
 
 
 def handle_load_character() -> Character:
-    """ this function displays all the available characters to load and reads the user's input, afterwards returns the loaded character"""
-    saved_characters_general_info = load_all_saved_characters_general_info()  # list of all the characters available for load
+    """
+    this function displays the available characters to load a page at a time and reads the user's input,
+    which is either 'next' for the next page, 'search {name prefix}' to list the characters whose name starts with it
+    or the name of the character to load, afterwards returns the loaded character
+    """
     print("You've chosen to load an existing character, please enter the name of the character you want to load: ")
-    print_available_characters_to_load(saved_characters_general_info)  # print available characters
+    print(f"To look for a character, type {colored('search', color='magenta')} and the start of his name "
+          f"(case sensitive, like the name itself).")
+    name_prefix = ''
+    saved_characters_general_info = load_saved_characters_general_info_page(name_prefix=name_prefix)
+    print_saved_characters_page(saved_characters_general_info)
+    # the name of the last listed character, which the next page starts after
+    last_name = saved_characters_general_info[-1]['name'] if saved_characters_general_info else None
 
     character_name = input(">Enter character name: ")
+    while character_name == 'next' or character_name.startswith('search '):
+        if character_name == 'next':
+            saved_characters_general_info = load_saved_characters_general_info_page(after_name=last_name,
+                                                                                    name_prefix=name_prefix)
+            if not saved_characters_general_info:
+                # stay on the current page, rather than going back to the first one
+                print('There are no more characters.')
+            else:
+                print_saved_characters_page(saved_characters_general_info)
+                last_name = saved_characters_general_info[-1]['name']
+        else:
+            name_prefix = character_name[len('search '):]
+            saved_characters_general_info = load_saved_characters_general_info_page(name_prefix=name_prefix)
+            print_saved_characters_page(saved_characters_general_info)
+            last_name = saved_characters_general_info[-1]['name'] if saved_characters_general_info else None
+        character_name = input(">Enter character name: ")
+
     return load_character(character_name)
 
 
+def print_saved_characters_page(saved_characters_general_info: [dict]):
+    """ Print a page of saved characters, telling whether there might be more after it """
+    has_next_page = len(saved_characters_general_info) == SAVED_CHARACTER_ROSTER_PAGE_SIZE
+    print_available_characters_to_load(saved_characters_general_info, has_next_page=has_next_page)
+
+
 def load_character(character_name: str) -> Character:
     """ this function loads a character from the DB"""
     try:
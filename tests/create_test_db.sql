@@ -151,7 +151,9 @@ CREATE TABLE saved_character (
     gloves_id      INTEGER      REFERENCES item_template (entry),
     belt_id        INTEGER      REFERENCES item_template (entry),
     leggings_id    INTEGER      REFERENCES item_template (entry),
-    boots_id       INTEGER      REFERENCES item_template (entry) 
+    boots_id       INTEGER      REFERENCES item_template (entry),
+    packed_killed_monsters BLOB,
+    packed_loaded_scripts  TEXT
 );
 
 INSERT INTO saved_character (
@@ -168,7 +170,9 @@ INSERT INTO saved_character (
                                 gloves_id,
                                 belt_id,
                                 leggings_id,
-                                boots_id
+                                boots_id,
+                                packed_killed_monsters,
+                                packed_loaded_scripts
                             )
                             VALUES (
                                 1,
@@ -184,7 +188,9 @@ INSERT INTO saved_character (
                                 NULL,
                                 NULL,
                                 NULL,
-                                NULL
+                                NULL,
+                                X'0E0105',
+                                'HASKEL_PAXTON_CONVERSATION'
                             );
 
 INSERT INTO saved_character (
@@ -201,7 +207,9 @@ INSERT INTO saved_character (
                                 gloves_id,
                                 belt_id,
                                 leggings_id,
-                                boots_id
+                                boots_id,
+                                packed_killed_monsters,
+                                packed_loaded_scripts
                             )
                             VALUES (
                                 246,
@@ -217,6 +225,8 @@ INSERT INTO saved_character (
                                 NULL,
                                 NULL,
                                 NULL,
+                                NULL,
+                                NULL,
                                 NULL
                             );
 
@@ -437,81 +447,6 @@ INSERT INTO spell_buffs (
                         );
 
 
--- Table: saved_character_killed_monsters
-DROP TABLE IF EXISTS saved_character_killed_monsters;
-
-CREATE TABLE saved_character_killed_monsters (
-    id                 INTEGER PRIMARY KEY,
-    saved_character_id INTEGER REFERENCES saved_character,
-    GUID               INTEGER REFERENCES creatures (guid) 
-);
-
-INSERT INTO saved_character_killed_monsters (
-                                                id,
-                                                saved_character_id,
-                                                GUID
-                                            )
-                                            VALUES (
-                                                1,
-                                                1,
-                                                20
-                                            );
-
-INSERT INTO saved_character_killed_monsters (
-                                                id,
-                                                saved_character_id,
-                                                GUID
-                                            )
-                                            VALUES (
-                                                2,
-                                                1,
-                                                14
-                                            );
-
-INSERT INTO saved_character_killed_monsters (
-                                                id,
-                                                saved_character_id,
-                                                GUID
-                                            )
-                                            VALUES (
-                                                3,
-                                                1,
-                                                15
-                                            );
-
-
--- Table: saved_character_loaded_scripts
-DROP TABLE IF EXISTS saved_character_loaded_scripts;
-
-CREATE TABLE saved_character_loaded_scripts (
-    id                 INTEGER PRIMARY KEY,
-    saved_character_id INTEGER REFERENCES saved_character,
-    script_name        TEXT
-);
-
-INSERT INTO saved_character_loaded_scripts (
-                                               id,
-                                               saved_character_id,
-                                               script_name
-                                           )
-                                           VALUES (
-                                               2,
-                                               2,
-                                               'ss'
-                                           );
-
-INSERT INTO saved_character_loaded_scripts (
-                                               id,
-                                               saved_character_id,
-                                               script_name
-                                           )
-                                           VALUES (
-                                               3,
-                                               1,
-                                               'HASKEL_PAXTON_CONVERSATION'
-                                           );
-
-
 -- Table: paladin_spells_template
 DROP TABLE IF EXISTS paladin_spells_template;
 
@@ -1387,26 +1322,49 @@ INSERT INTO creature_template (
 DROP TABLE IF EXISTS npc_vendor;
 
 CREATE TABLE npc_vendor (
-    creature_entry INTEGER PRIMARY KEY AUTOINCREMENT,
-    item_id        INTEGER REFERENCES item_template (entry),
-    item_count     INTEGER DEFAULT (1),
-    price          INTEGER
+    creature_entry  INTEGER PRIMARY KEY
+                            REFERENCES creature_template (entry),
+    product_list_id INTEGER
 );
 
 INSERT INTO npc_vendor (
                            creature_entry,
-                           item_id,
-                           item_count,
-                           price
+                           product_list_id
                        )
                        VALUES (
                            14,
-                           1,
-                           10,
                            1
                        );
 
 
+-- Table: vendor_product_list
+DROP TABLE IF EXISTS vendor_product_list;
+
+CREATE TABLE vendor_product_list (
+    entry      INTEGER,
+    item_id    INTEGER REFERENCES item_template (entry),
+    item_count INTEGER DEFAULT (1),
+    price      INTEGER,
+    PRIMARY KEY (
+        entry,
+        item_id
+    )
+);
+
+INSERT INTO vendor_product_list (
+                                    entry,
+                                    item_id,
+                                    item_count,
+                                    price
+                                )
+                                VALUES (
+                                    1,
+                                    1,
+                                    10,
+                                    1
+                                );
+
+
 -- Table: creatures
 DROP TABLE IF EXISTS creatures;
 
@@ -0,0 +1,64 @@
+"""
+Test the upgrades of an older database in database/migrations.py
+"""
+import sqlite3
+import unittest
+
+from database.migrations import upgrade_packed_character_progress
+from utils.guid_set import unpack_guids
+
+
+class PackedCharacterProgressUpgradeTests(unittest.TestCase):
+    def setUp(self):
+        """ A database as it was before the killed monsters and loaded scripts were packed """
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.executescript('''
+            CREATE TABLE saved_character (entry INTEGER PRIMARY KEY, name VARCHAR(60));
+            CREATE TABLE saved_character_killed_monsters (id INTEGER PRIMARY KEY, saved_character_id INTEGER,
+                                                          GUID INTEGER);
+            CREATE TABLE saved_character_loaded_scripts (id INTEGER PRIMARY KEY, saved_character_id INTEGER,
+                                                         script_name TEXT);
+            INSERT INTO saved_character VALUES (1, 'Netherblood'), (2, 'Visionary');
+            INSERT INTO saved_character_killed_monsters (saved_character_id, GUID) VALUES (1, 20), (1, 14), (1, 15),
+                                                                                             (3, 16);
+            INSERT INTO saved_character_loaded_scripts (saved_character_id, script_name)
+                VALUES (1, 'HASKEL_PAXTON_CONVERSATION'), (1, 'ss'), (3, 'ss');
+        ''')
+
+    def tearDown(self):
+        self.connection.close()
+
+    def get_progress(self) -> {int: ([int], str)}:
+        return {entry: (list(unpack_guids(packed_killed_monsters)), packed_loaded_scripts)
+                for entry, packed_killed_monsters, packed_loaded_scripts
+                in self.connection.execute('SELECT entry, packed_killed_monsters, packed_loaded_scripts '
+                                           'FROM saved_character')}
+
+    def get_tables(self) -> {str}:
+        return {name for name, in self.connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+    def test_upgrade(self):
+        """ The rows should be packed into the character's columns, those of missing characters dropped """
+        upgrade_packed_character_progress(self.connection)
+
+        self.assertEqual(self.get_progress(), {1: ([14, 15, 20], 'HASKEL_PAXTON_CONVERSATION\nss'),
+                                               2: ([], '')})
+        self.assertEqual(self.get_tables(), {'saved_character'})
+
+    def test_upgrade_twice(self):
+        """ An upgraded database should be left as it is """
+        upgrade_packed_character_progress(self.connection)
+        upgrade_packed_character_progress(self.connection)
+
+        self.assertEqual(self.get_progress(), {1: ([14, 15, 20], 'HASKEL_PAXTON_CONVERSATION\nss'),
+                                               2: ([], '')})
+
+    def test_upgrade_no_saved_characters(self):
+        connection = sqlite3.connect(':memory:')
+        upgrade_packed_character_progress(connection)
+
+        self.assertEqual(list(connection.execute("SELECT name FROM sqlite_master")), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from constants import (CHARACTER_EQUIPMENT_BOOTS_KEY, CHARACTER_EQUIPMENT_LEGGIN
                        CHARACTER_EQUIPMENT_SHOULDERPAD_KEY)
 from models.items.item_template import ItemTemplateSchema
 from classes import Paladin
+from inventory import Inventory
 from items import Potion, Item
 
 
@@ -35,8 +36,7 @@ char_equipment = {CHARACTER_EQUIPMENT_BOOTS_KEY: None,
                    CHARACTER_EQUIPMENT_NECKLACE_KEY: necklace,
                    CHARACTER_EQUIPMENT_HEADPIECE_KEY: headpiece}
 
-char_inventory: {str: (Item, int)} = {
-    'gold': gold,
+char_inventory: Inventory = Inventory({
     'Crimson Defias Bandana': (session.query(ItemTemplateSchema).get(11).convert_to_item_object(), 5),
     'Wolf Meat': (session.query(ItemTemplateSchema).get(1).convert_to_item_object(), 5),
     'Wolf Pelt': (session.query(ItemTemplateSchema).get(2).convert_to_item_object(), 3),
@@ -45,7 +45,7 @@ char_inventory: {str: (Item, int)} = {
     "Garrick's Head": (session.query(ItemTemplateSchema).get(9).convert_to_item_object(), 1),
     'Stolen Necklace': (session.query(ItemTemplateSchema).get(14).convert_to_item_object(), 1),
     'Strength Potion': (session.query(ItemTemplateSchema).get(4).convert_to_item_object(), 1)
-}
+}, gold=gold)
 # NOTE: test might fail due to the way we stack up armor in regards to agility and the formula.
 # if we have two items and we first equip an item with high agility we will get more armor
 # as opposed to one with less first
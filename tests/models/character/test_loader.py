@@ -8,10 +8,14 @@ database.main.session = session
 database.main.Base = Base
 
 from copy import deepcopy
+from sqlalchemy import event
 import models.main
 from classes import Paladin
 from exceptions import NoSuchCharacterError
-from models.characters.loader import load_saved_character, load_all_saved_characters_general_info
+from models.characters.loader import (load_saved_character, deserialize_character,
+                                      loaded_characters, forget_saved_character, load_saved_characters_general_info_page)
+from models.characters.saver import serialize_character
+from models.quests.loader import load_quest
 from tests.models.character.character_mock import character
 
 
@@ -22,6 +26,27 @@ class LoaderTests(unittest.TestCase):
             {'name': 'Netherblood', 'class': 'paladin', 'level': 3},
             {'name': 'Visionary', 'class': 'paladin', 'level': 1}
         ]
+        loaded_characters.clear()
+        forget_saved_character(character.name)
+
+    def capture_queries(self, function, *args, **kwargs) -> (object, [(str, tuple)]):
+        """ Returns a tuple of (the function's result, a list of the (statement, parameters) it has executed) """
+        statements = []
+
+        def capture_statement(conn, cursor, statement, parameters, *_):
+            statements.append((statement, parameters))
+
+        event.listen(engine, 'before_cursor_execute', capture_statement)
+        try:
+            return function(*args, **kwargs), statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', capture_statement)
+
+    def count_queries(self, function, *args) -> (object, int):
+        """ Returns a tuple of (the function's result, the count of statements it has executed) """
+        result, statements = self.capture_queries(function, *args)
+        return result, len(statements)
+
     def test_load_valid_character(self):
         loaded_char = load_saved_character(character.name)
         self.assertIsNotNone(loaded_char)
@@ -43,6 +68,33 @@ class LoaderTests(unittest.TestCase):
 
         self.assertEqual(vars(loaded_char), vars(self.character))
 
+    def test_load_valid_character_query_count(self):
+        """ The character, his equipment, completed quests, inventory and its potions' buffs should take three queries """
+        session.expire_all()  # nothing should be taken out of the session, everything has to be loaded
+        loaded_char, query_count = self.count_queries(load_saved_character, character.name)
+
+        self.assertLessEqual(query_count, 3)
+        self.assertCountEqual(loaded_char.inventory, self.character.inventory)
+        self.assertEqual(loaded_char.equipment, self.character.equipment)
+
+    def test_load_cached_character(self):
+        """ Loading the character again should not touch the DB and should give out a separate copy of him """
+        first_char = load_saved_character(character.name)
+        first_char.inventory.gold += 100
+
+        loaded_char, query_count = self.count_queries(load_saved_character, character.name)
+
+        self.assertEqual(query_count, 0)
+        self.assertIsNot(loaded_char, first_char)
+        self.assertEqual(loaded_char.inventory.gold, self.character.inventory.gold)
+        self.assertEqual(loaded_char.equipment, self.character.equipment)
+        self.assertEqual(loaded_char.killed_monsters, self.character.killed_monsters)
+        self.assertIsNot(loaded_char.killed_monsters, first_char.killed_monsters)
+        self.assertIsNot(loaded_char.equipment, first_char.equipment)
+        # the items are shared rather than copied, as every other loaded item is
+        for slot, item in loaded_char.equipment.items():
+            self.assertIs(item, first_char.equipment[slot])
+
     def test_load_invalid_character(self):
         invalid_name = 'AaAa'
         expected_message = f'There is no saved character by the name of {invalid_name}!'
@@ -52,9 +104,75 @@ class LoaderTests(unittest.TestCase):
         except NoSuchCharacterError as e:
             self.assertEqual(str(e), expected_message)
 
-    def test_load_all_saved_characters_general_info(self):
-        loaded_general_info = load_all_saved_characters_general_info()
-        self.assertEqual(loaded_general_info, self.expected_general_info)
+    def test_load_saved_characters_general_info_page(self):
+        first_page = load_saved_characters_general_info_page(page_size=1)
+        second_page = load_saved_characters_general_info_page(after_name='Netherblood', page_size=1)
+        last_page = load_saved_characters_general_info_page(after_name='Visionary', page_size=1)
+
+        self.assertEqual(first_page, self.expected_general_info[:1])
+        self.assertEqual(second_page, self.expected_general_info[1:])
+        self.assertEqual(last_page, [])
+        self.assertEqual(load_saved_characters_general_info_page(), self.expected_general_info)
+
+    def test_load_saved_characters_general_info_page_name_prefix(self):
+        self.assertEqual(load_saved_characters_general_info_page(name_prefix='Vis'), self.expected_general_info[1:])
+        self.assertEqual(load_saved_characters_general_info_page(name_prefix='Netherblood'),
+                         self.expected_general_info[:1])
+        self.assertEqual(load_saved_characters_general_info_page(after_name='Netherblood', name_prefix='N'), [])
+        self.assertEqual(load_saved_characters_general_info_page(name_prefix='vis'), [])
+
+    def test_load_saved_characters_general_info_page_uses_index(self):
+        """ The page should be searched for through the index on the names, rather than by scanning the table """
+        _, statements = self.capture_queries(load_saved_characters_general_info_page,
+                                             after_name='Netherblood', name_prefix='V')
+        statement, parameters = statements[0]
+
+        query_plan = ' '.join(row[-1] for row in engine.execute(f'EXPLAIN QUERY PLAN {statement}', parameters))
+
+        self.assertIn('USING INDEX', query_plan)
+        self.assertNotIn('SCAN', query_plan)
+
+    def test_deserialize_character(self):
+        self.character.experience = 120
+        self.character.current_subzone = 'Northshire Vineyards'
+        serialized_character = serialize_character(self.character)
+        deserialized_character = deserialize_character(serialized_character)
+
+        self.assertTrue(isinstance(deserialized_character, Paladin))
+        self.assertEqual(deserialized_character.experience, 120)
+        self.assertEqual(deserialized_character.current_subzone, 'Northshire Vineyards')
+        self.assertEqual(deserialized_character.equipment, self.character.equipment)
+        self.assertCountEqual(deserialized_character.inventory, self.character.inventory)
+        self.assertEqual(deserialized_character.equipped_weapon.name, 'Starter Weapon')
+        # a round trip should not lose anything
+        self.assertEqual(serialize_character(deserialized_character), serialized_character)
+
+    def test_deserialize_character_keeps_progress(self):
+        """ The current health and mana and the quest log should be kept """
+        quest = load_quest(1)
+        quest.kills = 2
+        self.character.quest_log[quest.ID] = quest
+        self.character.health, self.character.mana = 10.5, 3
+
+        deserialized_character = deserialize_character(serialize_character(self.character))
+
+        self.assertEqual(deserialized_character.health, 10.5)
+        self.assertEqual(deserialized_character.mana, 3)
+        self.assertEqual(list(deserialized_character.quest_log), [1])
+        self.assertEqual(deserialized_character.quest_log[1].kills, 2)
+        self.assertFalse(deserialized_character.quest_log[1].is_completed)
+        self.assertIs(deserialized_character.quest_log.get_kill_quests(quest.required_monster)[0],
+                      deserialized_character.quest_log[1])
+
+    def test_deserialize_character_unsupported_class(self):
+        serialized_character = serialize_character(self.character)
+        serialized_character['character_class'] = 'warrior'
+        expected_message = 'Unsupported class - warrior'
+        try:
+            deserialize_character(serialized_character)
+            self.fail('The test should have raised an Exception!')
+        except Exception as e:
+            self.assertEqual(str(e), expected_message)
 
 
 if __name__ == '__main__':
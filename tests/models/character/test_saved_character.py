@@ -52,7 +52,17 @@ class SavedCharacterTests(unittest.TestCase):
 
         self.assertEqual(vars(received_char), vars(self.character))
 
+    def test_convert_to_character_object_unpacks_progress(self):
+        received_char = session.query(SavedCharacterSchema).get(self.entry).convert_to_character_object()
+        self.assertEqual(received_char.killed_monsters, {14, 15, 20})
+        self.assertIn(14, received_char.killed_monsters)
+        self.assertEqual(received_char.loaded_scripts, {'HASKEL_PAXTON_CONVERSATION'})
 
+    def test_convert_to_character_object_without_progress(self):
+        """ A character without packed killed monsters or loaded scripts should have none """
+        received_char = session.query(SavedCharacterSchema).filter_by(name='Visionary').one().convert_to_character_object()
+        self.assertEqual(received_char.killed_monsters, set())
+        self.assertEqual(received_char.loaded_scripts, set())
 
 
 if __name__ == '__main__':
@@ -14,11 +14,14 @@ database.main.Base = Base
 
 import models.main
 from classes import Paladin
+from inventory import Inventory
 from models.characters.saved_character import SavedCharacterSchema
 from models.items.item_template import ItemTemplateSchema
 from tests.models.character.character_mock import character, char_equipment, entry
-from models.characters.saver import save_character, save_loaded_scripts, save_killed_monsters, save_completed_quests, save_inventory, delete_rows_from_table
-from models.characters.saved_character import LoadedScriptsSchema, KilledMonstersSchema, CompletedQuestsSchema, InventorySchema
+from models.characters.saver import save_character, pack_character_progress, save_completed_quests, save_inventory, delete_rows_from_table, serialize_character
+from models.characters.saved_character import CompletedQuestsSchema, InventorySchema
+from utils.guid_set import GuidSet, unpack_guids
+from models.characters.loader import load_saved_character, load_saved_characters_general_info_page, loaded_characters
 
 
 class SavedCharacterSaverTests(unittest.TestCase):
@@ -37,6 +40,7 @@ class SavedCharacterSaverTests(unittest.TestCase):
         session.commit()
         delete_test_db()
         importlib.reload(create_db_mod)
+        loaded_characters.clear()
 
     def test_save_character(self):
         save_character(self.expected_character)
@@ -70,21 +74,52 @@ class SavedCharacterSaverTests(unittest.TestCase):
         # assert they're the same
         self.assertEqual(vars(received_character), vars(self.expected_character))
 
-    def test_save_loaded_scripts(self):
-        test_char_id = 133
-        loaded_scripts = {'The Beat is too low', 'and the vocals too loud'}
-        save_loaded_scripts(test_char_id, loaded_scripts)
+    def test_serialize_character(self):
+        serialized_character = serialize_character(self.expected_character)
+
+        self.assertEqual(serialized_character['name'], 'Tester')
+        self.assertEqual(serialized_character['character_class'], 'paladin')
+        self.assertEqual(serialized_character['level'], 3)
+        self.assertEqual(serialized_character['gold'], 61)
+        self.assertEqual(serialized_character['headpiece_id'], 11)
+        self.assertIsNone(serialized_character['boots_id'])
+        self.assertEqual(serialized_character['completed_quests'], [1, 2])
+        self.assertEqual(serialized_character['killed_monsters'], [14, 15, 20])
+        self.assertEqual(serialized_character['loaded_scripts'], ['HASKEL_PAXTON_CONVERSATION'])
+        self.assertCountEqual(serialized_character['inventory'],
+                              [(11, 5), (1, 5), (2, 3), (12, 1), (10, 1), (9, 1), (14, 1), (4, 1)])
+        self.assertEqual(serialized_character['weapon_id'], 0)
+        self.assertEqual(serialized_character['current_zone'], 'Northshire Abbey')
+
+    def test_pack_character_progress(self):
+        self.expected_character.loaded_scripts = {'The Beat is too low', 'and the vocals too loud'}
+        self.expected_character.killed_monsters = GuidSet({109, 111, 131, 149, 13141})
+
+        packed_progress = pack_character_progress(self.expected_character)
+
+        self.assertEqual(list(unpack_guids(packed_progress['packed_killed_monsters'])), [109, 111, 131, 149, 13141])
+        self.assertEqual(packed_progress['packed_loaded_scripts'], 'The Beat is too low\nand the vocals too loud')
+
+    def test_save_character_invalidates_loaded_character(self):
+        """ A saved character should be loaded anew from the DB, rather than from the cache """
+        netherblood = load_saved_character(character.name)
+        load_saved_characters_general_info_page()
+        netherblood.inventory.gold += 10
+
+        save_character(netherblood)
+        save_character(self.expected_character)
 
-        loaded_scripts_count = session.query(LoadedScriptsSchema).filter_by(saved_character_id=test_char_id).count()
-        self.assertEqual(loaded_scripts_count, len(loaded_scripts))
+        self.assertEqual(load_saved_character(character.name).inventory.gold, netherblood.inventory.gold)
+        self.assertIn('Tester', [info['name'] for info in load_saved_characters_general_info_page()])
 
-    def test_save_killed_monsters(self):
-        test_char_id = 147
-        killed_monsters_guids = {109, 111, 131, 149, 13141}
-        save_killed_monsters(test_char_id, killed_monsters_guids)
+    def test_save_character_packs_progress(self):
+        """ The killed monsters and loaded scripts should be saved in the character's own row """
+        self.expected_character.killed_monsters.add(13141)
+        save_character(self.expected_character)
 
-        killed_monsters_count = session.query(KilledMonstersSchema).filter_by(saved_character_id=test_char_id).count()
-        self.assertEqual(killed_monsters_count, len(killed_monsters_guids))
+        saved_row = session.query(SavedCharacterSchema).filter_by(name=self.expected_character.name).one()
+        self.assertEqual(list(unpack_guids(saved_row.packed_killed_monsters)), [14, 15, 20, 13141])
+        self.assertEqual(saved_row.packed_loaded_scripts, 'HASKEL_PAXTON_CONVERSATION')
 
     def test_save_completed_quests(self):
         test_char_id = 94
@@ -98,16 +133,16 @@ class SavedCharacterSaverTests(unittest.TestCase):
         item1_mock = mock.Mock(id=1)
         item2_mock = mock.Mock(id=2)
         item3_mock = mock.Mock(id=3)
-        inventory_mock = {
+        inventory = Inventory({
             "Digital": (item1_mock, 1),
             "GetRid": (item2_mock, 2),
             "Bra": (item3_mock, 1)
-        }
+        }, gold=10)
         test_char_id = 94
-        save_inventory(test_char_id, inventory_mock)
+        save_inventory(test_char_id, inventory)
 
-        saved_inventory_count = session.query(InventorySchema).filter_by(saved_character_id=test_char_id).count()
-        self.assertEqual(saved_inventory_count, len(inventory_mock.keys()))
+        saved_rows = session.query(InventorySchema).filter_by(saved_character_id=test_char_id).all()
+        self.assertCountEqual([(row.item_id, row.item_count) for row in saved_rows], [(1, 1), (2, 2), (3, 1)])
 
     def test_delete_rows_from_table_valid_tables(self):
         """
@@ -124,27 +159,7 @@ class SavedCharacterSaverTests(unittest.TestCase):
         self.assertEqual(new_inventory_rows_count, 0)
         self.assertLess(new_inventory_rows_count, old_inventory_rows_count)
 
-        # 2.Delete from the saved_character_killed_monsters table
-        old_monsters_count = session.query(KilledMonstersSchema).filter_by(saved_character_id=char_id).count()
-        self.assertGreater(old_monsters_count, 0)
-
-        delete_rows_from_table(KilledMonstersSchema.__tablename__, char_id)
-        new_monsters_count = session.query(KilledMonstersSchema).filter_by(saved_character_id=char_id).count()
-
-        self.assertEqual(new_monsters_count, 0)
-        self.assertLess(new_monsters_count, old_monsters_count)
-
-        # 3.Delete from the saved_character_loaded_scripts table
-        old_scripts_count = session.query(LoadedScriptsSchema).filter_by(saved_character_id=char_id).count()
-        self.assertGreater(old_scripts_count, 0)
-
-        delete_rows_from_table(LoadedScriptsSchema.__tablename__, char_id)
-        new_scripts_count = session.query(LoadedScriptsSchema).filter_by(saved_character_id=char_id).count()
-
-        self.assertEqual(new_scripts_count, 0)
-        self.assertLess(new_scripts_count, old_scripts_count)
-
-        # 4.Delete from the saved_character_completed_quests table
+        # 2.Delete from the saved_character_completed_quests table
         old_quests_count = session.query(CompletedQuestsSchema).filter_by(saved_character_id=char_id).count()
         self.assertGreater(old_quests_count, 0)
 
@@ -52,8 +52,7 @@ class CreatureTemplateTests(unittest.TestCase):
         self.assertEqual(self.dummy_max_damage, dummy.max_dmg)
         self.assertEqual(self.dummy_gossip, dummy.gossip)
         self.assertEqual(self.dummy_respawnable, dummy.respawnable)
-        self.assertEqual(len(dummy.vendor_inventory), 1)
-        self.assertTrue(isinstance(dummy.vendor_inventory[0], NpcVendorSchema))
+        self.assertTrue(isinstance(dummy.vendor, NpcVendorSchema))
 
     def test_build_inventory_with_vendor_npc(self):
         """
@@ -74,6 +73,22 @@ class CreatureTemplateTests(unittest.TestCase):
         received_inventory = non_vendor_dummy.build_vendor_inventory()
         self.assertEqual(received_inventory, {})
 
+    def test_convert_to_creature_template(self):
+        """ Brother Paxton, whose armor and rewards come from the creature defaults for his level """
+        creature_template = session.query(CreatureTemplateSchema).get(16).convert_to_creature_template()
+        self.assertEqual(creature_template.entry, 16)
+        self.assertEqual(creature_template.name, 'Brother Paxton')
+        self.assertEqual(creature_template.level, 3)
+        self.assertEqual(creature_template.health, 25)
+        self.assertEqual(creature_template.armor, 80)
+        self.assertEqual(creature_template.xp_to_give, 100)
+        self.assertEqual(creature_template.gold_to_give_range, (5, 8))
+
+    def test_convert_to_creature_template_is_shared(self):
+        """ Every conversion of the same entry should return the same template """
+        creature_template = session.query(CreatureTemplateSchema).get(16).convert_to_creature_template()
+        self.assertIs(session.query(CreatureTemplateSchema).get(16).convert_to_creature_template(), creature_template)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,9 +9,9 @@ database.main.Base = Base
 
 import models.main
 from models.creatures.creature_template import CreatureTemplateSchema
-from models.creatures.creatures import CreaturesSchema
+from models.creatures.creatures import CreaturesSchema, SpawnRecord
 from models.items.loot_table import LootTableSchema
-from entities import Monster, FriendlyNPC, VendorNPC
+from entities import Monster, FriendlyNPC, VendorNPC, monster_pool
 from items import Item
 
 
@@ -61,6 +61,45 @@ class CreaturesMonsterTests(unittest.TestCase):
         self.monster._gold_to_give = None
         self.assertEqual(vars(converted_monster), vars(self.monster))
 
+    def test_convert_to_living_thing_object_monster_reuses_pooled_monster(self):
+        """ A monster that has been given back to the pool should be reused, fully reset """
+        creature = session.query(CreaturesSchema).get(self.monster_guid)
+        released_monster = creature.convert_to_living_thing_object()
+        released_monster.health = 0
+        released_monster._alive = False
+        released_monster.loot['Linen Cloth'] = Item(name='Linen Cloth', item_id=10, buy_price=1, sell_price=1)
+        monster_pool.release(released_monster)
+
+        converted_monster = creature.convert_to_living_thing_object()
+
+        self.assertIs(converted_monster, released_monster)
+        self.assertTrue(converted_monster.is_alive())
+        self.assertEqual(converted_monster.health, 25)
+        self.assertEqual(list(converted_monster.loot.keys()), ['gold'])
+        self.assertEqual(len(monster_pool), 0)
+
+    def test_convert_to_spawn_record(self):
+        spawn_record = session.query(CreaturesSchema).get(self.monster_guid).convert_to_spawn_record()
+        self.assertTrue(isinstance(spawn_record, SpawnRecord))
+        self.assertEqual(spawn_record.guid, self.monster_guid)
+        self.assertEqual(spawn_record.entry, self.monster_entry)
+        self.assertEqual(spawn_record.type, self.monster_type)
+        self.assertEqual(spawn_record.level, 3)
+        self.assertEqual(spawn_record.name, 'Brother Paxton')
+
+    def test_spawn_record_str(self):
+        """ A spawn record should be printed the same way as its monster """
+        spawn_record = session.query(CreaturesSchema).get(self.monster_guid).convert_to_spawn_record()
+        self.assertEqual(str(spawn_record), str(self.monster))
+
+    def test_spawn_record_materialize(self):
+        spawn_record = session.query(CreaturesSchema).get(self.monster_guid).convert_to_spawn_record()
+        monster = spawn_record.materialize()
+        self.assertTrue(isinstance(monster, Monster))
+        self.assertEqual(monster.name, 'Brother Paxton')
+        # every call should build a new monster
+        self.assertIsNot(spawn_record.copy_for_instance(), monster)
+
 
 class CreaturesFriendlyNpcTests(unittest.TestCase):
     def setUp(self):
@@ -91,6 +130,10 @@ class CreaturesFriendlyNpcTests(unittest.TestCase):
         self.assertTrue(isinstance(loaded_npc, FriendlyNPC))
         self.assertEqual(vars(loaded_npc), vars(self.npc))
 
+    def test_spawn_record_str(self):
+        spawn_record = session.query(CreaturesSchema).get(self.npc_guid).convert_to_spawn_record()
+        self.assertEqual(str(spawn_record), str(self.npc))
+
 
 class CreaturesVendorNpcTests(unittest.TestCase):
     def setUp(self):
@@ -119,6 +162,10 @@ class CreaturesVendorNpcTests(unittest.TestCase):
         self.assertIsNotNone(loaded_vendor)
         self.assertEqual(vars(loaded_vendor), vars(self.vendor))
 
+    def test_spawn_record_str(self):
+        spawn_record = session.query(CreaturesSchema).get(self.vendor_guid).convert_to_spawn_record()
+        self.assertEqual(str(spawn_record), str(self.vendor))
+
 
 if __name__ == '__main__':
     unittest.main()
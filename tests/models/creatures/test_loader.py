@@ -10,82 +10,56 @@ database.main.Base = Base
 import models.main
 from models.creatures.creature_template import CreatureTemplateSchema
 from models.creatures.creatures import CreaturesSchema
-from models.creatures.loader import load_monsters, load_npcs
+from models.creatures.loader import load_monster_spawns, load_npc_spawns
+from models.creatures.creatures import SpawnRecord
 from entities import Monster, FriendlyNPC, VendorNPC
 from items import Item
 
 
-class CharacterMock():
-    def __init__(self):
-        self.killed_monsters = set()
-
-    def add_killed_monster(self, guid):
-        self.killed_monsters.add(guid)
-
-    def has_killed_monster(self, monster_guid: int):
-        return monster_guid in self.killed_monsters
-
-
 class LoaderTest(unittest.TestCase):
-
-    def setUp(self):
-        self.character = CharacterMock()
-        self.character.add_killed_monster(15)  # Brother Paxton in peculiar hut
-
-    def test_load_monsters_valid(self):
+    def test_load_monster_spawns_valid(self):
         """ Load all the monsters from Northshire Abbey - Northshire Valley"""
         self.expected_monster_count = 5
-        monsters_dict, guid_name_set =  load_monsters(zone='Northshire Abbey', subzone='Northshire Valley', character=self.character)
-        self.assertEqual(len(monsters_dict.keys()), self.expected_monster_count)
+        monster_spawns, guid_name_set = load_monster_spawns(zone='Northshire Abbey', subzone='Northshire Valley')
+        self.assertEqual(len(monster_spawns.keys()), self.expected_monster_count)
+        self.assertEqual(len(guid_name_set), len(monster_spawns.keys()))
 
-    def test_load_monsters_invalid_zone(self):
+    def test_load_monster_spawns_invalid_zone(self):
         """ Load all the monsters from an invalid zone, should end up with 0 """
-        self.expected_monster_count = 0
-        monsters_dict, guid_name_set = load_monsters(zone='Bru', subzone='S',
-                                                     character=self.character)
-        self.assertEqual(len(monsters_dict.keys()), self.expected_monster_count)
-        self.assertEqual(len(guid_name_set), len(monsters_dict.keys()))
-
-    def test_load_monsters_character_has_killed(self):
-        """
-        Try to load the monsters from a zone in which the character has killed
-        a monster. We should end up with 0 monsters
-        """
-        self.expected_monster_count = 0
-        monsters_dict, guid_name_set =  load_monsters(zone='Northshire Abbey', subzone='A Peculiar Hut', character=self.character)
-        self.assertEqual(len(monsters_dict.keys()), 0)
+        monster_spawns, guid_name_set = load_monster_spawns(zone='Bru', subzone='S')
+        self.assertEqual(len(monster_spawns.keys()), 0)
         self.assertEqual(len(guid_name_set), 0)
 
-    def test_load_npcs_valid(self):
+    def test_load_monster_spawns(self):
+        """ Spawn records should be loaded for every monster, as they are not filtered by character """
+        monster_spawns, guid_name_set = load_monster_spawns(zone='Northshire Abbey', subzone='A Peculiar Hut')
+        self.assertEqual(list(monster_spawns.keys()), [15])
+        self.assertEqual(guid_name_set, {(15, 'Brother Paxton')})
+
+        spawn_record = monster_spawns[15]
+        self.assertTrue(isinstance(spawn_record, SpawnRecord))
+        self.assertEqual((spawn_record.guid, spawn_record.entry, spawn_record.level), (15, 16, 3))
+
+    def test_load_npc_spawns(self):
         """
         Load the npcs from a zone. We should get both FriendlyNPCs and VendorNPCs
         """
         expected_npc_count = 2
-        expected_zone = 'Northshire Abbey'
-        expected_subzone = 'Northshire Valley'
-        npcs_dict, guid_name_set = load_npcs(zone=expected_zone, subzone=expected_subzone)
+        npc_spawns, guid_name_set = load_npc_spawns(zone='Northshire Abbey', subzone='Northshire Valley')
 
-        for i in guid_name_set:
-            self.assertIsNotNone(i)
-            self.assertTrue(isinstance(i[0], int))
-            self.assertTrue(isinstance(i[1], str))
-        for i in npcs_dict.values():
-            self.assertTrue(isinstance(i, FriendlyNPC))
+        self.assertEqual(len(npc_spawns.keys()), expected_npc_count)
+        self.assertEqual(guid_name_set, {(guid, spawn.name) for guid, spawn in npc_spawns.items()})
+        self.assertEqual({spawn.type for spawn in npc_spawns.values()}, {'fnpc', 'vendor'})
+        for spawn in npc_spawns.values():
+            self.assertTrue(isinstance(spawn.materialize(), FriendlyNPC))
 
-        self.assertEqual(len(npcs_dict.keys()), expected_npc_count)
-        self.assertEqual(len(npcs_dict.keys()), len(guid_name_set))
-
-    def test_load_npcs_no_npcs(self):
+    def test_load_npc_spawns_no_npcs(self):
         """
         Load the npcs from a zone which has no NPCs
         """
-        expected_npc_count = 0
-        expected_zone = 'Northshire Abbey'
-        expected_subzone = 'A Peculiar Hut'
-
-        npcs_dict, guid_name_set = load_npcs(zone=expected_zone, subzone=expected_subzone)
-        self.assertEqual(len(npcs_dict.keys()), expected_npc_count)
-        self.assertEqual(len(npcs_dict.keys()), len(guid_name_set))
+        npc_spawns, guid_name_set = load_npc_spawns(zone='Northshire Abbey', subzone='A Peculiar Hut')
+        self.assertEqual(len(npc_spawns.keys()), 0)
+        self.assertEqual(len(guid_name_set), 0)
 
 
 if __name__ == '__main__':
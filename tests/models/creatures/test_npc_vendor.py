@@ -6,22 +6,74 @@ database.main.engine = engine
 database.main.session = session
 database.main.Base = Base
 import models.main
-from models.creatures.npc_vendor import NpcVendorSchema
+from models.creatures.npc_vendor import NpcVendorSchema, VendorProductListSchema, loaded_vendor_product_lists
+from models.creatures.creature_template import CreatureTemplateSchema
 from models.items.item_template import ItemTemplateSchema
+from utils.copy_on_write import CopyOnWriteDict
 
 
 class NpcVendorTests(unittest.TestCase):
     def setUp(self):
         """ There is only one entry in this table """
         self.dummy_creature_entry = 14
-        self.dummy_item_id = 1
-        self.dummy_item_count = 10
-        self.dummy_price = 1
+        self.dummy_product_list_id = 1
         self.expected_tablename = 'npc_vendor'
 
+    def tearDown(self):
+        loaded_vendor_product_lists.clear()
+
     def test_npc_vendor_values(self):
         received_dummy = session.query(NpcVendorSchema).get(self.dummy_creature_entry)
         self.assertEqual(received_dummy.__tablename__, self.expected_tablename)
+        self.assertEqual(received_dummy.product_list_id, self.dummy_product_list_id)
+
+        self.assertEqual(len(received_dummy.products), 1)
+        self.assertTrue(isinstance(received_dummy.products[0], VendorProductListSchema))
+
+    def test_build_product_catalog(self):
+        received_dummy = session.query(NpcVendorSchema).get(self.dummy_creature_entry)
+        catalog = received_dummy.build_product_catalog()
+
+        item, item_count = catalog['Wolf Meat']
+        self.assertEqual(item.id, 1)
+        self.assertEqual(item.buy_price, 1)  # overridden by the product list
+        self.assertEqual(item_count, 10)
+
+    def test_build_product_catalog_is_shared(self):
+        """ Every vendor of the same product list should get the same catalog, without it being built again """
+        received_dummy = session.query(NpcVendorSchema).get(self.dummy_creature_entry)
+        catalog = received_dummy.build_product_catalog()
+        other_vendor = NpcVendorSchema(creature_entry=1000, product_list_id=self.dummy_product_list_id)
+
+        self.assertIs(other_vendor.build_product_catalog(), catalog)
+
+    def test_vendor_inventories_share_the_catalog(self):
+        """ Selling an item should only change the vendor's own inventory """
+        vendor_template = session.query(CreatureTemplateSchema).get(self.dummy_creature_entry)
+        first_inventory = vendor_template.build_vendor_inventory()
+        second_inventory = vendor_template.build_vendor_inventory()
+        self.assertTrue(isinstance(first_inventory, CopyOnWriteDict))
+
+        del first_inventory['Wolf Meat']
+
+        self.assertNotIn('Wolf Meat', first_inventory)
+        self.assertIn('Wolf Meat', second_inventory)
+        self.assertIs(second_inventory['Wolf Meat'], loaded_vendor_product_lists[self.dummy_product_list_id]['Wolf Meat'])
+        self.assertEqual(second_inventory.materialized_count(), 0)
+
+
+class VendorProductListTests(unittest.TestCase):
+    def setUp(self):
+        """ There is only one entry in this table """
+        self.dummy_entry = 1
+        self.dummy_item_id = 1
+        self.dummy_item_count = 10
+        self.dummy_price = 1
+        self.expected_tablename = 'vendor_product_list'
+
+    def test_vendor_product_list_values(self):
+        received_dummy = session.query(VendorProductListSchema).get((self.dummy_entry, self.dummy_item_id))
+        self.assertEqual(received_dummy.__tablename__, self.expected_tablename)
         self.assertEqual(received_dummy.item_id, self.dummy_item_id)
         self.assertEqual(received_dummy.item_count, self.dummy_item_count)
         self.assertEqual(received_dummy.price, self.dummy_price)
@@ -12,6 +12,7 @@ from models.items.item_template import ItemTemplateSchema
 from models.quests.quest_template import QuestSchema
 from items import Item, Weapon, Equipment, Potion
 from buffs import BeneficialBuff
+from utils.helper import get_attributes
 
 class ItemTemplateMiscItemTests(unittest.TestCase):
     def setUp(self):
@@ -30,7 +31,7 @@ class ItemTemplateMiscItemTests(unittest.TestCase):
         received_item = received_item.convert_to_item_object()
         self.assertIsNotNone(received_item)
         self.assertTrue(isinstance(received_item, Item))
-        self.assertEqual(vars(received_item), vars(self.expected_item))
+        self.assertEqual(get_attributes(received_item), get_attributes(self.expected_item))
 
 
 class ItemTemplateWeaponItemTests(unittest.TestCase):
@@ -63,7 +64,7 @@ class ItemTemplateWeaponItemTests(unittest.TestCase):
         received_item = session.query(ItemTemplateSchema).get(self.item_entry).convert_to_item_object()
         self.assertIsNotNone(received_item)
         self.assertTrue(isinstance(received_item, Weapon))
-        self.assertEqual(vars(received_item), vars(self.expected_item))
+        self.assertEqual(get_attributes(received_item), get_attributes(self.expected_item))
 
 
 class ItemTemplatePotionItemTests(unittest.TestCase):
@@ -87,7 +88,18 @@ class ItemTemplatePotionItemTests(unittest.TestCase):
 
         self.assertIsNotNone(received_item)
         self.assertTrue(isinstance(received_item, Potion))
-        self.assertEqual(vars(received_item), vars(self.potion))
+        self.assertEqual(get_attributes(received_item), get_attributes(self.potion))
+
+    def test_convert_to_item_object_no_buff(self):
+        """ A potion whose effect points to no buff should raise an exception """
+        expected_message = 'The potion Empty Potion has no buff with an entry of 999!'
+        potion_template = ItemTemplateSchema(entry=999, name='Empty Potion', type='potion', buy_price=1,
+                                             sell_price=1, effect=999)
+        try:
+            potion_template.convert_to_item_object()
+            self.fail('The test should have raised an Exception!')
+        except Exception as e:
+            self.assertEqual(e.args[0], expected_message)
 
 
 if __name__ == '__main__':
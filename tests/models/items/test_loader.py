@@ -10,6 +10,7 @@ import models.main
 from models.items.loader import load_item
 from items import Potion
 from buffs import BeneficialBuff
+from utils.helper import get_attributes
 
 
 class LoaderTests(unittest.TestCase):
@@ -33,7 +34,7 @@ class LoaderTests(unittest.TestCase):
 
         self.assertIsNotNone(received_item)
         self.assertTrue(isinstance(received_item, Potion))
-        self.assertEqual(vars(received_item), vars(self.potion))
+        self.assertEqual(get_attributes(received_item), get_attributes(self.potion))
 
     def test_load_invalid_item_id(self):
         """ It should raise an exception """
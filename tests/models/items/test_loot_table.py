@@ -9,7 +9,7 @@ database.main.Base = Base
 import models.main
 from items import Item, Potion, Weapon
 from buffs import BeneficialBuff
-from models.items.loot_table import LootTableSchema
+from models.items.loot_table import LootTableSchema, get_drop_item
 from models.items.item_template import ItemTemplateSchema
 
 
@@ -74,6 +74,16 @@ class LootTableSchemaTests(unittest.TestCase):
 
         self.assertGreater(received_items_count, 10)
 
+    def test_decide_drops_shares_items(self):
+        """ Every drop of the same item should be the same Item object """
+        l_table = session.query(LootTableSchema).get(self.loot_table_entry)
+        dropped_items = {}
+        for _ in range(100):
+            for drop in l_table.decide_drops():
+                self.assertIs(dropped_items.setdefault(drop.id, drop), drop)
+
+        self.assertIs(get_drop_item(l_table.item1), get_drop_item(l_table.item1))
+
 
 if __name__ == '__main__':
     unittest.main()
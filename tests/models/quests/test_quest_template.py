@@ -13,6 +13,7 @@ from models.items.item_template import ItemTemplateSchema
 from quest import KillQuest, FetchQuest, Quest
 from items import Item, Potion
 from buffs import BeneficialBuff
+from utils.helper import get_attributes
 
 
 class QuestTemplateSchemaTests(unittest.TestCase):
@@ -65,7 +66,7 @@ class QuestTemplateSchemaTests(unittest.TestCase):
 
     def test_convert_to_quest_object_killquest(self):
         received_kill_quest = session.query(QuestSchema).get(self.quest_entry).convert_to_quest_object()
-        self.assertEqual(vars(received_kill_quest), vars(self.expected_kill_quest))
+        self.assertEqual(get_attributes(received_kill_quest), get_attributes(self.expected_kill_quest))
 
     def test_convert_to_quest_object_fetchquest(self):
         """
@@ -88,7 +89,7 @@ class QuestTemplateSchemaTests(unittest.TestCase):
                                     level_required=level_required, required_item_count=amount_required, is_completed=False)
         received_quest = session.query(QuestSchema).get(entry).convert_to_quest_object()
 
-        self.assertEqual(vars(received_quest), vars(expected_quest))
+        self.assertEqual(get_attributes(received_quest), get_attributes(expected_quest))
 
 
 if __name__ == '__main__':
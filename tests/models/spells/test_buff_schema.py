@@ -12,6 +12,7 @@ import models.main
 from models.spells.spell_buffs import BuffSchema
 from buffs import BeneficialBuff
 from damage import Damage
+from utils.helper import get_attributes
 
 
 class BuffSchemaTests(unittest.TestCase):
@@ -43,7 +44,7 @@ class BuffSchemaTests(unittest.TestCase):
 
     def test_convert_to_beneficial_buff_object(self):
         loaded_buff: BeneficialBuff = session.query(BuffSchema).get(self.buff_entry).convert_to_beneficial_buff_object()
-        self.assertEqual(vars(loaded_buff), vars(self.expected_buff))
+        self.assertEqual(get_attributes(loaded_buff), get_attributes(self.expected_buff))
 
 
 if __name__ == '__main__':
@@ -12,6 +12,7 @@ import models.main
 from models.spells.spell_dots import DotSchema
 from buffs import DoT
 from damage import Damage
+from utils.helper import get_attributes
 
 
 class DotSchemaTests(unittest.TestCase):
@@ -48,7 +49,7 @@ class DotSchemaTests(unittest.TestCase):
 
         self.assertTrue(isinstance(loaded_dot, DoT))
         self.assertEqual(loaded_dot, self.expected_dot)
-        self.assertEqual(vars(loaded_dot), vars(self.expected_dot))
+        self.assertEqual(get_attributes(loaded_dot), get_attributes(self.expected_dot))
 
 
 if __name__ == '__main__':
@@ -13,6 +13,7 @@ from spells import PaladinSpell
 from models.items.item_template import ItemTemplateSchema
 from models.spells.spell_dots import DotSchema
 from buffs import BeneficialBuff, DoT
+from utils.helper import get_attributes
 from damage import Damage
 
 
@@ -56,7 +57,7 @@ class PaladinSpellsSchemaTests(unittest.TestCase):
         See if the convert_to_paladin_spell_object works properly
         """
         loaded_quest: PaladinSpell = session.query(PaladinSpellsSchema).get(self.spell_entry).convert_to_paladin_spell_object()
-        self.assertEqual(vars(loaded_quest), vars(self.expected_spell))
+        self.assertEqual(get_attributes(loaded_quest), get_attributes(self.expected_spell))
 
 
 if __name__ == '__main__':
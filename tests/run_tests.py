@@ -10,20 +10,28 @@ from tests.models.items import test_loader as test_item_loader, test_item_templa
 from tests.models.misc import test_misc_loader
 from tests.models.quests import test_loader as test_quest_loader, test_quest_template
 from tests.models.spells import test_buff_schema, test_dot_schema, test_paladin_spells
-from tests.utils import test_helper
+from tests.utils import test_helper, test_copy_on_write, test_timing_wheel, test_guid_set, test_lru_cache
 from tests.zones import test_northshire_abbey
-from tests import test_buffs, test_entities, test_damage, heal_tests, test_classes
+from tests.server import test_router
+from tests.database import test_migrations
+from tests import test_buffs, test_entities, test_damage, heal_tests, test_classes, test_world, test_spells, \
+    test_quest, test_inventory, test_combat, test_encounter, test_auto_combat, test_batch, test_start_game_prompt
 
 modules_to_load = [test_saved_character, test_creature_template, test_creatures, test_npc_vendor, test_loot_table,
                    test_creatures_loader, test_creature_def_loader, test_item_loader, test_item_template,
                    test_char_saver, test_misc_loader, test_quest_loader, test_quest_template, test_buff_schema,
                    test_dot_schema, test_paladin_spells, test_helper, test_northshire_abbey, test_buffs, test_entities,
-                   test_damage, heal_tests, test_classes]
+                   test_damage, heal_tests, test_classes, test_world, test_router,
+                   test_copy_on_write, test_spells, test_quest,
+                   test_inventory, test_timing_wheel, test_guid_set, test_lru_cache, test_combat,
+                   test_encounter, test_auto_combat, test_batch, test_migrations, test_start_game_prompt]
 
-loader = unittest.TestLoader()
-main_suite = loader.loadTestsFromModule(test_char_loader)
-for module in modules_to_load:
-    main_suite.addTest(loader.loadTestsFromModule(module))
+# the guard is needed as the zone shard processes are spawned, which imports the main module in them
+if __name__ == '__main__':
+    loader = unittest.TestLoader()
+    main_suite = loader.loadTestsFromModule(test_char_loader)
+    for module in modules_to_load:
+        main_suite.addTest(loader.loadTestsFromModule(module))
 
-runner = unittest.TextTestRunner()
-runner.run(main_suite)
+    runner = unittest.TextTestRunner()
+    runner.run(main_suite)
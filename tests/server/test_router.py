@@ -0,0 +1,173 @@
+import unittest
+
+import models.main
+
+from classes import Paladin
+from constants import MONSTER_RESPAWN_TURNS
+from server.router import ShardRouter
+from zones.northshire_abbey import NorthshireAbbey
+
+
+class ExitNorthshireAbbey(NorthshireAbbey):
+    """ Northshire Abbey with an exit to another zone, as none of the zones in the game are connected yet """
+    zone_exits = {"Northshire Valley": ["Elwynn Forest"]}
+
+
+class TestElwynnForest(NorthshireAbbey):
+    zone_name = "Elwynn Forest"
+
+
+TEST_ZONE_CLASSES = {ExitNorthshireAbbey.zone_name: ExitNorthshireAbbey,
+                     TestElwynnForest.zone_name: TestElwynnForest}
+
+
+class ShardRouterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # every zone is ran in a separate shard (process)
+        cls.router = ShardRouter(zone_groups=[[ExitNorthshireAbbey.zone_name], [TestElwynnForest.zone_name]],
+                                 zone_classes=TEST_ZONE_CLASSES)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.router.close()
+
+    def setUp(self):
+        self.character = Paladin(name='Sharded', level=3)
+        self.character.experience = 50
+        self.character.inventory.gold = 20
+        self.output = self.router.connect(self.character)
+
+    def tearDown(self):
+        if self.character.name in self.router.character_shards:
+            self.router.disconnect(self.character.name)
+
+    def test_connect(self):
+        self.assertIn('Sharded has entered Northshire Abbey', self.output)
+        self.assertIn('Alive NPCs', self.output)
+        self.assertEqual(self.router.character_shards[self.character.name], 0)
+
+    def test_send_command(self):
+        output, waiting_for_input = self.router.send_command(self.character.name, 'go to Northshire Vineyards')
+
+        self.assertIn('Moved to Northshire Vineyards', output)
+        self.assertFalse(waiting_for_input)
+
+    def test_send_command_waiting_for_input(self):
+        """ The shard should send back what was printed so far whenever the command asks for input """
+        output, waiting_for_input = self.router.send_command(self.character.name, 'open inventory')
+        self.assertTrue(waiting_for_input)
+        self.assertIn('>inventory ', output)
+        self.assertIn(self.character.name, self.router.waiting_for_input)
+
+        output, waiting_for_input = self.router.send_command(self.character.name, 'exit')
+        self.assertFalse(waiting_for_input)
+        self.assertNotIn(self.character.name, self.router.waiting_for_input)
+
+    def test_handoff(self):
+        """ Going to a zone in another shard should move the character to that shard """
+        output, _ = self.router.send_command(self.character.name, 'go to Elwynn Forest')
+
+        self.assertIn('Sharded is leaving Northshire Abbey for Elwynn Forest', output)
+        self.assertIn('Sharded has entered Elwynn Forest', output)
+        self.assertEqual(self.router.character_shards[self.character.name], 1)
+
+    def test_handoff_keeps_character(self):
+        self.router.disconnect(self.character.name)
+        self.character.health = 20
+        self.router.connect(self.character)
+        self.router.send_command(self.character.name, 'go to Elwynn Forest')
+        serialized_character = self.router.disconnect(self.character.name)
+
+        self.assertEqual(serialized_character['name'], 'Sharded')
+        self.assertEqual(serialized_character['level'], 3)
+        self.assertEqual(serialized_character['experience'], 50)
+        self.assertEqual(serialized_character['gold'], 20)
+        self.assertEqual(serialized_character['current_zone'], 'Elwynn Forest')
+        self.assertEqual(serialized_character['current_subzone'], 'Northshire Valley')
+        self.assertEqual(serialized_character['health'], 20)
+
+    def test_reconnect_keeps_subzone(self):
+        """ A character who reconnects should be back in the subzone he was in, not in the starting one """
+        self.router.send_command(self.character.name, 'go to Northshire Vineyards')
+        serialized_character = self.router.disconnect(self.character.name)
+        self.assertEqual(serialized_character['current_subzone'], 'Northshire Vineyards')
+
+        self.character.current_subzone = 'Northshire Vineyards'
+        self.router.connect(self.character)
+        output, _ = self.router.send_command(self.character.name, 'go to Northshire Valley')
+
+        self.assertIn('Moved to Northshire Valley', output)
+
+    def test_shard_waiting_for_input_refuses_other_messages(self):
+        """ A shard waiting for a character's input should not be sent anything else, as it would never reply """
+        other_character = Paladin(name='Other', level=3)
+        self.router.send_command(self.character.name, 'open inventory')
+        try:
+            for message in [lambda: self.router.connect(other_character),
+                            lambda: self.router.disconnect(self.character.name)]:
+                with self.assertRaises(Exception) as context:
+                    message()
+                self.assertEqual(str(context.exception), 'The shard is waiting for a command from Sharded!')
+        finally:
+            self.router.send_command(self.character.name, 'exit')
+
+        # the shard should take messages once the command is over
+        self.router.connect(other_character)
+        output, _ = self.router.send_command(other_character.name, 'go to Northshire Vineyards')
+        self.router.disconnect(other_character.name)
+        self.assertIn('Moved to Northshire Vineyards', output)
+
+    def test_other_shard_is_not_blocked(self):
+        """ A character waiting for input should not block the characters of the other shards """
+        other_character = Paladin(name='Other', level=3)
+        other_character.current_zone = TestElwynnForest.zone_name
+        self.router.send_command(self.character.name, 'open inventory')
+        try:
+            self.router.connect(other_character)
+            output, _ = self.router.send_command(other_character.name, 'go to Northshire Vineyards')
+            self.router.disconnect(other_character.name)
+        finally:
+            self.router.send_command(self.character.name, 'exit')
+
+        self.assertIn('Moved to Northshire Vineyards', output)
+
+    def count_alive_wolves(self) -> int:
+        output, _ = self.router.send_command(self.character.name, 'pam')
+        return output.count('Wolf')
+
+    def test_killed_monster_respawns(self):
+        """ Every command should pass a turn of the character's world, bringing a killed wolf back in time """
+        wolf_count = self.count_alive_wolves()
+        output, waiting_for_input = self.router.send_command(self.character.name, 'engage Wolf')
+        while waiting_for_input and 'has slain Wolf' not in output:
+            output, waiting_for_input = self.router.send_command(self.character.name, 'attack')
+        while waiting_for_input:  # leave the loot window
+            output, waiting_for_input = self.router.send_command(self.character.name, 'exit')
+
+        # the engage command has passed the first turn, every pam command passes another one after printing
+        for _ in range(MONSTER_RESPAWN_TURNS - 1):
+            self.assertEqual(self.count_alive_wolves(), wolf_count - 1)
+        self.assertEqual(self.count_alive_wolves(), wolf_count)
+
+    def test_subzone_move_is_not_handoff(self):
+        """ Moving between the subzones of a shard's zone should not leave the shard """
+        self.router.send_command(self.character.name, 'go to Northshire Vineyards')
+        self.assertEqual(self.router.character_shards[self.character.name], 0)
+
+    def test_send_command_invalid_character(self):
+        self.assertRaises(KeyError, self.router.send_command, 'Nobody', 'pam')
+
+    def test_connect_invalid_zone(self):
+        character = Paladin(name='Lost')
+        character.current_zone = 'Aa'
+        expected_message = 'There is no shard for the zone Aa!'
+        try:
+            self.router.connect(character)
+            self.fail('The test should have raised an Exception!')
+        except Exception as e:
+            self.assertEqual(str(e), expected_message)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Test the auto combat mode in auto_combat.py
+"""
+import sys
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+import models.main
+from auto_combat import AutoCombat, AutoCombatPolicy, parse_auto_combat_policy
+from classes import Paladin
+from combat import engage_combat, engage_group_combat
+from encounter import Encounter
+from entities import Monster
+from information_printer import combat_log
+
+
+class ParseAutoCombatPolicyTests(unittest.TestCase):
+    def test_auto_attack_only(self):
+        self.assertEqual(parse_auto_combat_policy('auto'), AutoCombatPolicy())
+
+    def test_sor(self):
+        self.assertEqual(parse_auto_combat_policy('auto sor'), AutoCombatPolicy(keep_seal_of_righteousness=True))
+
+    def test_heal_default_percentage(self):
+        self.assertEqual(parse_auto_combat_policy('auto heal'), AutoCombatPolicy(heal_below_percentage=50))
+
+    def test_sor_heal_percentage(self):
+        self.assertEqual(parse_auto_combat_policy('auto sor heal 40'),
+                         AutoCombatPolicy(keep_seal_of_righteousness=True, heal_below_percentage=40))
+        self.assertEqual(parse_auto_combat_policy('auto heal 40 sor'),
+                         AutoCombatPolicy(keep_seal_of_righteousness=True, heal_below_percentage=40))
+
+    def test_invalid(self):
+        for command in ['attack', '', 'autosor', 'auto fol', 'auto heal 0', 'auto heal 101', 'auto heal ten',
+                        'auto sor sor']:
+            self.assertIsNone(parse_auto_combat_policy(command), command)
+
+
+class AutoCombatPolicyTests(unittest.TestCase):
+    def setUp(self):
+        sys.stdout = StringIO()
+        self.character = Paladin(name='Netherblood', level=3, health=100, mana=100, strength=10)
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def test_attack_only(self):
+        self.character.health = 1
+        self.assertEqual(AutoCombatPolicy().choose_command(self.character), 'attack')
+
+    def test_keep_sor_up(self):
+        policy = AutoCombatPolicy(keep_seal_of_righteousness=True)
+        self.assertEqual(policy.choose_command(self.character), 'sor')
+
+        self.character.SOR_ACTIVE = True
+        self.assertEqual(policy.choose_command(self.character), 'attack')
+
+    def test_heal_below_percentage(self):
+        policy = AutoCombatPolicy(keep_seal_of_righteousness=True, heal_below_percentage=50)
+        self.character.health = self.character.max_health // 2 - 1
+        self.assertEqual(policy.choose_command(self.character), 'fol')
+
+        self.character.health = self.character.max_health // 2 + 1
+        self.assertEqual(policy.choose_command(self.character), 'sor')
+
+    def test_no_spell_without_mana(self):
+        policy = AutoCombatPolicy(keep_seal_of_righteousness=True, heal_below_percentage=50)
+        self.character.health, self.character.mana = 1, 0
+
+        self.assertEqual(policy.choose_command(self.character), 'attack')
+
+
+class AutoCombatTests(unittest.TestCase):
+    def setUp(self):
+        self.output = StringIO()
+        sys.stdout = self.output
+        self.character = Paladin(name='Netherblood', level=3, health=100, mana=100, strength=10)
+        self.monster = Monster(monster_id=1, name='Kobold', health=60, level=1, min_damage=1, max_damage=1,
+                               xp_to_give=10, gold_to_give_range=(2, 2))
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def test_summary(self):
+        auto_combat = AutoCombat(AutoCombatPolicy(), self.character, [self.monster])
+        for _ in range(3):
+            auto_combat.next_command()
+        self.character.health = 90
+
+        self.assertEqual(auto_combat.get_summary(),
+                         'Auto combat against Kobold - 3 turns: 3 auto attacks | Health 111 -> 90/111 '
+                         '| Mana 111 -> 111/111')
+
+    def test_finish_once(self):
+        auto_combat = AutoCombat(AutoCombatPolicy(), self.character, [self.monster])
+        auto_combat.start()
+        combat_log.info('Kobold attacks Netherblood!')
+        print('Not muted')
+        auto_combat.finish()
+        auto_combat.finish()
+        combat_log.info('Kobold has died!')
+
+        self.assertIs(sys.stdout, self.output)
+        self.assertNotIn('Kobold attacks', self.output.getvalue())
+        self.assertIn('Not muted', self.output.getvalue())
+        self.assertIn('Kobold has died!', self.output.getvalue())
+        self.assertEqual(self.output.getvalue().count('Auto combat against Kobold'), 1)
+
+    def test_summary_names_every_monster(self):
+        wolf = Monster(monster_id=2, name='Wolf', health=10, level=1, min_damage=1, max_damage=1)
+        auto_combat = AutoCombat(AutoCombatPolicy(), self.character, [self.monster, wolf])
+
+        self.assertTrue(auto_combat.get_summary().startswith('Auto combat against Kobold, Wolf - 0 turns'))
+
+    def test_engage_combat_auto(self):
+        """ The whole fight should resolve from a single auto command, with only its summary printed """
+        commands = iter(['auto sor heal 50', 'take all'])
+        alive_monsters, guid_name_set = {1: self.monster}, {(1, 'Kobold')}
+
+        # have the monster take its turns first
+        initiatives = {self.character.name: 1, self.monster.name: 2}
+        with patch('builtins.input', lambda *_: next(commands)), \
+                patch.object(Encounter, 'roll_initiative', lambda _, living_thing: initiatives[living_thing.name]):
+            engage_combat(self.character, self.monster, alive_monsters, guid_name_set, 1)
+
+        output = self.output.getvalue()
+        self.assertFalse(self.monster.is_alive())
+        self.assertFalse(self.character.is_in_combat())
+        self.assertEqual(alive_monsters, {})
+        self.assertIn('Auto combat against Kobold', output)
+        self.assertIn(Paladin.KEY_SEAL_OF_RIGHTEOUSNESS, output)
+        # only the monster's first blow, which comes before the auto command is read, should be printed
+        self.assertEqual(output.count('Kobold attacks'), 1)
+        self.assertIs(sys.stdout, self.output)
+
+    def test_engage_group_combat_auto(self):
+        """ An auto command should resolve a fight against a group of monsters as well """
+        wolf = Monster(monster_id=2, name='Wolf', health=20, level=1, min_damage=1, max_damage=1,
+                       xp_to_give=10, gold_to_give_range=(2, 2))
+        commands = iter(['auto', 'take all'])
+        alive_monsters, guid_name_set = {1: self.monster, 2: wolf}, {(1, 'Kobold'), (2, 'Wolf')}
+
+        # have the monsters take their turns first
+        initiatives = {self.character.name: 1, self.monster.name: 3, wolf.name: 2}
+        with patch('builtins.input', lambda *_: next(commands)), \
+                patch.object(Encounter, 'roll_initiative', lambda _, living_thing: initiatives[living_thing.name]):
+            engage_group_combat(self.character, dict(alive_monsters), alive_monsters, guid_name_set)
+
+        output = self.output.getvalue()
+        self.assertFalse(self.monster.is_alive())
+        self.assertFalse(wolf.is_alive())
+        self.assertEqual(alive_monsters, {})
+        self.assertIn('Auto combat against Kobold, Wolf', output)
+        # only the monsters' first blows, which come before the auto command is read, should be printed
+        self.assertEqual(output.count('Kobold attacks'), 1)
+        self.assertEqual(output.count('Wolf attacks'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
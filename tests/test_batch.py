@@ -0,0 +1,196 @@
+"""
+Test the batch mode in batch.py
+"""
+import builtins
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from io import StringIO
+
+import combat
+from batch import CommandScript, get_percentile, run_script, scratch_database, skipped_sleeps
+from database.database_info import DB_PATH
+from tests.create_test_db import DB_PATH as TEST_DB_PATH, session
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CommandScriptTests(unittest.TestCase):
+    def setUp(self):
+        self.output = StringIO()
+        sys.stdout = self.output
+        self.clock = FakeClock()
+        self.script = CommandScript(['# create a paladin\n', 'new\n', '\n', 'paladin\n', '  engage Wolf  \n'],
+                                    clock=self.clock)
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def test_commands(self):
+        """ Empty lines and comments should be skipped """
+        self.assertEqual(self.script.commands, ['new', 'paladin', 'engage Wolf'])
+
+    def test_call(self):
+        """ The prompt should not be printed, the command should be echoed instead """
+        self.assertEqual(self.script('>Enter character name: '), 'new')
+        self.assertEqual(self.output.getvalue(), '>new\n')
+
+    def test_call_runs_out(self):
+        for _ in range(3):
+            self.script()
+
+        self.assertRaises(EOFError, self.script)
+
+    def test_latencies(self):
+        """ The latency of a command should last from it being read until the next one is asked for """
+        self.script()
+        self.clock.now = 0.5
+        self.script()
+        self.clock.now = 0.75
+        self.script()
+        self.clock.now = 2
+        self.assertRaises(EOFError, self.script)
+        self.script.finish()
+
+        self.assertEqual(self.script.latencies, [('new', 0.5), ('paladin', 0.25), ('engage Wolf', 1.25)])
+        self.assertEqual(self.script.end_time - self.script.start_time, 2)
+
+    def test_finish_before_running_out(self):
+        """ The game quitting on its own should end the last command's latency """
+        self.script()
+        self.clock.now = 1
+        self.script.finish()
+
+        self.assertEqual(self.script.latencies, [('new', 1)])
+
+    def test_get_report(self):
+        self.script()
+        self.clock.now = 0.001
+        self.script()
+        self.clock.now = 0.004
+        self.script()
+        self.clock.now = 0.01
+        self.script.finish()
+
+        report = self.script.get_report()
+
+        self.assertIn('Ran 3/3 commands in 0.010s', report)
+        self.assertIn('Latency - mean: 3.33ms, median: 3.00ms, 95th percentile: 6.00ms, max: 6.00ms', report)
+        # sorted by the total time the commands took
+        self.assertLess(report.index('engage'), report.index('paladin'))
+        self.assertLess(report.index('paladin'), report.index('new'))
+
+    def test_get_report_no_commands(self):
+        script = CommandScript([], clock=self.clock)
+        self.assertRaises(EOFError, script)
+        script.finish()
+
+        self.assertEqual(script.get_report(), 'Ran 0/0 commands in 0.000s')
+
+
+class BatchTests(unittest.TestCase):
+    def setUp(self):
+        sys.stdout = StringIO()
+        sys.stderr = StringIO()
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+        sys.stderr = sys.__stderr__
+
+    def test_get_percentile(self):
+        values = list(range(1, 21))
+        self.assertEqual(get_percentile(values, 50), 10)
+        self.assertEqual(get_percentile(values, 95), 19)
+        self.assertEqual(get_percentile(values, 100), 20)
+        self.assertEqual(get_percentile([5], 95), 5)
+
+    def test_skipped_sleeps(self):
+        """ Both time.sleep and the sleep imported in a module should be skipped, and restored afterwards """
+        original_sleep = time.sleep
+        with skipped_sleeps():
+            start = time.perf_counter()
+            time.sleep(5)
+            combat.sleep(5)
+            self.assertLess(time.perf_counter() - start, 1)
+
+        self.assertIs(time.sleep, original_sleep)
+        self.assertIs(combat.sleep, original_sleep)
+
+    def test_run_script(self):
+        """ The game should read its commands from the script until it runs out, and the report should be printed """
+        original_input = builtins.input
+        read_commands = []
+
+        def run_game():
+            while True:
+                read_commands.append(input('>'))
+                time.sleep(5)
+
+        run_script(CommandScript(['new', 'paladin', 'Netherblood']), run_game)
+
+        self.assertEqual(read_commands, ['new', 'paladin', 'Netherblood'])
+        self.assertIn('Ran 3/3 commands', sys.stderr.getvalue())
+        self.assertIs(builtins.input, original_input)
+
+    def test_run_script_game_quits(self):
+        """ The report should be printed even if the game quits before the script runs out """
+        def run_game():
+            input()
+            raise SystemExit
+
+        with self.assertRaises(SystemExit):
+            run_script(CommandScript(['revive', 'quit']), run_game)
+
+        self.assertIn('Ran 1/2 commands', sys.stderr.getvalue())
+
+
+class ScratchDatabaseTests(unittest.TestCase):
+    def get_gold(self) -> int:
+        gold, = session.execute("SELECT gold FROM saved_character WHERE name = 'Netherblood'").fetchone()
+        return gold
+
+    def test_scratch_database(self):
+        """ What is saved in the context should be seen in it, but should not reach the database itself """
+        original_bind, original_gold = session.bind, self.get_gold()
+
+        with scratch_database(session, TEST_DB_PATH):
+            session.execute("UPDATE saved_character SET gold = gold + 100 WHERE name = 'Netherblood'")
+            session.commit()
+            self.assertEqual(self.get_gold(), original_gold + 100)
+
+        self.assertIs(session.bind, original_bind)
+        self.assertEqual(self.get_gold(), original_gold)
+
+    def test_script_run_leaves_database_unchanged(self):
+        """ Running the game from a script which creates and saves a character should not touch the database """
+        with open(DB_PATH, 'rb') as db_file:
+            original_db_hash = hashlib.sha256(db_file.read()).hexdigest()
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as script_file:
+            script_file.write('new\npaladin\nScripted\nsave\npam\n')
+        try:
+            result = subprocess.run([sys.executable, 'main.py', '--script', script_file.name, '--seed', '1'],
+                                    cwd=PROJECT_PATH, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    universal_newlines=True, timeout=120)
+        finally:
+            os.remove(script_file.name)
+
+        with open(DB_PATH, 'rb') as db_file:
+            self.assertEqual(hashlib.sha256(db_file.read()).hexdigest(), original_db_hash)
+        self.assertIn('Character Scripted was saved successfully!', result.stdout)
+        self.assertIn('Ran 5/5 commands', result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
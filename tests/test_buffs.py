@@ -196,5 +196,92 @@ class DoTTests(unittest.TestCase):
 
 
 
+class StatusEffectSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = StatusEffectScheduler()
+        self.buff = BeneficialBuff(name='Heart of a Lion', buff_stats_and_amounts=[(KEY_ARMOR_ATTRIBUTE, 10)],
+                                   duration=3)
+        self.dot = DoT(name='Fire', damage_tick=Damage(magic_dmg=2), duration=2, caster_lvl=1)
+
+    def test_mapping(self):
+        """ The scheduler should behave like a dictionary of Key: effect, Value: turns left """
+        self.assertEqual(self.scheduler, {})
+        self.scheduler[self.buff] = 3
+        self.scheduler[self.dot] = 2
+
+        self.assertEqual(self.scheduler, {self.buff: 3, self.dot: 2})
+        self.assertEqual(len(self.scheduler), 2)
+        self.assertIn(self.dot, self.scheduler)
+
+        del self.scheduler[self.dot]
+        self.assertEqual(self.scheduler, {self.buff: 3})
+        self.assertRaises(KeyError, self.scheduler.__getitem__, self.dot)
+
+    def test_ticks_are_separate(self):
+        """ DoTs and buffs tick separately, as DoTs tick at the start of a turn and buffs at the end """
+        self.scheduler[self.buff] = 3
+        self.scheduler[self.dot] = 2
+
+        self.assertEqual(self.scheduler.tick_dots(), [])
+        self.assertEqual(self.scheduler, {self.buff: 3, self.dot: 1})
+        self.assertEqual(self.scheduler.tick_buffs(), [])
+        self.assertEqual(self.scheduler, {self.buff: 2, self.dot: 1})
+        self.assertEqual(self.scheduler.active_dots(), [self.dot])
+
+    def test_tick_returns_expired(self):
+        self.scheduler[self.dot] = 2
+        self.assertEqual(self.scheduler.tick_dots(), [])
+        self.assertEqual(self.scheduler.tick_dots(), [self.dot])
+        # the expired effects are not removed by the scheduler itself
+        self.assertIn(self.dot, self.scheduler)
+
+    def test_rescheduled_effect_does_not_expire_early(self):
+        self.scheduler[self.buff] = 1
+        self.scheduler[self.buff] = 3  # refreshed duration
+        self.assertEqual(self.scheduler.tick_buffs(), [])
+        self.assertEqual(self.scheduler.tick_buffs(), [])
+        self.assertEqual(self.scheduler.tick_buffs(), [self.buff])
+
+    def test_rescheduled_on_same_turn_expires_once(self):
+        """ An effect scheduled twice for the same expiry turn should still be returned a single time """
+        self.scheduler[self.buff] = 2
+        self.scheduler[self.buff] = 2
+        self.assertEqual(self.scheduler.tick_buffs(), [])
+        self.assertEqual(self.scheduler.tick_buffs(), [self.buff])
+        self.assertEqual(self.scheduler.tick_buffs(), [])
+
+    def test_removed_effect_does_not_expire(self):
+        self.scheduler[self.buff] = 1
+        del self.scheduler[self.buff]
+        self.assertEqual(self.scheduler.tick_buffs(), [])
+
+    def test_many_stacked_effects(self):
+        """ Hundreds of effects should each expire exactly on their turn """
+        dots = [DoT(name=f'Dot {i}', damage_tick=Damage(1), duration=i % 50 + 1, caster_lvl=1) for i in range(500)]
+        for dot in dots:
+            self.scheduler[dot] = dot.duration
+
+        for turn in range(1, 51):
+            expired_dots = self.scheduler.tick_dots()
+            self.assertCountEqual(expired_dots, [dot for dot in dots if dot.duration == turn])
+            for dot in expired_dots:
+                del self.scheduler[dot]
+            self.assertEqual(len(self.scheduler), len([dot for dot in dots if dot.duration > turn]))
+
+    def test_clear(self):
+        self.scheduler[self.buff] = 3
+        self.scheduler[self.dot] = 2
+        self.scheduler.tick_dots()
+
+        self.scheduler.clear()
+
+        self.assertEqual(self.scheduler, {})
+        self.assertEqual(self.scheduler.tick_dots(), [])
+        self.assertEqual(self.scheduler.tick_dots(), [])
+        # it should be usable afterwards
+        self.scheduler[self.dot] = 1
+        self.assertEqual(self.scheduler.tick_dots(), [self.dot])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,14 +1,19 @@
 import unittest
 import sys
 import inspect
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from io import StringIO
 from math import ceil
 
-from damage import Damage
 from classes import Paladin
-from spells import PaladinSpell
-from models.spells.loader import load_paladin_spells_for_level
+from entities import Monster
+from spells import PaladinSpell, Spellbook
+from utils.helper import get_attributes
+
+
+def get_paladin_spells_for_level(level: int) -> [PaladinSpell]:
+    """ The spells which a paladin learns at the level, as held by the paladin spellbook """
+    return Spellbook.get_spellbook('paladin').get_spells_for_level_range(level, level)
 
 
 class PaladinTests(unittest.TestCase):
@@ -19,7 +24,7 @@ class PaladinTests(unittest.TestCase):
 
     def test_init(self):
         """ The __init__ should load/save all the spells for the Paladin"""
-        spells = [spell for level in range(1,self.level+1) for spell in load_paladin_spells_for_level(level)]
+        spells = [spell for level in range(1,self.level+1) for spell in get_paladin_spells_for_level(level)]
 
         self.assertNotEqual(len(self.dummy.learned_spells), 0)
         for spell in spells:
@@ -30,6 +35,30 @@ class PaladinTests(unittest.TestCase):
 
             self.assertEqual(char_spell.rank, max_rank)
 
+    def test_learned_spells_are_not_shared(self):
+        """ Every Paladin should hold his own spells, learning a spell on one should not affect another"""
+        other_paladin = Paladin(name="Visionary")
+        spell = PaladinSpell(name="Too_Alive", rank=5)
+        self.assertIsNot(self.dummy.learned_spells, other_paladin.learned_spells)
+
+        try:
+            sys.stdout = StringIO()
+            self.dummy.learn_new_spell(spell)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertIn(spell.name, self.dummy.learned_spells)
+        self.assertNotIn(spell.name, other_paladin.learned_spells)
+
+    def test_seal_of_righteousness_is_not_shared(self):
+        """ Activating the Seal of Righteousness on one Paladin should not activate it on another"""
+        other_paladin = Paladin(name="Visionary")
+        self.dummy.SOR_ACTIVE = True
+        self.dummy.SOR_TURNS = 3
+
+        self.assertFalse(other_paladin.SOR_ACTIVE)
+        self.assertEqual(other_paladin.SOR_TURNS, 0)
+
     def test_leave_combat(self):
         """
         Except the normal behaviour, leave_combat should remove the SOR buff from the pally
@@ -38,7 +67,7 @@ class PaladinTests(unittest.TestCase):
         self.dummy._in_combat = True
         self.dummy.SOR_ACTIVE = True
         for spell in self.dummy.learned_spells.values():
-            spell._cooldown_counter = 100
+            self.dummy.spell_cooldowns.start_cooldown(spell)
 
         self.assertTrue(self.dummy.is_in_combat())
 
@@ -47,25 +76,27 @@ class PaladinTests(unittest.TestCase):
         self.assertFalse(self.dummy.is_in_combat())
         self.assertFalse(self.dummy.SOR_ACTIVE)
         # All cooldowns should be reset
-        self.assertTrue(all([spell._cooldown_counter == 0 for spell in self.dummy.learned_spells.values()]))
+        self.assertTrue(all([self.dummy.spell_cooldowns.is_ready(spell_name)
+                             for spell_name in self.dummy.learned_spells]))
 
     def test_reset_spell_cooldowns(self):
-        """ The reset_spell_cooldowns goes through every spell and resets its CD"""
+        """ The reset_spell_cooldowns resets the CD of every spell"""
         for spell in self.dummy.learned_spells.values():
-            spell._cooldown_counter = 100
-        self.assertTrue(all([spell._cooldown_counter != 0 for spell in self.dummy.learned_spells.values()]))
+            self.dummy.spell_cooldowns.start_cooldown(spell)
+        self.assertFalse(any([self.dummy.spell_cooldowns.is_ready(spell_name)
+                              for spell_name in self.dummy.learned_spells]))
 
         self.dummy.reset_spell_cooldowns()
 
-        self.assertTrue(all([spell._cooldown_counter == 0 for spell in self.dummy.learned_spells.values()]))
+        self.assertTrue(all([self.dummy.spell_cooldowns.is_ready(spell_name)
+                             for spell_name in self.dummy.learned_spells]))
+        self.assertEqual(self.dummy.spell_cooldowns.get_cooldowns(), {})
 
     def test_level_up(self):
         """ Except the normal behaviour, it should learn new spells for the character """
-        # empty the learned spells, it's stored as a static variable, which is not good practice but doesn't hurt in the game
-        Paladin.learned_spells = {}
         pl = Paladin(name="fuck a nine to five")
 
-        spells_to_learn = [spell.name for spell in load_paladin_spells_for_level(pl.level + 1)]
+        spells_to_learn = [spell.name for spell in get_paladin_spells_for_level(pl.level + 1)]
         for spell in spells_to_learn:
             self.assertNotIn(spell, pl.learned_spells)
         pl._level_up()
@@ -74,12 +105,10 @@ class PaladinTests(unittest.TestCase):
 
     def test_level_up_to_level(self):
         """ Except the normal behaviour, it should learn new spells for the character """
-        # empty the learned spells, it's stored as a static variable, which is not good practice but doesn't hurt in the game
-        Paladin.learned_spells = {}
         pl = Paladin(name="fuck a nine to five")
         to_level = 4
 
-        spells_to_learn = [spell for level in range(2, to_level + 1) for spell in load_paladin_spells_for_level(level)]
+        spells_to_learn = [spell for level in range(2, to_level + 1) for spell in get_paladin_spells_for_level(level)]
         for spell in spells_to_learn:
             has_not_learned_spell = spell.name not in pl.learned_spells
             has_smaller_rank = spell.rank > pl.learned_spells[spell.name].rank if not has_not_learned_spell else False
@@ -88,13 +117,35 @@ class PaladinTests(unittest.TestCase):
         for spell in spells_to_learn:
             self.assertIn(spell.name, pl.learned_spells)
 
+    def test_level_up_does_not_query_spells(self):
+        """ The spells should be learned from the cached spellbook, without touching the DB """
+        pl = Paladin(name="fuck a nine to five")
+        with patch('models.spells.loader.session') as session_mock:
+            pl._level_up(to_level=4)
+
+        session_mock.query.assert_not_called()
+        self.assertIn(Paladin.KEY_MELTING_STRIKE, pl.learned_spells)
+        self.assertEqual(pl.spell_commands, {'sor', 'fol', 'ms'})
+
+    def test_spell_cooldowns_are_not_shared(self):
+        """ Every paladin should track the cooldowns of the spellbook's spells by himself """
+        first_pl, second_pl = Paladin(name='First', level=3), Paladin(name='Second', level=3)
+        with patch('builtins.print'):
+            first_pl.spell_melting_strike(first_pl.learned_spells[Paladin.KEY_MELTING_STRIKE],
+                                          target=Monster(monster_id=1, name='Wolf', health=100, mana=0, level=3,
+                                                         min_damage=1, max_damage=2))
+
+        self.assertFalse(first_pl.spell_cooldowns.is_ready(Paladin.KEY_MELTING_STRIKE))
+        self.assertTrue(second_pl.spell_cooldowns.is_ready(Paladin.KEY_MELTING_STRIKE))
+        self.assertIs(first_pl.learned_spells[Paladin.KEY_MELTING_STRIKE],
+                      second_pl.learned_spells[Paladin.KEY_MELTING_STRIKE])
+
     def test_lookup_and_handle_new_spells(self):
         """ Should look up the available spells for our level and learn them or update our existing ones"""
-        Paladin.learned_spells = {}
         pl = Paladin(name="fuck a nine to five")
         print(pl.learned_spells)
         pl.level = 3
-        spells_to_learn = [spell for spell in load_paladin_spells_for_level(pl.level)]
+        spells_to_learn = [spell for spell in get_paladin_spells_for_level(pl.level)]
         for spell in spells_to_learn:
             has_not_learned_spell = spell.name not in pl.learned_spells
             has_smaller_rank = spell.rank > pl.learned_spells[spell.name].rank if not has_not_learned_spell else False
@@ -125,12 +176,12 @@ class PaladinTests(unittest.TestCase):
     def test_lookup_available_spells_to_learn(self):
         """ It's a generator function returning a spell that can be learnt for the level """
         lev = 3
-        expected_spells = load_paladin_spells_for_level(lev)
+        expected_spells = get_paladin_spells_for_level(lev)
         generator = self.dummy._lookup_available_spells_to_learn(lev)
 
         self.assertTrue(inspect.isgenerator(generator))
         for spell in expected_spells:
-            self.assertEqual(vars(next(generator)), vars(spell))
+            self.assertEqual(get_attributes(next(generator)), get_attributes(spell))
 
     def test_update_spell(self):
         """ The update_spell() function updates a spell we already have learned"""
@@ -200,7 +251,7 @@ class PaladinTests(unittest.TestCase):
         ms_success_msg = 'MS_CASTED'
         ms_command_name = 'ms'
         # Mock the function that should get called
-        self.dummy.spell_melting_strike = lambda target=None, spell=None: ms_success_msg
+        self.dummy.spell_melting_strike = lambda target=None, spell=None, splash_targets=(): ms_success_msg
 
         try:
             output = StringIO()
@@ -359,24 +410,53 @@ class PaladinTests(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(expected_mana, self.dummy.mana)
 
-    def test_get_auto_attack_damage(self):
-        """ Applies damage reduction in regard to level and adds the sor_damage
-            It attaches the sor_damage to the magic_dmg in the Damage class and
-            returns the sor_dmg explicitly for easy printing"""
+    def test_spell_melting_strike_copies_dot(self):
+        """ The DoT added to the target should be a copy, as the spell's DoT is shared between every paladin """
+        ms: PaladinSpell = self.dummy.learned_spells[Paladin.KEY_MELTING_STRIKE]
+        added_buffs = []
+        target = Mock(take_attack=lambda x, y: None, add_buff=added_buffs.append)
+
+        try:
+            sys.stdout = StringIO()
+            self.dummy.spell_melting_strike(ms, target)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(added_buffs, [ms.harmful_effect])
+        self.assertIsNot(added_buffs[0], ms.harmful_effect)
+        self.assertEqual(added_buffs[0].level, self.dummy.level)
+
+    def test_spell_melting_strike_splash_targets(self):
+        """ When fighting a group, every engaged monster should be damaged and get the DoT, for a single mana cost """
+        ms: PaladinSpell = self.dummy.learned_spells[Paladin.KEY_MELTING_STRIKE]
+        expected_mana = self.dummy.mana - ms.mana_cost
+        targets = [Monster(monster_id=idx, name=f'Monster {idx}', health=100, level=self.dummy.level) for idx in range(3)]
+
+        try:
+            sys.stdout = StringIO()
+            result = self.dummy.spell_melting_strike(ms, targets[0], splash_targets=targets[1:])
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertTrue(result)
+        self.assertEqual(self.dummy.mana, expected_mana)
+        for target in targets:
+            self.assertLess(target.health, 100)
+            self.assertIn(ms.harmful_effect, target.buffs)
+
+    def test_roll_auto_attack_damage(self):
+        """ Applies damage reduction in regard to level and returns the sor_damage
+            alongside the physical damage, as the magical damage of the hit"""
         sor: PaladinSpell = self.dummy.learned_spells[Paladin.KEY_SEAL_OF_RIGHTEOUSNESS]
         self.dummy.spell_seal_of_righteousness(sor)
 
-        received_dmg, sor_dmg = self.dummy.get_auto_attack_damage(self.dummy.level)
+        phys_dmg, sor_dmg = self.dummy._roll_auto_attack_damage(self.dummy.level)
 
-        self.assertTrue(isinstance(received_dmg, Damage))
-        self.assertTrue(self.dummy.min_damage <= received_dmg.phys_dmg <= self.dummy.max_damage)
-        self.assertEqual(received_dmg.magic_dmg, sor.damage1)
+        self.assertTrue(self.dummy.min_damage <= phys_dmg <= self.dummy.max_damage)
         self.assertEqual(sor_dmg, sor.damage1)
 
-    def test_get_auto_attack_damage_higher_level(self):
-        """ Applies damage reduction in regard to level and adds the sor_damage
-            It attaches the sor_damage to the magic_dmg in the Damage class and
-            returns the sor_dmg explicitly for easy printing"""
+    def test_roll_auto_attack_damage_higher_level(self):
+        """ Applies damage reduction in regard to level to both the physical damage and the sor_damage """
         sor: PaladinSpell = self.dummy.learned_spells[Paladin.KEY_SEAL_OF_RIGHTEOUSNESS]
         level_diff = 2
         prc_mod = (level_diff * 0.1)
@@ -386,18 +466,16 @@ class PaladinTests(unittest.TestCase):
         expected_max_dmg = int(self.dummy.max_damage) - (self.dummy.max_damage * prc_mod)
         self.dummy.spell_seal_of_righteousness(sor)
 
-        received_dmg, sor_dmg = self.dummy.get_auto_attack_damage(level)
-        self.assertTrue(isinstance(received_dmg, Damage))
+        phys_dmg, sor_dmg = self.dummy._roll_auto_attack_damage(level)
 
-        self.assertTrue(expected_min_dmg <= received_dmg.phys_dmg <= expected_max_dmg)
-        self.assertEqual(received_dmg.magic_dmg, expected_sor_dg)
+        self.assertTrue(expected_min_dmg <= phys_dmg <= expected_max_dmg)
         self.assertEqual(sor_dmg, expected_sor_dg)
 
     def test_attack(self):
         expected_message2 = 'Took Attack!'
-        expected_message3 = 'Get_take_attack_damage_repr called!'
-        victim = Mock(level=self.dummy.level, take_attack=lambda x, y: print(expected_message2),
-                      get_take_attack_damage_repr=lambda x,y: print(expected_message3))
+        expected_message3 = 'Resolve_hit called!'
+        victim = Mock(level=self.dummy.level, apply_hit=lambda hit: print(expected_message2),
+                      resolve_hit=lambda phys_dmg, magic_dmg, level: print(expected_message3))
         expected_message = f'{self.dummy.name} attacks {victim.name}'
 
         try:
@@ -0,0 +1,157 @@
+"""
+Test the group combat and the pooled loot in combat.py
+"""
+import sys
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+import models.main
+from classes import Paladin
+from combat import LootPool, engage_combat, engage_group_combat, handle_monster_deaths
+from encounter import Encounter
+from entities import Monster
+from items import Item
+
+
+class LootPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.first_monster = Monster(monster_id=1, name='Wolf', gold_to_give_range=(3, 3))
+        self.second_monster = Monster(monster_id=2, name='Wolf', gold_to_give_range=(4, 4))
+        self.fur = Item(name='Wolf Fur', item_id=1, buy_price=1, sell_price=1)
+        self.other_fur = Item(name='Wolf Fur', item_id=1, buy_price=1, sell_price=1)
+        self.fang = Item(name='Wolf Fang', item_id=2, buy_price=1, sell_price=1)
+        self.first_monster.loot.update({'Wolf Fur': self.fur, 'Wolf Fang': self.fang})
+        self.second_monster.loot.update({'Wolf Fur': self.other_fur})
+        self.loot_pool = LootPool([self.first_monster, self.second_monster])
+
+    def test_loot(self):
+        self.assertEqual(self.loot_pool.loot, {'gold': 7, 'Wolf Fur': self.fur, 'Wolf Fang': self.fang})
+
+    def test_give_loot_gold(self):
+        self.assertEqual(self.loot_pool.give_loot('gold'), 7)
+        self.assertNotIn('gold', self.loot_pool.loot)
+        self.assertFalse(self.loot_pool.give_loot('gold'))
+
+    def test_give_loot_item_of_every_monster(self):
+        """ Items of the same name should be given out one after the other, from every monster """
+        self.assertIs(self.loot_pool.give_loot('Wolf Fur'), self.fur)
+        self.assertIs(self.loot_pool.give_loot('Wolf Fur'), self.other_fur)
+
+        self.assertEqual(self.loot_pool.loot, {'gold': 7, 'Wolf Fang': self.fang})
+
+    def test_give_loot_not_dropped(self):
+        try:
+            output = StringIO()
+            sys.stdout = output
+            self.assertFalse(self.loot_pool.give_loot('Wolf Tail'))
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertIn('The monsters did not drop Wolf Tail.', output.getvalue())
+
+
+class GroupCombatTests(unittest.TestCase):
+    def setUp(self):
+        sys.stdout = StringIO()
+        self.character = Paladin(name='Netherblood', level=3, health=100, mana=100, strength=10)
+        self.monsters = {guid: Monster(monster_id=1, name='Kobold', health=1, level=1, min_damage=1, max_damage=1,
+                                       xp_to_give=10, gold_to_give_range=(2, 2))
+                         for guid in range(1, 4)}
+        self.alive_monsters = dict(self.monsters)
+        self.guid_name_set = {(guid, monster.name) for guid, monster in self.monsters.items()}
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def test_handle_monster_deaths(self):
+        slain_monsters = {1: self.monsters[1], 3: self.monsters[3]}
+
+        with patch.object(self.character, 'award_monster_kills') as award_monster_kills:
+            handle_monster_deaths(self.character, slain_monsters, self.alive_monsters, self.guid_name_set)
+
+        award_monster_kills.assert_called_once_with([(1, self.monsters[1]), (3, self.monsters[3])])
+        self.assertEqual(list(self.alive_monsters), [2])
+        self.assertEqual(self.guid_name_set, {(2, 'Kobold')})
+
+    def test_engage_group_combat(self):
+        """ The character should kill the monsters one after the other and loot all of them through one window """
+        orig_gold = self.character.inventory.gold
+        commands = iter(['attack', 'attack', 'attack', 'take all'])
+
+        with patch('builtins.input', lambda *_: next(commands)):
+            engage_group_combat(self.character, self.monsters, self.alive_monsters, self.guid_name_set)
+
+        self.assertFalse(any(monster.is_alive() for monster in self.monsters.values()))
+        self.assertEqual(self.alive_monsters, {})
+        self.assertEqual(self.guid_name_set, set())
+        self.assertFalse(self.character.is_in_combat())
+        self.assertEqual(self.character.inventory.gold, orig_gold + 6)
+        self.assertEqual(self.character.experience, 30)
+
+    def test_engage_group_combat_melting_strike_hits_every_monster(self):
+        commands = iter(['ms', 'take all'])
+
+        with patch('builtins.input', lambda *_: next(commands)):
+            engage_group_combat(self.character, self.monsters, self.alive_monsters, self.guid_name_set)
+
+        self.assertEqual(self.alive_monsters, {})
+        self.assertIn('XP awarded: 30 for 3 kills!', sys.stdout.getvalue())
+
+
+
+class CombatTests(unittest.TestCase):
+    def setUp(self):
+        self.output = StringIO()
+        sys.stdout = self.output
+        self.character = Paladin(name='Netherblood', level=3, health=100, mana=100, strength=10)
+        self.monster = Monster(monster_id=1, name='Kobold', health=1, level=1, min_damage=1, max_damage=1,
+                               xp_to_give=10, gold_to_give_range=(2, 2))
+        self.alive_monsters = {1: self.monster}
+        self.guid_name_set = {(1, 'Kobold')}
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def engage(self, commands: [str], initiatives: {str: int}):
+        """ Engage the monster with the given commands as the player's input and the given initiatives by name """
+        commands = iter(commands)
+        with patch('builtins.input', lambda *_: next(commands)), \
+                patch.object(Encounter, 'roll_initiative', lambda _, living_thing: initiatives[living_thing.name]):
+            engage_combat(self.character, self.monster, self.alive_monsters, self.guid_name_set, 1)
+
+    def test_engage_combat_character_first(self):
+        """ A character with a higher initiative should kill the monster before it gets to swing """
+        orig_health = self.character.health
+        self.engage(['attack', 'take all'], initiatives={'Netherblood': 2, 'Kobold': 1})
+
+        self.assertFalse(self.monster.is_alive())
+        self.assertEqual(self.alive_monsters, {})
+        self.assertEqual(self.guid_name_set, set())
+        self.assertFalse(self.character.is_in_combat())
+        self.assertNotIn('Kobold attacks', self.output.getvalue())
+        self.assertEqual(self.character.health, orig_health)
+        self.assertEqual(self.character.experience, 10)
+
+    def test_engage_combat_monster_first(self):
+        self.engage(['print xp', 'attack', 'take all'], initiatives={'Netherblood': 1, 'Kobold': 2})
+
+        self.assertFalse(self.monster.is_alive())
+        self.assertEqual(self.output.getvalue().count('Kobold attacks'), 1)
+
+    def test_engage_combat_character_dies(self):
+        """ The player should be asked to revive his character, the monster should be left alive """
+        self.monster.health = self.monster.max_health = 1000
+        self.monster.min_damage = self.monster.max_damage = 1000
+
+        self.engage(['Y'], initiatives={'Netherblood': 1, 'Kobold': 2})
+
+        self.assertIn('Kobold has slain character Netherblood', self.output.getvalue())
+        self.assertTrue(self.character.is_alive())
+        self.assertTrue(self.monster.is_alive())
+        self.assertFalse(self.monster.is_in_combat())
+        self.assertEqual(self.alive_monsters, {1: self.monster})
+
+
+if __name__ == '__main__':
+    unittest.main()
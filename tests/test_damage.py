@@ -1,5 +1,5 @@
 import unittest
-from damage import Damage
+from damage import Damage, HitResult, resolve_hit
 
 
 class DamageTests(unittest.TestCase):
@@ -15,6 +15,13 @@ class DamageTests(unittest.TestCase):
         self.assertEqual(dmg.phys_absorbed, expected_absorbed)
         self.assertEqual(dmg.magic_absorbed, expected_absorbed)
 
+    def test_slots(self):
+        """ Damage is created on every attack, it should not hold a __dict__ """
+        dmg = Damage(1, 1)
+        self.assertFalse(hasattr(dmg, '__dict__'))
+        with self.assertRaises(AttributeError):
+            dmg.true_dmg = 1
+
     def test_eq(self):
         """ Two Damage classes should be equal if their magic/phys dmg and absorbed are equal"""
         dmg_1 = Damage(1, 1)
@@ -211,5 +218,30 @@ class DamageTests(unittest.TestCase):
         self.assertEqual(dmg, expected_dmg)
         self.assertEqual(left_shield, expected_shield)
 
+
+class ResolveHitTests(unittest.TestCase):
+    def test_resolve_hit_matches_damage_pipeline(self):
+        """ resolve_hit should give the same result as armor reduction and Damage.handle_absorption """
+        armor, attacker_level = 50, 3
+        for phys_dmg, magic_dmg, absorption_shield in [(10.34, 6.21, 5), (10, 6, 7), (3, 0, 100), (7, 2, 0), (0, 4, 1)]:
+            reduction_percentage = armor / (armor + 400 + 85 * attacker_level)
+            damage = Damage(phys_dmg=phys_dmg, magic_dmg=magic_dmg)
+            expected_dmg = Damage(phys_dmg=damage.phys_dmg - damage.phys_dmg * reduction_percentage,
+                                  magic_dmg=damage.magic_dmg)
+            expected_shield = expected_dmg.handle_absorption(absorption_shield) if absorption_shield else 0
+
+            hit = resolve_hit(phys_dmg, magic_dmg, armor, attacker_level, absorption_shield)
+
+            self.assertEqual(hit.to_damage(), expected_dmg)
+            self.assertEqual(hit.absorption_shield, expected_shield)
+            self.assertEqual(str(hit), str(expected_dmg))
+
+    def test_resolve_hit_total(self):
+        hit = resolve_hit(phys_dmg=10, magic_dmg=6, armor=0, attacker_level=1, absorption_shield=7)
+
+        self.assertEqual(hit, HitResult(phys_dmg=9, magic_dmg=0, phys_absorbed=1, magic_absorbed=6,
+                                        absorption_shield=0))
+        self.assertEqual(hit.total, 9)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+"""
+Test the initiative ordered turn engine in encounter.py
+"""
+import random
+import sys
+import unittest
+from io import StringIO
+
+import models.main
+from classes import Paladin
+from encounter import Encounter, CommandController, attack_target_controller
+from entities import Monster
+from buffs import DoT
+from damage import Damage
+
+
+class EncounterTests(unittest.TestCase):
+    def setUp(self):
+        self.encounter = Encounter(rng=random.Random(0))
+        self.turns = []  # the names of the participants, in the order they have taken their turns
+        sys.stdout = StringIO()
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def create_monster(self, name: str, health: int=10, damage: int=1) -> Monster:
+        return Monster(monster_id=1, name=name, health=health, min_damage=damage, max_damage=damage)
+
+    def record_turn(self, encounter: Encounter, living_thing):
+        self.turns.append(living_thing.name)
+
+    def test_turns_are_taken_in_initiative_order(self):
+        for name, initiative in [('Wolf', 5), ('Kobold', 12), ('Defias', 8), ('Murloc', 8)]:
+            self.encounter.add_participant(self.create_monster(name), 'monsters' if name != 'Kobold' else 'players',
+                                           self.record_turn, initiative=initiative)
+
+        self.encounter.run_round()
+        self.encounter.run_round()
+
+        # equal initiatives keep the order in which the participants have joined
+        self.assertEqual(self.turns, ['Kobold', 'Defias', 'Murloc', 'Wolf'] * 2)
+
+    def test_roll_initiative(self):
+        """ The roll should add up the level and agility to a d20 roll """
+        paladin = Paladin(name='Netherblood', level=3)
+        roll = Encounter(rng=random.Random(1)).roll_initiative(paladin)
+
+        self.assertEqual(roll, random.Random(1).randint(1, 20) + 3 + paladin.attributes['agility'])
+
+    def test_dead_participants_are_skipped(self):
+        wolf, kobold = self.create_monster('Wolf'), self.create_monster('Kobold')
+        self.encounter.add_participant(wolf, 'monsters', self.record_turn, initiative=1)
+        self.encounter.add_participant(kobold, 'players', self.record_turn, initiative=2)
+        self.encounter.add_participant(self.create_monster('Defias'), 'monsters', self.record_turn, initiative=3)
+
+        self.encounter.run_round()
+        wolf._die()
+        self.encounter.run_round()
+
+        self.assertEqual(self.turns, ['Defias', 'Kobold', 'Wolf', 'Defias', 'Kobold'])
+        self.assertEqual(self.encounter.slain, [wolf])
+
+    def test_participant_joining_mid_round_acts_next_round(self):
+        def call_for_help(encounter: Encounter, living_thing):
+            self.record_turn(encounter, living_thing)
+            if encounter.round == 1:
+                encounter.add_participant(self.create_monster('Murloc'), 'monsters', self.record_turn, initiative=10)
+
+        self.encounter.add_participant(self.create_monster('Wolf'), 'monsters', call_for_help, initiative=1)
+        self.encounter.add_participant(self.create_monster('Kobold'), 'players', self.record_turn, initiative=2)
+
+        self.encounter.run_round()
+        self.encounter.run_round()
+
+        self.assertEqual(self.turns, ['Kobold', 'Wolf', 'Murloc', 'Kobold', 'Wolf'])
+
+    def test_turn_updates(self):
+        """ A DoT should tick at the start of its target's turn and the one that kills him should skip his action """
+        wolf, kobold = self.create_monster('Wolf', health=5), self.create_monster('Kobold')
+        wolf.add_buff(DoT(name='Melting', damage_tick=Damage(magic_dmg=10), duration=2, caster_lvl=1))
+        self.encounter.add_participant(wolf, 'monsters', self.record_turn, initiative=1)
+        self.encounter.add_participant(kobold, 'players', self.record_turn, initiative=2)
+
+        self.encounter.run_round()
+
+        self.assertFalse(wolf.is_alive())
+        self.assertEqual(self.turns, ['Kobold'])
+        self.assertTrue(self.encounter.is_over())
+
+    def test_get_enemies_and_target(self):
+        wolf, kobold, defias = self.create_monster('Wolf'), self.create_monster('Kobold'), self.create_monster('Defias')
+        self.encounter.add_participant(wolf, 'monsters', self.record_turn)
+        self.encounter.add_participant(kobold, 'players', self.record_turn)
+        self.encounter.add_participant(defias, 'players', self.record_turn)
+        kobold._die()
+
+        self.assertEqual(self.encounter.get_enemies(wolf), [defias])
+        self.assertIs(self.encounter.get_target(wolf), defias)
+        self.assertEqual(self.encounter.get_enemies(defias), [wolf])
+        with self.assertRaises(ValueError):
+            self.encounter.get_target(self.create_monster('Murloc'))
+
+    def test_run_party_against_monsters(self):
+        """ A party of paladins controlled by a script and an AI should beat a group of weak monsters """
+        first_paladin = Paladin(name='Netherblood', level=3, health=100)
+        second_paladin = Paladin(name='Visionary', level=3, health=100)
+        monsters = [self.create_monster(f'Wolf {idx}', health=5) for idx in range(3)]
+        self.encounter.add_participant(first_paladin, 'party', CommandController(['print stats', 'attack'] * 20))
+        self.encounter.add_participant(second_paladin, 'party', attack_target_controller)
+        for monster in monsters:
+            self.encounter.add_participant(monster, 'monsters', attack_target_controller)
+
+        winner = self.encounter.run()
+
+        self.assertEqual(winner, 'party')
+        self.assertCountEqual(self.encounter.slain, monsters)
+        self.assertFalse(first_paladin.is_in_combat())
+
+    def test_run_max_rounds(self):
+        self.encounter.add_participant(self.create_monster('Wolf', health=1000), 'monsters', attack_target_controller)
+        self.encounter.add_participant(self.create_monster('Kobold', health=1000), 'players', attack_target_controller)
+
+        self.assertIsNone(self.encounter.run(max_rounds=3))
+        self.assertEqual(self.encounter.round, 3)
+
+
+class CommandControllerTests(unittest.TestCase):
+    def setUp(self):
+        sys.stdout = StringIO()
+        self.paladin = Paladin(name='Netherblood', level=3, health=100, mana=100)
+        self.wolf = Monster(monster_id=1, name='Wolf', health=100)
+        self.encounter = Encounter()
+        self.encounter.add_participant(self.paladin, 'party', None)
+        self.encounter.add_participant(self.wolf, 'monsters', None)
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def test_spell_and_non_ending_commands_are_followed_by_another(self):
+        """ Printing and a spell that could not be cast should not end the turn """
+        self.paladin.mana = 0
+        controller = CommandController(['print xp', 'ms', 'attack', 'attack'])
+
+        controller(self.encounter, self.paladin)
+
+        self.assertLess(self.wolf.health, 100)
+        self.assertEqual(controller.read_command(), 'attack')  # one attack is left for the next turn
+
+    def test_spell(self):
+        controller = CommandController(['sor'])
+        controller(self.encounter, self.paladin)
+
+        self.assertTrue(self.paladin.SOR_ACTIVE)
+
+
+if __name__ == '__main__':
+    unittest.main()
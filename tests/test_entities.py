@@ -9,12 +9,14 @@ from exceptions import NonExistantBuffError, ItemNotInInventoryError
 
 from constants import (
     KEY_ARMOR_ATTRIBUTE, CHARACTER_DEFAULT_EQUIPMENT, CHARACTER_LEVELUP_BONUS_STATS, CHAR_STARTER_SUBZONE,
-    CHAR_STARTER_ZONE, MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD, CHARACTER_LEVELUP_BONUS_STATS, CHARACTER_LEVEL_XP_REQUIREMENTS)
-from entities import LivingThing, FriendlyNPC, VendorNPC, Monster, Character
-from damage import Damage
-from quest import Quest, FetchQuest, KillQuest
+    CHAR_STARTER_ZONE, MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD, CHARACTER_LEVELUP_BONUS_STATS, CHARACTER_LEVEL_XP_REQUIREMENTS,
+    KEY_STAT_LAYER_BASE, KEY_STAT_LAYER_LEVEL, KEY_STAT_LAYER_GEAR, KEY_STAT_LAYER_BUFFS)
+from entities import LivingThing, FriendlyNPC, VendorNPC, Monster, MonsterPool, Character, CreatureTemplate
+from damage import Damage, HitResult
+from quest import Quest, FetchQuest, KillQuest, QuestLog
 from utils.helper import create_attributes_dict
 from items import Item, Equipment, Weapon, Potion
+from inventory import Inventory
 from buffs import BeneficialBuff, DoT
 
 
@@ -117,6 +119,16 @@ class LivingThingTests(unittest.TestCase):
         self.assertEqual(self.dummy.max_health, self.health + self.dummy_buff.buff_amounts['health'])
         self.assertEqual(self.dummy.health, self.health + self.dummy_buff.buff_amounts['health'])
 
+    def test_buffs_created_on_first_buff(self):
+        """ The status effect scheduler should not be created until the entity gets its first buff/DoT """
+        self.dummy.start_turn_update()
+        self.dummy.end_turn_update()
+        self.assertIsNone(self.dummy._buffs)
+
+        self.dummy.add_buff(self.dummy_buff)
+        self.assertIsNotNone(self.dummy._buffs)
+        self.assertEqual(self.dummy.buffs, {self.dummy_buff: self.dummy_buff.duration})
+
     def test_add_multiple_buffs(self):
         """
         If it is the same buff, it should just overwrite itself on the duration
@@ -132,6 +144,32 @@ class LivingThingTests(unittest.TestCase):
         self.assertEqual(self.dummy.max_health, self.health + self.dummy_buff.buff_amounts['health'])
         self.assertEqual(self.dummy.health, self.health + self.dummy_buff.buff_amounts['health'])
 
+    def test_add_active_buff_in_combat(self):
+        """ Refreshing an active buff in combat should only refresh its duration, without touching the health """
+        self.dummy.add_buff(self.dummy_buff)
+        self.dummy.enter_combat()
+        self.dummy.health -= 1
+        self.dummy._update_buffs()
+        self.dummy.add_buff(self.dummy_buff)
+
+        self.assertEqual(self.dummy.buffs[self.dummy_buff], self.dummy_buff.duration)
+        self.assertEqual(self.dummy.health, self.health + self.dummy_buff.buff_amounts['health'] - 1)
+        self.assertEqual(self.dummy.max_health, self.health + self.dummy_buff.buff_amounts['health'])
+
+    def test_add_same_buff_twice_in_a_turn(self):
+        """ Adding an active buff again on the same turn (i.e two potions) should have it expire once """
+        try:
+            sys.stdout = StringIO()
+            self.dummy.add_buff(self.dummy_buff)
+            self.dummy.add_buff(self.dummy_buff)
+            for _ in range(self.dummy_buff.duration):
+                self.dummy.end_turn_update()
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(self.dummy.buffs, {})
+        self.assertEqual(self.dummy.max_health, self.health)
+
     def test_remove_buff(self):
         """
         The remove_buff method should be called whenever a buff has expired from the character.
@@ -316,9 +354,9 @@ class LivingThingTests(unittest.TestCase):
             received_message = e.args[0]
             self.assertEqual(received_message, expected_message)
 
-    def test_apply_armor_reduction(self):
+    def test_resolve_hit_armor_reduction(self):
         """
-        Test the _apply_armor_reduction, which reduces the damage given to it via
+        resolve_hit reduces the damage given to it via
         a formula regarding the attacker's level and the character's armor points
         It only reduces physical damage
         """
@@ -334,10 +372,10 @@ class LivingThingTests(unittest.TestCase):
         expected_phys_dmg, expected_magic_dmg = phys_dmg - (reduction_percentage * phys_dmg), magic_dmg
         expected_damage = Damage(phys_dmg=expected_phys_dmg, magic_dmg=expected_magic_dmg)
 
-        reduced_dmg: Damage = self.dummy._apply_armor_reduction(damage, attacker_level)
-        self.assertEqual(reduced_dmg, expected_damage)
+        hit: HitResult = self.dummy.resolve_hit(phys_dmg, magic_dmg, attacker_level)
+        self.assertEqual(hit.to_damage(), expected_damage)
 
-    def test_apply_armor_reduction_no_phys_dmg(self):
+    def test_resolve_hit_armor_reduction_no_phys_dmg(self):
         attacker_level = self.dummy.level
         armor = 500
         self.dummy.attributes['armor'] = armor
@@ -350,9 +388,9 @@ class LivingThingTests(unittest.TestCase):
         expected_phys_dmg, expected_magic_dmg = phys_dmg - (reduction_percentage * phys_dmg), magic_dmg
         expected_damage = Damage(phys_dmg=expected_phys_dmg, magic_dmg=expected_magic_dmg)
 
-        reduced_dmg: Damage = self.dummy._apply_armor_reduction(damage, attacker_level)
-        self.assertEqual(reduced_dmg.phys_dmg, 0)
-        self.assertEqual(reduced_dmg, expected_damage)
+        hit: HitResult = self.dummy.resolve_hit(phys_dmg, magic_dmg, attacker_level)
+        self.assertEqual(hit.phys_dmg, 0)
+        self.assertEqual(hit.to_damage(), expected_damage)
 
     def test_calculate_level_difference_damage(self):
         """
@@ -393,41 +431,49 @@ class LivingThingTests(unittest.TestCase):
         damage = 100
         self.assertEqual(self.dummy._calculate_level_difference_damage(damage, target_level, inverse=True), damage + (damage * 0.1))
 
-    def test_apply_damage_absorption(self):
+    def test_resolve_hit_damage_absorption(self):
         """
-        The _apply_damage_absorption function subtracts from the received damage according to the
-        absorption shield points the character has.
-        It calls the damage.handle_absorption method of the Damage class, so further tests regarding
-        absorption are in the tests for that class
+        resolve_hit subtracts from the received damage according to the
+        absorption shield points the character has, apply_hit then takes the absorbed damage off the shield.
+        Further tests regarding absorption are in the tests for resolve_hit in test_damage.py
         """
         orig_absorption_shield = 500
         self.dummy.absorption_shield = orig_absorption_shield
+        self.dummy.attributes[KEY_ARMOR_ATTRIBUTE] = 0
+        orig_health = self.dummy.health
         phys_dmg, magic_dmg = 100, 100
-        damage_to_deal = Damage(phys_dmg=100, magic_dmg=100)
         expected_damage = Damage(phys_dmg=0, magic_dmg=0)
         expected_damage.phys_absorbed = phys_dmg
         expected_damage.magic_absorbed = magic_dmg
 
-        reduced_dmg = self.dummy._apply_damage_absorption(damage_to_deal)
-        self.assertEqual(reduced_dmg, expected_damage)
+        hit: HitResult = self.dummy.resolve_hit(phys_dmg, magic_dmg, attacker_level=self.dummy.level)
+        self.assertEqual(hit.to_damage(), expected_damage)
+        self.assertEqual(hit.absorption_shield, orig_absorption_shield-phys_dmg-magic_dmg)
+        # resolving the hit alone, i.e to print it, should not modify the shield
+        self.assertEqual(self.dummy.absorption_shield, orig_absorption_shield)
+
+        self.dummy.apply_hit(hit)
         self.assertEqual(self.dummy.absorption_shield, orig_absorption_shield-phys_dmg-magic_dmg)
+        self.assertEqual(self.dummy.health, orig_health)
 
-    def test_apply_damage_absorption_to_print_set(self):
+    def test_resolve_hit_and_apply_hit(self):
         """
-        The function takes a flag called to_print, which if set to True
-         only returns the resulting Damage object without modifying the LivingThing's absorption shield
+        resolve_hit applies the armor reduction and absorption without modifying the LivingThing,
+        apply_hit then deals the resolved hit
         """
-        orig_absorption_shield = 500
-        self.dummy.absorption_shield = orig_absorption_shield
-        phys_dmg, magic_dmg = 100, 100
-        damage_to_deal = Damage(phys_dmg=100, magic_dmg=100)
-        expected_damage = Damage(phys_dmg=0, magic_dmg=0)
-        expected_damage.phys_absorbed = phys_dmg
-        expected_damage.magic_absorbed = magic_dmg
+        self.dummy.absorption_shield = 5
+        self.dummy.attributes[KEY_ARMOR_ATTRIBUTE] = 0
+        orig_health = self.dummy.health
 
-        reduced_dmg = self.dummy._apply_damage_absorption(damage_to_deal, to_print=True)
-        self.assertEqual(reduced_dmg, expected_damage)
-        self.assertEqual(self.dummy.absorption_shield, orig_absorption_shield)
+        hit = self.dummy.resolve_hit(phys_dmg=10, magic_dmg=6, attacker_level=self.dummy.level)
+        self.assertEqual(hit, HitResult(phys_dmg=10, magic_dmg=1, phys_absorbed=0, magic_absorbed=5,
+                                        absorption_shield=0))
+        self.assertEqual(self.dummy.absorption_shield, 5)
+        self.assertEqual(self.dummy.health, orig_health)
+
+        self.dummy.apply_hit(hit)
+        self.assertEqual(self.dummy.absorption_shield, 0)
+        self.assertEqual(self.dummy.health, orig_health - 11)
 
 
 class FriendlyNpcTests(unittest.TestCase):
@@ -605,6 +651,32 @@ class MonsterTests(unittest.TestCase):
         self.assertEqual(self.dummy.loot_table, self.loot_table)
         self.assertEqual(self.dummy.loot, {'gold': self.dummy._gold_to_give})
 
+    def test_from_template(self):
+        """ Monsters created from the same template should share it, but not their mutable state """
+        monster = Monster.from_template(self.dummy.template)
+        other_monster = Monster.from_template(self.dummy.template)
+        self.assertIs(monster.template, other_monster.template)
+        self.assertEqual(monster.name, self.name)
+        self.assertEqual(monster.max_health, self.health)
+        self.assertEqual(monster.attributes, {'armor': self.armor})
+        self.assertTrue(self.gold_to_give_range[0] <= monster._gold_to_give <= self.gold_to_give_range[1])
+
+        monster.health -= 10
+        monster.loot['item'] = 'item'
+        self.assertEqual(other_monster.health, self.health)
+        self.assertNotIn('item', other_monster.loot)
+
+    def test_set_template_field(self):
+        """ Changing a template value of a monster should not change it for the other monsters sharing it """
+        template = self.dummy.template
+        other_monster = Monster.from_template(template)
+        self.dummy.gossip = 'Changed'
+
+        self.assertEqual(self.dummy.gossip, 'Changed')
+        self.assertEqual(other_monster.gossip, self.gossip)
+        self.assertIs(other_monster.template, template)
+        self.assertTrue(isinstance(self.dummy.template, CreatureTemplate))
+
     def test_str(self):
         """
         The str method should return all sorts of information regarding the creature
@@ -614,21 +686,20 @@ class MonsterTests(unittest.TestCase):
 
         self.assertEqual(str(self.dummy), expected_str)
 
-    def test_get_auto_attack_damage(self):
+    def test_roll_auto_attack_damage(self):
         """
-        The get_auto_attack_damage should return a basic attack damage from the Monster class
+        The _roll_auto_attack_damage should return the physical damage of a basic attack from the Monster class
         it chooses a random integer between the min/max damage and
         """
         target_level = self.dummy.level  # so the level doesn't affect the damage
-        result: Damage = self.dummy.get_auto_attack_damage(target_level)
+        result: float = self.dummy._roll_auto_attack_damage(target_level)
 
-        self.assertTrue(isinstance(result, Damage))
-        self.assertTrue(self.min_damage <= result.phys_dmg <= self.max_damage)
+        self.assertTrue(self.min_damage <= result <= self.max_damage)
 
     def test_attack(self):
         """
         The attack function deals damage to the monster while applying armor reduction and absorption
-        It calls the victim's take_attack function with the damage dealt
+        It resolves the hit through the victim's resolve_hit and deals it with the victim's apply_hit
         """
         output = StringIO()
         # Increase the damage difference so there is a minimal chance to get the same damage twice in a row (for the test)
@@ -637,15 +708,16 @@ class MonsterTests(unittest.TestCase):
         self.dummy.max_damage = self.max_damage
         self.dummy.min_damage = self.min_damage
         victim_level = self.dummy.level
-        # Modify the take_attack function to print the damage it took so we can assert it takes the appropriate damage
-        victim_mock = Mock(take_attack=lambda *args: print(args[1].phys_dmg), level=victim_level)
-        expected_damage = self.dummy.get_auto_attack_damage(victim_level)
+        # Modify the apply_hit function to print the damage it took so we can assert it takes the appropriate damage
+        victim_mock = Mock(resolve_hit=lambda phys_dmg, magic_dmg, level: HitResult(phys_dmg, magic_dmg, 0, 0, 0),
+                           apply_hit=lambda hit: print(hit.phys_dmg), level=victim_level)
+        expected_damage = self.dummy._roll_auto_attack_damage(victim_level)
         try:
             sys.stdout = output
             self.dummy.attack(victim_mock)
             # the damage should be different, since it's always random
-            std_output = output.getvalue()
-            self.assertNotIn(str(expected_damage.phys_dmg), std_output)   # WARNING: RANDOM!
+            std_output = output.getvalue().splitlines()[-1]
+            self.assertNotIn(str(expected_damage), std_output)   # WARNING: RANDOM!
             dealt_dmg: float = float(std_output)
             self.assertTrue(self.min_damage <= dealt_dmg <= self.max_damage)
         finally:
@@ -802,6 +874,28 @@ class MonsterTests(unittest.TestCase):
         finally:
             sys.stdout = sys.__stdout__
 
+    def test_respawn(self):
+        """ Respawning should bring the same monster back with full health/mana, no buffs and a fresh loot """
+        self.dummy.health, self.dummy.mana = 0, 5
+        self.dummy.buffs[Mock(name='buff')] = 2
+        self.dummy.enter_combat()
+        try:
+            sys.stdout = StringIO()
+            self.dummy._die()
+        finally:
+            sys.stdout = sys.__stdout__
+
+        loot = self.dummy.loot
+        self.dummy.respawn()
+
+        self.assertIs(self.dummy.loot, loot)
+        self.assertTrue(self.dummy.is_alive())
+        self.assertFalse(self.dummy.is_in_combat())
+        self.assertEqual((self.dummy.health, self.dummy.mana), (self.health, self.mana))
+        self.assertEqual(len(self.dummy.buffs), 0)
+        self.assertEqual(self.dummy.attributes, {'armor': self.armor})
+        self.assertEqual(self.dummy.loot, {'gold': self.dummy._gold_to_give})
+
     def test_calculate_gold_reward(self):
         """
         The calculate_gold_reward returns a random integer between the gold_to_give_range
@@ -860,11 +954,63 @@ class MonsterTests(unittest.TestCase):
             sys.stdout = sys.__stdout__
 
 
+class MonsterPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = MonsterPool(max_free_per_entry=2)
+        self.template = CreatureTemplate(entry=1, name='Wolf', health=10, mana=5, level=2, min_damage=1, max_damage=2,
+                                         quest_relation_id=0, xp_to_give=50, gold_to_give_range=(1, 3),
+                                         loot_table=None, armor=20, gossip='', respawnable=False)
+
+    def test_acquire_empty_pool(self):
+        monster = self.pool.acquire(self.template)
+        self.assertTrue(isinstance(monster, Monster))
+        self.assertIs(monster.template, self.template)
+
+    def test_acquire_reuses_released_monster(self):
+        """ A released monster should be reset in place, reusing its loot container """
+        monster = self.pool.acquire(self.template)
+        loot = monster.loot
+        monster.health, monster.mana = 0, 0
+        monster._alive = False
+        monster.loot['Wolf Meat'] = Mock()
+        self.pool.release(monster)
+        self.assertEqual(len(self.pool), 1)
+
+        reused_monster = self.pool.acquire(self.template)
+
+        self.assertIs(reused_monster, monster)
+        self.assertIs(reused_monster.loot, loot)
+        self.assertEqual(reused_monster.loot, {'gold': reused_monster._gold_to_give})
+        self.assertTrue(reused_monster.is_alive())
+        self.assertEqual((reused_monster.health, reused_monster.mana), (10, 5))
+        self.assertEqual(len(self.pool), 0)
+
+    def test_acquire_other_entry(self):
+        """ A monster should only be reused for its own creature entry """
+        monster = self.pool.acquire(self.template)
+        self.pool.release(monster)
+
+        other_monster = self.pool.acquire(self.template._replace(entry=2, name='Kobold'))
+
+        self.assertIsNot(other_monster, monster)
+        self.assertEqual(other_monster.name, 'Kobold')
+        self.assertEqual(len(self.pool), 1)
+
+    def test_release_over_limit(self):
+        """ The pool should not hold more than max_free_per_entry monsters of an entry """
+        for _ in range(3):
+            self.pool.release(Monster.from_template(self.template))
+        self.assertEqual(len(self.pool), 2)
+
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+
 class CharacterTests(unittest.TestCase):
     def setUp(self):
         self.name, self.health, self.mana, self.strength = 'Neth', 100, 100, 10
         self.agility, self.loaded_scripts, self.killed_monsters = 5, set(), set()
-        self.completed_quests, self.saved_inventory, self.saved_equipment = set(), {'gold': 0}, deepcopy(CHARACTER_DEFAULT_EQUIPMENT)
+        self.completed_quests, self.saved_inventory, self.saved_equipment = set(), Inventory(), deepcopy(CHARACTER_DEFAULT_EQUIPMENT)
         self.dummy = Character(name=self.name, health=self.health, mana=self.mana, strength=self.strength,
                                agility=self.agility, loaded_scripts=self.loaded_scripts, killed_monsters=self.killed_monsters,
                                completed_quests=self.completed_quests, saved_equipment=self.saved_equipment,
@@ -890,6 +1036,24 @@ class CharacterTests(unittest.TestCase):
         self.assertEqual(self.dummy.current_zone, CHAR_STARTER_ZONE)
         self.assertEqual(self.dummy.current_subzone, CHAR_STARTER_SUBZONE)
 
+    def test_init_default_containers_are_not_shared(self):
+        """
+        Characters created with the default arguments should each get their own inventory, equipment and sets
+        """
+        first_char, second_char = Character(name='First'), Character(name='Second')
+        first_char.inventory.gold += 10
+        first_char.killed_monsters.add(1)
+        first_char.completed_quests.add(1)
+        first_char.loaded_scripts.add('SCRIPT')
+        first_char.equipment['headpiece'] = Equipment(name='Head', item_id=1, slot='headpiece')
+
+        self.assertEqual(second_char.inventory, Inventory())
+        self.assertEqual(second_char.killed_monsters, set())
+        self.assertEqual(second_char.completed_quests, set())
+        self.assertEqual(second_char.loaded_scripts, set())
+        self.assertIsNone(second_char.equipment['headpiece'])
+        self.assertIsNone(CHARACTER_DEFAULT_EQUIPMENT['headpiece'])
+
     def test_equip_item(self):
         """
         The equip item takes na item from our inventory and adds it to our equipment, swapping with the
@@ -898,9 +1062,9 @@ class CharacterTests(unittest.TestCase):
         original_health = self.dummy.health
         self.item_to_equip = Equipment(name='FirstHead', item_id=1, slot='headpiece',
                                        attributes=create_attributes_dict(bonus_health=1000), buy_price=1)
-        self.dummy.inventory = {
+        self.dummy.inventory = Inventory({
             self.item_to_equip.name: (self.item_to_equip, 1)
-        }
+        })
 
         # act
 
@@ -922,12 +1086,12 @@ class CharacterTests(unittest.TestCase):
         original_health = self.dummy.health
         self.gear = Equipment(name='FirstHead', item_id=1, slot='headpiece',
                               attributes=create_attributes_dict(bonus_health=1000), buy_price=1)
-        self.item_to_eq = Equipment(name='SecondHead', item_id=1, slot='headpiece',
+        self.item_to_eq = Equipment(name='SecondHead', item_id=2, slot='headpiece',
                                     attributes=create_attributes_dict(), buy_price=1)
-        self.dummy.inventory = {
+        self.dummy.inventory = Inventory({
             self.gear.name: (self.gear, 1),
             self.item_to_eq.name: (self.item_to_eq, 1)
-        }
+        })
 
         # act
 
@@ -954,9 +1118,9 @@ class CharacterTests(unittest.TestCase):
         self.wep_to_eq = Weapon(name='wep', item_id=1, min_damage=10, max_damage=20, attributes=create_attributes_dict(
             bonus_health=1000, strength=1000
         ))
-        self.dummy.inventory = {
+        self.dummy.inventory = Inventory({
             self.wep_to_eq.name: (self.wep_to_eq, 1)
-        }
+        })
         equipped_weapon = self.dummy.equipped_weapon
         self.assertTrue(equipped_weapon.name not in self.dummy.inventory)
 
@@ -973,12 +1137,74 @@ class CharacterTests(unittest.TestCase):
         self.assertGreater(self.dummy.min_damage, orig_min_dmg)
         self.assertGreater(self.dummy.max_damage, orig_max_dmg)
 
+    def test_equip_item_recalculates_once(self):
+        """ Equipping an item over another should recalculate the stats formulas a single time """
+        old_wep = Weapon(name='Old', item_id=1, min_damage=1, max_damage=2, attributes=create_attributes_dict(strength=5))
+        new_wep = Weapon(name='New', item_id=2, min_damage=10, max_damage=20, attributes=create_attributes_dict(strength=10))
+        self.dummy.inventory = Inventory({old_wep.name: (old_wep, 1), new_wep.name: (new_wep, 1)})
+        self.dummy.equip_item(old_wep)
+        recalculate_mock = Mock(wraps=self.dummy._calculate_stats_formulas)
+        self.dummy._calculate_stats_formulas = recalculate_mock
+
+        self.dummy.equip_item(new_wep)
+
+        self.assertEqual(recalculate_mock.call_count, 1)
+        self.assertEqual(self.dummy.stat_layers[KEY_STAT_LAYER_GEAR]['strength'], 10)
+
+    def test_stat_batch(self):
+        """ Changes inside a stat_batch() should recalculate the formulas once, when the outermost batch ends """
+        orig_max_health = self.dummy.max_health
+        first_gear = Equipment(name='Head', item_id=1, slot='headpiece',
+                               attributes=create_attributes_dict(bonus_health=50, agility=2))
+        second_gear = Equipment(name='Belt', item_id=2, slot='belt', attributes=create_attributes_dict(bonus_health=25))
+        self.dummy.inventory = Inventory({first_gear.name: (first_gear, 1), second_gear.name: (second_gear, 1)})
+        recalculate_mock = Mock(wraps=self.dummy._calculate_stats_formulas)
+        self.dummy._calculate_stats_formulas = recalculate_mock
+
+        with self.dummy.stat_batch():
+            with self.dummy.stat_batch():
+                self.dummy.equip_item(first_gear)
+            self.dummy.equip_item(second_gear)
+            # nothing derived is recalculated inside the batch
+            self.assertEqual(self.dummy.max_health, orig_max_health)
+            self.assertEqual(recalculate_mock.call_count, 0)
+
+        self.assertEqual(recalculate_mock.call_count, 1)
+        self.assertEqual(self.dummy.max_health, orig_max_health + 75)
+
+    def test_stat_layers(self):
+        """ The attributes are the sum of the stat layers, plus the strength/armor that agility gives """
+        gear = Equipment(name='Head', item_id=1, slot='headpiece', attributes=create_attributes_dict(armor=10))
+        self.dummy.inventory = Inventory({gear.name: (gear, 1)})
+        self.dummy.equip_item(gear)
+        self.dummy._apply_buff(BeneficialBuff(name='Mana', buff_stats_and_amounts=[('mana', 20), ('armor', 5)],
+                                              duration=5))
+
+        self.assertEqual(self.dummy.stat_layers[KEY_STAT_LAYER_GEAR]['armor'], 10)
+        self.assertEqual(self.dummy.stat_layers[KEY_STAT_LAYER_BUFFS]['armor'], 5)
+        self.assertEqual(self.dummy.stat_layers[KEY_STAT_LAYER_BUFFS]['bonus_mana'], 20)
+        self.assertEqual(self.dummy.stat_layers[KEY_STAT_LAYER_LEVEL]['armor'], CHARACTER_LEVELUP_BONUS_STATS[1]['armor'])
+        for attribute_name, value in self.dummy.attributes.items():
+            layers_sum = sum(layer[attribute_name] for layer in self.dummy.stat_layers.values())
+            agility_bonus = {'strength': self.dummy._bonus_strength, 'armor': self.dummy._bonus_armor}.get(attribute_name, 0)
+            self.assertEqual(value, layers_sum + agility_bonus)
+
+    def test_stat_layers_recalculate_attributes(self):
+        """ The attributes should be summed up from the layers anew, rather than being kept as a running total """
+        orig_armor = self.dummy.attributes['armor']
+        self.dummy.attributes['armor'] += 1000  # not a part of any layer, gets dropped on the next recalculation
+
+        self.dummy._modify_stat_layer(KEY_STAT_LAYER_BASE, {'armor': 10, 'agility': 2})
+
+        self.assertEqual(self.dummy.stat_layers[KEY_STAT_LAYER_BASE]['armor'], 10)
+        self.assertEqual(self.dummy.attributes['armor'], orig_armor + 10 + 2 * 2.5)
+
     def test_equip_item_non_equippable_item(self):
         self.item_to_eq = Item(name='Evangelism', item_id=1, buy_price=1, sell_price=1)
         orig_health, orig_mana, orig_agi, orig_stren = self.dummy.health, self.dummy.mana, self.dummy.attributes['agility'], self.dummy.attributes['strength']
-        self.dummy.inventory = {
+        self.dummy.inventory = Inventory({
             self.item_to_eq.name: (self.item_to_eq, 1)
-        }
+        })
 
         self.dummy.equip_item(self.item_to_eq)
 
@@ -1000,9 +1226,9 @@ class CharacterTests(unittest.TestCase):
         self.item_to_eq = Item(name='Evangelism', item_id=1, buy_price=1, sell_price=1)
         orig_health, orig_mana, orig_agi, orig_stren = self.dummy.health, self.dummy.mana, self.dummy.attributes[
             'agility'], self.dummy.attributes['strength']
-        self.dummy.inventory = {
+        self.dummy.inventory = Inventory({
             self.item_to_eq.name: (self.item_to_eq, 1)
-        }
+        })
 
         for _ in range(10000):
             self.dummy.equip_item(self.item_to_eq)
@@ -1035,9 +1261,9 @@ class CharacterTests(unittest.TestCase):
                              sell_price=self.sell_price,
                              buff=self.effect, quest_id=0)
 
-        self.dummy.inventory = {
+        self.dummy.inventory = Inventory({
             self.potion.name: (self.potion, 1)
-        }
+        })
 
         self.dummy.consume_item(self.potion)
 
@@ -1048,9 +1274,9 @@ class CharacterTests(unittest.TestCase):
 
     def test_consume_item_non_consumable_item(self):
         self.item_to_eq = Item(name='Evangelism', item_id=1, buy_price=1, sell_price=1)
-        self.dummy.inventory = {
+        self.dummy.inventory = Inventory({
             self.item_to_eq.name: (self.item_to_eq, 1)
-        }
+        })
         self.dummy.consume_item(self.item_to_eq)
         self.assertTrue(self.item_to_eq.name in self.dummy.inventory)
 
@@ -1269,9 +1495,8 @@ class CharacterTests(unittest.TestCase):
         expected_current_health, expected_current_mana = orig_current_health, orig_current_mana
 
         # increase the health/mana from the attributes
-        self.dummy.attributes['bonus_health'] += health_increase
-        self.dummy.attributes['bonus_mana'] += mana_increase
-        self.dummy._calculate_stats_formulas()
+        self.dummy._modify_stat_layer(KEY_STAT_LAYER_BASE, {'bonus_health': health_increase,
+                                                            'bonus_mana': mana_increase})
 
         self.assertEqual(self.dummy.health, expected_current_health)
         self.assertEqual(self.dummy.mana, expected_current_mana)
@@ -1279,21 +1504,6 @@ class CharacterTests(unittest.TestCase):
         self.assertEqual(self.dummy.max_health, expected_max_health)
         self.assertEqual(self.dummy.max_mana, expected_max_mana)
 
-    def test_get_auto_attack_damage(self):
-        """
-        The get_auto_attack_damage function returns a Damage object with random physical damage, according to
-        the min/max damage of the character and his level difference
-        """
-        # let them be the same level so no level difference damage is applied
-        for _ in range(100):
-            result: Damage = self.dummy.get_auto_attack_damage(target_level=self.dummy.level)
-            self.assertTrue(isinstance(result, Damage))
-            self.assertEqual(result.magic_dmg, 0)
-            self.assertNotEqual(result.phys_dmg, 0)
-            phys_dmg = result.phys_dmg
-
-            self.assertTrue(int(self.dummy.min_damage) <= phys_dmg <= int(self.dummy.max_damage))
-
     def test_take_attack(self):
         """
         The take_attack function deals the damage given to it to the Character after applying
@@ -1584,15 +1794,15 @@ class CharacterTests(unittest.TestCase):
         self.assertGreaterEqual(self.dummy.max_health, self.dummy.health)
 
     def test_has_enough_gold(self):
-        self.dummy.inventory['gold'] = 100
+        self.dummy.inventory.gold = 100
         self.assertTrue(self.dummy.has_enough_gold(99))
         self.assertTrue(self.dummy.has_enough_gold(100))
         self.assertFalse(self.dummy.has_enough_gold(101))
 
     def test_has_item(self):
-        self.dummy.inventory = {
-            'item1': None,
-        }
+        self.dummy.inventory = Inventory({
+            'item1': (Item(name='item1', item_id=1, buy_price=1, sell_price=1), 1),
+        })
 
         self.assertTrue(self.dummy.has_item('item1'))
         self.assertFalse(self.dummy.has_item('item2'))
@@ -1602,13 +1812,13 @@ class CharacterTests(unittest.TestCase):
     def test_buy_item(self):
         item_to_buy = Item(name='NuItem', item_id=1, buy_price=1, sell_price=1)
         sale = (item_to_buy, 10, 10)
-        self.dummy.inventory['gold'] = 11
+        self.dummy.inventory.gold = 11
         expected_gold = 1
 
         self.dummy.buy_item(sale)
 
         # assert that we bought 10 NuItems for 10 NuItems for 10 Gold
-        self.assertEqual(self.dummy.inventory['gold'], expected_gold)
+        self.assertEqual(self.dummy.inventory.gold, expected_gold)
         self.assertTrue('NuItem' in self.dummy.inventory)
         self.assertEqual(self.dummy.inventory['NuItem'], (item_to_buy, 10))
 
@@ -1620,17 +1830,17 @@ class CharacterTests(unittest.TestCase):
         sell_price = 10000
         item_name = 'Diamond'
         item_to_sell = Item(name=item_name, item_id=1, buy_price=1, sell_price=sell_price)
-        self.dummy.inventory = {item_name: (item_to_sell, 2), 'gold': 0}
+        self.dummy.inventory = Inventory({item_name: (item_to_sell, 2)}, gold=0)
 
         self.dummy.sell_item(item_name)
         # assert that the character has sold his first item and has one remaining
-        self.assertEqual(self.dummy.inventory['gold'], sell_price)
+        self.assertEqual(self.dummy.inventory.gold, sell_price)
         self.assertEqual(self.dummy.inventory[item_name], (item_to_sell, 1))
 
         self.dummy.sell_item(item_name)
         # assert that he does not have the item anymore
         self.assertNotIn(item_name, self.dummy.inventory)
-        self.assertEqual(self.dummy.inventory['gold'], sell_price * 2)
+        self.assertEqual(self.dummy.inventory.gold, sell_price * 2)
 
     def test_add_quest(self):
         """
@@ -1656,7 +1866,7 @@ class CharacterTests(unittest.TestCase):
                                        reward_choice_enabled=False)
         expected_message = f'Quest {quest.name} is completed! XP awarded: {quest.xp_reward}!'
         wanted_item = Item(name=wanted_item_name, item_id=2, buy_price=1, sell_price=1)
-        self.dummy.inventory = {wanted_item_name: (wanted_item, wanted_amount)}
+        self.dummy.inventory = Inventory({wanted_item_name: (wanted_item, wanted_amount)})
 
         try:
             output = StringIO()
@@ -1691,7 +1901,7 @@ class CharacterTests(unittest.TestCase):
         quest = Quest(quest_id=1, quest_name="Vices", item_reward_dict={}, level_required=1,
                       reward_choice_enabled=False, xp_reward=10)
         expected_message = f'Quest {quest.name} is completed! XP awarded: {quest.xp_reward}!'
-        self.dummy.quest_log = {1: quest}
+        self.dummy.quest_log = QuestLog({1: quest})
         original_xp = self.dummy.experience
         try:
             sys.stdout = output
@@ -1732,7 +1942,7 @@ class CharacterTests(unittest.TestCase):
         self.assertNotIn(item1_name, self.dummy.inventory)
         self.assertNotIn(item2_name, self.dummy.inventory)
 
-        self.dummy.quest_log = {kill_quest.ID: kill_quest}
+        self.dummy.quest_log = QuestLog({kill_quest.ID: kill_quest})
         try:
             output = StringIO()
             sys.stdout = output
@@ -1759,8 +1969,8 @@ class CharacterTests(unittest.TestCase):
                            reward_choice_enabled=False)
         expected_message = f'Quest {quest.name} is completed! XP awarded: {quest.xp_reward}!'
         wanted_item = Item(name=wanted_item_name, item_id=2, buy_price=1, sell_price=1)
-        self.dummy.inventory = {wanted_item_name: (wanted_item, wanted_amount)}
-        self.dummy.quest_log = {quest.ID: quest}
+        self.dummy.inventory = Inventory({wanted_item_name: (wanted_item, wanted_amount)})
+        self.dummy.quest_log = QuestLog({quest.ID: quest})
         try:
             output = StringIO()
             sys.stdout = output
@@ -1789,8 +1999,8 @@ class CharacterTests(unittest.TestCase):
                                        reward_choice_enabled=False)
         expected_message = f'Quest {quest.name} is completed! XP awarded: {quest.xp_reward}!'
         wanted_item = Item(name=wanted_item_name, item_id=2, buy_price=1, sell_price=1)
-        self.dummy.inventory = {wanted_item_name: (wanted_item, wanted_amount)}
-        self.dummy.quest_log = {quest.ID: quest}
+        self.dummy.inventory = Inventory({wanted_item_name: (wanted_item, wanted_amount)})
+        self.dummy.quest_log = QuestLog({quest.ID: quest})
         try:
             output = StringIO()
             sys.stdout = output
@@ -1803,7 +2013,7 @@ class CharacterTests(unittest.TestCase):
 
         # assert that the item is no longer in the inventory, because the quest required exactly as much as we had
         self.assertIn(wanted_item_name, self.dummy.inventory)
-        left_item_count = self.dummy.inventory[wanted_item_name][1]
+        left_item_count = self.dummy.inventory[wanted_item_name].count
         self.assertEqual(left_item_count, wanted_amount-quest.required_item_count)
         self.assertNotIn(quest.ID, self.dummy.quest_log)
         self.assertEqual(self.dummy.experience, orig_xp + quest.xp_reward)
@@ -1915,6 +2125,48 @@ class CharacterTests(unittest.TestCase):
         self.assertEqual(self.dummy.experience, orig_xp + expected_xp)
         self.assertNotIn(guid, self.dummy.killed_monsters)
 
+    def test_award_monster_kills(self):
+        """ The XP of every monster should be summed up and awarded at once """
+        orig_xp = self.dummy.experience
+        monsters = [(1, Monster(monster_id=1, name='Wolf', xp_to_give=15, level=self.dummy.level, respawnable=True)),
+                    (2, Monster(monster_id=2, name='Wolf', xp_to_give=10, level=self.dummy.level + 1)),
+                    (3, Monster(monster_id=3, name='Rat', xp_to_give=10,
+                                level=self.dummy.level - MAXIMUM_LEVEL_DIFFERENCE_XP_YIELD))]
+        # 10% bonus for the second wolf's level, none from the rat as it is too low a level
+        expected_xp = 15 + 10 + 1
+        award_experience_calls = []
+        self.dummy._award_experience = award_experience_calls.append
+
+        try:
+            output = StringIO()
+            sys.stdout = output
+
+            self.dummy.award_monster_kills(monsters)
+
+            self.assertIn(f'XP awarded: {expected_xp} for 3 kills!', output.getvalue())
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(award_experience_calls, [expected_xp])
+        self.assertEqual(set(self.dummy.killed_monsters), {2, 3})
+        self.assertEqual(self.dummy.experience, orig_xp)
+
+    def test_award_monster_kills_for_quest(self):
+        """ Every kill should be counted for the quests """
+        k_quest = KillQuest(quest_name="kill", quest_id=10, required_monster='Wolf', level_required=1,
+                            item_reward_dict={}, reward_choice_enabled=False, required_kills=3, xp_reward=10)
+        self.dummy.quest_log = QuestLog({k_quest.ID: k_quest})
+        wolves = [(guid, Monster(monster_id=1, name='Wolf', xp_to_give=10, level=self.dummy.level)) for guid in range(2)]
+
+        try:
+            sys.stdout = StringIO()
+            self.dummy.award_monster_kills(wolves)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(k_quest.kills, 2)
+        self.assertFalse(k_quest.is_completed)
+
     def test_award_monster_kill_for_quest(self):
         """ Killing a monster that is for a quest should update the quest's killed monsters count """
         q_id = 10
@@ -1922,8 +2174,8 @@ class CharacterTests(unittest.TestCase):
         k_quest = KillQuest(quest_name="kill", quest_id=q_id, required_monster=monster_name,
                             level_required=1, item_reward_dict={},
                             reward_choice_enabled=False, required_kills=10, xp_reward=10)
-        mon = Monster(monster_id=1, name="Monster", xp_to_give=10, level=self.dummy.level, quest_relation_id=k_quest.ID)
-        self.dummy.quest_log = {k_quest.ID: k_quest}
+        mon = Monster(monster_id=1, name=monster_name, xp_to_give=10, level=self.dummy.level, quest_relation_id=k_quest.ID)
+        self.dummy.quest_log = QuestLog({k_quest.ID: k_quest})
         self.assertEqual(k_quest.kills, 0)
 
         for i in range(k_quest.required_kills):
@@ -1932,10 +2184,35 @@ class CharacterTests(unittest.TestCase):
 
         self.assertTrue(k_quest.is_completed)
 
+    def test_award_monster_kill_for_multiple_quests(self):
+        """ Every quest that requires the monster should count the kill, the others should not """
+        first_quest = KillQuest(quest_name="kill", quest_id=1, required_monster='Wolf', level_required=1,
+                                item_reward_dict={}, reward_choice_enabled=False, required_kills=2, xp_reward=10)
+        second_quest = KillQuest(quest_name="kill more", quest_id=2, required_monster='Wolf', level_required=1,
+                                 item_reward_dict={}, reward_choice_enabled=False, required_kills=5, xp_reward=10)
+        other_quest = KillQuest(quest_name="kill others", quest_id=3, required_monster='Kobold', level_required=1,
+                                item_reward_dict={}, reward_choice_enabled=False, required_kills=5, xp_reward=10)
+        for quest in [first_quest, second_quest, other_quest]:
+            self.dummy.add_quest(quest)
+        mon = Monster(monster_id=1, name='Wolf', xp_to_give=10, level=self.dummy.level)
+
+        try:
+            sys.stdout = StringIO()
+            for _ in range(2):
+                self.dummy.award_monster_kill(mon, 1)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(second_quest.kills, 2)
+        self.assertEqual(other_quest.kills, 0)
+        self.assertIn(first_quest.ID, self.dummy.completed_quests)
+        self.assertEqual(list(self.dummy.quest_log), [second_quest.ID, other_quest.ID])
+        self.assertEqual(self.dummy.quest_log.get_kill_quests('Wolf'), [second_quest])
+
     def test_award_gold(self):
-        self.dummy.inventory = {'gold': 0}
+        self.dummy.inventory = Inventory(gold=0)
         self.dummy.award_gold(10)
-        self.assertEqual(self.dummy.inventory['gold'], 10)
+        self.assertEqual(self.dummy.inventory.gold, 10)
 
     def test_award_item(self):
         # The award_item function adds an item to the character's inventory
@@ -1945,7 +2222,7 @@ class CharacterTests(unittest.TestCase):
 
     def test_award_item_already_in_inventory(self):
         item = Item(name="item", item_id=1, buy_price=1, sell_price=1)
-        self.dummy.inventory = {'item': (item, 10)}
+        self.dummy.inventory = Inventory({'item': (item, 10)})
         self.dummy.award_item(item, 10)
         self.assertEqual(self.dummy.inventory['item'], (item, 20))
 
@@ -1956,18 +2233,41 @@ class CharacterTests(unittest.TestCase):
                              xp_reward=1, reward_choice_enabled=False, level_required=1)
         item = Item(name="item", item_id=1, buy_price=1, sell_price=1, quest_id=f_quest.ID)
 
-        self.dummy.quest_log = {f_quest.ID: f_quest}
+        self.dummy.quest_log = QuestLog({f_quest.ID: f_quest})
 
         # We add exactly as much items as the quest requires and that should complete it
         self.dummy.award_item(item, item_count)
 
         self.assertTrue(f_quest.is_completed)
 
+    def test_award_item_for_multiple_fetch_quests(self):
+        """ Both quests require the item, completing the first one takes away the items the second one needs """
+        first_quest = FetchQuest(quest_name="d", quest_id=1, required_item='item', required_item_count=2,
+                                 item_reward_dict={}, xp_reward=1, reward_choice_enabled=False, level_required=1)
+        second_quest = FetchQuest(quest_name="e", quest_id=2, required_item='item', required_item_count=1,
+                                  item_reward_dict={}, xp_reward=1, reward_choice_enabled=False, level_required=1)
+        item = Item(name="item", item_id=1, buy_price=1, sell_price=1)
+        self.dummy.quest_log = QuestLog({first_quest.ID: first_quest, second_quest.ID: second_quest})
+
+        try:
+            sys.stdout = StringIO()
+            self.dummy.award_item(item, 2)
+            self.assertTrue(first_quest.is_completed)
+            self.assertFalse(second_quest.is_completed)
+
+            self.dummy.award_item(item)
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertTrue(second_quest.is_completed)
+        self.assertEqual(len(self.dummy.quest_log), 0)
+        self.assertNotIn(item.name, self.dummy.inventory)
+
     def test_remove_item_from_inventory(self):
         """ The remove_item_from inventory removes an item from the inventory of the character """
         item = Item(name="item", item_id=1, buy_price=1, sell_price=1)
         orig_count = 10
-        self.dummy.inventory = {'item': (item, orig_count)}
+        self.dummy.inventory = Inventory({'item': (item, orig_count)})
         remove_count = 5
 
         self.dummy._remove_item_from_inventory(item.name, remove_count)
@@ -1977,7 +2277,7 @@ class CharacterTests(unittest.TestCase):
     def test_remove_item_all_items_from_inventory(self):
         item = Item(name="item", item_id=1, buy_price=1, sell_price=1)
         orig_count = 10
-        self.dummy.inventory = {'item': (item, orig_count)}
+        self.dummy.inventory = Inventory({'item': (item, orig_count)})
         remove_count = 5
 
         self.dummy._remove_item_from_inventory(item.name, remove_count, remove_all=True)
@@ -2050,6 +2350,40 @@ class CharacterTests(unittest.TestCase):
         self.assertEqual(self.dummy.attributes['armor'], expected_armor)
         self.assertEqual(self.dummy.attributes['strength'], expected_stren)
 
+    def test_check_if_levelup_multiple_levels(self):
+        """ An experience award worth multiple levels should level the character up through all of them at once """
+        first_level_xp = CHARACTER_LEVEL_XP_REQUIREMENTS[self.dummy.level]
+        second_level_xp = CHARACTER_LEVEL_XP_REQUIREMENTS[self.dummy.level + 1]
+        orig_level = self.dummy.level
+        self.dummy.experience = first_level_xp + second_level_xp + 15
+
+        try:
+            output = StringIO()
+            sys.stdout = output
+            self.dummy.check_if_levelup()
+        finally:
+            sys.stdout = sys.__stdout__
+
+        self.assertEqual(self.dummy.level, orig_level + 2)
+        self.assertEqual(self.dummy.experience, 15)
+        self.assertEqual(self.dummy.xp_req_to_level, CHARACTER_LEVEL_XP_REQUIREMENTS[orig_level + 2])
+
+    def test_level_up_to_level(self):
+        """ Jumping straight to a level should give the same stats as leveling up one level at a time """
+        to_level = 5
+        jumped_char, leveled_char = Character(name='Jumped'), Character(name='Leveled')
+        for _ in range(leveled_char.level, to_level):
+            leveled_char._level_up(to_print=False)
+
+        jumped_char._level_up(to_level=to_level, to_print=False)
+
+        self.assertEqual(jumped_char.level, to_level)
+        self.assertEqual(jumped_char.attributes, leveled_char.attributes)
+        self.assertEqual(jumped_char.max_health, leveled_char.max_health)
+        self.assertEqual(jumped_char.max_mana, leveled_char.max_mana)
+        self.assertEqual(jumped_char.health, jumped_char.max_health)
+        self.assertEqual(jumped_char.min_damage, leveled_char.min_damage)
+
     def test_level_up_no_print(self):
         expected_message = f'Character {self.dummy.name} has leveled up to level {self.dummy.level + 1}!'
 
@@ -2110,13 +2444,14 @@ class CharacterTests(unittest.TestCase):
         from spells import Spell
         spell_cd = 3
         sp = Spell(name="Carb", rank=1, cooldown=spell_cd)
-        sp._cooldown_counter = spell_cd
-
-        self.dummy.learned_spells = {'Carb': sp}
+        self.dummy.spell_cooldowns.start_cooldown(sp)
 
         for cd_left in reversed(range(spell_cd)):
             self.dummy.update_spell_cooldowns()
-            self.assertEqual(sp.turns_on_cd, cd_left)
+            self.assertEqual(self.dummy.spell_cooldowns.get_turns_on_cooldown(sp.name), cd_left)
+            self.assertFalse(self.dummy.spell_cooldowns.is_ready(sp.name))
+        self.dummy.update_spell_cooldowns()
+        self.assertTrue(self.dummy.spell_cooldowns.is_ready(sp.name))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,93 @@
+import unittest
+
+from inventory import Inventory, ItemStack
+from items import Item
+
+
+class InventoryTests(unittest.TestCase):
+    def setUp(self):
+        self.wolf_meat = Item(name='Wolf Meat', item_id=1, buy_price=1, sell_price=1)
+        self.linen_cloth = Item(name='Linen Cloth', item_id=10, buy_price=1, sell_price=1)
+        self.inventory = Inventory({self.wolf_meat.name: (self.wolf_meat, 5)}, gold=10)
+
+    def test_init(self):
+        self.assertEqual(self.inventory.gold, 10)
+        self.assertEqual(len(self.inventory), 1)
+        self.assertEqual(self.inventory[self.wolf_meat.name], (self.wolf_meat, 5))
+        self.assertNotIn('gold', self.inventory)
+
+    def test_add_item(self):
+        self.inventory.add_item(self.wolf_meat, 3)
+        self.inventory.add_item(self.linen_cloth)
+
+        self.assertEqual(self.inventory.get_item_count(self.wolf_meat.name), 8)
+        self.assertEqual(self.inventory.get_item_count(self.linen_cloth.name), 1)
+        self.assertIs(self.inventory.get_stack_by_id(self.linen_cloth.id), self.inventory[self.linen_cloth.name])
+
+    def test_remove_item(self):
+        left_count = self.inventory.remove_item(self.wolf_meat.name, 2)
+
+        self.assertEqual(left_count, 3)
+        self.assertEqual(self.inventory[self.wolf_meat.name], (self.wolf_meat, 3))
+
+    def test_remove_item_removes_empty_stack(self):
+        """ Removing as many or more items than there are should remove the stack from both indexes """
+        left_count = self.inventory.remove_item(self.wolf_meat.name, 7)
+
+        self.assertEqual(left_count, 0)
+        self.assertNotIn(self.wolf_meat.name, self.inventory)
+        self.assertIsNone(self.inventory.get_stack_by_id(self.wolf_meat.id))
+        self.assertEqual(self.inventory.get_item_count(self.wolf_meat.name), 0)
+
+    def test_remove_item_not_in_inventory(self):
+        with self.assertRaises(KeyError):
+            self.inventory.remove_item(self.linen_cloth.name)
+
+    def test_remove_stack(self):
+        self.inventory.remove_stack(self.wolf_meat.name)
+
+        self.assertEqual(len(self.inventory), 0)
+        self.assertIsNone(self.inventory.get_item(self.wolf_meat.name))
+
+    def test_get_item(self):
+        self.assertIs(self.inventory.get_item(self.wolf_meat.name), self.wolf_meat)
+        self.assertIsNone(self.inventory.get_item(self.linen_cloth.name))
+
+    def test_stacks(self):
+        self.inventory.add_item(self.linen_cloth, 2)
+
+        self.assertEqual([tuple(stack) for stack in self.inventory.stacks()],
+                         [(self.wolf_meat, 5), (self.linen_cloth, 2)])
+
+    def test_serialize(self):
+        self.inventory.add_item(self.linen_cloth, 2)
+
+        self.assertEqual(self.inventory.serialize(), [(1, 5), (10, 2)])
+
+    def test_eq(self):
+        """ Inventories are equal if they have the same items and gold """
+        other_inventory = Inventory({self.wolf_meat.name: (self.wolf_meat, 5)}, gold=10)
+        self.assertEqual(self.inventory, other_inventory)
+        self.assertEqual(self.inventory, {self.wolf_meat.name: (self.wolf_meat, 5)})
+
+        other_inventory.gold += 1
+        self.assertNotEqual(self.inventory, other_inventory)
+        other_inventory.gold -= 1
+        other_inventory.add_item(self.wolf_meat)
+        self.assertNotEqual(self.inventory, other_inventory)
+
+
+class ItemStackTests(unittest.TestCase):
+    def test_unpack_and_eq(self):
+        item = Item(name='Wolf Meat', item_id=1, buy_price=1, sell_price=1)
+        stack = ItemStack(item, 2)
+        stack_item, stack_count = stack
+
+        self.assertIs(stack_item, item)
+        self.assertEqual(stack_count, 2)
+        self.assertEqual(stack, (item, 2))
+        self.assertNotEqual(stack, (item, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import Mock
+
+from inventory import Inventory
+from items import Item
+from quest import Quest, KillQuest, FetchQuest, QuestLog
+
+
+class QuestLogTests(unittest.TestCase):
+    def setUp(self):
+        self.kill_quest = KillQuest(quest_name='A Canine Menace', quest_id=1, required_monster='Wolf', xp_reward=300,
+                                    item_reward_dict={}, reward_choice_enabled=False, level_required=1,
+                                    required_kills=5)
+        self.fetch_quest = FetchQuest(quest_name='Canine-Like Hunger', quest_id=2, required_item='Wolf Meat',
+                                      xp_reward=300, item_reward_dict={}, reward_choice_enabled=False,
+                                      level_required=1, required_item_count=4)
+        self.quest = Quest(quest_name='Vices', quest_id=3, xp_reward=10, item_reward_dict={},
+                           reward_choice_enabled=False, level_required=1)
+        self.quest_log = QuestLog({quest.ID: quest for quest in [self.kill_quest, self.fetch_quest, self.quest]})
+
+    def test_mapping(self):
+        self.assertEqual(len(self.quest_log), 3)
+        self.assertIs(self.quest_log[self.kill_quest.ID], self.kill_quest)
+        self.assertIn(self.quest.ID, self.quest_log)
+        self.assertEqual(list(self.quest_log), [self.kill_quest.ID, self.fetch_quest.ID, self.quest.ID])
+        self.assertEqual(self.quest_log, {quest.ID: quest for quest in [self.kill_quest, self.fetch_quest, self.quest]})
+
+    def test_get_kill_quests(self):
+        second_kill_quest = KillQuest(quest_name='Wolves again', quest_id=4, required_monster='Wolf',
+                                      xp_reward=300, item_reward_dict={}, reward_choice_enabled=False,
+                                      level_required=1, required_kills=5)
+        self.quest_log[second_kill_quest.ID] = second_kill_quest
+
+        self.assertEqual(self.quest_log.get_kill_quests('Wolf'), [self.kill_quest, second_kill_quest])
+        self.assertEqual(self.quest_log.get_kill_quests('Wolf Meat'), [])
+        self.assertEqual(self.quest_log.get_kill_quests('Kobold'), [])
+
+    def test_get_fetch_quests(self):
+        self.assertEqual(self.quest_log.get_fetch_quests('Wolf Meat'), [self.fetch_quest])
+        self.assertEqual(self.quest_log.get_fetch_quests('Wolf'), [])
+
+    def test_delete_removes_from_index(self):
+        del self.quest_log[self.kill_quest.ID]
+        del self.quest_log[self.fetch_quest.ID]
+
+        self.assertEqual(self.quest_log.get_kill_quests('Wolf'), [])
+        self.assertEqual(self.quest_log.get_fetch_quests('Wolf Meat'), [])
+        self.assertEqual(self.quest_log._kill_quests, {})
+        self.assertEqual(self.quest_log._fetch_quests, {})
+        with self.assertRaises(KeyError):
+            del self.quest_log[self.kill_quest.ID]
+
+    def test_set_replaces_quest_in_index(self):
+        """ Setting a new quest on an existing ID should drop the old quest from the index """
+        replacing_quest = KillQuest(quest_name='Kobolds', quest_id=self.kill_quest.ID, required_monster='Kobold',
+                                    xp_reward=300, item_reward_dict={}, reward_choice_enabled=False,
+                                    level_required=1, required_kills=5)
+        self.quest_log[replacing_quest.ID] = replacing_quest
+
+        self.assertEqual(self.quest_log.get_kill_quests('Wolf'), [])
+        self.assertEqual(self.quest_log.get_kill_quests('Kobold'), [replacing_quest])
+
+    def test_get_progress_description(self):
+        character = Mock(inventory=Inventory({'Wolf Meat': (Item(name='Wolf Meat', item_id=1, buy_price=1,
+                                                                 sell_price=1), 3)}))
+        self.kill_quest.kills = 2
+
+        self.assertEqual(self.kill_quest.get_progress_description(character), 'A Canine Menace - 2/5 Wolf slain.')
+        self.assertEqual(self.fetch_quest.get_progress_description(character),
+                         'Canine-Like Hunger - 3/4 Wolf Meat obtained.')
+        self.assertEqual(self.quest.get_progress_description(character), 'Vices')
+
+
+if __name__ == '__main__':
+    unittest.main()
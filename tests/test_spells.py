@@ -0,0 +1,104 @@
+import unittest
+
+import models.main
+from spells import PaladinSpell, Spellbook, CooldownTracker
+
+
+class SpellbookTests(unittest.TestCase):
+    def setUp(self):
+        self.sor_rank_1 = PaladinSpell(name='Seal of Righteousness', rank=1, damage1=2)
+        self.sor_rank_2 = PaladinSpell(name='Seal of Righteousness', rank=2, damage1=4)
+        self.fol = PaladinSpell(name='Flash of Light', rank=1, heal1=5)
+        self.spellbook = Spellbook(spells_by_level={1: [self.sor_rank_1], 2: [self.fol], 4: [self.sor_rank_2]},
+                                   spell_commands={'Seal of Righteousness': 'sor', 'Flash of Light': 'fol'})
+
+    def test_get_spells_for_level_range(self):
+        self.assertEqual(self.spellbook.get_spells_for_level_range(1, 1), [self.sor_rank_1])
+        self.assertEqual(self.spellbook.get_spells_for_level_range(2, 4), [self.fol, self.sor_rank_2])
+        self.assertEqual(self.spellbook.get_spells_for_level_range(3, 3), [])
+        self.assertEqual(self.spellbook.get_spells_for_level_range(5, 10), [])
+
+    def test_get_available_commands(self):
+        self.assertEqual(self.spellbook.get_available_commands(1), {'sor'})
+        self.assertEqual(self.spellbook.get_available_commands(2), {'sor', 'fol'})
+        self.assertEqual(self.spellbook.get_available_commands(10), {'sor', 'fol'})
+
+    def test_get_spellbook_is_cached(self):
+        paladin_spellbook = Spellbook.get_spellbook('paladin')
+
+        self.assertIs(Spellbook.get_spellbook('paladin'), paladin_spellbook)
+        self.assertIn('ms', paladin_spellbook.get_available_commands(paladin_spellbook.max_level))
+
+    def test_get_spellbook_unsupported_class(self):
+        expected_message = 'Unsupported class - warrior'
+        try:
+            Spellbook.get_spellbook('warrior')
+            self.fail('The test should have raised an Exception!')
+        except Exception as e:
+            self.assertEqual(str(e), expected_message)
+
+
+class CooldownTrackerTests(unittest.TestCase):
+    def setUp(self):
+        self.tracker = CooldownTracker()
+        self.spell = PaladinSpell(name='Melting Strike', rank=1, damage1=3, cooldown=3)
+
+    def test_start_cooldown(self):
+        """ A spell with a cooldown of N should be ready N+1 turns after it is cast """
+        self.assertTrue(self.tracker.is_ready(self.spell.name))
+        self.tracker.start_cooldown(self.spell)
+
+        for turns_left in [3, 2, 1, 0]:
+            self.assertFalse(self.tracker.is_ready(self.spell.name))
+            self.assertEqual(self.tracker.get_turns_on_cooldown(self.spell.name), turns_left)
+            self.tracker.pass_turn()
+
+        self.assertTrue(self.tracker.is_ready(self.spell.name))
+        self.assertEqual(self.tracker.get_turns_on_cooldown(self.spell.name), 0)
+
+    def test_no_cooldown_spell(self):
+        """ A spell without a cooldown should be castable once per turn """
+        spell = PaladinSpell(name='Flash of Light', rank=1, heal1=5)
+        self.tracker.start_cooldown(spell)
+        self.assertFalse(self.tracker.is_ready(spell.name))
+
+        self.tracker.pass_turn()
+        self.assertTrue(self.tracker.is_ready(spell.name))
+
+    def test_pass_turn_forgets_ready_spells(self):
+        """ Only the spells which are on cooldown should be held """
+        self.tracker.start_cooldown(self.spell)
+        self.tracker.start_cooldown(PaladinSpell(name='Flash of Light', rank=1))
+        self.assertEqual(self.tracker.get_cooldowns(), {'Melting Strike': 3, 'Flash of Light': 0})
+
+        self.tracker.pass_turn()
+        self.assertEqual(self.tracker.get_cooldowns(), {'Melting Strike': 2})
+        for _ in range(3):
+            self.tracker.pass_turn()
+        self.assertEqual(self.tracker.get_cooldowns(), {})
+        self.assertEqual(self.tracker._spells_by_ready_turn, {})
+
+    def test_reset(self):
+        self.tracker.start_cooldown(self.spell)
+        self.tracker.reset()
+
+        self.assertTrue(self.tracker.is_ready(self.spell.name))
+        self.assertEqual(self.tracker.get_cooldowns(), {})
+        # the turns keep counting after a reset
+        self.tracker.pass_turn()
+        self.tracker.start_cooldown(self.spell)
+        self.assertEqual(self.tracker.get_turns_on_cooldown(self.spell.name), 3)
+
+    def test_eq(self):
+        other_tracker = CooldownTracker()
+        other_tracker.pass_turn()
+        self.assertEqual(self.tracker, other_tracker)
+
+        self.tracker.start_cooldown(self.spell)
+        self.assertNotEqual(self.tracker, other_tracker)
+        other_tracker.start_cooldown(self.spell)
+        self.assertEqual(self.tracker, other_tracker)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Test the loading of a character in start_game_prompt.py
+"""
+import sys
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+import start_game_prompt
+from start_game_prompt import handle_load_character
+
+
+class HandleLoadCharacterTests(unittest.TestCase):
+    def setUp(self):
+        self.output = StringIO()
+        sys.stdout = self.output
+        # the saved characters, listed two at a time
+        self.names = ['Amber', 'Bolvar', 'Cairne']
+        self.requested_pages = []
+
+        def load_page(after_name: str=None, name_prefix: str='') -> [dict]:
+            self.requested_pages.append((after_name, name_prefix))
+            names = [name for name in self.names if name.startswith(name_prefix)
+                     and (after_name is None or name > after_name)]
+            return [{'name': name, 'class': 'paladin', 'level': 1} for name in names[:2]]
+
+        patchers = [patch.object(start_game_prompt, 'load_saved_characters_general_info_page', load_page),
+                    patch.object(start_game_prompt, 'SAVED_CHARACTER_ROSTER_PAGE_SIZE', 2),
+                    patch.object(start_game_prompt, 'load_character', lambda name: name)]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        sys.stdout = sys.__stdout__
+
+    def load_with_commands(self, commands: [str]):
+        commands = iter(commands)
+        with patch('builtins.input', lambda *_: next(commands)):
+            return handle_load_character()
+
+    def test_next_past_the_last_page(self):
+        """ Paging past the last character should stay on the last page, rather than going back to the first one """
+        self.assertEqual(self.load_with_commands(['next', 'next', 'next', 'Cairne']), 'Cairne')
+
+        self.assertEqual(self.requested_pages, [(None, ''), ('Bolvar', ''), ('Cairne', ''), ('Cairne', '')])
+        self.assertEqual(self.output.getvalue().count('There are no more characters.'), 2)
+
+    def test_next_after_empty_search(self):
+        """ A search with no matches should not have next list the characters that do not match it """
+        self.load_with_commands(['search Z', 'next', 'Amber'])
+
+        self.assertEqual(self.requested_pages, [(None, ''), (None, 'Z'), (None, 'Z')])
+        self.assertIn('There are no more characters.', self.output.getvalue())
+        self.assertNotIn('Cairne', self.output.getvalue())
+
+    def test_search_is_case_sensitive(self):
+        """ The prompt should tell that the search matches the names' case, as the lookup does """
+        self.load_with_commands(['search a', 'Amber'])
+
+        self.assertIn('case sensitive', self.output.getvalue())
+        self.assertEqual(self.requested_pages, [(None, ''), (None, 'a')])
+
+
+if __name__ == '__main__':
+    unittest.main()
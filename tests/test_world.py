@@ -0,0 +1,71 @@
+import unittest
+import unittest.mock
+
+import models.main
+from world import World
+from zones.northshire_abbey import NorthshireAbbey
+
+
+class WorldTests(unittest.TestCase):
+    def setUp(self):
+        self.char_mock = unittest.mock.Mock(level=10)
+        self.char_mock.has_completed_quest = lambda x: False
+        self.char_mock.has_killed_monster = lambda x: False
+        self.zone_name = 'Northshire Abbey'
+
+    def test_init(self):
+        world = World(self.char_mock)
+        self.assertEqual(world.character, self.char_mock)
+        # zones should not be loaded before they are needed
+        self.assertEqual(world.zones, {})
+
+    def test_get_zone(self):
+        world = World(self.char_mock)
+        zone = world.get_zone(self.zone_name)
+
+        self.assertTrue(isinstance(zone, NorthshireAbbey))
+        # should load the zone only once
+        self.assertIs(world.get_zone(self.zone_name), zone)
+
+    def test_get_zone_invalid_zone(self):
+        world = World(self.char_mock)
+        expected_message = 'There is no zone by the name of Aa!'
+        try:
+            world.get_zone('Aa')
+            self.fail('The test should have raised an Exception!')
+        except Exception as e:
+            self.assertEqual(str(e), expected_message)
+
+    def test_has_zone(self):
+        world = World(self.char_mock)
+        self.assertTrue(world.has_zone(self.zone_name))
+        self.assertFalse(world.has_zone('Aa'))
+
+    def test_pass_turn(self):
+        """ Every loaded zone should pass a turn """
+        world = World(self.char_mock)
+        zone = world.get_zone(self.zone_name)
+
+        world.pass_turn()
+        world.pass_turn()
+
+        self.assertEqual(zone.respawn_wheel.turn, 2)
+
+    def test_worlds_do_not_share_zones(self):
+        """ Two worlds should be fully separate, killing a monster in one should not kill it in the other """
+        world, other_world = World(self.char_mock), World(self.char_mock)
+        zone, other_zone = world.get_zone(self.zone_name), other_world.get_zone(self.zone_name)
+        self.assertIsNot(zone, other_zone)
+
+        alive_monsters, guid_name_set = zone.get_cs_monsters()
+        guid, name = next(iter(guid_name_set))
+        del alive_monsters[guid]
+        guid_name_set.remove((guid, name))
+
+        other_alive_monsters, other_guid_name_set = other_zone.get_cs_monsters()
+        self.assertIn(guid, other_alive_monsters)
+        self.assertIn((guid, name), other_guid_name_set)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Test the copy-on-write views in utils/copy_on_write.py
+"""
+import unittest
+
+from utils.copy_on_write import CopyOnWriteDict, CopyOnWriteSet
+
+
+class CopyOnWriteDictTests(unittest.TestCase):
+    def setUp(self):
+        self.base = {1: [1], 2: [2], 3: [3]}
+        self.view = CopyOnWriteDict(self.base, copy_function=list)
+
+    def test_getitem_materializes_copy(self):
+        value = self.view[1]
+        self.assertEqual(value, [1])
+        self.assertIsNot(value, self.base[1])
+        # the same copy should be returned afterwards
+        self.assertIs(self.view[1], value)
+
+        value.append(5)
+        self.assertEqual(self.base[1], [1])
+        self.assertEqual(self.view[1], [1, 5])
+
+    def test_items_and_values_do_not_materialize(self):
+        self.assertEqual(list(self.view.items()), list(self.base.items()))
+        self.assertIs(list(self.view.values())[0], self.base[1])
+        self.assertEqual(self.view.materialized_count(), 0)
+
+    def test_items_show_materialized_values(self):
+        self.view[2].append(5)
+        self.assertEqual(dict(self.view.items()), {1: [1], 2: [2, 5], 3: [3]})
+
+    def test_getitem_without_copy_function(self):
+        """ Without a copy function the shared values are returned as they are and nothing is materialized """
+        view = CopyOnWriteDict(self.base, copy_function=None)
+        self.assertIs(view[1], self.base[1])
+        self.assertEqual(view.materialized_count(), 0)
+
+    def test_copy(self):
+        self.view[1].append(5)
+        del self.view[2]
+        copied_view = self.view.copy()
+        self.assertEqual(dict(copied_view.items()), {1: [1, 5], 3: [3]})
+
+        del copied_view[3]
+        self.assertIn(3, self.view)
+        self.assertEqual(self.base, {1: [1], 2: [2], 3: [3]})
+
+    def test_delitem(self):
+        del self.view[1]
+        self.assertNotIn(1, self.view)
+        self.assertEqual(list(self.view.keys()), [2, 3])
+        self.assertEqual(len(self.view), 2)
+        self.assertIn(1, self.base)
+        self.assertRaises(KeyError, self.view.__getitem__, 1)
+
+    def test_delitem_invalid_key(self):
+        self.assertRaises(KeyError, self.view.__delitem__, 4)
+        del self.view[1]
+        self.assertRaises(KeyError, self.view.__delitem__, 1)
+
+    def test_setitem(self):
+        self.view[4] = [4]
+        self.assertEqual(len(self.view), 4)
+        self.assertEqual(list(self.view.keys()), [1, 2, 3, 4])
+        self.assertNotIn(4, self.base)
+
+        del self.view[2]
+        self.view[2] = [22]
+        self.assertEqual(self.view[2], [22])
+        self.assertEqual(self.base[2], [2])
+
+    def test_eq(self):
+        self.assertEqual(self.view, self.base)
+        self.view[1].append(5)
+        self.assertNotEqual(self.view, self.base)
+
+
+class CopyOnWriteSetTests(unittest.TestCase):
+    def setUp(self):
+        self.base = {(1, 'Wolf'), (2, 'Bear')}
+        self.view = CopyOnWriteSet(self.base)
+
+    def test_remove(self):
+        self.view.remove((1, 'Wolf'))
+        self.assertNotIn((1, 'Wolf'), self.view)
+        self.assertEqual(len(self.view), 1)
+        self.assertIn((1, 'Wolf'), self.base)
+        self.assertRaises(KeyError, self.view.remove, (1, 'Wolf'))
+
+    def test_add(self):
+        self.view.add((3, 'Kobold'))
+        self.assertEqual(self.view, {(1, 'Wolf'), (2, 'Bear'), (3, 'Kobold')})
+        self.assertEqual(len(self.base), 2)
+
+    def test_add_removed(self):
+        self.view.remove((1, 'Wolf'))
+        self.view.add((1, 'Wolf'))
+        self.assertEqual(self.view, self.base)
+
+
+if __name__ == '__main__':
+    unittest.main()
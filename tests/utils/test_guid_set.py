@@ -0,0 +1,67 @@
+"""
+Test the GUID set and its packing in utils/guid_set.py
+"""
+import unittest
+
+from utils.guid_set import GuidSet, MAX_GUID, pack_guids, unpack_guids
+
+
+class GuidSetTests(unittest.TestCase):
+    def setUp(self):
+        self.guids = {14, 15, 20, 300, 0, 70000}
+        self.guid_set = GuidSet(self.guids)
+
+    def test_set(self):
+        self.assertEqual(self.guid_set, self.guids)
+        self.assertEqual(len(self.guid_set), len(self.guids))
+        self.assertIn(300, self.guid_set)
+        self.assertIn(0, self.guid_set)
+        self.assertNotIn(16, self.guid_set)
+        self.assertNotIn(10 ** 9, self.guid_set)
+        self.assertNotIn(-1, self.guid_set)
+        self.assertNotIn('14', self.guid_set)
+
+    def test_iter_is_sorted(self):
+        self.assertEqual(list(self.guid_set), sorted(self.guids))
+
+    def test_add_and_discard(self):
+        self.guid_set.add(16)
+        self.guid_set.add(16)
+        self.assertIn(16, self.guid_set)
+        self.assertEqual(len(self.guid_set), len(self.guids) + 1)
+
+        self.guid_set.discard(16)
+        self.guid_set.discard(16)
+        self.guid_set.discard(10 ** 9)
+        self.assertEqual(self.guid_set, self.guids)
+
+    def test_add_negative_guid(self):
+        with self.assertRaises(ValueError):
+            self.guid_set.add(-1)
+
+    def test_add_guid_above_max(self):
+        """ The bitmap grows with the highest GUID, a GUID past the maximum would take up too much memory """
+        self.guid_set.add(MAX_GUID)
+        with self.assertRaises(ValueError):
+            self.guid_set.add(MAX_GUID + 1)
+        with self.assertRaises(ValueError):
+            GuidSet.from_packed(pack_guids([1, MAX_GUID + 1]))
+
+    def test_pack(self):
+        """ Each GUID should be packed as a varint of its delta from the previous one """
+        self.assertEqual(pack_guids({14, 15, 20, 300}), bytes([0x0E, 0x01, 0x05, 0x98, 0x02]))
+        self.assertEqual(pack_guids([]), b'')
+
+    def test_pack_and_unpack(self):
+        packed_guids = self.guid_set.pack()
+        self.assertEqual(list(unpack_guids(packed_guids)), sorted(self.guids))
+        self.assertEqual(GuidSet.from_packed(packed_guids), self.guid_set)
+
+    def test_unpack_empty(self):
+        """ A character that has not killed anything might hold NULL in the DB """
+        self.assertEqual(GuidSet.from_packed(None), set())
+        self.assertEqual(GuidSet.from_packed(b''), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,9 @@ Test the helper functions in utils/helper.py
 """
 import unittest
 
-from utils.helper import parse_int
+from items import Weapon
+from utils.helper import (parse_int, get_attributes, build_cumulative_level_stats,
+                          build_cumulative_xp_requirements)
 
 
 class TestUtils(unittest.TestCase):
@@ -24,6 +26,36 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(parse_int('aa'), 0)
         self.assertEqual(parse_int([]), 0)
 
+    def test_get_attributes_slots(self):
+        """ It should collect the attributes held in the __slots__ of every class in the hierarchy """
+        weapon = Weapon(name='Worn Sword', item_id=1, min_damage=1, max_damage=3)
+        attributes = get_attributes(weapon)
+
+        self.assertEqual(attributes['name'], 'Worn Sword')
+        self.assertEqual(attributes['id'], 1)
+        self.assertEqual(attributes['min_damage'], 1)
+        self.assertEqual(attributes['max_damage'], 3)
+        self.assertEqual(len(attributes), 8)
+
+    def test_get_attributes_dict(self):
+        """ It should work like vars() for objects without __slots__ """
+        class Dummy:
+            def __init__(self):
+                self.a = 1
+
+        self.assertEqual(get_attributes(Dummy()), {'a': 1})
+
+    def test_build_cumulative_level_stats(self):
+        level_stats = {1: {'health': 10, 'armor': 1}, 2: {'health': 5, 'armor': 0}, 3: {'health': 7, 'armor': 2}}
+        expected_stats = {0: {'health': 0, 'armor': 0}, 1: {'health': 10, 'armor': 1},
+                          2: {'health': 15, 'armor': 1}, 3: {'health': 22, 'armor': 3}}
+
+        self.assertEqual(build_cumulative_level_stats(level_stats), expected_stats)
+
+    def test_build_cumulative_xp_requirements(self):
+        """ The element at index X should be the experience needed to get to level X+1 """
+        self.assertEqual(build_cumulative_xp_requirements({1: 400, 2: 800, 3: 1200}), [0, 400, 1200, 2400])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,80 @@
+"""
+Test the least recently used cache in utils/lru_cache.py
+"""
+import unittest
+
+from utils.lru_cache import LRUCache
+
+
+class LRUCacheTests(unittest.TestCase):
+    def setUp(self):
+        # every value is sized by its length, so that the tests can pass the bytes bound with strings
+        self.cache = LRUCache(max_count=3, max_bytes=10, size_function=len)
+
+    def test_get_set(self):
+        self.cache['wolf'] = 'aa'
+        self.cache['boar'] = 'bbb'
+
+        self.assertEqual(self.cache['wolf'], 'aa')
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.total_bytes, 5)
+        self.assertIsNone(self.cache.get('kobold'))
+
+    def test_evicts_least_recently_used_over_max_count(self):
+        self.cache['wolf'] = 'a'
+        self.cache['boar'] = 'b'
+        self.cache['kobold'] = 'c'
+        self.cache['wolf']  # looking it up makes the boar the least recently used one
+        self.cache['murloc'] = 'd'
+
+        self.assertEqual(list(self.cache), ['kobold', 'wolf', 'murloc'])
+        self.assertEqual(self.cache.total_bytes, 3)
+
+    def test_evicts_over_max_bytes(self):
+        self.cache['wolf'] = 'aaaa'
+        self.cache['boar'] = 'bbbb'
+        self.cache['kobold'] = 'cccc'
+
+        self.assertEqual(list(self.cache), ['boar', 'kobold'])
+        self.assertEqual(self.cache.total_bytes, 8)
+
+    def test_set_value_bigger_than_max_bytes(self):
+        """ A value which cannot fit on its own should not be cached nor evict anything """
+        self.cache['wolf'] = 'aaaa'
+        self.cache['boar'] = 'b' * 11
+
+        self.assertEqual(list(self.cache), ['wolf'])
+        self.assertEqual(self.cache.total_bytes, 4)
+
+    def test_set_existing_key(self):
+        self.cache['wolf'] = 'aaaa'
+        self.cache['boar'] = 'bb'
+        self.cache['wolf'] = 'a'
+
+        self.assertEqual(list(self.cache), ['boar', 'wolf'])
+        self.assertEqual(self.cache['wolf'], 'a')
+        self.assertEqual(self.cache.total_bytes, 3)
+
+    def test_contains_does_not_count_as_lookup(self):
+        self.cache['wolf'] = 'a'
+        self.cache['boar'] = 'b'
+
+        self.assertIn('wolf', self.cache)
+        self.assertEqual(list(self.cache), ['wolf', 'boar'])
+
+    def test_delete_and_clear(self):
+        self.cache['wolf'] = 'aa'
+        self.cache['boar'] = 'bbb'
+
+        del self.cache['wolf']
+        self.assertNotIn('wolf', self.cache)
+        self.assertEqual(self.cache.total_bytes, 3)
+        self.assertIsNone(self.cache.pop('wolf', None))
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.total_bytes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
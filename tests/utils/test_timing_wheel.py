@@ -0,0 +1,84 @@
+"""
+Test the hierarchical timing wheel in utils/timing_wheel.py
+"""
+import unittest
+
+from utils.timing_wheel import TimingWheel
+
+
+class TimingWheelTests(unittest.TestCase):
+    def setUp(self):
+        # a small wheel, so that the tests go through every level and wrap around it
+        self.wheel = TimingWheel(slot_count=4, level_count=2)
+
+    def tick_until_due(self, turn_count: int) -> {int: list}:
+        """ Returns a dictionary of Key: the turn, Value: the things that were due on it """
+        due_things = {}
+        for _ in range(turn_count):
+            things = self.wheel.tick()
+            if things:
+                due_things[self.wheel.turn] = things
+        return due_things
+
+    def test_schedule_in_first_level(self):
+        due_turn = self.wheel.schedule('wolf', 3)
+
+        self.assertEqual(due_turn, 3)
+        self.assertEqual(len(self.wheel), 1)
+        self.assertEqual(self.tick_until_due(10), {3: ['wolf']})
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_schedule_cascades_from_higher_level(self):
+        """ A thing due after the span of the first level should be moved down and returned on its exact turn """
+        self.wheel.schedule('wolf', 9)
+        self.wheel.schedule('boar', 13)
+
+        self.assertEqual(self.tick_until_due(20), {9: ['wolf'], 13: ['boar']})
+
+    def test_schedule_beyond_every_level(self):
+        """ Things due after the whole wheel has been gone through should wait on the side until it comes around """
+        self.wheel.schedule('kobold', 37)
+        self.wheel.schedule('wolf', 16)
+
+        self.assertEqual(self.tick_until_due(40), {16: ['wolf'], 37: ['kobold']})
+
+    def test_schedule_on_later_turns(self):
+        self.tick_until_due(6)
+        self.assertEqual(self.wheel.schedule('wolf', 5), 11)
+        self.wheel.schedule('boar', 30)
+
+        self.assertEqual(self.tick_until_due(40), {11: ['wolf'], 36: ['boar']})
+
+    def test_schedule_non_positive_turns(self):
+        """ Nothing can be due on the current turn, as it has already been ticked """
+        self.assertEqual(self.wheel.schedule('wolf', 0), 1)
+        self.assertEqual(self.wheel.tick(), ['wolf'])
+
+    def test_tick_returns_every_thing_due_on_the_turn(self):
+        self.tick_until_due(3)
+        self.wheel.schedule('wolf', 21)
+        self.tick_until_due(10)
+        self.wheel.schedule('boar', 11)
+        self.wheel.schedule('kobold', 3)
+
+        due_things = self.tick_until_due(20)
+
+        self.assertEqual(sorted(due_things[24]), ['boar', 'wolf'])
+        self.assertEqual(due_things[16], ['kobold'])
+
+    def test_matches_naive_schedule(self):
+        """ Scheduling on many different turns should return the same things as checking every one of them """
+        expected_due_things = {}
+        for idx in range(200):
+            delay = (idx * 7) % 53 + 1
+            expected_due_things.setdefault(self.wheel.schedule(idx, delay), []).append(idx)
+            if idx % 3 == 0:
+                self.assertEqual(sorted(self.wheel.tick()), sorted(expected_due_things.pop(self.wheel.turn, [])))
+
+        while len(self.wheel):
+            self.assertEqual(sorted(self.wheel.tick()), sorted(expected_due_things.pop(self.wheel.turn, [])))
+        self.assertEqual(expected_due_things, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
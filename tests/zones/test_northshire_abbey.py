@@ -7,6 +7,9 @@ from datetime import datetime, timedelta
 
 import models.main
 from zones.northshire_abbey import NorthshireAbbey, NorthshireValley, NorthshireVineyards
+from zones.zone import SubZoneTemplate
+from models.creatures.creatures import SpawnRecord
+from entities import Monster
 from constants import ZONE_MOVE_BLOCK_SPECIAL_KEY, GARRICK_PADFOOT_GUID
 
 
@@ -27,15 +30,6 @@ class NorthshireAbbeyTests(unittest.TestCase):
         self.peculiar_hut_npc_count = 0
         self.peculiar_hut_quest_count = 0
 
-    def tearDown(self):
-        """
-        Due to the mutability of the static variables, we need to reset them
-        on each tearDown. (Since we change them in the tests)
-        """
-        NorthshireAbbey.loaded_zones = {"Northshire Valley": None,
-                                        "Northshire Vineyards": None,
-                                        "A Peculiar Hut": None}
-
     def test_zone(self):
         zone = NorthshireAbbey(self.char_mock)
         # it should have loaded subzones
@@ -49,6 +43,103 @@ class NorthshireAbbeyTests(unittest.TestCase):
         self.assertEqual(len(zone.cs_available_quests.keys()), self.northshire_valley_quest_count)
         self.assertEqual(zone.curr_subzone, 'Northshire Valley')
 
+    def test_zones_do_not_share_state(self):
+        """
+        Two zone objects should hold their own subzones and alive monsters,
+        meaning changes in one should not be visible in the other
+        """
+        zone = NorthshireAbbey(self.char_mock)
+        other_zone = NorthshireAbbey(self.char_mock)
+        self.assertIsNot(zone.loaded_zones, other_zone.loaded_zones)
+
+        zone.move_player(current_subzone='Northshire Valley', destination='Northshire Vineyards',
+                         character=self.char_mock)
+        del zone.cs_alive_monsters[GARRICK_PADFOOT_GUID]
+
+        self.assertIsNotNone(zone.loaded_zones['Northshire Vineyards'])
+        self.assertIsNone(other_zone.loaded_zones['Northshire Vineyards'])
+        self.assertEqual(other_zone.curr_subzone, 'Northshire Valley')
+        self.assertEqual(len(other_zone.cs_alive_monsters.keys()), self.northshire_valley_monster_count)
+
+    def test_zones_share_subzone_templates(self):
+        """
+        Every zone object should build its subzones from the same template, building a monster only
+        when it is engaged
+        """
+        zone = NorthshireAbbey(self.char_mock)
+        other_zone = NorthshireAbbey(self.char_mock)
+        template = SubZoneTemplate.get_template('Northshire Abbey', 'Northshire Valley')
+
+        guid, _ = next(iter(zone.cs_monsters_guid_name_set))
+        self.assertIs(dict(zone.cs_alive_monsters.items())[guid], template.monsters[guid])
+        self.assertTrue(isinstance(template.monsters[guid], SpawnRecord))
+        self.assertEqual(zone.cs_alive_monsters.materialized_count(), 0)
+
+        engaged_monster = zone.cs_alive_monsters[guid]
+        self.assertTrue(isinstance(engaged_monster, Monster))
+        engaged_monster.health = 0
+        self.assertIs(zone.cs_alive_monsters[guid], engaged_monster)
+        self.assertEqual(zone.cs_alive_monsters.materialized_count(), 1)
+        self.assertNotEqual(other_zone.cs_alive_monsters[guid].health, 0)
+        self.assertTrue(isinstance(template.monsters[guid], SpawnRecord))
+
+    def test_subzone_hides_killed_monsters(self):
+        killed_guid, killed_name = next(iter(
+            SubZoneTemplate.get_template('Northshire Abbey', 'Northshire Valley').monster_guid_name_set))
+        self.char_mock.has_killed_monster = lambda guid: guid == killed_guid
+        zone = NorthshireAbbey(self.char_mock)
+
+        self.assertNotIn(killed_guid, zone.cs_alive_monsters)
+        self.assertNotIn((killed_guid, killed_name), zone.cs_monsters_guid_name_set)
+        self.assertEqual(len(zone.cs_alive_monsters), self.northshire_valley_monster_count - 1)
+
+    def kill_monster(self, zone: NorthshireAbbey) -> (int, Monster):
+        """ Kill a monster in the current subzone, removing it like combat.handle_monster_death does """
+        guid, name = next(iter(zone.cs_monsters_guid_name_set))
+        monster = zone.cs_alive_monsters[guid]
+        monster.health = 0
+        monster._alive = False
+        del zone.cs_alive_monsters[guid]
+        zone.cs_monsters_guid_name_set.remove((guid, name))
+        return guid, monster
+
+    def test_pass_turn_respawns_monster(self):
+        """ The very same monster should be put back in the subzone, fully healed, once its respawn is due """
+        zone = NorthshireAbbey(self.char_mock)
+        guid, monster = self.kill_monster(zone)
+        zone.schedule_respawn(guid, monster, respawn_turns=3)
+
+        zone.pass_turn()
+        zone.pass_turn()
+        self.assertNotIn(guid, zone.cs_alive_monsters)
+
+        zone.pass_turn()
+        self.assertIs(zone.cs_alive_monsters[guid], monster)
+        self.assertIn((guid, monster.name), zone.cs_monsters_guid_name_set)
+        self.assertTrue(monster.is_alive())
+        self.assertEqual(monster.health, monster.max_health)
+        self.assertEqual(len(zone.cs_alive_monsters), self.northshire_valley_monster_count)
+        self.assertEqual(len(zone.respawn_wheel), 0)
+
+    def test_pass_turn_respawns_monster_in_other_subzone(self):
+        """ A monster should respawn in the subzone it has died in, even if the player has left it """
+        zone = NorthshireAbbey(self.char_mock)
+        guid, monster = self.kill_monster(zone)
+        zone.schedule_respawn(guid, monster, respawn_turns=1)
+        zone.move_player(current_subzone='Northshire Valley', destination='Northshire Vineyards',
+                         character=self.char_mock)
+
+        zone.pass_turn()
+
+        self.assertNotIn(guid, zone.cs_alive_monsters)
+        alive_monsters, guid_name_set = zone.loaded_zones['Northshire Valley'].get_monsters()
+        self.assertIs(alive_monsters[guid], monster)
+        self.assertIn((guid, monster.name), guid_name_set)
+
+        zone.move_player(current_subzone='Northshire Vineyards', destination='Northshire Valley',
+                         character=self.char_mock)
+        self.assertIs(zone.cs_alive_monsters[guid], monster)
+
     def test_move_player_valid(self):
         """
         Move the player to a valid subzone giving valid values
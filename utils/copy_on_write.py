@@ -0,0 +1,147 @@
+"""
+This module holds copy-on-write views over shared collections.
+A view never modifies the collection it is built upon, it keeps its own changes on the side instead.
+This lets every player hold his own view of a shared subzone template (see zones/zone.py SubZoneTemplate), where only
+the things he has interacted with take up memory.
+"""
+from collections.abc import MutableMapping, MutableSet, ItemsView, ValuesView
+from operator import methodcaller
+
+
+class CopyOnWriteDict(MutableMapping):
+    """
+    A dictionary view over a shared dictionary.
+    Getting a value by its key (view[key]) materializes a copy of the shared value, which is then kept in the view,
+    because the caller might modify it (i.e. engage a monster and damage it).
+    Iterating through items() or values() does not materialize anything, as it is used for printing/looking up.
+    """
+    def __init__(self, base: dict, copy_function=methodcaller('copy_for_instance')):
+        """
+        :param base: the shared dictionary, which is never modified
+        :param copy_function: a function which receives a shared value and returns a copy of it for this view,
+            None if the shared values are never modified, in which case they are returned without being copied
+        """
+        self._base = base
+        self._copy_function = copy_function
+        self._overlay = {}  # the materialized copies and newly added values
+        self._removed = set()  # the keys of the shared dictionary which have been deleted from this view
+
+    def __getitem__(self, key):
+        if key in self._overlay:
+            return self._overlay[key]
+        if key in self._removed or key not in self._base:
+            raise KeyError(key)
+        if self._copy_function is None:
+            return self._base[key]
+
+        value = self._copy_function(self._base[key])
+        self._overlay[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._overlay[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._overlay.pop(key, None)
+        if key in self._base:
+            self._removed.add(key)
+
+    def __contains__(self, key):
+        return key in self._overlay or (key in self._base and key not in self._removed)
+
+    def __iter__(self):
+        # keep the order of the shared dictionary
+        for key in self._base:
+            if key not in self._removed:
+                yield key
+        for key in self._overlay:
+            if key not in self._base:
+                yield key
+
+    def __len__(self):
+        added_count = sum(1 for key in self._overlay if key not in self._base)
+        return len(self._base) - len(self._removed) + added_count
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self.items())})'
+
+    def copy(self) -> 'CopyOnWriteDict':
+        """ Returns a new view over the same shared dictionary, holding the changes of this one (not copies of them) """
+        view = CopyOnWriteDict(self._base, self._copy_function)
+        view._overlay = dict(self._overlay)
+        view._removed = set(self._removed)
+        return view
+
+    def peek(self, key):
+        """ Returns the value of the key without materializing a copy of it """
+        if key in self._overlay:
+            return self._overlay[key]
+        if key in self._removed:
+            raise KeyError(key)
+        return self._base[key]
+
+    def items(self):
+        return _PeekItemsView(self)
+
+    def values(self):
+        return _PeekValuesView(self)
+
+    def materialized_count(self) -> int:
+        """ Returns the count of values this view holds by itself """
+        return len(self._overlay)
+
+
+class _PeekItemsView(ItemsView):
+    def __iter__(self):
+        for key in self._mapping:
+            yield key, self._mapping.peek(key)
+
+
+class _PeekValuesView(ValuesView):
+    def __iter__(self):
+        for key in self._mapping:
+            yield self._mapping.peek(key)
+
+
+class CopyOnWriteSet(MutableSet):
+    """
+    A set view over a shared set. The elements are expected to be immutable (i.e. tuples of (GUID, Name)),
+    therefore only the additions and removals are kept in the view.
+    """
+    def __init__(self, base: set):
+        """
+        :param base: the shared set, which is never modified
+        """
+        self._base = base
+        self._added = set()
+        self._removed = set()
+
+    def __contains__(self, element):
+        return element in self._added or (element in self._base and element not in self._removed)
+
+    def __iter__(self):
+        for element in self._base:
+            if element not in self._removed:
+                yield element
+        yield from self._added
+
+    def __len__(self):
+        return len(self._base) - len(self._removed) + len(self._added)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({set(self)})'
+
+    def add(self, element):
+        if element in self._base:
+            self._removed.discard(element)
+        else:
+            self._added.add(element)
+
+    def discard(self, element):
+        if element in self._base:
+            self._removed.add(element)
+        else:
+            self._added.discard(element)
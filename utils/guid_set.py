@@ -0,0 +1,111 @@
+"""
+This module holds a compact set of GUIDs (non-negative integers), used for the monsters a character has killed.
+In memory the GUIDs are held as a bitmap, a bit per GUID, so that a membership test is a bit lookup rather than
+a hash of a boxed int. They are saved to the DB packed as a sorted array of the deltas between each GUID,
+every delta encoded as a varint, which takes a byte for GUIDs that are less than 128 apart.
+
+The bitmap takes up a bit for every GUID up to the highest one that was added, no matter how few were added -
+i.e 122 KB for a GUID of a million. This suits the creature GUIDs, which are small and dense, but not arbitrary
+numbers, which is why a GUID above MAX_GUID is refused.
+"""
+from collections.abc import MutableSet
+
+MAX_GUID = 2 ** 24 - 1  # a bitmap of 2 MB
+# Key: a byte value, Value: a tuple of the positions of its set bits, i.e 0b101 -> (0, 2)
+_BYTE_BIT_POSITIONS = [tuple(bit for bit in range(8) if value & (1 << bit)) for value in range(256)]
+
+
+class GuidSet(MutableSet):
+    def __init__(self, guids=()):
+        self._bitmap = bytearray()
+        self._count = 0
+        for guid in guids:
+            self.add(guid)
+
+    def __contains__(self, guid):
+        try:
+            return guid >= 0 and self._bitmap[guid >> 3] >> (guid & 7) & 1 == 1
+        except (IndexError, TypeError):  # a GUID past the bitmap or not an int at all
+            return False
+
+    def __iter__(self):
+        """ Iterates through the GUIDs in ascending order """
+        for byte_idx, byte in enumerate(self._bitmap):
+            if byte:
+                base_guid = byte_idx << 3
+                for bit in _BYTE_BIT_POSITIONS[byte]:
+                    yield base_guid | bit
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)})'
+
+    def add(self, guid: int):
+        if guid < 0:
+            raise ValueError(f'A GUID cannot be negative, {guid} was given!')
+        if guid > MAX_GUID:
+            raise ValueError(f'A GUID cannot be greater than {MAX_GUID}, {guid} was given!')
+        byte_idx, mask = guid >> 3, 1 << (guid & 7)
+        if byte_idx >= len(self._bitmap):
+            self._bitmap.extend(bytes(byte_idx + 1 - len(self._bitmap)))
+        if not self._bitmap[byte_idx] & mask:
+            self._bitmap[byte_idx] |= mask
+            self._count += 1
+
+    def discard(self, guid: int):
+        if guid in self:
+            self._bitmap[guid >> 3] &= ~(1 << (guid & 7))
+            self._count -= 1
+
+    def pack(self) -> bytes:
+        """ Returns the GUIDs as delta-encoded varints, as they are saved in the DB """
+        return pack_guids(self)
+
+    @classmethod
+    def from_packed(cls, packed_guids: bytes) -> 'GuidSet':
+        guid_set = cls()
+        guids = list(unpack_guids(packed_guids))
+        if guids:
+            if guids[-1] > MAX_GUID:
+                raise ValueError(f'A GUID cannot be greater than {MAX_GUID}, {guids[-1]} was packed!')
+            # the GUIDs are sorted, the bitmap is therefore allocated at once
+            bitmap = guid_set._bitmap = bytearray((guids[-1] >> 3) + 1)
+            for guid in guids:
+                bitmap[guid >> 3] |= 1 << (guid & 7)
+            guid_set._count = len(guids)
+
+        return guid_set
+
+
+def pack_guids(guids) -> bytes:
+    """
+    Packs the GUIDs into a sorted array of the deltas between each of them, encoded as varints -
+    7 bits per byte, with the high bit set on every byte but the last one of a varint
+        {14, 15, 20, 300} -> deltas 14, 1, 5, 280 -> 0x0E 0x01 0x05 0x98 0x02
+    """
+    packed = bytearray()
+    previous_guid = 0
+    for guid in sorted(guids):
+        delta = guid - previous_guid
+        previous_guid = guid
+        while delta >= 0x80:
+            packed.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        packed.append(delta)
+
+    return bytes(packed)
+
+
+def unpack_guids(packed_guids: bytes):
+    """ Yields the GUIDs which were packed by pack_guids, in ascending order """
+    guid, delta, shift = 0, 0, 0
+    for byte in packed_guids or b'':
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        guid += delta
+        yield guid
+        delta, shift = 0, 0
@@ -62,6 +62,35 @@ def create_character_attributes_template() -> dict:
     return deepcopy(CHAR_ATTRIBUTES_TEMPLATE)
 
 
+def build_cumulative_level_stats(level_stats: {int: {str: int}}) -> {int: {str: int}}:
+    """
+    Build a prefix sum of the stats a character gains on each level up (see CHARACTER_LEVELUP_BONUS_STATS),
+    so that the stats gained from level X to level Y are cumulative[Y][stat] - cumulative[X][stat]
+    :return: a dictionary Key: level, Value: a dictionary holding the total of each stat gained up to that level.
+             Level 0 holds zeros, as it is the level every character starts leveling up from
+    """
+    stat_names = next(iter(level_stats.values())).keys() if level_stats else []
+    cumulative_stats = {0: {stat: 0 for stat in stat_names}}
+    for level in sorted(level_stats):
+        previous_stats = cumulative_stats[level - 1]
+        cumulative_stats[level] = {stat: previous_stats[stat] + level_stats[level][stat] for stat in stat_names}
+
+    return cumulative_stats
+
+
+def build_cumulative_xp_requirements(xp_requirements: {int: int}) -> [int]:
+    """
+    Build a prefix sum of the experience needed to level up (see CHARACTER_LEVEL_XP_REQUIREMENTS)
+    :return: a sorted list, where the element at index X is the total experience needed to get to level X+1 from
+             level 1. A character with a total of Y experience is level bisect_right(cumulative_xp, Y)
+    """
+    cumulative_xp = [0]
+    for level in sorted(xp_requirements):
+        cumulative_xp.append(cumulative_xp[-1] + xp_requirements[level])
+
+    return cumulative_xp
+
+
 def get_guid_by_name(name: str, guid_names: {(int, str)}):
     """
     A function that returns a GUID which is associated with the given name,
@@ -75,3 +104,17 @@ def get_guid_by_name(name: str, guid_names: {(int, str)}):
             return guid
 
     return None
+
+
+def get_attributes(obj) -> dict:
+    """
+    Works like vars(), returning a dictionary of the object's attributes,
+    but also supports objects whose attributes are held in __slots__ (i.e Damage, Item, Spell)
+    """
+    attributes = dict(getattr(obj, '__dict__', {}))
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get('__slots__', ()):
+            if slot not in ('__dict__', '__weakref__') and hasattr(obj, slot):
+                attributes[slot] = getattr(obj, slot)
+
+    return attributes
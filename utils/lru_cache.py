@@ -0,0 +1,62 @@
+"""
+This module holds a least recently used cache, bounded by both the count of its values and their estimated size.
+Once either bound is passed, the values which have gone the longest without being looked up are evicted.
+"""
+import sys
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+
+class LRUCache(MutableMapping):
+    def __init__(self, max_count: int, max_bytes: int, size_function=sys.getsizeof):
+        """
+        :param max_count: the maximum count of values in the cache
+        :param max_bytes: the maximum sum of the values' estimated sizes
+        :param size_function: a function which receives a value and returns its estimated size in bytes,
+            called once when the value is put in the cache
+        """
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self._size_function = size_function
+        self._entries: OrderedDict = OrderedDict()  # Key: the key, Value: a tuple of (value, its size), oldest first
+        self.total_bytes = 0
+
+    def __getitem__(self, key):
+        value, _ = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        size = self._size_function(value)
+        if key in self._entries:
+            del self[key]
+        if size > self.max_bytes:
+            return  # it would evict everything else and still not fit
+
+        self._entries[key] = (value, size)
+        self.total_bytes += size
+        while len(self._entries) > self.max_count or self.total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def __delitem__(self, key):
+        _, size = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def __contains__(self, key):
+        """ Does not count as a lookup, the value keeps its place """
+        return key in self._entries
+
+    def __iter__(self):
+        """ Iterates through the keys from the least to the most recently used one """
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self._entries)}, {self.total_bytes}/{self.max_bytes} bytes)'
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
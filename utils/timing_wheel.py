@@ -0,0 +1,88 @@
+"""
+This module holds a hierarchical timing wheel, a scheduler of things which are due after a number of turns.
+Passing a turn costs the same whether nothing or a thousand things are scheduled, as only the things that are due
+(or about to be due) are ever touched.
+"""
+
+
+class TimingWheel:
+    """
+    The wheel is made out of levels, each holding slot_count slots.
+    A slot of the first level holds the things that are due on a single turn, a slot of the second level holds
+    the things due in a span of slot_count turns, a slot of the third one the things due in slot_count^2 turns and so on.
+    Whenever the turn reaches the start of a higher level slot, its things are cascaded down into the lower levels.
+    Things which are due after every level has been gone through are held on the side until the wheel comes around.
+
+    Example with slot_count=4:
+        a thing scheduled at turn 0, due in 2 turns, goes into slot 2 of the first level
+        a thing scheduled at turn 0, due in 9 turns, goes into slot 2 (9 // 4) of the second level and it is
+            moved into slot 1 (9 % 4) of the first level once the turn reaches 8
+    """
+    def __init__(self, slot_count: int=64, level_count: int=4):
+        self.turn = 0
+        self.slot_count = slot_count
+        # the count of turns that a single slot spans on each level - 1, slot_count, slot_count^2...
+        self._level_spans = [slot_count ** level for level in range(level_count)]
+        self._levels: [[[(int, object)]]] = [[[] for _ in range(slot_count)] for _ in range(level_count)]
+        self._overflow: [(int, object)] = []  # things due after every level of the wheel
+        self._scheduled_count = 0
+
+    def __len__(self):
+        return self._scheduled_count
+
+    def schedule(self, thing, turns: int) -> int:
+        """
+        Schedule the thing to be returned by tick() after the given count of turns
+        :return: the turn on which the thing is due
+        """
+        due_turn = self.turn + max(turns, 1)
+        self._insert(due_turn, thing)
+        self._scheduled_count += 1
+
+        return due_turn
+
+    def tick(self) -> list:
+        """
+        Passes a turn
+        :return: a list of the things which are due on this turn
+        """
+        self.turn += 1
+        self._cascade()
+
+        slot_idx = self.turn % self.slot_count
+        due_entries = self._levels[0][slot_idx]
+        if not due_entries:
+            return []
+        self._levels[0][slot_idx] = []
+        self._scheduled_count -= len(due_entries)
+
+        return [thing for _, thing in due_entries]
+
+    def _insert(self, due_turn: int, thing):
+        turns_left = due_turn - self.turn
+        for level, level_span in enumerate(self._level_spans):
+            if turns_left < level_span * self.slot_count:
+                self._levels[level][(due_turn // level_span) % self.slot_count].append((due_turn, thing))
+                return
+        self._overflow.append((due_turn, thing))
+
+    def _cascade(self):
+        """
+        Move the things of the higher level slots which start on this turn into the lower levels,
+        going from the highest level down, as a cascaded thing might land in a lower slot that starts on this turn as well
+        """
+        if self.turn % (self._level_spans[-1] * self.slot_count) == 0 and self._overflow:
+            overflow, self._overflow = self._overflow, []
+            for due_turn, thing in overflow:
+                self._insert(due_turn, thing)
+
+        for level in range(len(self._level_spans) - 1, 0, -1):
+            level_span = self._level_spans[level]
+            if self.turn % level_span != 0:
+                continue
+            slot_idx = (self.turn // level_span) % self.slot_count
+            entries = self._levels[level][slot_idx]
+            if entries:
+                self._levels[level][slot_idx] = []
+                for due_turn, thing in entries:
+                    self._insert(due_turn, thing)
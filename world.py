@@ -0,0 +1,44 @@
+"""
+This module holds the World class, which owns all the zones of the game.
+Every World object holds its own zone objects (and therefore its own alive monsters, npcs and quests),
+meaning that multiple worlds (shards, test worlds and etc.) can run side by side in one process.
+"""
+from zones.zone import Zone
+from zones.northshire_abbey import NorthshireAbbey
+
+
+class World:
+    # Key: the name of the zone, Value: the class of the zone
+    zone_classes = {NorthshireAbbey.zone_name: NorthshireAbbey}
+
+    def __init__(self, character, zone_classes: dict=None):
+        """
+        :param character: the Character object that this world is loaded for, the zones use it to decide
+        which monsters/quests to load (i.e. skip the monsters he has killed)
+        :param zone_classes: optionally overrides the zones this world can load
+        """
+        self.character = character
+        if zone_classes is not None:
+            self.zone_classes = zone_classes
+        self.zones: {str: Zone} = {}  # Key: zone name, Value: the loaded Zone object
+
+    def get_zone(self, zone_name: str) -> Zone:
+        """
+        Returns the Zone object with the given name, loading it if it has not been loaded before
+        :param zone_name: The name of the zone
+        """
+        if zone_name not in self.zones:
+            if zone_name not in self.zone_classes:
+                raise Exception(f'There is no zone by the name of {zone_name}!')
+            self.zones[zone_name] = self.zone_classes[zone_name](self.character)
+
+        return self.zones[zone_name]
+
+    def has_zone(self, zone_name: str) -> bool:
+        """ Returns a boolean indicating if the zone is part of this world """
+        return zone_name in self.zone_classes
+
+    def pass_turn(self):
+        """ Passes a turn in every loaded zone. A turn of the world is a command of the main game loop """
+        for zone in self.zones.values():
+            zone.pass_turn()
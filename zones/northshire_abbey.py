@@ -18,10 +18,6 @@ class NorthshireAbbey(Zone):
                 "A Peculiar Hut": ["Northshire Vineyards"]}
     zone_name = "Northshire Abbey"
     starter_subzone = "Northshire Valley"
-    #  dictionary that will hold the subzone class objects
-    loaded_zones = {"Northshire Valley": None,
-                    "Northshire Vineyards": None,
-                    "A Peculiar Hut": None}
 
     def __init__(self, character):
         super().__init__()
@@ -2,7 +2,10 @@
 This is the base class for zones. Every zone in the game will inherit from this class.
 """
 from models.quests.loader import load_quests
-from models.creatures.loader import load_monsters, load_npcs
+from models.creatures.loader import load_monster_spawns, load_npc_spawns
+from constants import MONSTER_RESPAWN_TURNS
+from utils.copy_on_write import CopyOnWriteDict, CopyOnWriteSet
+from utils.timing_wheel import TimingWheel
 
 
 class Zone:
@@ -10,14 +13,22 @@ class Zone:
     zone_map = {}  # type: dict - key: current_subzone: str, value: A list of subzones: str which we can go to
     zone_name = "" # name of the zone
     starter_subzone = ""  # the subzone you start in
-    loaded_zones = {}  # dictionary that will hold the subzone class objects
-
-    #  the cs in cs_alive_monsters and similar names stands for Current Subzone
-    cs_alive_monsters, cs_monsters_guid_name_set = {}, set()
-    cs_alive_npcs, cs_npcs_guid_name_set = {}, set()
-    cs_available_quests = {}
-    cs_map = []
-    curr_subzone = ""
+    # the zones outside of this one that we can go to, Key: subzone: str, value: A list of zone names: str
+    zone_exits = {}
+
+    def __init__(self):
+        # Everything below is mutable world state and is therefore held per instance,
+        # otherwise two Zone objects of the same class would share (and corrupt) each other's subzones
+        self.loaded_zones = {subzone: None for subzone in self.zone_map}  # dictionary that will hold the subzone class objects
+
+        #  the cs in cs_alive_monsters and similar names stands for Current Subzone
+        self.cs_alive_monsters, self.cs_monsters_guid_name_set = {}, set()
+        self.cs_alive_npcs, self.cs_npcs_guid_name_set = {}, set()
+        self.cs_available_quests = {}
+        self.cs_map = []
+        self.curr_subzone = ""
+        # holds the dead respawnable monsters as tuples of (subzone name, monster GUID, Monster object)
+        self.respawn_wheel = TimingWheel()
 
     def move_player(self, current_subzone: str, destination: str, character):
         """
@@ -45,6 +56,37 @@ class Zone:
     def _load_zone(self, subzone: str, dead_monsters: set):
         pass
 
+    def schedule_respawn(self, monster_guid: int, monster, respawn_turns: int=MONSTER_RESPAWN_TURNS):
+        """
+        Schedules a monster which has just died in the current subzone to come back to life after the given turns
+        """
+        self.respawn_wheel.schedule((self.curr_subzone, monster_guid, monster), respawn_turns)
+
+    def pass_turn(self):
+        """
+        Passes a turn of the zone, bringing back every monster whose respawn is due.
+        The same Monster object is put back in its subzone, as it was when it was spawned.
+        """
+        for subzone, monster_guid, monster in self.respawn_wheel.tick():
+            monster.respawn()
+            self.loaded_zones[subzone].add_monster(monster_guid, monster)
+
+    def enter_subzone(self, subzone: str, character):
+        """
+        Put the character straight into the subzone, without walking there from the current one.
+        Used for a character who was in the subzone before being handed off between zone shards (see server/shard.py)
+        """
+        if subzone not in self.loaded_zones:
+            raise Exception("The subzone is not in the zone_object!")
+        if subzone == self.curr_subzone:
+            return
+
+        self._update_subzone_attributes(self.curr_subzone)
+        if not self.loaded_zones[subzone]:
+            self._load_zone(subzone, character)
+        self.curr_subzone = subzone
+        self._update_attributes(subzone)
+
     def _update_attributes(self, subzone: str):
         subzone_object = self.loaded_zones[subzone]  # type: SubZone
 
@@ -90,6 +132,36 @@ class Zone:
         pass
 
 
+class SubZoneTemplate:
+    """
+    Holds everything that is loaded from the DB for a subzone - monsters, npcs and quests.
+    A template is loaded once per (zone, subzone) and is shared by every SubZone object of that subzone,
+    it must never be modified. Every SubZone holds copy-on-write views over it instead.
+    """
+    # Key: tuple of (zone name, subzone name), Value: the SubZoneTemplate object
+    _loaded_templates = {}
+
+    def __init__(self, zone_name: str, subzone_name: str):
+        # the creatures are held as SpawnRecords, which are built into Monster/NPC objects on their first lookup
+        self.monsters, self.monster_guid_name_set = load_monster_spawns(zone_name, subzone_name)
+        self.npcs, self.npc_guid_name_set = load_npc_spawns(zone_name, subzone_name)
+        self.quests = load_quests(zone_name, subzone_name)
+
+    @classmethod
+    def get_template(cls, zone_name: str, subzone_name: str) -> 'SubZoneTemplate':
+        """ Returns the template of the subzone, loading it if it has not been loaded before """
+        key = (zone_name, subzone_name)
+        if key not in cls._loaded_templates:
+            cls._loaded_templates[key] = cls(zone_name, subzone_name)
+
+        return cls._loaded_templates[key]
+
+    @classmethod
+    def clear_loaded_templates(cls):
+        """ Forget every loaded template, meaning they'll be loaded from the DB again """
+        cls._loaded_templates.clear()
+
+
 class SubZone:
 
     def __init__(self, name: str, parent_zone_name: str, zone_map: list, character):
@@ -97,9 +169,21 @@ class SubZone:
         self.parent_zone_name = parent_zone_name
         self._map = zone_map  # the _map that shows us where we can go from here
 
-        self._alive_monsters, self._monster_guid_name_set = load_monsters(self.parent_zone_name, self.name, character)
-        self._alive_npcs, self._npc_guid_name_set = load_npcs(self.parent_zone_name, self.name)
-        self._quest_list = load_quests(self.parent_zone_name, self.name, character)
+        template = SubZoneTemplate.get_template(self.parent_zone_name, self.name)
+        self._alive_monsters = CopyOnWriteDict(template.monsters)
+        self._monster_guid_name_set = CopyOnWriteSet(template.monster_guid_name_set)
+        self._alive_npcs = CopyOnWriteDict(template.npcs)
+        self._npc_guid_name_set = CopyOnWriteSet(template.npc_guid_name_set)
+        self._quest_list = CopyOnWriteDict(template.quests)
+
+        # hide what the character is done with
+        for guid, monster_name in template.monster_guid_name_set:
+            if character.has_killed_monster(guid):
+                del self._alive_monsters[guid]
+                self._monster_guid_name_set.remove((guid, monster_name))
+        for quest_name, quest in template.quests.items():
+            if character.has_completed_quest(quest.ID):
+                del self._quest_list[quest_name]
 
     def load_on_zone_entry_script(self, character):
         """
@@ -133,6 +217,10 @@ class SubZone:
     def get_map_directions(self):  # return the zone _map holding the connections of sub_zones
         return self._map
 
+    def add_monster(self, monster_guid: int, monster):
+        self._alive_monsters[monster_guid] = monster
+        self._monster_guid_name_set.add((monster_guid, monster.name))
+
     def update_monsters(self, alive_monsters: dict, guid_name_set: set):
         self._alive_monsters = alive_monsters
         self._monster_guid_name_set = guid_name_set